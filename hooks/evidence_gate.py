@@ -9,11 +9,147 @@ Never crashes — all parsing wrapped in try/except.
 Short-circuits when stop_hook_active is True to avoid infinite block loops
 when Claude Code re-invokes Stop hooks after a block decision.
 No explicit process termination — main() returns and the process ends naturally.
+
+When a prd_taskmaster daemon is serving this project (``daemon-serve``) the
+decision is made there, against warm parsed state; otherwise in-process.
+Either way the hook prefers the small in-progress summary that task_state
+maintains, and falls back to parsing the master tag's file (its shard when
+tasks are sharded) when it is stale. If the package cannot be imported the
+hook still scans, just without the summary.
 """
 import json
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+try:
+    # Paths and summary layout are shared with task_state, which writes it.
+    from prd_taskmaster import progress_summary
+except Exception:
+    progress_summary = None
+
+# Standalone copies of progress_summary's layout, used only when the package
+# cannot be imported: the gate then scans every time rather than turning off.
+PIPELINE = ".atlas-ai/state/pipeline.json"
+TASKS = ".taskmaster/tasks/tasks.json"
+TAG_MANIFEST = ".taskmaster/tasks/tags/manifest.json"
+
+
+def _load_json(path):
+    return json.loads(Path(path).read_text())
+
+
+def _master_tasks_file(root):
+    if progress_summary is not None:
+        return progress_summary.master_tasks_file(root)
+    try:
+        tags = json.loads((Path(root) / TAG_MANIFEST).read_text())["tags"]
+        return Path(TAG_MANIFEST).parent / str(tags.get("master") or "master.json")
+    except Exception:
+        return Path(TASKS)
+
+
+def _in_progress(tasks_data):
+    if progress_summary is not None:
+        return progress_summary.in_progress_entries(tasks_data)
+    block = tasks_data.get("master") if isinstance(tasks_data, dict) else None
+    tasks = (block.get("tasks") if isinstance(block, dict) else None) or []
+    return [
+        {
+            "id": t.get("id"),
+            "subtasks": len(t.get("subtasks") or []),
+            "evidence": len(t.get("evidence_files") or []),
+        }
+        for t in tasks
+        if isinstance(t, dict) and t.get("status") == "in-progress"
+    ]
+
+
+def _fingerprint(path):
+    return progress_summary.file_fingerprint(path) if progress_summary is not None else None
+
+
+def _scan(root, load_json):
+    """Full scan: (current_phase, in-progress entries) or None to allow."""
+    pipeline_path = Path(root) / PIPELINE
+    if not pipeline_path.is_file():
+        return None
+    pipeline_fp = _fingerprint(pipeline_path)
+
+    try:
+        pipeline = load_json(pipeline_path)
+    except Exception:
+        return None
+
+    phase = pipeline.get("current_phase")
+    if phase != "EXECUTE":
+        return None
+
+    source = _master_tasks_file(root)
+    tasks_path = Path(root) / source
+    if not tasks_path.is_file():
+        return None
+    tasks_fp = _fingerprint(tasks_path)
+
+    try:
+        tasks_data = load_json(tasks_path)
+    except Exception:
+        return None
+
+    in_progress = _in_progress(tasks_data)
+    if progress_summary is not None:
+        # Best effort: the next Stop reads a few hundred bytes instead of rescanning.
+        progress_summary.store_summary(root, progress_summary.build_summary(
+            tasks_data, source, phase, tasks_fp, pipeline_fp,
+        ))
+    return phase, in_progress
+
+
+def decide(payload, root=Path("."), load_json=_load_json):
+    """The hook's output dict for *payload*; ``{}`` allows."""
+    # Short-circuit: if Claude Code is re-invoking Stop hooks after a block,
+    # always allow to prevent infinite loops.
+    if payload.get("stop_hook_active") is True:
+        return {}
+
+    # task_state keeps a derived summary current on every status change; the
+    # full tasks.json is only parsed when that summary is missing or stale.
+    summary = progress_summary.fresh_summary(root, load_json) if progress_summary is not None else None
+    if summary is not None:
+        phase, in_progress = summary.get("current_phase"), summary.get("in_progress") or []
+    else:
+        scanned = _scan(root, load_json)
+        if scanned is None:
+            return {}
+        phase, in_progress = scanned
+
+    if phase != "EXECUTE":
+        return {}
+
+    offenders = [
+        f"task {t.get('id')}: {t.get('evidence', 0)}/{t.get('subtasks', 0)} evidence"
+        for t in in_progress
+        if isinstance(t, dict) and 0 < t.get("subtasks", 0) and t.get("evidence", 0) < t.get("subtasks", 0)
+    ]
+
+    if offenders:
+        reason = (
+            f"Incomplete CDD evidence — {len(offenders)} tasks have subtasks "
+            f"without matching evidence: {'; '.join(offenders)}. "
+            f"Run execute-task loop to completion or mark blocked."
+        )
+        return {"decision": "block", "reason": reason}
+    return {}
+
+
+def _via_daemon(payload):
+    try:
+        from prd_taskmaster import daemon
+
+        return daemon.run_hook_via_daemon("evidence_gate", payload)
+    except Exception:
+        return None
+
 
 def main():
     try:
@@ -24,61 +160,10 @@ def main():
         return
 
     try:
-        # Short-circuit: if Claude Code is re-invoking Stop hooks after a block,
-        # always allow to prevent infinite loops.
-        if payload.get("stop_hook_active") is True:
-            print(json.dumps({}))
-            return
-
-        pipeline_path = Path(".atlas-ai/state/pipeline.json")
-        if not pipeline_path.is_file():
-            print(json.dumps({}))
-            return
-
-        try:
-            pipeline = json.loads(pipeline_path.read_text())
-        except Exception:
-            print(json.dumps({}))
-            return
-
-        if pipeline.get("current_phase") != "EXECUTE":
-            print(json.dumps({}))
-            return
-
-        tasks_path = Path(".atlas-ai/taskmaster/tasks/tasks.json")
-        if not tasks_path.is_file():
-            print(json.dumps({}))
-            return
-
-        try:
-            tasks_data = json.loads(tasks_path.read_text())
-        except Exception:
-            print(json.dumps({}))
-            return
-
-        tasks = tasks_data.get("master", {}).get("tasks", []) or []
-        offenders = []
-        for t in tasks:
-            if not isinstance(t, dict):
-                continue
-            if t.get("status") != "in-progress":
-                continue
-            subtasks = t.get("subtasks") or []
-            evidence_files = t.get("evidence_files") or []
-            if len(subtasks) > 0 and len(evidence_files) < len(subtasks):
-                offenders.append(
-                    f"task {t.get('id')}: {len(evidence_files)}/{len(subtasks)} evidence"
-                )
-
-        if offenders:
-            reason = (
-                f"Incomplete CDD evidence — {len(offenders)} tasks have subtasks "
-                f"without matching evidence: {'; '.join(offenders)}. "
-                f"Run execute-task loop to completion or mark blocked."
-            )
-            print(json.dumps({"decision": "block", "reason": reason}))
-        else:
-            print(json.dumps({}))
+        output = _via_daemon(payload)
+        if output is None:
+            output = decide(payload)
+        print(json.dumps(output))
     except Exception:
         # any unexpected failure — allow, never crash the hook
         print(json.dumps({}))
@@ -4,23 +4,18 @@ Gate enforcer hook. Blocks mcp__...__advance_phase calls without gate evidence.
 Reads PreToolUse JSON from stdin, returns permissionDecision on stdout.
 Never crashes — all JSON parsing wrapped in try/except.
 No explicit process termination — main() returns and the process ends naturally.
+The decision itself is the pure ``decide(payload)``, which the optional
+prd_taskmaster daemon also serves.
 """
 import json
 import sys
 
 
-def main():
-    try:
-        payload = json.loads(sys.stdin.read())
-    except Exception:
-        # never crash the hook — bad stdin is a no-op (implicit allow)
-        print(json.dumps({}))
-        return
-
+def decide(payload):
+    """The hook's output dict for *payload*; ``{}`` allows."""
     tool_name = payload.get("tool_name", "")
     if not tool_name.endswith("__advance_phase"):
-        print(json.dumps({}))
-        return
+        return {}
 
     tool_input = payload.get("tool_input", {})
     target = tool_input.get("target")
@@ -61,15 +56,25 @@ def main():
 
     if violations:
         reason = f"Gate for {target} not passed: {'; '.join(violations)}"
-        print(json.dumps({
+        return {
             "hookSpecificOutput": {
                 "hookEventName": "PreToolUse",
                 "permissionDecision": "deny",
                 "permissionDecisionReason": reason,
             }
-        }))
-    else:
+        }
+    return {}
+
+
+def main():
+    try:
+        payload = json.loads(sys.stdin.read())
+    except Exception:
+        # never crash the hook — bad stdin is a no-op (implicit allow)
         print(json.dumps({}))
+        return
+
+    print(json.dumps(decide(payload)))
 
 
 if __name__ == "__main__":
@@ -5,19 +5,15 @@ Mode D (full CDD + atlas-phoenix) is preview-alpha and requires waitlist opt-in.
 Reads PreToolUse JSON from stdin, returns permissionDecision on stdout.
 Never crashes — all JSON parsing wrapped in try/except.
 No explicit process termination — main() returns and the process ends naturally.
+The decision itself is the pure ``decide(payload)``, which the optional
+prd_taskmaster daemon also serves.
 """
 import json
 import sys
 
 
-def main():
-    try:
-        payload = json.loads(sys.stdin.read())
-    except Exception:
-        # never crash the hook — bad stdin is a no-op (implicit allow)
-        print(json.dumps({}))
-        return
-
+def decide(payload):
+    """The hook's output dict for *payload*; ``{}`` allows."""
     tool_name = payload.get("tool_name", "")
 
     # Check if tool is from blocked Mode D namespaces
@@ -26,15 +22,25 @@ def main():
             "Mode D (full CDD + atlas-phoenix integration) is preview-alpha and requires waitlist opt-in. "
             "Please join the waitlist at https://atlas-ai.au/waitlist/mode-d to access this feature."
         )
-        print(json.dumps({
+        return {
             "hookSpecificOutput": {
                 "hookEventName": "PreToolUse",
                 "permissionDecision": "deny",
                 "permissionDecisionReason": reason,
             }
-        }))
-    else:
+        }
+    return {}
+
+
+def main():
+    try:
+        payload = json.loads(sys.stdin.read())
+    except Exception:
+        # never crash the hook — bad stdin is a no-op (implicit allow)
         print(json.dumps({}))
+        return
+
+    print(json.dumps(decide(payload)))
 
 
 if __name__ == "__main__":
@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 """FastMCP server for prd-taskmaster.
 
-Registers 32 tools wrapping the sibling modules (pipeline, capabilities,
+Registers 35 tools wrapping the sibling modules (pipeline, capabilities,
 taskmaster, backend, validation, templates) plus server-native helpers
 (calc_tasks, backup_prd, append_workflow, debrief, log_progress,
 gen_test_tasks, read_state, gen_scripts, compute_fleet_waves, context_pack,
 feedback, suggestion).
 
+The long-running tools (engine_preflight, parse_prd, expand_tasks,
+rate_tasks) return a job id immediately and run on a background pool
+(prd_taskmaster.jobs); job_status / job_cancel / job_list follow them up.
+Pass wait=true for the old blocking behaviour.
+
 No explicit process termination — mcp.run() is the event loop and
 returns naturally when the transport closes.
 """
@@ -33,6 +38,7 @@ from prd_taskmaster import batch as B
 from prd_taskmaster import task_state as TS
 from prd_taskmaster import cli as CLI
 from prd_taskmaster import feedback as FB
+from prd_taskmaster import jobs as JOBS
 from prd_taskmaster import suggestions as SG
 from prd_taskmaster.context_pack import build_context_pack
 
@@ -94,6 +100,22 @@ class _HardenedMCP:
 
 mcp = _HardenedMCP(_mcp)
 
+_jobs: JOBS.JobManager | None = None
+
+
+def _job_manager() -> JOBS.JobManager:
+    # Created lazily so the jobs dir resolves against the project cwd.
+    global _jobs
+    if _jobs is None:
+        _jobs = JOBS.JobManager()
+    return _jobs
+
+
+def _run_or_submit(wait: bool, kind: str, fn, *args, **kwargs) -> dict:
+    if wait:
+        return fn(*args, **kwargs)
+    return _job_manager().submit(kind, fn, *args, **kwargs)
+
 
 # ─── Delegation tools (17) ────────────────────────────────────────────────────
 
@@ -104,11 +126,14 @@ def preflight(cwd: str | None = None) -> dict:
 
 
 @mcp.tool()
-def engine_preflight(configure: bool = True) -> dict:
+def engine_preflight(configure: bool = True, refresh: bool = False, wait: bool = False) -> dict:
     """One-call Phase 1: preflight + taskmaster + provider config/detect +
     capabilities, with a human-presentable summary. Prefer this over the
-    individual probes."""
-    return B.run_engine_preflight(configure=configure)
+    individual probes. refresh=true ignores the cached tool detection.
+
+    Returns {job_id} at once; poll job_status for the result (wait=true blocks)."""
+    return _run_or_submit(wait, "engine_preflight", B.run_engine_preflight,
+                          configure=configure, refresh=refresh)
 
 
 @mcp.tool()
@@ -136,9 +161,11 @@ def detect_taskmaster() -> dict:
 
 
 @mcp.tool()
-def detect_capabilities() -> dict:
-    """Scan for plugins, skills, and external AI tools; recommend a mode."""
-    return C.detect_capabilities()
+def detect_capabilities(refresh: bool = False) -> dict:
+    """Scan for plugins, skills, and external AI tools; recommend a mode.
+
+    Cached per environment fingerprint; refresh=true re-detects."""
+    return C.detect_capabilities(refresh=refresh)
 
 
 @mcp.tool()
@@ -214,6 +241,8 @@ def set_task_status(
 def _backend_tool_call(fn, *args, **kwargs) -> dict:
     try:
         return fn(*args, **kwargs)
+    except JOBS.JobCancelled:
+        raise
     except LIB.CommandError as exc:
         return {"ok": False, "error": exc.message, **exc.extra}
     except SystemExit as exc:
@@ -229,13 +258,17 @@ def init_project() -> dict:
 
 
 @mcp.tool()
-def parse_prd(prd_path: str, num_tasks: int, tag: str = "") -> dict:
+def parse_prd(prd_path: str, num_tasks: int, tag: str = "", wait: bool = False) -> dict:
     """Parse a PRD through the resolved backend.
 
-    When the resolved native backend's ai_ops is "agent", this can return ok=false with
-    agent_action_required instead of doing headless AI work.
+    Returns {job_id} at once; poll job_status for the result (wait=true blocks).
+    When the resolved native backend's ai_ops is "agent", the result can be ok=false
+    with agent_action_required instead of doing headless AI work.
     """
-    return _backend_tool_call(CLI.run_parse_prd, prd_path, num_tasks, tag=tag or None)
+    return _run_or_submit(
+        wait, "parse_prd", _backend_tool_call,
+        CLI.run_parse_prd, prd_path, num_tasks, tag=tag or None,
+    )
 
 
 @mcp.tool()
@@ -243,13 +276,17 @@ def expand_tasks(
     task_ids: list | None = None,
     research: bool = True,
     tag: str = "",
+    wait: bool = False,
 ) -> dict:
     """Expand selected or all pending tasks through the resolved backend.
 
-    When the resolved native backend's ai_ops is "agent", this can return ok=false with
+    Returns {job_id} at once; job_status reports packets done/total and each
+    finished packet as a partial result (wait=true blocks). When the resolved
+    native backend's ai_ops is "agent", the result can be ok=false with
     agent_action_required instead of doing headless AI work.
     """
-    return _backend_tool_call(
+    return _run_or_submit(
+        wait, "expand_tasks", _backend_tool_call,
         CLI.run_expand,
         task_ids=task_ids,
         research=research,
@@ -258,13 +295,37 @@ def expand_tasks(
 
 
 @mcp.tool()
-def rate_tasks(tag: str = "", research: bool = True) -> dict:
+def rate_tasks(tag: str = "", research: bool = True, wait: bool = False) -> dict:
     """Rate task complexity through the resolved backend.
 
-    When the resolved native backend's ai_ops is "agent", this can return ok=false with
-    agent_action_required instead of doing headless AI work.
+    Returns {job_id} at once; poll job_status for the result (wait=true blocks).
+    When the resolved native backend's ai_ops is "agent", the result can be ok=false
+    with agent_action_required instead of doing headless AI work.
     """
-    return _backend_tool_call(CLI.run_rate, tag=tag or None, research=research)
+    return _run_or_submit(
+        wait, "rate_tasks", _backend_tool_call,
+        CLI.run_rate, tag=tag or None, research=research,
+    )
+
+
+@mcp.tool()
+def job_status(job_id: str) -> dict:
+    """Status of a background job: queued/running/succeeded/failed/cancelled/interrupted,
+    progress {done, total}, partial results so far, and the final result once done.
+    Works for jobs started before a server restart (results are persisted)."""
+    return _job_manager().status(job_id)
+
+
+@mcp.tool()
+def job_cancel(job_id: str) -> dict:
+    """Ask a background job to stop. Work already in flight finishes; queued work is dropped."""
+    return _job_manager().cancel(job_id)
+
+
+@mcp.tool()
+def job_list() -> dict:
+    """List background jobs persisted in .atlas-ai/jobs (newest last)."""
+    return _job_manager().list()
 
 
 @mcp.tool()
@@ -3,17 +3,24 @@
 from __future__ import annotations
 
 import json
+import math
 import tempfile
+import threading
 import time
 import warnings
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Protocol
 
 import prd_taskmaster
-from prd_taskmaster import cli_agent, fleet, llm_client, parallel
-from prd_taskmaster.economy import append_telemetry, economy_profile, shift_tier
+from prd_taskmaster import budget, cli_agent, fleet, jobs, llm_client, parallel
+from prd_taskmaster.economy import (
+    append_telemetry,
+    economy_profile,
+    op_class_latency,
+    shift_tier,
+)
 from prd_taskmaster.provider_resolver import resolve_provider
 from prd_taskmaster.lib import CommandError, now_iso
 from prd_taskmaster.validation import run_validate_tasks
@@ -94,6 +101,31 @@ Rules: return one JSON object for the packet task; complexityScore must be 1-10;
 recommendedSubtasks should be 3-7; subtasks must be TDD-ordered checkpoints."""
 
 
+BATCH_RESULT_SCHEMA_HINT = """{
+  "results": {
+    "<task id>": {
+      "id": "<task id>",
+      "complexityScore": 1,
+      "recommendedSubtasks": 3,
+      "reasoning": "Why this score and decomposition fit the task.",
+      "researchNotes": "Concise research findings or empty string.",
+      "subtasks": [
+        {
+          "title": "Concrete checkpoint",
+          "description": "Verifiable subtask outcome",
+          "details": "Implementation and verification notes.",
+          "dependencies": []
+        }
+      ]
+    }
+  }
+}
+
+Rules: "results" has exactly one key per task id in the request, each mapping to
+that task's result object; complexityScore must be 1-10; recommendedSubtasks
+should be 3-7; subtasks must be TDD-ordered checkpoints."""
+
+
 COMPLEXITY_REPORT_SCHEMA_HINT = """{
   "complexityAnalysis": [
     {
@@ -201,6 +233,9 @@ def _load_existing_tagged() -> dict:
 
 def _write_tasks_into_tag(tasks: list[dict], tag: str | None) -> str:
     resolved = parallel.current_tag(tag)
+    if parallel.read_tag_manifest(parallel.TASKS) is not None:
+        parallel.store_tag_shard(resolved, {"tasks": tasks})
+        return resolved
     raw = _load_existing_tagged()
     raw[resolved] = {"tasks": tasks}
     parallel.TASKS.parent.mkdir(parents=True, exist_ok=True)
@@ -300,6 +335,114 @@ def _report_candidates(tag: str | None) -> list[Path]:
     return paths
 
 
+def _keyed_batch_results(candidate: Any) -> dict:
+    """{str(task id): result} from a batch reply; tolerates a bare id-keyed map or a list."""
+    if isinstance(candidate, dict):
+        results = candidate.get("results", candidate)
+    else:
+        results = candidate
+    if isinstance(results, list):
+        return {
+            str(item["id"]): item
+            for item in results
+            if isinstance(item, dict) and item.get("id") is not None
+        }
+    if isinstance(results, dict):
+        return {str(key): value for key, value in results.items()}
+    return {}
+
+
+# ─── Hedged requests ──────────────────────────────────────────────────────────
+# One slow response (up to per_call_timeout_s) holds back a whole expand wave.
+# With engine.hedge.enabled, a call still running past the op class's observed
+# p95 wall time gets a duplicate on the next eligible provider or tier; the
+# first valid result wins and the loser is cancelled (a CLI spawn is killed; an
+# HTTP call cannot be interrupted, so its reply is discarded). The budget caps
+# duplicates at budget_fraction of the run's calls.
+
+class _Hedge:
+    def __init__(self, delay_s: float, handle: Any, tier: str, budget: int) -> None:
+        self.delay_s = delay_s
+        self.handle = handle
+        self.tier = tier
+        self.budget = budget
+        self.fired = 0
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self._lock:
+            if self.fired >= self.budget:
+                return False
+            self.fired += 1
+            return True
+
+
+def _hedge_plan(handle: Any, profile: dict, config: dict | None, calls: int) -> _Hedge | None:
+    """The run's hedge (delay, alternate, budget), or None when hedging is off or blind."""
+    settings = fleet.engine_config(config)["hedge"]
+    budget = math.ceil(settings["budget_fraction"] * calls)
+    if not settings["enabled"] or budget < 1:
+        return None
+    p95_ms, samples = op_class_latency("structured_gen")
+    if p95_ms is None or samples < settings["min_samples"]:
+        return None
+    start_tier = profile.get("structured_gen_start", "standard")
+    alternate = resolve_provider("fallback", fleet_config=config)
+    same = (alternate.kind, alternate.provider, alternate.model) == (
+        handle.kind, handle.provider, handle.model)
+    if alternate.kind == "plan" or same:
+        # No distinct fallback provider: duplicate on the primary, one tier up for api.
+        alternate = handle
+        ceiling = profile.get("escalation", {}).get("ceiling")
+        tier = shift_tier(start_tier, 1, ceiling=ceiling) if handle.kind == "api" else start_tier
+    else:
+        tier = start_tier
+    delay_s = max(p95_ms, settings["min_delay_ms"]) / 1000
+    return _Hedge(delay_s, alternate, tier, budget)
+
+
+def _hedged_call(primary, duplicate, hedge: _Hedge) -> tuple[Any, bool]:
+    """Run ``primary(cancel)``; past ``hedge.delay_s`` also run ``duplicate(cancel)``.
+
+    Returns (first dict result, whether the duplicate produced it). When no
+    attempt yields one, the primary's own outcome is raised or returned.
+    """
+    cancels = (threading.Event(), threading.Event())
+    pool = ThreadPoolExecutor(max_workers=2)
+    try:
+        futures = {pool.submit(primary, cancels[0]): 0}
+        done, _ = wait(futures, timeout=hedge.delay_s)
+        if not done and hedge.take():
+            futures[pool.submit(duplicate, cancels[1])] = 1
+        failures: dict[int, Any] = {}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                which = futures[future]
+                try:
+                    result = future.result()
+                except Exception as exc:  # noqa: BLE001 — the other attempt may still win
+                    failures[which] = exc
+                    continue
+                if isinstance(result, dict):
+                    return result, which == 1
+                failures[which] = result  # not an object: the caller reports it
+        if isinstance(failures[0], BaseException):
+            raise failures[0]
+        return failures[0], False
+    finally:
+        for cancel in cancels:
+            cancel.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _mark_hedged(outcome: dict, hedged: bool) -> dict:
+    if hedged:
+        outcome["hedged"] = True
+    return outcome
+
+
 def _cli_timeout(config: dict | None = None) -> int:
     return int(fleet.engine_config(config)["cli_agent"]["per_call_timeout_s"])
 
@@ -348,6 +491,7 @@ class NativeBackend(Backend):
             "created": created,
         }
 
+    @budget.scoped
     def parse_prd(self, prd_path, num_tasks, tag=None) -> dict:
         handle = resolve_provider("main")
         if handle.kind == "plan":
@@ -448,6 +592,7 @@ class NativeBackend(Backend):
             result["telemetry_ref"] = telemetry_ref
         return result
 
+    @budget.scoped
     def expand(self, task_ids=None, research=True, tag=None) -> dict:
         try:
             resolved, pending = _pending_tasks(tag, task_ids)
@@ -470,15 +615,31 @@ class NativeBackend(Backend):
         config = fleet.load_fleet_config()
         profile = economy_profile(config)
         workers = _native_concurrency(len(packets), config, profile)
+        batching = fleet.engine_config(config)["expand_batch"]
+        batches = parallel.batch_packets(
+            packets,
+            token_budget=batching["token_budget"],
+            max_tasks=batching["max_tasks"],
+            min_batches=workers,
+        )
+        hedge = _hedge_plan(handle, profile, config, calls=len(packets))
         outcomes = []
 
-        with ThreadPoolExecutor(max_workers=workers) as executor:
+        with ThreadPoolExecutor(max_workers=min(workers, len(batches))) as executor:
             futures = [
-                executor.submit(self._expand_packet, packet, profile, research, handle, config)
-                for packet in packets
+                executor.submit(self._expand_batch, batch, profile, research, handle, config, hedge)
+                for batch in batches
             ]
+            jobs.report_progress(0, len(packets))
             for future in as_completed(futures):
-                outcomes.append(future.result())
+                done = future.result()
+                outcomes.extend(done)
+                jobs.report_progress(len(outcomes), len(packets), partial=done[-1])
+                if jobs.cancel_requested():
+                    # Batches already in flight finish; queued ones never start.
+                    for pending in futures:
+                        pending.cancel()
+                    raise jobs.JobCancelled()
 
         outcomes.sort(key=lambda item: str(item.get("task_id")))
         results = [item["result"] for item in outcomes if item.get("ok")]
@@ -505,12 +666,14 @@ class NativeBackend(Backend):
             "ok": bool(applied.get("ok")) and not failed,
             "failed": failed,
             "results": outcomes,
+            "hedges": hedge.fired if hedge else 0,
             "backend": "native",
             "ai": handle.kind,
         }
 
     def _expand_packet(
-        self, packet: dict, profile: dict, research: bool, handle: Any, config: dict | None = None
+        self, packet: dict, profile: dict, research: bool, handle: Any,
+        config: dict | None = None, hedge: "_Hedge | None" = None,
     ) -> dict:
         task_id = packet.get("id")
         start_tier = profile.get("structured_gen_start", "standard")
@@ -522,20 +685,42 @@ class NativeBackend(Backend):
             "one strict JSON result object for parallel.apply_results."
         )
 
-        if handle.kind == "cli":
-            try:
-                result = cli_agent.generate_json_via_cli(
-                    handle.provider,
+        def generate(target: Any, tier: str, cancel=None) -> Any:
+            if target.kind == "cli":
+                return cli_agent.generate_json_via_cli(
+                    target.provider,
                     prompt,
                     system=system,
                     schema_hint=PARALLEL_RESULT_SCHEMA_HINT,
-                    model=handle.model,
+                    model=target.model,
                     op_class="structured_gen",
                     task_id=task_id,
                     timeout=_cli_timeout(config),
                     structured_json=_cli_structured_mode(config),
+                    cancel=cancel,
                 )
-            except cli_agent.CliAgentError as exc:
+            return llm_client.generate_json(
+                prompt,
+                system=system,
+                schema_hint=PARALLEL_RESULT_SCHEMA_HINT,
+                tier=tier,
+                op_class="structured_gen",
+                task_id=task_id,
+            )
+
+        def first_call() -> tuple[Any, bool]:
+            if hedge is None:
+                return generate(handle, start_tier), False
+            return _hedged_call(
+                lambda cancel: generate(handle, start_tier, cancel),
+                lambda cancel: generate(hedge.handle, hedge.tier, cancel),
+                hedge,
+            )
+
+        if handle.kind == "cli":
+            try:
+                result, hedged = first_call()
+            except (cli_agent.CliAgentError, llm_client.LLMError) as exc:
                 return {
                     "ok": False,
                     "task_id": task_id,
@@ -543,18 +728,13 @@ class NativeBackend(Backend):
                     "kind": exc.kind,
                     "escalated": False,
                 }
-            return self._packet_success(packet, result, escalated=False)
+            return _mark_hedged(self._packet_success(packet, result, escalated=False), hedged)
 
         try:
-            result = llm_client.generate_json(
-                prompt,
-                system=system,
-                schema_hint=PARALLEL_RESULT_SCHEMA_HINT,
-                tier=start_tier,
-                op_class="structured_gen",
-                task_id=task_id,
-            )
-            return self._packet_success(packet, result, escalated=False)
+            # _hedged_call re-raises the primary's own error, so an api
+            # primary only ever surfaces LLMError here.
+            result, hedged = first_call()
+            return _mark_hedged(self._packet_success(packet, result, escalated=False), hedged)
         except llm_client.LLMError as exc:
             if exc.kind != "invalid_json":
                 return {
@@ -614,6 +794,61 @@ class NativeBackend(Backend):
                 row["kind"] = error.kind
             append_telemetry(row)
 
+    def _expand_batch(
+        self, batch: list, profile: dict, research: bool, handle: Any,
+        config: dict | None = None, hedge: "_Hedge | None" = None,
+    ) -> list:
+        """Expand several packets in one request; re-queue only what comes back missing.
+
+        A batch of one is the plain per-packet path. Otherwise a single call
+        asks for results keyed by task id; every packet whose entry is absent
+        or malformed — or all of them, if the call itself fails — is retried
+        on its own through ``_expand_packet`` (which escalates as usual).
+        """
+        if len(batch) == 1:
+            return [self._expand_packet(batch[0], profile, research, handle, config, hedge)]
+        prompt = parallel.batch_prompt(batch)
+        if not research:
+            prompt += "\n\nDo not perform external research; decompose structurally from the task text."
+        system = (
+            "You are the prd-taskmaster native backend expansion engine. Return "
+            "one strict JSON object mapping each task id to its result object."
+        )
+        try:
+            if handle.kind == "cli":
+                candidate = cli_agent.generate_json_via_cli(
+                    handle.provider,
+                    prompt,
+                    system=system,
+                    schema_hint=BATCH_RESULT_SCHEMA_HINT,
+                    model=handle.model,
+                    op_class="structured_gen",
+                    timeout=_cli_timeout(config),
+                    structured_json=_cli_structured_mode(config),
+                )
+            else:
+                candidate = llm_client.generate_json(
+                    prompt,
+                    system=system,
+                    schema_hint=BATCH_RESULT_SCHEMA_HINT,
+                    tier=profile.get("structured_gen_start", "standard"),
+                    op_class="structured_gen",
+                )
+        except (cli_agent.CliAgentError, llm_client.LLMError):
+            candidate = None
+
+        keyed = _keyed_batch_results(candidate)
+        outcomes = []
+        for packet in batch:
+            result = keyed.get(str(packet.get("id")))
+            if isinstance(result, dict):
+                result["id"] = packet.get("id")
+                outcomes.append({**self._packet_success(packet, result, escalated=False),
+                                 "batch_size": len(batch)})
+            else:
+                outcomes.append(self._expand_packet(packet, profile, research, handle, config, hedge))
+        return outcomes
+
     @staticmethod
     def _packet_success(packet: dict, result: Any, escalated: bool) -> dict:
         task_id = packet.get("id")
@@ -633,6 +868,7 @@ class NativeBackend(Backend):
             "escalated": escalated,
         }
 
+    @budget.scoped
     def rate(self, tag=None, research=True) -> dict:
         try:
             resolved, tasks = _load_tasks(tag)
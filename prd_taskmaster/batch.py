@@ -8,10 +8,16 @@ whole phase and return a human-presentable summary.
 
 import json
 
-from prd_taskmaster import fleet
+from prd_taskmaster import fleet, jobs
 from prd_taskmaster.backend import NativeBackend, get_backend
 from prd_taskmaster.capabilities import run_detect_capabilities
-from prd_taskmaster.lib import CommandError, _detect_taskmaster_method, emit, fail
+from prd_taskmaster.lib import (
+    CommandError,
+    _detect_taskmaster_cached,
+    clear_detection_cache,
+    emit,
+    fail,
+)
 from prd_taskmaster.preflight import run_detect_taskmaster, run_preflight
 from prd_taskmaster.providers import run_configure_providers, run_detect_providers
 
@@ -42,7 +48,7 @@ def _backend_block() -> dict:
     # presence probe (via the surviving _detect_taskmaster_method), never a
     # selectable backend — so engine-preflight stays honest about the optional
     # binary without depending on the deleted TaskMasterBackend class.
-    tm_detected = _detect_taskmaster_method()
+    tm_detected = _detect_taskmaster_cached()
     tm_available = tm_detected.get("method") in ("cli", "mcp")
     native_detect = NativeBackend().detect()
     return {
@@ -72,17 +78,25 @@ def _backend_summary(block: dict) -> str:
     return "Backend: native (agent-driven)"
 
 
-def run_engine_preflight(configure: bool = True) -> dict:
+def run_engine_preflight(configure: bool = True, refresh: bool = False) -> dict:
     """Run every Phase-1 probe in one call.
 
     Read-only on a bare directory: provider configuration is attempted only
     when a TaskMaster project already exists (configure_providers refuses
     otherwise, and we swallow that refusal into the summary rather than
     failing the batch).
+
+    TaskMaster and capability detection come from the fingerprinted
+    detection cache; refresh=True drops it first.
     """
+    if refresh:
+        clear_detection_cache()
+    steps = 5
     preflight = run_preflight()
+    jobs.report_progress(1, steps)
     taskmaster = run_detect_taskmaster()
     backend = _backend_block()
+    jobs.report_progress(2, steps)
 
     # When the caller asks to configure (the default), always return a structured
     # result — never a silent null. On a fresh project there is no .taskmaster
@@ -107,8 +121,11 @@ def run_engine_preflight(configure: bool = True) -> dict:
                 ),
             }
 
+    jobs.report_progress(3, steps)
     providers = run_detect_providers()
+    jobs.report_progress(4, steps)
     capabilities = run_detect_capabilities()
+    jobs.report_progress(5, steps)
 
     summary = []
     tm_state = taskmaster.get("method", "none")
@@ -158,6 +175,9 @@ def run_engine_preflight(configure: bool = True) -> dict:
 
 def cmd_engine_preflight(args) -> None:
     try:
-        emit(run_engine_preflight(configure=not getattr(args, "no_configure", False)))
+        emit(run_engine_preflight(
+            configure=not getattr(args, "no_configure", False),
+            refresh=getattr(args, "refresh", False),
+        ))
     except CommandError as e:
         fail(e.message, **e.extra)
@@ -0,0 +1,325 @@
+"""Pre-call cost and latency admission control for paid API calls.
+
+The economy presets only pick tiers; nothing used to stop a big expand from
+running past a dollar or wall-clock budget — overruns showed up afterwards in
+``economy-report``. ``BudgetManager.admit`` runs before every
+``llm_client.generate_json`` HTTP attempt:
+
+  1. estimate the call — input tokens from the prompt size, output tokens from
+     telemetry priors for (op class, model) — priced at ``PRICES_PER_MTOK``;
+  2. admit it when the estimate fits the run and op-class budgets (the estimate
+     is reserved until the call settles);
+  3. otherwise downgrade to the cheapest-fitting lower tier;
+  4. otherwise defer: wait up to ``defer_timeout_s`` for in-flight calls to
+     settle and release their reservations, then re-check;
+  5. otherwise reject with ``BudgetExceeded``.
+
+``Ticket.settle`` replaces the reservation with the call's actual cost and
+feeds the actual token counts back into the estimator, so later estimates in
+the run track reality. Unpriced models are admitted unmetered.
+
+Limits come from the ``budget`` block of fleet.json (see ``fleet.budget_config``);
+with no limits set every call is admitted at its requested tier. A run is one
+``run_scope`` (entered by the native backend operations) or, outside any scope,
+the process.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import threading
+import time
+from typing import Any, Callable
+
+from prd_taskmaster.economy import (
+    TIER_ORDER,
+    call_priors,
+    estimate_call_cost,
+)
+
+CHARS_PER_TOKEN = 4
+DEFAULT_TOKENS_OUT = 1500
+_EWMA_WEIGHT = 0.3
+
+
+class BudgetExceeded(Exception):
+    """A call could not be admitted within the run or op-class budget."""
+
+    def __init__(self, message: str, **extra: Any) -> None:
+        super().__init__(message)
+        self.extra = extra
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, -(-len(text) // CHARS_PER_TOKEN))
+
+
+class Ticket:
+    """One admitted call; ``settle`` exactly once when it finishes."""
+
+    def __init__(self, manager: "BudgetManager | None", op_class: str, tier: str | None,
+                 model: str, prompt_tokens: int, est_usd: float | None, action: str) -> None:
+        self.manager = manager
+        self.op_class = op_class
+        self.tier = tier
+        self.model = model
+        self.prompt_tokens = prompt_tokens
+        self.est_usd = est_usd
+        self.action = action
+        self._settled = False
+
+    def settle(self, usage: dict | None = None, *, charged: bool = True) -> None:
+        """Record the outcome: *usage* ``{"tokens_in", "tokens_out"}`` when known.
+
+        ``charged=False`` (a refused HTTP attempt) releases the reservation at
+        no cost; a charged call without usage keeps its estimate as the cost.
+        """
+        if self._settled:
+            return
+        self._settled = True
+        if self.manager is not None:
+            self.manager._settle(self, usage, charged)
+
+
+class BudgetManager:
+    def __init__(self, settings: dict, *, priors: dict | None = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.settings = settings
+        self.clock = clock
+        self.started = clock()
+        self._priors = priors
+        self._cond = threading.Condition()
+        self.spent_usd = 0.0
+        self.reserved_usd = 0.0
+        self.op_spent: dict[str, float] = {}
+        self.op_reserved: dict[str, float] = {}
+        self.inflight = 0
+        self.decisions = {"admit": 0, "downgrade": 0, "defer": 0, "reject": 0}
+        self._tokens_out: dict[tuple, float] = {}
+        self._input_ratio: dict[str, float] = {}
+
+    @property
+    def limited(self) -> bool:
+        s = self.settings
+        return bool(s.get("run_usd") or s.get("op_class_usd") or s.get("run_wall_s"))
+
+    # ─── Estimation ───────────────────────────────────────────────────────────
+
+    def _prior(self, op_class: str, model: str) -> dict:
+        if self._priors is None:
+            try:
+                self._priors = call_priors()
+            except OSError:
+                self._priors = {}
+        return self._priors.get((op_class, model)) or {}
+
+    def estimate(self, op_class: str, model: str, prompt_tokens: int,
+                 max_tokens: int | None = None) -> float | None:
+        """Estimated USD for one call, or None when the model is unpriced."""
+        with self._cond:
+            ratio = self._input_ratio.get(op_class, 1.0)
+            out = self._tokens_out.get((op_class, model))
+        tokens_in = max(1, int(prompt_tokens * ratio))
+        if out is None:
+            out = self._prior(op_class, model).get("tokens_out") or DEFAULT_TOKENS_OUT
+        if max_tokens:
+            out = min(out, max_tokens)
+        return estimate_call_cost(model, tokens_in, int(out))
+
+    # ─── Admission ────────────────────────────────────────────────────────────
+
+    def _fits(self, op_class: str, est: float | None) -> bool:
+        if est is None:
+            return True
+        run_limit = self.settings.get("run_usd")
+        if run_limit and self.spent_usd + self.reserved_usd + est > run_limit:
+            return False
+        op_limit = (self.settings.get("op_class_usd") or {}).get(op_class)
+        if op_limit and (self.op_spent.get(op_class, 0.0)
+                         + self.op_reserved.get(op_class, 0.0) + est > op_limit):
+            return False
+        return True
+
+    def _too_slow(self, op_class: str, model: str) -> bool:
+        """True when the model's typical latency overruns the run's remaining wall time."""
+        limit = self.settings.get("run_wall_s")
+        if not limit:
+            return False
+        p50_ms = self._prior(op_class, model).get("p50_wall_ms")
+        remaining = limit - (self.clock() - self.started)
+        return bool(p50_ms) and p50_ms / 1000 > remaining
+
+    def admit(self, op_class: str, candidates: list, prompt: str,
+              max_tokens: int | None = None) -> Ticket:
+        """Admit one call. *candidates* is ``[(tier, model), ...]``, requested first
+        and then cheaper fallbacks; the returned ticket names the one chosen."""
+        tier, model = candidates[0]
+        prompt_tokens = estimate_tokens(prompt)
+        if not self.limited:
+            est = self.estimate(op_class, model, prompt_tokens, max_tokens)
+            with self._cond:
+                return self._reserve_locked(op_class, tier, model, prompt_tokens, est, "admit")
+
+        wall_limit = self.settings.get("run_wall_s")
+        if wall_limit and self.clock() - self.started >= wall_limit:
+            self._count("reject")
+            raise BudgetExceeded(
+                f"run wall-clock budget of {wall_limit}s exhausted",
+                op_class=op_class, limit="run_wall_s",
+            )
+
+        deadline = self.clock() + float(self.settings.get("defer_timeout_s") or 0)
+        deferred = False
+        # (tier, model, est_usd, too slow?) — the cheapest candidate is never
+        # skipped for latency; it is the last resort either way.
+        options = [
+            (t, m, self.estimate(op_class, m, prompt_tokens, max_tokens),
+             self._too_slow(op_class, m) and index < len(candidates) - 1)
+            for index, (t, m) in enumerate(candidates)
+        ]
+        with self._cond:
+            while True:
+                for index, (t, m, est, slow) in enumerate(options):
+                    if not slow and self._fits(op_class, est):
+                        action = "admit" if index == 0 else "downgrade"
+                        if deferred:
+                            self._count_locked("defer")
+                        return self._reserve_locked(op_class, t, m, prompt_tokens, est, action)
+                remaining = deadline - self.clock()
+                if self.inflight == 0 or remaining <= 0:
+                    break
+                deferred = True
+                self._cond.wait(remaining)
+            self._count_locked("reject")
+        cheapest = options[-1][2] or 0.0
+        raise BudgetExceeded(
+            f"{op_class} call (est ${cheapest:.4f}) does not fit the remaining budget",
+            op_class=op_class, est_usd=cheapest, spent_usd=self.spent_usd,
+            reserved_usd=self.reserved_usd,
+        )
+
+    def _count(self, action: str) -> None:
+        with self._cond:
+            self._count_locked(action)
+
+    def _count_locked(self, action: str) -> None:
+        self.decisions[action] += 1
+
+    def _reserve_locked(self, op_class, tier, model, prompt_tokens, est, action) -> Ticket:
+        self._count_locked(action)
+        if est is not None:
+            self.reserved_usd += est
+            self.op_reserved[op_class] = self.op_reserved.get(op_class, 0.0) + est
+        self.inflight += 1
+        return Ticket(self, op_class, tier, model, prompt_tokens, est, action)
+
+    # ─── Reconciliation ───────────────────────────────────────────────────────
+
+    def _settle(self, ticket: Ticket, usage: dict | None, charged: bool) -> None:
+        tokens_in = tokens_out = None
+        if isinstance(usage, dict):
+            tokens_in, tokens_out = usage.get("tokens_in"), usage.get("tokens_out")
+        actual = None
+        if isinstance(tokens_in, int) and isinstance(tokens_out, int):
+            actual = estimate_call_cost(ticket.model, tokens_in, tokens_out)
+        elif charged:
+            actual = ticket.est_usd
+        with self._cond:
+            if ticket.est_usd is not None:
+                self.reserved_usd = max(0.0, self.reserved_usd - ticket.est_usd)
+                op_reserved = self.op_reserved.get(ticket.op_class, 0.0) - ticket.est_usd
+                self.op_reserved[ticket.op_class] = max(0.0, op_reserved)
+            if actual:
+                self.spent_usd += actual
+                self.op_spent[ticket.op_class] = self.op_spent.get(ticket.op_class, 0.0) + actual
+            if isinstance(tokens_in, int) and isinstance(tokens_out, int):
+                key = (ticket.op_class, ticket.model)
+                previous = self._tokens_out.get(key)
+                self._tokens_out[key] = (tokens_out if previous is None else
+                                         previous + _EWMA_WEIGHT * (tokens_out - previous))
+                observed = tokens_in / max(1, ticket.prompt_tokens)
+                ratio = self._input_ratio.get(ticket.op_class, 1.0)
+                self._input_ratio[ticket.op_class] = ratio + _EWMA_WEIGHT * (observed - ratio)
+            self.inflight = max(0, self.inflight - 1)
+            self._cond.notify_all()
+
+    def summary(self) -> dict:
+        with self._cond:
+            return {
+                "spent_usd": self.spent_usd,
+                "reserved_usd": self.reserved_usd,
+                "inflight": self.inflight,
+                "elapsed_s": self.clock() - self.started,
+                "decisions": dict(self.decisions),
+                "limits": {key: self.settings.get(key)
+                           for key in ("run_usd", "op_class_usd", "run_wall_s")},
+            }
+
+
+# ─── Run scope ────────────────────────────────────────────────────────────────
+# Worker threads must see the run's manager, so the active one is a process
+# global rather than a context variable. Concurrent operations that start while
+# a run is active join it and share its budget.
+
+_LOCK = threading.Lock()
+_ACTIVE: BudgetManager | None = None
+_DEPTH = 0
+_PROCESS: BudgetManager | None = None
+
+
+def _load_settings() -> dict:
+    from prd_taskmaster.fleet import load_fleet_config
+
+    return load_fleet_config()["budget"]
+
+
+def current() -> BudgetManager:
+    """The active run's manager, else one process-wide manager."""
+    global _PROCESS
+    with _LOCK:
+        if _ACTIVE is not None:
+            return _ACTIVE
+        if _PROCESS is None:
+            _PROCESS = BudgetManager(_load_settings())
+        return _PROCESS
+
+
+@contextlib.contextmanager
+def run_scope(settings: dict | None = None):
+    """Give every call inside the block one shared run budget."""
+    global _ACTIVE, _DEPTH
+    with _LOCK:
+        if _ACTIVE is None:
+            _ACTIVE = BudgetManager(settings if settings is not None else _load_settings())
+        _DEPTH += 1
+        manager = _ACTIVE
+    try:
+        yield manager
+    finally:
+        with _LOCK:
+            _DEPTH -= 1
+            if _DEPTH == 0:
+                _ACTIVE = None
+
+
+def scoped(fn):
+    """Decorator: run *fn* inside ``run_scope()``."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with run_scope():
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+def reset() -> None:
+    """Drop the process-wide manager (tests; a changed fleet.json)."""
+    global _PROCESS
+    with _LOCK:
+        _PROCESS = None
+
+
+def tier_candidates(tier: str | None) -> list:
+    """*tier* then every cheaper tier, cheapest last."""
+    base = tier if tier in TIER_ORDER else "standard"
+    return list(reversed(TIER_ORDER[: TIER_ORDER.index(base) + 1]))
@@ -5,15 +5,23 @@ from pathlib import Path
 
 from prd_taskmaster.lib import (
     CommandError,
+    cached_detection,
     emit,
     fail,
-    _detect_taskmaster_method,
+    _detect_taskmaster_cached,
 )
 from prd_taskmaster.mode_recommend import ATLAS_FLEET_REASON, detect_atlas_launcher
 
 
-def run_detect_capabilities() -> dict:
-    """Scan for available skills, tools, and plugins that enable execution modes."""
+def run_detect_capabilities(refresh: bool = False) -> dict:
+    """Scan for available skills, tools, and plugins that enable execution modes.
+
+    Cached per environment fingerprint; refresh=True forces re-detection.
+    """
+    return cached_detection("capabilities-cli", _detect_capabilities, refresh=refresh)
+
+
+def _detect_capabilities() -> dict:
     capabilities = {}
 
     # Check superpowers plugin
@@ -30,7 +38,7 @@ def run_detect_capabilities() -> dict:
         capabilities[skill_name] = skill_path.is_file()
 
     # Check TaskMaster
-    tm = _detect_taskmaster_method()
+    tm = _detect_taskmaster_cached()
     capabilities["taskmaster-mcp"] = tm["method"] == "mcp"
     capabilities["taskmaster-cli"] = tm["method"] in ("mcp", "cli")
 
@@ -69,6 +77,6 @@ def run_detect_capabilities() -> dict:
 
 def cmd_detect_capabilities(args: argparse.Namespace) -> None:
     try:
-        emit(run_detect_capabilities())
+        emit(run_detect_capabilities(refresh=getattr(args, "refresh", False)))
     except CommandError as e:
         fail(e.message, **e.extra)
@@ -23,8 +23,9 @@ from prd_taskmaster.batch import cmd_engine_preflight
 from prd_taskmaster.economy import cmd_economy_report
 from prd_taskmaster.feedback import HARNESS_CHOICES, cmd_feedback_add, cmd_feedback_report
 from prd_taskmaster.context_pack import build_context_pack
-from prd_taskmaster import fleet, parallel, task_state
-from prd_taskmaster.lib import _detect_taskmaster_method
+from prd_taskmaster import daemon, fleet, fleet_sim, parallel, task_state
+from prd_taskmaster.lib import _detect_taskmaster_cached
+from prd_taskmaster.locks import cmd_lock_report
 from prd_taskmaster.reachability_cmd import cmd_reachability_sweep
 from prd_taskmaster.tournament.cmd import (
     cmd_tournament_run,
@@ -60,7 +61,7 @@ def _taskmaster_file_format_detect() -> dict:
     generator — but `.taskmaster/` file-format detection survives, so we still
     surface whether the binary exists for diagnostic transparency.
     """
-    detected = _detect_taskmaster_method()
+    detected = _detect_taskmaster_cached()
     available = detected.get("method") in ("cli", "mcp")
     return {
         "available": available,
@@ -180,9 +181,11 @@ def build_parser() -> argparse.ArgumentParser:
         "--no-configure", action="store_true",
         help="Skip auto-configuring providers; read-only probe (default configures providers on an existing .taskmaster project)",
     )
+    p.add_argument("--refresh", action="store_true", help="Ignore the cached detection and re-detect")
 
     # detect-taskmaster
-    sub.add_parser("detect-taskmaster", help="Find MCP or CLI taskmaster")
+    p = sub.add_parser("detect-taskmaster", help="Find MCP or CLI taskmaster")
+    p.add_argument("--refresh", action="store_true", help="Ignore the cached detection and re-detect")
 
     # backend-detect
     sub.add_parser("backend-detect", help="Detect resolved backend and both backend capabilities")
@@ -214,7 +217,8 @@ def build_parser() -> argparse.ArgumentParser:
     sub.add_parser("detect-providers", help="Auto-detect AI providers")
 
     # detect-capabilities
-    sub.add_parser("detect-capabilities", help="Scan for available skills and tools")
+    p = sub.add_parser("detect-capabilities", help="Scan for available skills and tools")
+    p.add_argument("--refresh", action="store_true", help="Ignore the cached detection and re-detect")
 
     # setup — guided provider/setup wizard (better than task-master models --setup)
     p = sub.add_parser("setup", help="Guided provider setup wizard (detect, recommend, validate)")
@@ -330,10 +334,25 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--tag")
     p.add_argument("--input", required=True)
 
+    # tasks-shard / tasks-unshard / tasks-export (per-tag task storage)
+    sub.add_parser("tasks-shard", help="Split tasks.json into per-tag shard files with a manifest")
+    sub.add_parser("tasks-unshard", help="Merge per-tag shards back into a single tasks.json")
+    p = sub.add_parser("tasks-export", help="Write the merged TaskMaster-compatible tasks.json")
+    p.add_argument("--output", default=None, help="Destination (default: .taskmaster/tasks/tasks.json)")
+
     # economy-report
     p = sub.add_parser("economy-report", help="Summarize .atlas-ai/telemetry.jsonl per (op_class, model)")
     p.add_argument("--input", default=None, help="Telemetry JSONL path (default: .atlas-ai/telemetry.jsonl)")
 
+    # lock-report
+    p = sub.add_parser("lock-report", help="Summarize lock contention logged via ATLAS_LOCK_WAIT_LOG")
+    p.add_argument("--input", default=None, help="Lock-wait JSONL path (default: $ATLAS_LOCK_WAIT_LOG)")
+
+    # daemon-serve / daemon-stop / daemon-status (optional warm local daemon)
+    sub.add_parser("daemon-serve", help="Serve hooks and CLI commands from a warm process over a Unix socket")
+    sub.add_parser("daemon-stop", help="Stop this project's daemon")
+    sub.add_parser("daemon-status", help="Report whether a daemon is serving this project")
+
     # context-pack
     p = sub.add_parser("context-pack", help="Extract AST-based Python signature context")
     p.add_argument("--files", nargs="+", required=True, help="Python files to parse")
@@ -358,6 +377,23 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--concurrency", type=int, default=3)
     p.add_argument("--tag", default="")
 
+    # fleet-simulate
+    p = sub.add_parser("fleet-simulate",
+                       help="Predict fleet makespan, cost and utilization from telemetry")
+    p.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 3, 4, 8])
+    p.add_argument("--tag", default="")
+    p.add_argument("--economy", nargs="+", default=None,
+                   help="Economy presets to compare (default: the configured one)")
+    p.add_argument("--routing", action="append", default=None,
+                   help="JSON routing table (tier -> backend:model) to compare; repeatable")
+    p.add_argument("--scheduler", choices=fleet_sim.SCHEDULERS, default="waves")
+    p.add_argument("--trials", type=int, default=20)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--calls-per-task", type=int, default=1)
+    p.add_argument("--op-class", default=None,
+                   help="Only use telemetry from this op class (default: all)")
+    p.add_argument("--telemetry", default=None, help="Telemetry JSONL (default: .atlas-ai/telemetry.jsonl)")
+
     # next-task
     p = sub.add_parser("next-task", help="Select the next TaskMaster-compatible task")
     p.add_argument("--tag", help="Tasks.json tag context to read (default: the active/master tag)")
@@ -394,12 +430,21 @@ def build_parser() -> argparse.ArgumentParser:
         "reachability-sweep",
         help="Run the reachability sweep for a task and write the verdict into its CDD card",
     )
-    p.add_argument("--task", required=True, help="Task id (e.g. 1 or 1.2)")
+    p.add_argument("--task", default=None, help="Task id (e.g. 1 or 1.2); required without --all")
     p.add_argument(
         "--start-commit",
-        required=True,
-        help="Git SHA recorded when work on this task began (git rev-parse HEAD at task start)",
+        default=None,
+        help=(
+            "Git SHA recorded when work on this task began (git rev-parse HEAD at task start). "
+            "With --all: fallback for tasks whose card records no start commit"
+        ),
+    )
+    p.add_argument(
+        "--all",
+        action="store_true",
+        help="Batch-sweep every task with --status (default: done) in one pass",
     )
+    p.add_argument("--status", default="done", help="Task status selected by --all (default: done)")
     p.add_argument(
         "--cwd",
         default=None,
@@ -421,6 +466,7 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--window", type=float, default=120.0, help="Commit-reveal window in seconds (default 120)")
     p.add_argument("--enforce-slash", action="store_true", help="Pass --enforce-slash to the settle CLI")
     p.add_argument("--task-class", default="coding", help="Reputation bucket (default: coding)")
+    p.add_argument("--inbox-dir", default=None, help="Directory racer submissions land in; watched with inotify on Linux instead of polling")
 
     # tournament-status — read reputation snapshot + active operator count
     p = sub.add_parser(
@@ -500,7 +546,11 @@ DISPATCH = {
     "parallel-apply": parallel.cmd_apply,
     "parallel-extract": parallel.cmd_extract,
     "parallel-inject": parallel.cmd_inject,
+    "tasks-shard": parallel.cmd_shard,
+    "tasks-unshard": parallel.cmd_unshard,
+    "tasks-export": parallel.cmd_export,
     "fleet-waves": fleet.cmd_fleet_waves,
+    "fleet-simulate": fleet_sim.cmd_fleet_simulate,
     "next-task": task_state.cmd_next_task,
     "claim-task": task_state.cmd_claim_task,
     "set-status": task_state.cmd_set_status,
@@ -510,6 +560,10 @@ DISPATCH = {
     "watcher-run": cmd_watcher_run,
     "watcher-status": cmd_watcher_status,
     "economy-report": cmd_economy_report,
+    "lock-report": cmd_lock_report,
+    "daemon-serve": daemon.cmd_daemon_serve,
+    "daemon-stop": daemon.cmd_daemon_stop,
+    "daemon-status": daemon.cmd_daemon_status,
     "context-pack": cmd_context_pack,
     "feedback-add": cmd_feedback_add,
     "feedback-report": cmd_feedback_report,
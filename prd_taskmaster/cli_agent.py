@@ -20,13 +20,15 @@ from prd_taskmaster.llm_client import _extract_json
 # avoid a hard import cycle and because cli_agent must run even if probe is stubbed).
 _CLI_FOR_PROVIDER = {"claude-code": "claude", "codex-cli": "codex", "gemini-cli": "gemini"}
 
+_CANCEL_POLL_S = 0.2
+
 _RETRY_INSTRUCTION = (
     "\nYour previous output failed json.loads. Return ONLY the JSON, no prose, no fences."
 )
 
 
 class CliAgentError(Exception):
-    """kind in {"no_cli", "spawn_refused", "timeout", "invalid_json", "nonzero_exit"}."""
+    """kind in {"no_cli", "spawn_refused", "timeout", "invalid_json", "nonzero_exit", "cancelled"}."""
 
     def __init__(self, kind, message):
         super().__init__(message)
@@ -110,24 +112,64 @@ def _claude_error_detail(stdout, stderr):
     return (stderr or stdout or "no detail").strip()[:400]
 
 
+class _Cancelled(Exception):
+    pass
+
+
+def _run_cancellable(argv, stdin_text, timeout, cancel):
+    """subprocess.run(capture_output=True, text=True) that kills the child once
+    *cancel* (a threading.Event) is set — how a hedged call's loser is stopped."""
+    deadline = time.monotonic() + timeout
+    with subprocess.Popen(
+        argv,
+        stdin=subprocess.PIPE if stdin_text is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    ) as proc:
+        pending_input = stdin_text
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                stdout, stderr = proc.communicate(
+                    pending_input, timeout=max(0.0, min(_CANCEL_POLL_S, remaining)),
+                )
+                break
+            except subprocess.TimeoutExpired:
+                pending_input = None  # already written; communicate() keeps its buffers
+                if cancel.is_set() or remaining <= 0:
+                    proc.kill()
+                    proc.communicate()
+                    if cancel.is_set():
+                        raise _Cancelled() from None
+                    raise subprocess.TimeoutExpired(argv, timeout) from None
+    return subprocess.CompletedProcess(argv, proc.returncode, stdout, stderr)
+
+
 def _run_once(provider, binary, prompt, *, schema_hint, structured_json,
-              model, op_class, task_id, timeout, parse_retry=False):
+              model, op_class, task_id, timeout, parse_retry=False, cancel=None):
     """Spawn the CLI once, parse stdout into JSON. Returns the parsed dict/list,
     or None on a parse failure (caller decides whether to retry). Raises
-    CliAgentError for timeout / nonzero_exit / spawn_refused. Emits exactly one
-    native-cli telemetry row for this attempt."""
+    CliAgentError for timeout / nonzero_exit / spawn_refused / cancelled. Emits
+    exactly one native-cli telemetry row for this attempt."""
     argv, stdin_text = _build_argv(
         provider, binary, prompt, schema_hint=schema_hint, structured_json=structured_json,
     )
     start = time.monotonic()
     try:
-        completed = subprocess.run(
-            argv,
-            input=stdin_text,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
+        if cancel is None:
+            completed = subprocess.run(
+                argv,
+                input=stdin_text,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        else:
+            completed = _run_cancellable(argv, stdin_text, timeout, cancel)
+    except _Cancelled:
+        _telemetry(op_class, task_id, model, 1, start, parse_retry)
+        raise CliAgentError("cancelled", f"{binary} cancelled")
     except subprocess.TimeoutExpired:
         _telemetry(op_class, task_id, model, 1, start, parse_retry)
         raise CliAgentError("timeout", f"{binary} exceeded {timeout}s timeout")
@@ -160,14 +202,15 @@ def _has_schema_flag(provider):
 
 def generate_json_via_cli(provider, prompt, *, system="", schema_hint="", model=None,
                           op_class="structured_gen", task_id=None, timeout=180,
-                          structured_json="auto"):
+                          structured_json="auto", cancel=None):
     """Structured-JSON generation by shelling out to a keyless host CLI.
 
     Mirrors llm_client.generate_json: builds the full prompt (system + schema for
     CLIs without a schema flag), spawns once, and on a parse failure respawns ONCE
     with the corrective instruction. Raises CliAgentError(kind, message) with
-    kind in {no_cli, spawn_refused, timeout, invalid_json, nonzero_exit}. One
-    telemetry row (backend=native-cli) per spawn attempt.
+    kind in {no_cli, spawn_refused, timeout, invalid_json, nonzero_exit,
+    cancelled}. One telemetry row (backend=native-cli) per spawn attempt.
+    Setting the optional *cancel* event kills an in-flight spawn.
     """
     cli = _CLI_FOR_PROVIDER.get(str(provider or "").lower())
     if not cli:
@@ -202,7 +245,7 @@ def generate_json_via_cli(provider, prompt, *, system="", schema_hint="", model=
             provider, binary, attempt_prompt,
             schema_hint=flag_schema, structured_json=structured_json,
             model=model, op_class=op_class, task_id=task_id, timeout=timeout,
-            parse_retry=parse_retry,
+            parse_retry=parse_retry, cancel=cancel,
         )
         if result is not None:
             return result
@@ -0,0 +1,330 @@
+"""Optional long-lived local daemon for hooks and CLI commands.
+
+Every hook invocation and CLI command is a fresh interpreter that re-imports
+the package and re-parses state. ``serve`` keeps one process warm per project
+and answers over a Unix domain socket (``.atlas-ai/daemon.sock``, or
+``$ATLAS_DAEMON_SOCKET``):
+
+- hook requests run the hook's ``decide(payload)`` with state files read
+  through an (mtime, size)-keyed parse cache;
+- CLI requests run the normal argparse dispatch with stdout/stderr captured
+  and the client's environment applied, one at a time. Long-running AI
+  commands never go to the daemon (``LOCAL_ONLY_COMMANDS``), and a request
+  that cannot get the CLI slot within ``CLI_QUEUE_S`` is turned away.
+
+Clients (``script.py`` and ``hooks/*.py``) call ``request``. It returns None —
+run it yourself — only when the daemon provably did not execute the request:
+nothing is listening, the connect fails, or the daemon declines it (other
+project or version, busy). Once a CLI request has been sent, a lost or late
+reply raises ``DaemonError`` instead: the command may be running, and
+re-running it in-process would duplicate its side effects. Hook decisions are
+read-only, so hooks may still fall back after a send. The daemon is never
+required — start it with ``daemon-serve`` (foreground), stop it with
+``daemon-stop``, inspect it with ``daemon-status``.
+
+This module's top level imports only the stdlib so the client path stays
+cheap; the server imports the CLI lazily.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import tempfile
+from pathlib import Path
+
+import prd_taskmaster
+
+SOCKET_ENV = "ATLAS_DAEMON_SOCKET"
+DISABLE_ENV = "ATLAS_DAEMON"  # "0" disables the client side entirely
+CLIENT_TIMEOUT_S = 0.5
+CLI_TIMEOUT_S = 600.0
+CLI_QUEUE_S = 2.0  # longest a CLI request waits for the daemon's CLI slot
+_MAX_UNIX_PATH = 100
+
+# Commands that must run in the caller's own process: daemon control,
+# interactive prompts, and long-running loops or AI calls that would hold the
+# CLI lock (and everything queued behind it) for minutes.
+LOCAL_ONLY_COMMANDS = frozenset({
+    "daemon-serve", "daemon-stop", "daemon-status",
+    "setup", "watcher-run", "tournament-run",
+    "parse-prd", "expand", "rate", "tm-parallel", "engine-preflight",
+})
+
+
+class DaemonError(Exception):
+    """A request reached the daemon but no usable reply came back.
+
+    The daemon may still be executing it, so the caller must not re-run it.
+    """
+
+HOOKS_DIR = Path(prd_taskmaster.__file__).resolve().parent.parent / "hooks"
+
+
+def socket_path(root: "str | Path | None" = None) -> Path:
+    """Socket for the project at *root* (default: cwd)."""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    root = Path(root or os.getcwd()).resolve()
+    path = root / ".atlas-ai" / "daemon.sock"
+    if len(str(path)) <= _MAX_UNIX_PATH:
+        return path
+    # AF_UNIX paths are capped at ~107 bytes; deep checkouts get a hashed name.
+    digest = hashlib.sha256(str(root).encode()).hexdigest()[:16]
+    return Path(tempfile.gettempdir()) / f"atlas-daemon-{digest}.sock"
+
+
+def request(message: dict, *, timeout: float = CLIENT_TIMEOUT_S, root=None,
+            retry_safe: bool = True) -> "dict | None":
+    """Send one request to the project's daemon; None means "run it yourself".
+
+    None is returned when the daemon cannot have executed the request. With
+    ``retry_safe=False`` a failure after the request was sent raises
+    ``DaemonError``; the default (read-only requests) falls back to None.
+    """
+    if os.environ.get(DISABLE_ENV) == "0":
+        return None
+    path = socket_path(root)
+    if not path.exists():
+        return None
+    message = {**message, "cwd": str(Path(root or os.getcwd()).resolve()),
+               "version": prd_taskmaster.__version__}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return None  # nothing listening (stale socket file): never sent
+        try:
+            sock.sendall(json.dumps(message).encode() + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            reply = json.loads(b"".join(chunks))
+        except (OSError, ValueError) as exc:
+            if retry_safe:
+                return None
+            kind = "timed out" if isinstance(exc, socket.timeout) else "failed"
+            raise DaemonError(
+                f"daemon request {kind} after it was sent ({exc}); it may still be "
+                f"running — check its effects, or stop the daemon and retry"
+            ) from exc
+    # Non-ok replies are refusals issued before anything ran.
+    if not isinstance(reply, dict) or not reply.get("ok"):
+        return None
+    return reply
+
+
+def run_hook_via_daemon(hook: str, payload: dict) -> "dict | None":
+    reply = request({"op": "hook", "hook": hook, "payload": payload})
+    return reply.get("output") if reply else None
+
+
+def run_cli_via_daemon(argv: "list[str]") -> "dict | None":
+    """{"stdout", "stderr", "exit"} from the daemon, or None to run locally.
+
+    Raises ``DaemonError`` when the command was sent but no reply arrived.
+    """
+    if not argv or argv[0] in LOCAL_ONLY_COMMANDS or argv[0].startswith("-"):
+        return None
+    return request(
+        {"op": "cli", "argv": list(argv), "env": dict(os.environ)},
+        timeout=CLI_TIMEOUT_S, retry_safe=False,
+    )
+
+
+# ─── Server ───────────────────────────────────────────────────────────────────
+
+class _ParseCache:
+    """JSON files parsed once per (mtime_ns, size, inode) — the daemon's warm state."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple] = {}
+
+    def load(self, path: "str | Path"):
+        path = Path(path)
+        st = path.stat()  # FileNotFoundError propagates like read_text() would
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._entries.get(str(path.resolve()))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        data = json.loads(path.read_text())
+        self._entries[str(path.resolve())] = (key, data)
+        return data
+
+
+def _load_hook(name: str):
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location(f"_atlas_hook_{name}", HOOKS_DIR / f"{name}.py")
+    if spec is None or spec.loader is None:
+        raise ImportError(name)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _Daemon:
+    HOOKS = ("gate_enforcer", "evidence_gate", "mode_d_blocker")
+    STATEFUL_HOOKS = frozenset({"evidence_gate"})
+
+    def __init__(self, root: Path) -> None:
+        import threading
+
+        from prd_taskmaster import cli  # warm the whole command surface once
+
+        self.root = root
+        self.version = prd_taskmaster.__version__
+        self.cli = cli
+        self.hooks = {name: _load_hook(name) for name in self.HOOKS}
+        self.cache = _ParseCache()
+        self.cli_lock = threading.Lock()
+        self.served = 0
+
+    def handle(self, message: dict) -> dict:
+        op = message.get("op")
+        if op == "ping":
+            return self._status()
+        if op == "shutdown":  # version-agnostic so an upgraded client can stop an old daemon
+            return {"ok": True, "stopping": True}
+        if message.get("version") != self.version:
+            return {"ok": False, "error": "version mismatch"}
+        if message.get("cwd") != str(self.root):
+            return {"ok": False, "error": "different project"}
+        self.served += 1
+        if op == "hook":
+            return self._run_hook(message.get("hook"), message.get("payload") or {})
+        if op == "cli":
+            return self._run_cli(message.get("argv") or [], message.get("env") or {})
+        return {"ok": False, "error": f"unknown op {op!r}"}
+
+    def _run_hook(self, name, payload: dict) -> dict:
+        hook = self.hooks.get(name)
+        if hook is None:
+            return {"ok": False, "error": f"unknown hook {name!r}"}
+        if name in self.STATEFUL_HOOKS:
+            # Explicit root: a concurrent CLI request may have chdir'd.
+            return {"ok": True, "output": hook.decide(payload, root=self.root,
+                                                      load_json=self.cache.load)}
+        return {"ok": True, "output": hook.decide(payload)}
+
+    def _status(self) -> dict:
+        return {"ok": True, "pid": os.getpid(), "root": str(self.root),
+                "version": self.version, "served": self.served}
+
+    def _run_cli(self, argv: list, env: dict) -> dict:
+        import contextlib
+        import io
+        import sys
+
+        out, err = io.StringIO(), io.StringIO()
+        # Refused before running, so the client safely runs it in-process.
+        if not self.cli_lock.acquire(timeout=CLI_QUEUE_S):
+            return {"ok": False, "error": "busy"}
+        try:
+            saved_env, saved_argv = dict(os.environ), sys.argv
+            os.environ.clear()
+            os.environ.update(env)
+            sys.argv = ["script.py", *argv]
+            code = 0
+            try:
+                with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                    try:
+                        self.cli.main()
+                    except SystemExit as exc:  # emit()/fail() always exit
+                        if exc.code is None or isinstance(exc.code, int):
+                            code = exc.code or 0
+                        else:
+                            print(exc.code, file=sys.stderr)
+                            code = 1
+                    except Exception as exc:  # noqa: BLE001 — report, keep serving
+                        print(f"{type(exc).__name__}: {exc}", file=sys.stderr)
+                        code = 1
+            finally:
+                os.environ.clear()
+                os.environ.update(saved_env)
+                sys.argv = saved_argv
+                os.chdir(self.root)  # a command may chdir (pipeline.preflight --cwd)
+        finally:
+            self.cli_lock.release()
+        return {"ok": True, "stdout": out.getvalue(), "stderr": err.getvalue(), "exit": code}
+
+
+def serve(root: "str | Path | None" = None) -> None:
+    """Serve the project at *root* until ``daemon-stop`` (blocking)."""
+    import socketserver
+    import threading
+
+    from prd_taskmaster.lib import CommandError
+
+    root = Path(root or os.getcwd()).resolve()
+    path = socket_path(root)
+    if request({"op": "ping"}, root=root) is not None:
+        raise CommandError(f"a daemon is already serving {root}", {"socket": str(path)})
+    os.chdir(root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+    daemon = _Daemon(root)
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            try:
+                message = json.loads(self.rfile.readline())
+                if not isinstance(message, dict):
+                    raise ValueError("request must be a JSON object")
+                reply = daemon.handle(message)
+            except Exception as exc:  # noqa: BLE001 — a bad request never stops the daemon
+                reply = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+            self.wfile.write(json.dumps(reply, default=str).encode())
+            if reply.get("stopping"):
+                threading.Thread(target=server.shutdown, daemon=True).start()
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    old_umask = os.umask(0o177)  # socket is 0600: same-user clients only
+    try:
+        server = Server(str(path), Handler)
+    finally:
+        os.umask(old_umask)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+
+
+# ─── CLI wrappers ─────────────────────────────────────────────────────────────
+
+def cmd_daemon_serve(args) -> None:
+    from prd_taskmaster.lib import CommandError, fail
+
+    try:
+        serve()
+    except CommandError as exc:
+        fail(exc.message, **exc.extra)
+
+
+def cmd_daemon_stop(args) -> None:
+    from prd_taskmaster.lib import emit
+
+    reply = request({"op": "shutdown"})
+    emit({"ok": True, "stopped": reply is not None})
+
+
+def cmd_daemon_status(args) -> None:
+    from prd_taskmaster.lib import emit
+
+    reply = request({"op": "ping"})
+    if reply is None:
+        emit({"ok": True, "running": False, "socket": str(socket_path())})
+        return
+    reply.pop("ok", None)
+    emit({"ok": True, "running": True, "socket": str(socket_path()), **reply})
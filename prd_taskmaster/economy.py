@@ -1,9 +1,12 @@
 """Token economy presets, telemetry, and tier helpers for Atlas Fleet routing."""
 
+import hashlib
 import json
+import os
 from pathlib import Path
 
-from prd_taskmaster.lib import locked_update
+from prd_taskmaster.lib import atomic_write, locked_append
+from prd_taskmaster.sketch import QuantileSketch
 
 TIER_ORDER = ["fast", "standard", "capable", "frontier"]
 
@@ -93,27 +96,55 @@ def economy_profile(cfg):
 # ─── Telemetry append helper ─────────────────────────────────────────────────
 
 def append_telemetry(row, path=None):
-    """Append one telemetry row to JSONL and return its stable row reference."""
+    """Append one telemetry row to JSONL and return its stable row reference.
+
+    The row goes in with ``lib.locked_append`` (O(row), never a rewrite of the
+    ledger); its 1-based ``line`` is counted afterwards, outside the lock.
+    """
     p = Path(path) if path else TELEMETRY
     line = json.dumps(row, default=str) + "\n"
-    ref = {}
-
-    def transform(current: str) -> str:
-        separator = "" if not current or current.endswith("\n") else "\n"
-        row_line = len(current.splitlines()) + 1
-        ref.update({
-            "path": str(p.resolve()),
-            "line": row_line,
-            "ts": row.get("ts"),
-            "op_class": row.get("op_class"),
-            "model": row.get("model"),
-            "backend": row.get("backend"),
-            "exit": row.get("exit"),
-        })
-        return current + separator + line
+    offset = locked_append(p, line)
+    return {
+        "path": str(p.resolve()),
+        "line": _line_number(p, offset),
+        "ts": row.get("ts"),
+        "op_class": row.get("op_class"),
+        "model": row.get("model"),
+        "backend": row.get("backend"),
+        "exit": row.get("exit"),
+    }
+
 
-    locked_update(p, transform)
-    return ref
+# Per-ledger newline counts: {resolved path: (inode, head bytes, offset, lines)}.
+# Bytes before an appended row's offset never change, so each call only scans
+# the bytes appended since the last one. Entries are replaced whole; a racing
+# thread can at worst leave an older, still valid entry.
+_LINE_COUNTS = {}
+_LINE_COUNT_CHUNK = 1 << 20
+
+
+def _line_number(p, offset):
+    """1-based line of the row that starts at byte *offset* of ledger *p*."""
+    key = str(p.resolve())
+    with open(p, "rb") as f:
+        ino = os.fstat(f.fileno()).st_ino
+        head = f.read(min(offset, _ROLLUP_HEAD_BYTES))
+        start, lines = 0, 0
+        cached = _LINE_COUNTS.get(key)
+        # A replaced (new inode) or rewritten (new head) ledger is rescanned.
+        if (cached and cached[0] == ino and cached[2] <= offset
+                and head[:len(cached[1])] == cached[1]):
+            start, lines = cached[2], cached[3]
+        f.seek(start)
+        remaining = offset - start
+        while remaining > 0:
+            chunk = f.read(min(remaining, _LINE_COUNT_CHUNK))
+            if not chunk:
+                break
+            lines += chunk.count(b"\n")
+            remaining -= len(chunk)
+    _LINE_COUNTS[key] = (ino, head, offset, lines)
+    return lines + 1
 
 
 def _token_int(value):
@@ -138,43 +169,210 @@ def _estimate_cost_usd(tokens_in, tokens_out, rates):
     return ((tokens_in * input_per_mtok) + (tokens_out * output_per_mtok)) / 1_000_000
 
 
-def _summarize_costs(rows):
-    est_cost = 0.0
-    naive_cost = 0.0
-    priced_calls = 0
-    unpriced_calls = 0
-    token_calls = 0
-    baseline_rates = PRICES_PER_MTOK[NAIVE_BASELINE_MODEL]
-
-    for row in rows:
-        tokens_in = _token_int(row.get("tokens_in"))
-        tokens_out = _token_int(row.get("tokens_out"))
-        if tokens_in is not None and tokens_out is not None:
-            token_calls += 1
-        price_key = _price_key_for_model(row.get("model"))
-        if tokens_in is None or tokens_out is None or price_key is None:
-            unpriced_calls += 1
-            continue
-
-        priced_calls += 1
-        est_cost += _estimate_cost_usd(tokens_in, tokens_out, PRICES_PER_MTOK[price_key])
-        naive_cost += _estimate_cost_usd(tokens_in, tokens_out, baseline_rates)
-
-    total = priced_calls + unpriced_calls
+def estimate_call_cost(model, tokens_in, tokens_out):
+    """USD for one call at PRICES_PER_MTOK, or None when the model is unpriced."""
+    price_key = _price_key_for_model(model)
+    if price_key is None:
+        return None
+    return _estimate_cost_usd(tokens_in, tokens_out, PRICES_PER_MTOK[price_key])
+
+
+def _row_cost(row):
+    """Per-row cost contribution: (has_tokens, est_usd, naive_usd) or None if unpriced."""
+    tokens_in = _token_int(row.get("tokens_in"))
+    tokens_out = _token_int(row.get("tokens_out"))
+    has_tokens = tokens_in is not None and tokens_out is not None
+    price_key = _price_key_for_model(row.get("model"))
+    if not has_tokens or price_key is None:
+        return has_tokens, None, None
+    return (
+        True,
+        _estimate_cost_usd(tokens_in, tokens_out, PRICES_PER_MTOK[price_key]),
+        _estimate_cost_usd(tokens_in, tokens_out, PRICES_PER_MTOK[NAIVE_BASELINE_MODEL]),
+    )
+
+
+def _empty_cost_totals():
+    return {"est_cost": 0.0, "naive_cost": 0.0, "priced_calls": 0,
+            "unpriced_calls": 0, "token_calls": 0}
+
+
+def _fold_cost(totals, row):
+    has_tokens, est, naive = _row_cost(row)
+    if has_tokens:
+        totals["token_calls"] += 1
+    if est is None:
+        totals["unpriced_calls"] += 1
+        return
+    totals["priced_calls"] += 1
+    totals["est_cost"] += est
+    totals["naive_cost"] += naive
+
+
+def _render_costs(totals):
+    priced_calls = totals["priced_calls"]
+    total = priced_calls + totals["unpriced_calls"]
     return {
         "naive_baseline_model": NAIVE_BASELINE_MODEL,
-        "est_cost_usd": est_cost,
-        "naive_cost_usd": naive_cost,
-        "est_saved_usd": naive_cost - est_cost,
+        "est_cost_usd": totals["est_cost"],
+        "naive_cost_usd": totals["naive_cost"],
+        "est_saved_usd": totals["naive_cost"] - totals["est_cost"],
         "priced_calls": priced_calls,
-        "unpriced_calls": unpriced_calls,
+        "unpriced_calls": totals["unpriced_calls"],
         # token_coverage = calls carrying token counts; priced_coverage = calls
         # whose model also matched a known price (the $ figures cover only those).
-        "token_coverage": (token_calls / total) if total else 0.0,
+        "token_coverage": (totals["token_calls"] / total) if total else 0.0,
         "priced_coverage": (priced_calls / total) if total else 0.0,
     }
 
 
+# ─── Telemetry rollup sidecar ────────────────────────────────────────────────
+# summarize_telemetry used to re-read and re-sort the whole ledger on every
+# report. The rollup keeps per-(op_class, model) counts, token/cost sums and a
+# mergeable wall-time sketch next to the ledger, plus the byte offset it has
+# folded up to; a report folds only the bytes appended since, so it costs
+# O(groups + new rows) instead of O(all rows). A ledger that shrank or whose
+# head bytes changed (rotated / rewritten) is refolded from byte 0.
+
+_ROLLUP_VERSION = 2
+_ROLLUP_HEAD_BYTES = 256
+_GROUP_SEP = "\x1f"
+
+
+def rollup_path_for(path):
+    """``.../telemetry.jsonl`` → ``.../telemetry.rollup.json``."""
+    path = Path(path)
+    return path.with_name(path.stem + ".rollup.json")
+
+
+def _empty_rollup():
+    return {
+        "version": _ROLLUP_VERSION,
+        "offset": 0,
+        "head": "",
+        "rows": 0,
+        "skipped": 0,
+        "escalations": 0,
+        "costs": _empty_cost_totals(),
+        "groups": {},
+    }
+
+
+def _load_rollup(path):
+    try:
+        data = json.loads(Path(path).read_text())
+    except (OSError, json.JSONDecodeError):
+        return _empty_rollup()
+    if not isinstance(data, dict) or data.get("version") != _ROLLUP_VERSION:
+        return _empty_rollup()
+    rollup = _empty_rollup()
+    for key in ("offset", "rows", "skipped", "escalations"):
+        if isinstance(data.get(key), int) and data[key] >= 0:
+            rollup[key] = data[key]
+    if isinstance(data.get("head"), str):
+        rollup["head"] = data["head"]
+    if isinstance(data.get("costs"), dict):
+        rollup["costs"].update(data["costs"])
+    if isinstance(data.get("groups"), dict):
+        rollup["groups"] = {
+            key: {**g, "walls": QuantileSketch.from_dict(g.get("walls"))}
+            for key, g in data["groups"].items() if isinstance(g, dict)
+        }
+    return rollup
+
+
+def _fold_row(rollup, row):
+    rollup["rows"] += 1
+    key = str(row.get("op_class", "unknown")) + _GROUP_SEP + str(row.get("model", "unknown"))
+    g = rollup["groups"].get(key)
+    if g is None:
+        g = rollup["groups"][key] = {
+            "calls": 0, "successes": 0, "tokens_in": 0, "tokens_out": 0,
+            "est_cost_usd": 0.0, "priced_calls": 0, "walls": QuantileSketch(),
+        }
+    g["calls"] += 1
+    if row.get("exit") == 0:
+        g["successes"] += 1
+    wall = row.get("wall_ms")
+    if isinstance(wall, (int, float)) and not isinstance(wall, bool):
+        g["walls"].add(wall)
+    if row.get("escalated"):
+        rollup["escalations"] += 1
+    tokens_in = _token_int(row.get("tokens_in"))
+    tokens_out = _token_int(row.get("tokens_out"))
+    if tokens_in is not None and tokens_out is not None:
+        g["tokens_in"] += tokens_in
+        g["tokens_out"] += tokens_out
+    _, est, _ = _row_cost(row)
+    if est is not None:
+        g["est_cost_usd"] += est
+        g["priced_calls"] += 1
+    _fold_cost(rollup["costs"], row)
+
+
+def _fold_lines(rollup, data):
+    for raw in data.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            rollup["skipped"] += 1
+            continue
+        if isinstance(row, dict):
+            _fold_row(rollup, row)
+        else:
+            rollup["skipped"] += 1
+
+
+def _head_digest(f, limit):
+    """Fingerprint of the ledger's first bytes (detects a rewritten ledger)."""
+    f.seek(0)
+    return hashlib.sha256(f.read(min(limit, _ROLLUP_HEAD_BYTES))).hexdigest()
+
+
+def refresh_rollup(path=None):
+    """Fold any ledger bytes past the stored offset into the sidecar; return it.
+
+    Missing ledger → empty rollup (nothing written). Sidecar write failures are
+    non-fatal: the in-memory rollup is still returned.
+    """
+    p = Path(path) if path else TELEMETRY
+    if not p.is_file():
+        return _empty_rollup()
+    sidecar = rollup_path_for(p)
+    rollup = _load_rollup(sidecar)
+    with open(p, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        offset = rollup["offset"]
+        if offset and (size < offset or _head_digest(f, offset) != rollup["head"]):
+            rollup = _empty_rollup()
+        if size == rollup["offset"]:
+            return rollup
+        f.seek(rollup["offset"])
+        data = f.read()
+        head = _head_digest(f, rollup["offset"] + len(data))
+    _fold_lines(rollup, data)
+    rollup["offset"] += len(data)
+    rollup["head"] = head
+    try:
+        atomic_write(sidecar, json.dumps(_serialize_rollup(rollup), default=str))
+    except OSError:
+        pass
+    return rollup
+
+
+def _serialize_rollup(rollup):
+    return {
+        **rollup,
+        "groups": {
+            key: {**g, "walls": g["walls"].to_dict()}
+            for key, g in rollup["groups"].items()
+        },
+    }
+
+
 # ─── T7: telemetry summary (economy-report) ──────────────────────────────────
 
 def summarize_telemetry(path=None):
@@ -182,63 +380,105 @@ def summarize_telemetry(path=None):
 
     The local-measurement loop from MODEL-ECONOMY.md: success rate and p50
     wall-time per model per op class, plus escalation count. Malformed lines
-    are skipped and counted, never fatal.
+    are skipped and counted, never fatal. Served from the rollup sidecar
+    (see ``refresh_rollup``): percentiles are exact for small groups and
+    within ``sketch.RELATIVE_ACCURACY`` once a group outgrows the exact window.
     """
-    import json
-    from pathlib import Path as _P
-
-    p = _P(path) if path else _P(".atlas-ai") / "telemetry.jsonl"
-    rows, skipped = [], 0
-    if p.is_file():
-        for line in p.read_text().splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                row = json.loads(line)
-                if isinstance(row, dict):
-                    rows.append(row)
-                else:
-                    skipped += 1
-            except json.JSONDecodeError:
-                skipped += 1
-
-    groups = {}
-    escalations = 0
-    for r in rows:
-        key = (str(r.get("op_class", "unknown")), str(r.get("model", "unknown")))
-        g = groups.setdefault(key, {"calls": 0, "successes": 0, "walls": []})
-        g["calls"] += 1
-        if r.get("exit") == 0:
-            g["successes"] += 1
-        if isinstance(r.get("wall_ms"), (int, float)):
-            g["walls"].append(r["wall_ms"])
-        if r.get("escalated"):
-            escalations += 1
+    p = Path(path) if path else TELEMETRY
+    rollup = refresh_rollup(p)
 
     out = []
-    for (op_class, model), g in sorted(groups.items()):
-        walls = sorted(g["walls"])
-        p50 = walls[len(walls) // 2] if walls else None
+    for key in sorted(rollup["groups"], key=lambda k: tuple(k.split(_GROUP_SEP, 1))):
+        op_class, _, model = key.partition(_GROUP_SEP)
+        g = rollup["groups"][key]
         out.append({
             "op_class": op_class,
             "model": model,
             "calls": g["calls"],
             "success_rate": (g["successes"] / g["calls"]) if g["calls"] else None,
-            "p50_wall_ms": p50,
+            "p50_wall_ms": g["walls"].quantile(0.5),
+            "p95_wall_ms": g["walls"].quantile(0.95),
+            "tokens_in": g["tokens_in"],
+            "tokens_out": g["tokens_out"],
+            "est_cost_usd": g["est_cost_usd"],
         })
 
     return {
         "ok": True,
-        "total_calls": len(rows),
-        "skipped_lines": skipped,
-        "escalations": escalations,
+        "total_calls": rollup["rows"],
+        "skipped_lines": rollup["skipped"],
+        "escalations": rollup["escalations"],
         "groups": out,
-        "costs": _summarize_costs(rows),
+        "costs": _render_costs(rollup["costs"]),
         "telemetry_path": str(p),
     }
 
 
+def op_class_latency(op_class, q=0.95, path=None):
+    """(*q* wall-time quantile in ms, sample count) over every model of *op_class*.
+
+    The quantile is None until the op class has telemetry. Served from the
+    rollup sidecar, so it is cheap enough to call once per run.
+    """
+    rollup = refresh_rollup(Path(path) if path else TELEMETRY)
+    walls = QuantileSketch()
+    for key, g in rollup["groups"].items():
+        if key.partition(_GROUP_SEP)[0] == op_class:
+            walls.merge(g["walls"])
+    return walls.quantile(q), walls.count
+
+
+def call_priors(path=None):
+    """{(op_class, model): {"tokens_out", "p50_wall_ms"}} per-call priors from telemetry.
+
+    ``tokens_out`` is the mean output size over the group's calls (None when no
+    row carried token counts). Seeds budget estimates before a run has its own
+    actuals.
+    """
+    rollup = refresh_rollup(Path(path) if path else TELEMETRY)
+    priors = {}
+    for key, g in rollup["groups"].items():
+        op_class, _, model = key.partition(_GROUP_SEP)
+        priors[(op_class, model)] = {
+            "tokens_out": (g["tokens_out"] / g["calls"]) if g["tokens_out"] and g["calls"] else None,
+            "p50_wall_ms": g["walls"].quantile(0.5),
+        }
+    return priors
+
+
+def model_distributions(op_class=None, points=21, path=None):
+    """{model: {"calls", "wall_ms_quantiles", "cost_usd"}} per telemetry model.
+
+    ``wall_ms_quantiles`` holds *points* evenly spaced wall-time quantiles
+    (0 → 1), enough to sample latencies by inverse CDF; ``cost_usd`` is the mean
+    priced cost per call (None when no call was priced). *op_class* restricts
+    the rows used; by default every op class is pooled.
+    """
+    rollup = refresh_rollup(Path(path) if path else TELEMETRY)
+    merged = {}
+    for key, g in rollup["groups"].items():
+        group_op, _, model = key.partition(_GROUP_SEP)
+        if op_class is not None and group_op != op_class:
+            continue
+        entry = merged.setdefault(model, {"calls": 0, "cost": 0.0, "priced": 0,
+                                          "walls": QuantileSketch()})
+        entry["calls"] += g["calls"]
+        entry["walls"].merge(g["walls"])
+        entry["cost"] += g["est_cost_usd"]
+        entry["priced"] += g["priced_calls"]
+    out = {}
+    for model, entry in merged.items():
+        walls = entry["walls"]
+        if not walls.count:
+            continue
+        out[model] = {
+            "calls": entry["calls"],
+            "wall_ms_quantiles": [walls.quantile(i / (points - 1)) for i in range(points)],
+            "cost_usd": entry["cost"] / entry["priced"] if entry["priced"] else None,
+        }
+    return out
+
+
 def cmd_economy_report(args):
     from prd_taskmaster.lib import emit
 
@@ -0,0 +1,181 @@
+"""Shared file enumeration for repository scanners.
+
+Reachability importer searches and evidence scans used to walk the whole
+working tree (``grep -r`` / ``rglob``), descending into node_modules,
+virtualenvs and build output. ``list_files`` answers "which files matter
+here" once:
+
+- Inside a git work tree it asks git: ``git ls-files -z --cached --others
+  --exclude-standard`` — tracked files plus untracked files that are not
+  ignored. Git prunes ignored directories itself, so they are never stat'ed.
+- Outside git (or with ``use_git=False``) it walks the tree, pruning
+  directories that match an exclude glob.
+
+Either way, paths matching an exclude glob are dropped. Globs come from the
+``exclude`` argument, else ``ATLAS_SCAN_EXCLUDE`` (comma-separated), else
+``DEFAULT_EXCLUDES``; a glob matches a path when it matches the whole
+repo-relative path or any single component of it (``node_modules`` drops
+every file under any node_modules directory; ``*.min.js`` drops minified
+bundles anywhere).
+
+Git listings are memoized per (root, HEAD, index stat, excludes), so the
+many scanners of one sweep share a single ``git ls-files`` call. Untracked
+files created after a listing are not seen until HEAD or the index moves or
+``clear_cache()`` is called.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import stat
+import subprocess
+from pathlib import Path
+
+DEFAULT_EXCLUDES = (
+    ".git",
+    "node_modules",
+    ".venv",
+    "venv",
+    "__pycache__",
+    ".tox",
+    ".nox",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+)
+
+_CACHE: dict[tuple, tuple[str, ...]] = {}
+
+
+def clear_cache() -> None:
+    _CACHE.clear()
+
+
+def exclude_globs(exclude: "list[str] | tuple[str, ...] | None" = None) -> tuple[str, ...]:
+    """Effective exclude globs: explicit argument, env override, or defaults."""
+    if exclude is not None:
+        return tuple(exclude)
+    raw = os.environ.get("ATLAS_SCAN_EXCLUDE")
+    if raw is not None:
+        return tuple(g.strip() for g in raw.split(",") if g.strip())
+    return DEFAULT_EXCLUDES
+
+
+def is_excluded(rel_path: str, globs: "tuple[str, ...]") -> bool:
+    """True when *rel_path* (posix) or any of its components matches a glob."""
+    parts = rel_path.split("/")
+    for glob in globs:
+        if fnmatch.fnmatchcase(rel_path, glob):
+            return True
+        if any(fnmatch.fnmatchcase(part, glob) for part in parts):
+            return True
+    return False
+
+
+def list_files(
+    root: "str | Path",
+    *,
+    exclude: "list[str] | tuple[str, ...] | None" = None,
+    use_git: bool = True,
+) -> list[str]:
+    """Sorted repo-relative posix paths of regular files under *root*.
+
+    Symlinks and paths listed by git but missing from the working tree
+    (deleted, or submodule gitlinks) are skipped, so every returned path is
+    a readable-in-principle regular file. ``use_git=False`` forces the walk —
+    for directories such as ``.atlas-ai/evidence`` that are usually
+    gitignored but must still be scanned.
+    """
+    root = Path(root)
+    globs = exclude_globs(exclude)
+    if use_git:
+        listed = _git_listing(root, globs)
+        if listed is not None:
+            return list(listed)
+    return _walk(root, globs)
+
+
+def _git_state(root: Path) -> "tuple[str, str, tuple] | None":
+    """(git dir, HEAD sha or "", index stat) — None when *root* is not in git."""
+    try:
+        proc = subprocess.run(
+            ["git", "-C", str(root), "rev-parse", "--absolute-git-dir", "HEAD"],
+            capture_output=True, text=True, timeout=30,
+        )
+        lines = proc.stdout.split()
+        if proc.returncode != 0:
+            # Unborn branch (no commits yet): HEAD does not resolve.
+            proc = subprocess.run(
+                ["git", "-C", str(root), "rev-parse", "--absolute-git-dir"],
+                capture_output=True, text=True, timeout=30,
+            )
+            if proc.returncode != 0:
+                return None
+            lines = proc.stdout.split()[:1] + [""]
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if len(lines) < 2:
+        return None
+    git_dir, head = lines[0], lines[1]
+    try:
+        st = os.stat(os.path.join(git_dir, "index"))
+        index_state: tuple = (st.st_mtime_ns, st.st_size, st.st_ino)
+    except OSError:
+        index_state = ()
+    return git_dir, head, index_state
+
+
+def _git_listing(root: Path, globs: "tuple[str, ...]") -> "tuple[str, ...] | None":
+    state = _git_state(root)
+    if state is None:
+        return None
+    key = (str(root.resolve()), *state, globs)
+    cached = _CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        proc = subprocess.run(
+            ["git", "-C", str(root), "ls-files", "-z",
+             "--cached", "--others", "--exclude-standard"],
+            capture_output=True, timeout=120,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if proc.returncode != 0:
+        return None
+
+    files: set[str] = set()
+    for raw in proc.stdout.split(b"\0"):
+        if not raw:
+            continue
+        rel = os.fsdecode(raw)
+        if is_excluded(rel, globs):
+            continue
+        try:
+            mode = os.lstat(root / rel).st_mode
+        except OSError:
+            continue
+        if stat.S_ISREG(mode):
+            files.add(rel)
+    listing = tuple(sorted(files))
+    _CACHE[key] = listing
+    return listing
+
+
+def _walk(root: Path, globs: "tuple[str, ...]") -> list[str]:
+    files: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = Path(dirpath).relative_to(root).as_posix()
+        prefix = "" if rel_dir == "." else rel_dir + "/"
+        dirnames[:] = [d for d in dirnames if not is_excluded(prefix + d, globs)]
+        for name in filenames:
+            rel = prefix + name
+            if is_excluded(rel, globs):
+                continue
+            if os.path.islink(os.path.join(dirpath, name)):
+                continue
+            files.append(rel)
+    files.sort()
+    return files
@@ -5,12 +5,13 @@ cmd_* wrappers resolve TaskMaster tags for CLI/MCP callers.
 """
 
 import argparse
+import heapq
 import json
 from pathlib import Path
 
 from prd_taskmaster.economy import TIER_ORDER, economy_profile, shift_tier
 from prd_taskmaster import parallel
-from prd_taskmaster.lib import CommandError, emit, fail
+from prd_taskmaster.lib import CommandError, emit, fail, snapshot_read
 
 # ─── REQ-010: optional .atlas-ai/fleet.json routing config ───────────────────
 
@@ -70,6 +71,16 @@ DEFAULT_ENGINE_CONFIG = {
         "structured_gen": None,       # null -> inherit max_concurrency
         "ram_aware": False,           # reserved for sub-project #2
     },
+    "expand_batch": {
+        "token_budget": 6000,         # est. input tokens per shared expand request
+        "max_tasks": 8,               # 1 -> one request per task (batching off)
+    },
+    "hedge": {
+        "enabled": False,             # opt-in duplicate of calls slower than the op-class p95
+        "budget_fraction": 0.1,       # extra calls allowed, as a fraction of the run's calls
+        "min_samples": 20,            # telemetry rows needed before the p95 is trusted
+        "min_delay_ms": 2000,         # never hedge sooner than this
+    },
 }
 
 
@@ -111,6 +122,8 @@ def engine_config(cfg=None):
         "keyless_default": DEFAULT_ENGINE_CONFIG["keyless_default"],
         "cli_agent": dict(DEFAULT_ENGINE_CONFIG["cli_agent"]),
         "concurrency": dict(DEFAULT_ENGINE_CONFIG["concurrency"]),
+        "expand_batch": dict(DEFAULT_ENGINE_CONFIG["expand_batch"]),
+        "hedge": dict(DEFAULT_ENGINE_CONFIG["hedge"]),
     }
     if not isinstance(cfg, dict):
         return eng
@@ -150,6 +163,23 @@ def engine_config(cfg=None):
         if isinstance(conc.get("ram_aware"), bool):
             eng["concurrency"]["ram_aware"] = conc["ram_aware"]
 
+    batch = raw.get("expand_batch")
+    if isinstance(batch, dict):
+        for key in ("token_budget", "max_tasks"):
+            if _is_pos_int(batch.get(key)):
+                eng["expand_batch"][key] = batch[key]
+
+    hedge = raw.get("hedge")
+    if isinstance(hedge, dict):
+        if isinstance(hedge.get("enabled"), bool):
+            eng["hedge"]["enabled"] = hedge["enabled"]
+        fraction = hedge.get("budget_fraction")
+        if isinstance(fraction, (int, float)) and not isinstance(fraction, bool) and 0 <= fraction <= 1:
+            eng["hedge"]["budget_fraction"] = fraction
+        for key in ("min_samples", "min_delay_ms"):
+            if _is_pos_int(hedge.get(key)):
+                eng["hedge"][key] = hedge[key]
+
     return eng
 
 
@@ -193,6 +223,91 @@ def save_engine_config(updates):
     return engine_config(doc)
 
 
+# ─── Spend / wall-clock budget block ─────────────────────────────────────────
+# Consumed by budget.BudgetManager: admission control for paid API calls.
+# null limits are unlimited, so the default block admits everything.
+
+DEFAULT_BUDGET_CONFIG = {
+    "run_usd": None,          # cap on estimated+actual spend for one run
+    "op_class_usd": {},       # per op class caps, e.g. {"structured_gen": 0.5}
+    "run_wall_s": None,       # wall-clock cap for one run
+    "defer_timeout_s": 60,    # how long a call waits for in-flight spend to settle
+}
+
+
+def _is_pos_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
+
+
+def budget_config(cfg=None):
+    """Merged `budget` block with defaults applied; malformed values fall back silently."""
+    out = {**DEFAULT_BUDGET_CONFIG, "op_class_usd": {}}
+    raw = cfg.get("budget") if isinstance(cfg, dict) else None
+    if not isinstance(raw, dict):
+        return out
+    for key in ("run_usd", "run_wall_s", "defer_timeout_s"):
+        if _is_pos_number(raw.get(key)):
+            out[key] = raw[key]
+    per_op = raw.get("op_class_usd")
+    if isinstance(per_op, dict):
+        out["op_class_usd"] = {
+            str(op): limit for op, limit in per_op.items() if _is_pos_number(limit)
+        }
+    return out
+
+
+# ─── Reputation router block ─────────────────────────────────────────────────
+# Consumed by reputation.route_with_reputation. The prior is the pseudo-record
+# every candidate starts from (prior_wins out of prior_jobs), which bounds the
+# cold-start bonus of an executor with no history.
+
+REPUTATION_POLICIES = ("ucb1", "discounted-ucb", "sliding-window-ucb", "thompson")
+
+DEFAULT_REPUTATION_CONFIG = {
+    "policy": "ucb1",
+    "prior_wins": 0.5,
+    "prior_jobs": 1.0,
+}
+
+
+def reputation_config(cfg=None):
+    """Merged `reputation` block with defaults applied; malformed values fall back silently."""
+    out = dict(DEFAULT_REPUTATION_CONFIG)
+    raw = cfg.get("reputation") if isinstance(cfg, dict) else None
+    if not isinstance(raw, dict):
+        return out
+    if raw.get("policy") in REPUTATION_POLICIES:
+        out["policy"] = raw["policy"]
+    if _is_pos_number(raw.get("prior_jobs")):
+        out["prior_jobs"] = float(raw["prior_jobs"])
+        out["prior_wins"] = out["prior_jobs"] / 2
+    wins = raw.get("prior_wins")
+    if _is_pos_number(wins) and wins < out["prior_jobs"]:
+        out["prior_wins"] = float(wins)
+    return out
+
+
+# ─── Tournament block ────────────────────────────────────────────────────────
+# Consumed by tournament.cmd.run_tournament. spawn_start_timeout_s is how long
+# provisioned racers wait at the start barrier for the rest of the first wave;
+# only two-phase spawn adapters meet there (see tournament.spawn.spawn_roster).
+
+DEFAULT_TOURNAMENT_CONFIG = {
+    "spawn_start_timeout_s": 30.0,
+}
+
+
+def tournament_config(cfg=None):
+    """Merged `tournament` block with defaults applied; malformed values fall back silently."""
+    out = dict(DEFAULT_TOURNAMENT_CONFIG)
+    raw = cfg.get("tournament") if isinstance(cfg, dict) else None
+    if not isinstance(raw, dict):
+        return out
+    if _is_pos_number(raw.get("spawn_start_timeout_s")):
+        out["spawn_start_timeout_s"] = float(raw["spawn_start_timeout_s"])
+    return out
+
+
 def load_fleet_config(path=None):
     """Load .atlas-ai/fleet.json merged over defaults.
 
@@ -208,6 +323,9 @@ def load_fleet_config(path=None):
         "token_economy": _atlas_config_economy() or DEFAULT_FLEET_CONFIG["token_economy"],
         "backend": DEFAULT_FLEET_CONFIG["backend"],
         "engine": engine_config(None),
+        "budget": budget_config(None),
+        "reputation": reputation_config(None),
+        "tournament": tournament_config(None),
     }
     p = Path(path) if path else FLEET_CONFIG_PATH
     if not p.is_file():
@@ -255,6 +373,9 @@ def load_fleet_config(path=None):
             cfg["escalation"] = resolved
 
     cfg["engine"] = engine_config(raw)
+    cfg["budget"] = budget_config(raw)
+    cfg["reputation"] = reputation_config(raw)
+    cfg["tournament"] = tournament_config(raw)
 
     return cfg
 
@@ -366,17 +487,20 @@ def _chunk(items, size):
 
 
 def _load_tagged_or_raise(tag):
-    if not parallel.TASKS.is_file():
-        raise CommandError(f"{parallel.TASKS} not found")
+    path = parallel.tasks_path(tag)
+    # Lock-free: wave planning and next-task previews never queue behind writers.
+    content = snapshot_read(path)
+    if content is None:
+        raise CommandError(f"{path} not found")
     try:
-        raw = json.loads(parallel.TASKS.read_text())
+        raw = json.loads(content)
     except json.JSONDecodeError as exc:
-        raise CommandError(f"Failed to parse {parallel.TASKS}: {exc}") from exc
+        raise CommandError(f"Failed to parse {path}: {exc}") from exc
 
     if tag not in raw or not isinstance(raw.get(tag), dict):
         if "tasks" in raw and isinstance(raw["tasks"], list):
             return raw, None
-        raise CommandError(f"tag '{tag}' not found in {parallel.TASKS}")
+        raise CommandError(f"tag '{tag}' not found in {path}")
     return raw, tag
 
 
@@ -391,38 +515,117 @@ def ready_set(tasks):
     ]
 
 
-def compute_waves(tasks, max_concurrency=3):
-    """Return dependency-ordered execution waves for pending tasks."""
+# ─── Critical-path priority ───────────────────────────────────────────────────
+# Ordering ready tasks by priority and id alone starts the longest dependency
+# chains late, stretching the makespan while agents sit idle. A task's bottom
+# level — its own estimated duration plus the longest chain of pending work
+# that waits on it — is the classic list-scheduling priority: run the task that
+# holds up the most downstream work first. Durations are relative weights from
+# the complexity score (or tier), so only their ratios matter.
+
+PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+_TIER_DURATION = {"fast": 2.0, "standard": 5.0, "capable": 8.0, "frontier": 10.0}
+
+
+def priority_rank(task):
+    return PRIORITY_RANK.get(str(task.get("priority", "medium")).lower(), 1)
+
+
+def estimated_duration(task):
+    """Relative duration weight: complexityScore when set, else the tier's weight."""
+    score = task.get("complexityScore")
+    if isinstance(score, (int, float)) and not isinstance(score, bool) and score > 0:
+        return float(score)
+    return _TIER_DURATION.get(task_tier(task), _TIER_DURATION["standard"])
+
+
+def critical_path_lengths(tasks, durations=None):
+    """{task id: bottom level} for every pending task.
+
+    *durations* maps task id -> duration (missing ids use
+    ``estimated_duration``). Tasks on a dependency cycle keep just their own
+    duration. Iterative, O(tasks + edges).
+    """
+    pending = {_task_id(task): task for task in tasks if _is_pending(task)}
+    durations = durations or {}
+    weight = {
+        task_id: float(durations.get(task_id, estimated_duration(task)))
+        for task_id, task in pending.items()
+    }
+    children = {task_id: [] for task_id in pending}
+    waiting = dict.fromkeys(pending, 0)  # pending dependents still to be resolved
+    for task_id, task in pending.items():
+        for dep_id in set(_dependencies(task)):
+            if dep_id in pending:
+                children[dep_id].append(task_id)
+                waiting[dep_id] += 1
+    level = {}
+    sinks = [task_id for task_id, count in waiting.items() if count == 0]
+    while sinks:
+        task_id = sinks.pop()
+        level[task_id] = weight[task_id] + max(
+            (level[child] for child in children[task_id]), default=0.0)
+        for dep_id in set(_dependencies(pending[task_id])):
+            if dep_id in waiting:
+                waiting[dep_id] -= 1
+                if waiting[dep_id] == 0:
+                    sinks.append(dep_id)
+    for task_id in pending:
+        level.setdefault(task_id, weight[task_id])
+    return level
+
+
+def compute_waves(tasks, max_concurrency=3, durations=None):
+    """Return dependency-ordered execution waves for pending tasks.
+
+    Each wave takes up to *max_concurrency* ready tasks, longest critical path
+    first (see ``critical_path_lengths``), then priority, then input order; a
+    task becomes ready for the next wave as soon as its dependencies are in
+    earlier waves.
+    """
     if max_concurrency < 1:
         raise ValueError("max_concurrency must be >= 1")
 
     completed = {_task_id(task) for task in tasks if _is_done(task)}
-    remaining = [task for task in tasks if _is_pending(task)]
-    waves = []
-
-    while remaining:
-        frontier = [
-            task
-            for task in remaining
-            if all(dep_id in completed for dep_id in _dependencies(task))
-        ]
-        if not frontier:
-            return {
-                "waves": waves,
-                "blocked": [_task_id(task) for task in remaining],
-                "deadlocked": True,
-            }
-
-        frontier_ids = [_task_id(task) for task in frontier]
-        waves.extend(_chunk(frontier_ids, max_concurrency))
-        completed.update(frontier_ids)
-
-        frontier_objects = {id(task) for task in frontier}
-        remaining = [
-            task for task in remaining
-            if id(task) not in frontier_objects
-        ]
-
+    pending = [task for task in tasks if _is_pending(task)]
+    pending_ids = {_task_id(task) for task in pending}
+    level = critical_path_lengths(tasks, durations)
+
+    # Dependencies that are neither done nor pending can never be satisfied.
+    blocked_forever = set()
+    unmet, dependents = {}, {}
+    for index, task in enumerate(pending):
+        deps = set(_dependencies(task)) - completed
+        if deps - pending_ids:
+            blocked_forever.add(index)
+        unmet[index] = len(deps & pending_ids)
+        for dep_id in deps & pending_ids:
+            dependents.setdefault(dep_id, []).append(index)
+
+    def key(index):
+        task = pending[index]
+        return (-level[_task_id(task)], priority_rank(task), index)
+
+    ready = [key(i) for i in unmet if unmet[i] == 0 and i not in blocked_forever]
+    heapq.heapify(ready)
+    waves, scheduled = [], 0
+    while ready:
+        wave = [heapq.heappop(ready)[2] for _ in range(min(max_concurrency, len(ready)))]
+        waves.append([_task_id(pending[i]) for i in wave])
+        scheduled += len(wave)
+        for i in wave:
+            for child in dependents.get(_task_id(pending[i]), ()):
+                unmet[child] -= 1
+                if unmet[child] == 0 and child not in blocked_forever:
+                    heapq.heappush(ready, key(child))
+
+    if scheduled < len(pending):
+        done = {task_id for wave in waves for task_id in wave}
+        return {
+            "waves": waves,
+            "blocked": [_task_id(task) for task in pending if _task_id(task) not in done],
+            "deadlocked": True,
+        }
     return {
         "waves": waves,
         "blocked": [],
@@ -0,0 +1,265 @@
+"""Offline fleet makespan simulator driven by historical telemetry.
+
+Choosing a concurrency level or economy preset used to be a guess. This
+module replays a task graph through the real scheduler and routing —
+``fleet.compute_waves`` for the waves, ``fleet.route_task`` for each task's
+backend:model — with task durations and costs drawn from the per-model
+latency and cost distributions in telemetry.jsonl, and reports the predicted
+makespan, cost and agent utilization per scenario and concurrency level.
+
+Two execution models:
+
+  waves   every wave waits for its slowest task (what fleet-waves dispatch does)
+  greedy  an agent takes the next ready task as soon as it is free, longest
+          critical path first
+
+Scheduling decisions use each task's median duration (what a scheduler could
+know up front); every trial then samples actual durations by inverse CDF
+from the model's quantile table. Everything is O(tasks log tasks) per trial,
+so 10k-task graphs simulate in seconds.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import random
+import statistics
+from pathlib import Path
+
+from prd_taskmaster import fleet, parallel
+from prd_taskmaster.economy import ECONOMY_PRESETS, TIER_MODEL_IDS, model_distributions
+from prd_taskmaster.lib import CommandError, emit, fail
+
+SCHEDULERS = ("waves", "greedy")
+
+
+# ─── Telemetry profiles ───────────────────────────────────────────────────────
+
+def _profile_for(target: str, profiles: dict, pooled: dict) -> tuple[dict, bool]:
+    """(profile, matched) for a routing target such as ``claude:sonnet``."""
+    alias = target.split(":", 1)[-1]
+    model_id = TIER_MODEL_IDS.get(alias, alias)
+    if model_id in profiles:
+        return profiles[model_id], True
+    for model, profile in profiles.items():
+        if model and (model.startswith(model_id) or model_id.startswith(model) or alias in model):
+            return profile, True
+    return pooled, False
+
+
+def _pooled(profiles: dict) -> dict:
+    """Call-weighted mix of every model: the stand-in for unseen targets."""
+    total = sum(p["calls"] for p in profiles.values())
+    points = len(next(iter(profiles.values()))["wall_ms_quantiles"])
+    priced = [p for p in profiles.values() if p["cost_usd"] is not None]
+    return {
+        "calls": total,
+        "wall_ms_quantiles": [
+            sum(p["wall_ms_quantiles"][i] * p["calls"] for p in profiles.values()) / total
+            for i in range(points)
+        ],
+        "cost_usd": (sum(p["cost_usd"] * p["calls"] for p in priced)
+                     / sum(p["calls"] for p in priced)) if priced else None,
+    }
+
+
+def _sample(quantiles: list, rng: random.Random) -> float:
+    position = rng.random() * (len(quantiles) - 1)
+    index = int(position)
+    if index >= len(quantiles) - 1:
+        return quantiles[-1]
+    low, high = quantiles[index], quantiles[index + 1]
+    return low + (high - low) * (position - index)
+
+
+# ─── Execution models ─────────────────────────────────────────────────────────
+
+def _waves_makespan(waves: list, actual: dict) -> float:
+    return sum(max(actual[task_id] for task_id in wave) for wave in waves)
+
+
+def _greedy_makespan(order: dict, dependents: dict, unmet: dict, actual: dict,
+                     agents: int) -> float:
+    unmet = dict(unmet)
+    ready = [(order[task_id], task_id) for task_id, count in unmet.items() if count == 0]
+    heapq.heapify(ready)
+    running, now, free = [], 0.0, agents
+    while ready or running:
+        while free and ready:
+            _, task_id = heapq.heappop(ready)
+            heapq.heappush(running, (now + actual[task_id], order[task_id], task_id))
+            free -= 1
+        now, _, task_id = heapq.heappop(running)
+        free += 1
+        for child in dependents.get(task_id, ()):
+            unmet[child] -= 1
+            if unmet[child] == 0:
+                heapq.heappush(ready, (order[child], child))
+    return now
+
+
+def _summary(values: list) -> dict:
+    ordered = sorted(values)
+    return {
+        "mean": statistics.fmean(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p90": ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))],
+    }
+
+
+# ─── Simulation ───────────────────────────────────────────────────────────────
+
+def simulate(tasks: list, scenarios: list, concurrency_levels: list, profiles: dict, *,
+             trials: int = 20, seed: int = 0, scheduler: str = "waves",
+             calls_per_task: int = 1, backends: dict | None = None) -> list:
+    """Simulate *tasks* under each ``(label, fleet_config)`` scenario.
+
+    *profiles* is ``economy.model_distributions()`` output. Returns one result
+    dict per scenario; see ``run_fleet_simulate`` for the shape.
+    """
+    if scheduler not in SCHEDULERS:
+        raise CommandError(f"scheduler must be one of {', '.join(SCHEDULERS)}")
+    if not profiles:
+        raise CommandError("no latency telemetry to simulate from",
+                           {"hint": "run some generation first, or pass --telemetry"})
+    if any(level < 1 for level in concurrency_levels):
+        raise CommandError("concurrency must be >= 1")
+    backends = fleet.available_backends() if backends is None else backends
+    pooled = _pooled(profiles)
+    pending = [task for task in tasks if fleet._is_pending(task)]
+    results = []
+    for label, config in scenarios:
+        quantiles, cost, unmatched, unpriced = {}, 0.0, set(), set()
+        routing = {}
+        for task in pending:
+            target = fleet.route_task(task, config, backends)
+            profile, matched = _profile_for(target, profiles, pooled)
+            if not matched:
+                unmatched.add(target)
+            if profile["cost_usd"] is None:
+                unpriced.add(target)
+            else:
+                cost += profile["cost_usd"] * calls_per_task
+            task_id = fleet._task_id(task)
+            quantiles[task_id] = profile["wall_ms_quantiles"]
+            routing[target] = routing.get(target, 0) + 1
+        expected = {
+            task_id: table[len(table) // 2] * calls_per_task / 1000
+            for task_id, table in quantiles.items()
+        }
+        plan = fleet.compute_waves(tasks, len(pending) or 1, durations=expected)
+        runnable = [task_id for wave in plan["waves"] for task_id in wave]
+        runnable_set = set(runnable)
+        dependents, unmet = {}, {}
+        for task in pending:
+            task_id = fleet._task_id(task)
+            if task_id not in runnable_set:
+                continue
+            deps = [d for d in set(fleet._dependencies(task)) if d in runnable_set]
+            unmet[task_id] = len(deps)
+            for dep in deps:
+                dependents.setdefault(dep, []).append(task_id)
+        level = fleet.critical_path_lengths(tasks, expected)
+        order = {
+            fleet._task_id(task): (-level[fleet._task_id(task)], fleet.priority_rank(task), index)
+            for index, task in enumerate(pending)
+        }
+
+        rng = random.Random(seed)
+        samples = [
+            {task_id: sum(_sample(quantiles[task_id], rng) for _ in range(calls_per_task)) / 1000
+             for task_id in runnable}
+            for _ in range(trials)
+        ]
+        by_level = []
+        for level in concurrency_levels:
+            waves = fleet.compute_waves(tasks, level, durations=expected)["waves"]
+            spans, utilization = [], []
+            for actual in samples:
+                if scheduler == "waves":
+                    span = _waves_makespan(waves, actual)
+                else:
+                    span = _greedy_makespan(order, dependents, unmet, actual, level)
+                spans.append(span)
+                busy = sum(actual.values())
+                utilization.append(busy / (level * span) if span else 0.0)
+            by_level.append({
+                "concurrency": level,
+                "makespan_s": _summary(spans) if spans else None,
+                "utilization": statistics.fmean(utilization) if utilization else None,
+                "waves": len(waves),
+            })
+        results.append({
+            "label": label,
+            "economy": config.get("token_economy"),
+            "routing": routing,
+            "cost_usd": cost,
+            "unmatched_targets": sorted(unmatched),
+            "unpriced_targets": sorted(unpriced),
+            "blocked": len(plan["blocked"]),
+            "by_concurrency": by_level,
+        })
+    return results
+
+
+def _scenarios(cfg: dict, economies: list | None, routing_files: list | None) -> list:
+    scenarios = []
+    for economy in economies or []:
+        if economy not in ECONOMY_PRESETS:
+            raise CommandError(f"unknown economy {economy!r}",
+                               {"choices": sorted(ECONOMY_PRESETS)})
+        scenarios.append((f"economy:{economy}", {**cfg, "token_economy": economy}))
+    for path in routing_files or []:
+        try:
+            table = json.loads(Path(path).read_text())
+        except (OSError, json.JSONDecodeError) as exc:
+            raise CommandError(f"cannot read routing table {path}: {exc}") from exc
+        if not isinstance(table, dict):
+            raise CommandError(f"routing table {path} must be a JSON object")
+        table = table.get("routing", table)
+        scenarios.append((f"routing:{Path(path).name}",
+                          {**cfg, "routing": {**cfg.get("routing", {}), **table}}))
+    return scenarios or [("current", cfg)]
+
+
+def run_fleet_simulate(concurrency_levels=(1, 2, 3, 4, 8), tag="", *, economies=None,
+                       routing_files=None, trials=20, seed=0, scheduler="waves",
+                       calls_per_task=1, op_class=None, telemetry=None) -> dict:
+    """Predict makespan, cost and utilization for the tag's pending tasks."""
+    resolved_tag = parallel.current_tag(argparse.Namespace(tag=tag or None))
+    raw, tag_key = fleet._load_tagged_or_raise(resolved_tag)
+    try:
+        tasks = parallel.get_tasks(raw, tag_key)
+    except (KeyError, TypeError) as exc:
+        raise CommandError(f"tasks missing for tag '{resolved_tag}' in {parallel.TASKS}") from exc
+    if trials < 1 or calls_per_task < 1:
+        raise CommandError("trials and calls-per-task must be >= 1")
+    profiles = model_distributions(op_class, path=telemetry)
+    cfg = fleet.load_fleet_config()
+    results = simulate(
+        tasks, _scenarios(cfg, economies, routing_files), list(concurrency_levels), profiles,
+        trials=trials, seed=seed, scheduler=scheduler, calls_per_task=calls_per_task,
+    )
+    return {
+        "ok": True,
+        "tag": resolved_tag,
+        "tasks": sum(1 for task in tasks if fleet._is_pending(task)),
+        "scheduler": scheduler,
+        "trials": trials,
+        "telemetry_models": sorted(profiles),
+        "scenarios": results,
+    }
+
+
+def cmd_fleet_simulate(args):
+    try:
+        emit(run_fleet_simulate(
+            args.concurrency, getattr(args, "tag", ""),
+            economies=args.economy, routing_files=args.routing, trials=args.trials,
+            seed=args.seed, scheduler=args.scheduler, calls_per_task=args.calls_per_task,
+            op_class=args.op_class, telemetry=args.telemetry,
+        ))
+    except CommandError as exc:
+        fail(exc.message, **exc.extra)
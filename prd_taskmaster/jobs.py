@@ -0,0 +1,180 @@
+"""Background jobs for long-running engine operations.
+
+parse-prd, expand, rate and engine-preflight can run for minutes, longer
+than many MCP clients wait for a tool call. ``JobManager.submit`` runs such an
+operation on a small managed thread pool and returns a job id at once; the
+caller then polls ``status`` (progress, partial results, final result) and may
+``cancel``.
+
+Every state change is persisted to ``.atlas-ai/jobs/<job_id>.json`` so a
+client that reconnects — even to a restarted server — can still collect the
+result. A record left ``queued``/``running`` by a process that no longer owns
+it is reported as ``interrupted``.
+
+Operations report progress and honour cancellation cooperatively through the
+module-level ``report_progress`` / ``cancel_requested`` helpers, which are
+no-ops outside a job — so backend code calls them unconditionally.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+from prd_taskmaster.lib import CommandError, now_iso, read_json, write_json
+
+JOBS_DIR = Path(".atlas-ai") / "jobs"
+MAX_JOB_WORKERS = 2
+PARTIAL_LIMIT = 200
+
+TERMINAL = ("succeeded", "failed", "cancelled", "interrupted")
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when the operation stops early on cancel()."""
+
+
+_CURRENT: contextvars.ContextVar["_Job | None"] = contextvars.ContextVar(
+    "prd_taskmaster_job", default=None
+)
+
+
+def report_progress(done: int, total: int, partial: Any = None) -> None:
+    """Record ``done``/``total`` work units (and one partial result) for the current job."""
+    job = _CURRENT.get()
+    if job is not None:
+        job.progress(done, total, partial)
+
+
+def cancel_requested() -> bool:
+    """True when the current job has been asked to stop."""
+    job = _CURRENT.get()
+    return job is not None and job.cancel_event.is_set()
+
+
+class _Job:
+    def __init__(self, manager: "JobManager", record: dict) -> None:
+        self.manager = manager
+        self.record = record
+        self.cancel_event = threading.Event()
+        self.lock = threading.Lock()
+
+    def update(self, **fields: Any) -> None:
+        with self.lock:
+            self.record.update(fields)
+            self.record["updated_at"] = now_iso()
+            write_json(self.manager.path_for(self.record["job_id"]), self.record)
+
+    def progress(self, done: int, total: int, partial: Any) -> None:
+        with self.lock:
+            if partial is not None and len(self.record["partial"]) < PARTIAL_LIMIT:
+                self.record["partial"].append(partial)
+        self.update(progress={"done": done, "total": total})
+
+
+class JobManager:
+    """Owns the worker pool and the live job table of one process."""
+
+    def __init__(self, jobs_dir: Path | None = None, max_workers: int = MAX_JOB_WORKERS) -> None:
+        self.jobs_dir = Path(jobs_dir or JOBS_DIR).resolve()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="prd-taskmaster-job"
+        )
+        self._jobs: dict[str, _Job] = {}
+        self._mutex = threading.Lock()
+
+    def path_for(self, job_id: str) -> Path:
+        return self.jobs_dir / f"{job_id}.json"
+
+    def submit(self, kind: str, fn: Callable[..., dict], *args: Any, **kwargs: Any) -> dict:
+        job_id = uuid.uuid4().hex[:12]
+        job = _Job(self, {
+            "job_id": job_id,
+            "kind": kind,
+            "params": {
+                "args": [a for a in args if not callable(a)],
+                "kwargs": {k: v for k, v in kwargs.items() if not callable(v)},
+            },
+            "status": "queued",
+            "created_at": now_iso(),
+            "progress": {"done": 0, "total": None},
+            "partial": [],
+            "result": None,
+            "error": None,
+        })
+        with self._mutex:
+            self._jobs[job_id] = job
+        job.update()
+        self._executor.submit(self._run, job, fn, args, kwargs)
+        return {"ok": True, "job_id": job_id, "kind": kind, "status": "queued"}
+
+    def _run(self, job: _Job, fn: Callable[..., dict], args: tuple, kwargs: dict) -> None:
+        if job.cancel_event.is_set():
+            job.update(status="cancelled", finished_at=now_iso())
+            return
+        job.update(status="running", started_at=now_iso())
+        token = _CURRENT.set(job)
+        try:
+            result = fn(*args, **kwargs)
+        except JobCancelled:
+            job.update(status="cancelled", finished_at=now_iso())
+        except CommandError as exc:
+            job.update(status="failed", finished_at=now_iso(),
+                       error={"message": exc.message, **exc.extra})
+        except SystemExit as exc:
+            job.update(status="failed", finished_at=now_iso(),
+                       error={"message": "operation exited", "exit": exc.code})
+        except Exception as exc:  # noqa: BLE001 — a job failure must never kill the pool thread
+            job.update(status="failed", finished_at=now_iso(),
+                       error={"message": f"{type(exc).__name__}: {exc}"})
+        else:
+            status = "cancelled" if job.cancel_event.is_set() else "succeeded"
+            job.update(status=status, finished_at=now_iso(), result=result)
+        finally:
+            _CURRENT.reset(token)
+
+    def status(self, job_id: str) -> dict:
+        with self._mutex:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            with job.lock:
+                return {"ok": True, **job.record, "partial": list(job.record["partial"])}
+        try:
+            record = read_json(self.path_for(job_id))
+        except ValueError:
+            record = {}
+        if not record:
+            raise CommandError(f"unknown job: {job_id}")
+        if record.get("status") not in TERMINAL:
+            # Persisted by a process that is gone: it will never finish.
+            record["status"] = "interrupted"
+        return {"ok": True, **record}
+
+    def cancel(self, job_id: str) -> dict:
+        with self._mutex:
+            job = self._jobs.get(job_id)
+        if job is None:
+            record = self.status(job_id)
+            return {"ok": record["status"] in TERMINAL, "job_id": job_id,
+                    "status": record["status"]}
+        job.cancel_event.set()
+        with job.lock:
+            status = job.record["status"]
+        return {"ok": True, "job_id": job_id, "status": status, "cancel_requested": True}
+
+    def list(self) -> dict:
+        jobs = []
+        if self.jobs_dir.is_dir():
+            for path in sorted(self.jobs_dir.glob("*.json")):
+                try:
+                    summary = self.status(path.stem)
+                except (CommandError, ValueError):
+                    continue
+                jobs.append({key: summary.get(key) for key in
+                             ("job_id", "kind", "status", "created_at", "progress")})
+        jobs.sort(key=lambda item: item.get("created_at") or "")
+        return {"ok": True, "jobs": jobs}
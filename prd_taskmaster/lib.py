@@ -5,6 +5,7 @@ calling fail(), and return dicts instead of calling emit().
 """
 
 import fcntl
+import hashlib
 import json
 import os
 import re
@@ -12,6 +13,8 @@ import shutil
 import socket
 import subprocess
 import sys
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable
@@ -75,6 +78,65 @@ def atomic_write(path: Path, content: str) -> None:
     os.replace(tmp, path)
 
 
+# Lock-wait measurement: every flock acquisition is timed. Per-process totals
+# are kept in memory (lock_wait_stats); with ATLAS_LOCK_WAIT_LOG set, waits of
+# at least LOCK_WAIT_LOG_MIN_MS are also appended there as JSONL rows so
+# contention across a fleet of processes can be summarized (`lock-report`,
+# prd_taskmaster/locks.py). _flock runs on worker threads too, so the totals
+# are only touched under _LOCK_WAITS_GUARD.
+LOCK_WAIT_LOG_ENV = "ATLAS_LOCK_WAIT_LOG"
+LOCK_WAIT_LOG_MIN_MS = 5.0
+_LOCK_WAITS: dict[str, dict] = {}
+_LOCK_WAITS_GUARD = threading.Lock()
+
+
+def lock_wait_stats() -> dict:
+    """Per-file lock-wait totals for this process: count, contended, total_ms, max_ms."""
+    with _LOCK_WAITS_GUARD:
+        return {path: dict(entry) for path, entry in _LOCK_WAITS.items()}
+
+
+def reset_lock_wait_stats() -> None:
+    with _LOCK_WAITS_GUARD:
+        _LOCK_WAITS.clear()
+
+
+def _record_lock_wait(path: Path, mode: str, wait_ms: float) -> None:
+    contended = wait_ms >= LOCK_WAIT_LOG_MIN_MS
+    with _LOCK_WAITS_GUARD:
+        entry = _LOCK_WAITS.setdefault(
+            str(path), {"count": 0, "contended": 0, "total_ms": 0.0, "max_ms": 0.0}
+        )
+        entry["count"] += 1
+        entry["total_ms"] += wait_ms
+        entry["max_ms"] = max(entry["max_ms"], wait_ms)
+        if contended:
+            entry["contended"] += 1
+    if not contended:
+        return
+    log_path = os.environ.get(LOCK_WAIT_LOG_ENV)
+    if not log_path:
+        return
+    row = json.dumps({
+        "at": now_iso(), "path": str(path), "mode": mode,
+        "wait_ms": round(wait_ms, 3), "pid": os.getpid(),
+    })
+    # One O_APPEND write per row — no flock, so the log never measures itself.
+    try:
+        with open(log_path, "a") as f:
+            f.write(row + "\n")
+    except OSError:
+        pass
+
+
+def _flock(lock_f, mode: int, path: Path) -> None:
+    start = time.monotonic()
+    fcntl.flock(lock_f, mode)
+    _record_lock_wait(
+        path, "sh" if mode == fcntl.LOCK_SH else "ex", (time.monotonic() - start) * 1000
+    )
+
+
 def locked_update(path: Path, transform: Callable[[str], str]) -> str:
     """Read-modify-write under flock. transform takes current content, returns new content.
     Returns the new content for convenience.
@@ -88,7 +150,7 @@ def locked_update(path: Path, transform: Callable[[str], str]) -> str:
     path.parent.mkdir(parents=True, exist_ok=True)
     lock_path = path.with_suffix(path.suffix + ".lock")
     with open(lock_path, "w") as lock_f:
-        fcntl.flock(lock_f, fcntl.LOCK_EX)
+        _flock(lock_f, fcntl.LOCK_EX, path)
         try:
             current = path.read_text() if path.exists() else ""
             new = transform(current)
@@ -99,22 +161,184 @@ def locked_update(path: Path, transform: Callable[[str], str]) -> str:
             fcntl.flock(lock_f, fcntl.LOCK_UN)
 
 
+def locked_append(path: Path, text: str) -> int:
+    """Append text under the same flock as locked_update, without reading the file.
+
+    O(len(text)) where locked_update is O(file) — the right primitive for
+    append-only logs. A missing trailing newline on the existing content is
+    repaired first so the appended line never fuses with a torn last line.
+    Returns the byte offset the appended text starts at.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lock_path = path.with_suffix(path.suffix + ".lock")
+    with open(lock_path, "w") as lock_f:
+        _flock(lock_f, fcntl.LOCK_EX, path)
+        try:
+            with open(path, "ab+") as f:
+                end = f.seek(0, os.SEEK_END)
+                if end:
+                    f.seek(end - 1)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+                        end += 1
+                f.write(text.encode())
+            return end
+        finally:
+            fcntl.flock(lock_f, fcntl.LOCK_UN)
+
+
+# Cross-process group commit. A caller spools its update as JSON data in
+# <path>.spool/ and then queues for the flock; whichever process gets the lock
+# applies every pending op in one read + one write and leaves a .result file
+# per op. Ops must be idempotent: a holder that dies between the data write
+# and the results leaves its ops spooled, and the next holder applies them
+# again. Closures cannot cross processes, so only data ops can be batched.
+SPOOL_SUFFIX = ".spool"
+SPOOL_RESULT_TTL_S = 3600.0
+
+
+def spooled_update(
+    path: Path,
+    op: dict,
+    apply: Callable[[str, "list[dict]"], "tuple[str, list[dict]]"],
+) -> dict:
+    """Apply *op* to *path* under its flock, batched with other processes' ops.
+
+    ``apply(current, ops)`` returns the new content and one JSON-serializable
+    result per op, and must be the same function for every op spooled against
+    *path* (it may run in another process). Returns this op's result, which
+    may have been produced by another process.
+    """
+    path = Path(path)
+    spool = path.with_name(path.name + SPOOL_SUFFIX)
+    name = f"{time.time_ns():020d}-{os.getpid()}-{os.urandom(4).hex()}"
+    atomic_write(spool / f"{name}.op", json.dumps(op))
+    result_path = spool / f"{name}.result"
+    lock_path = path.with_suffix(path.suffix + ".lock")
+    with open(lock_path, "w") as lock_f:
+        _flock(lock_f, fcntl.LOCK_EX, path)
+        try:
+            if not result_path.exists():
+                _drain_spool(path, spool, apply)
+            result = json.loads(result_path.read_text())
+            result_path.unlink()
+            return result
+        finally:
+            fcntl.flock(lock_f, fcntl.LOCK_UN)
+
+
+def _drain_spool(path: Path, spool: Path, apply: Callable) -> None:
+    """Apply every pending op in arrival order. Caller holds the flock."""
+    pending = sorted(spool.glob("*.op"))
+    ops = [json.loads(op_path.read_text()) for op_path in pending]
+    current = path.read_text() if path.exists() else ""
+    try:
+        new, results = apply(current, ops)
+        if len(results) != len(ops):
+            raise ValueError(f"apply returned {len(results)} results for {len(ops)} ops")
+        if new != current:
+            atomic_write(path, new)
+    except Exception as exc:
+        # Nothing was written: fail the whole batch so no caller's op lingers
+        # in the spool to be applied after its caller already saw an error.
+        results = [emit_json_error(f"{type(exc).__name__}: {exc}")] * len(ops)
+    for op_path, result in zip(pending, results):
+        atomic_write(op_path.with_suffix(".result"), json.dumps(result))
+        op_path.unlink()
+    # Results whose caller died before collecting them.
+    cutoff = time.time() - SPOOL_RESULT_TTL_S
+    for stale in spool.glob("*.result"):
+        try:
+            if stale.stat().st_mtime < cutoff:
+                stale.unlink()
+        except OSError:
+            pass
+
+
+def snapshot_read(path: Path) -> str | None:
+    """Read *path* without taking its lock; None when the file is missing.
+
+    Safe for any file written through atomic_write / locked_update: writers
+    swap a complete file in with os.replace, so a reader sees either the old
+    or the new content, never a torn mix. Use this for previews and status
+    panels that must not queue behind (or block) writers.
+    """
+    try:
+        return Path(path).read_text()
+    except FileNotFoundError:
+        return None
+
+
+def locked_read(paths: "list[Path]") -> dict:
+    """Consistent read of several files under shared (LOCK_SH) locks.
+
+    Takes the same per-file ``<path>.lock`` that writers hold exclusively,
+    in sorted order, so the returned {path: content-or-None} is never a mix
+    of before/after states of a concurrent writer. Readers do not block each
+    other. Falls back to snapshot reads if a lock file cannot be created.
+    """
+    ordered = sorted({Path(p) for p in paths}, key=str)
+    handles = []
+    try:
+        for path in ordered:
+            lock_path = path.with_suffix(path.suffix + ".lock")
+            try:
+                lock_f = open(lock_path, "a")
+            except OSError:
+                continue
+            handles.append(lock_f)
+            _flock(lock_f, fcntl.LOCK_SH, path)
+        return {path: snapshot_read(path) for path in ordered}
+    finally:
+        for lock_f in reversed(handles):
+            fcntl.flock(lock_f, fcntl.LOCK_UN)
+            lock_f.close()
+
+
 def emit_json_error(message: str, **extra: Any) -> dict:
     """Format an error response as a dict. DO NOT call sys.exit."""
     return {"ok": False, "error": message, **extra}
 
 
 def read_json(path: Path) -> dict:
-    """Read and parse a JSON file. Returns empty dict if missing."""
-    path = Path(path)
-    if not path.exists():
+    """Read and parse a JSON file (a lock-free snapshot read). Returns empty dict if missing."""
+    content = snapshot_read(path)
+    if content is None:
         return {}
-    return json.loads(path.read_text())
+    return json.loads(content)
 
 
-def write_json(path: Path, data: dict) -> None:
-    """Write dict as JSON atomically."""
-    atomic_write(path, json.dumps(data, indent=2, default=str))
+# ─── JSON storage encoding ────────────────────────────────────────────────────
+# State files (tasks.json, tag shards) are rewritten on every mutation, so they
+# are stored compactly by default: no indentation roughly halves both the file
+# and the encode time on large task graphs. ATLAS_JSON_ENCODING=pretty restores
+# indent=2 on disk; `tasks-export` always writes the pretty form for humans and
+# diffs.
+
+JSON_ENCODING_ENV = "ATLAS_JSON_ENCODING"
+
+
+def storage_json_dumps(data: object, *, pretty: bool | None = None) -> str:
+    """Serialize a state file in the configured storage encoding.
+
+    ``pretty=None`` follows ATLAS_JSON_ENCODING (compact unless "pretty").
+    """
+    if pretty is None:
+        pretty = os.environ.get(JSON_ENCODING_ENV, "compact").strip().lower() == "pretty"
+    if pretty:
+        return json.dumps(data, indent=2, default=str)
+    return json.dumps(data, separators=(",", ":"), default=str)
+
+
+def storage_json_loads(text: str) -> object:
+    """Parse a state file (either encoding). Raises json.JSONDecodeError."""
+    return json.loads(text)
+
+
+def write_json(path: Path, data: dict, *, pretty: bool | None = None) -> None:
+    """Write dict as JSON atomically, in the storage encoding (see storage_json_dumps)."""
+    atomic_write(path, storage_json_dumps(data, pretty=pretty))
 
 
 def word_count(text: str) -> int:
@@ -404,6 +628,235 @@ def _resolve_tasks_payload(raw: object, tag: str | None = None) -> tuple[list |
     return None, raw
 
 
+# ─── Capability-detection cache ──────────────────────────────────────────────
+#
+# Capability and TaskMaster detection stat dozens of paths, call
+# shutil.which repeatedly and spawn `task-master --version`. Their result
+# only changes when the environment does, so it is cached under
+# .atlas-ai/state keyed by a cheap fingerprint of exactly what detection
+# looks at: PATH (and each PATH directory's mtime, which moves when a
+# binary is installed or removed), the resolved TaskMaster binary (its
+# realpath + mtime stands in for `--version`), and the mtimes of the plugin,
+# skill, editor and MCP-config locations. refresh=True re-detects. Nothing is
+# written until the project has an .atlas-ai directory.
+
+DETECTION_CACHE_DIR = Path(".atlas-ai") / "state"
+_TASKMASTER_BINARIES = ("taskmaster", "task-master", "task-master-ai")
+
+
+def _stat_key(path: "str | Path") -> "list[int] | None":
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def environment_fingerprint() -> str:
+    """Hash of everything capability / TaskMaster detection depends on."""
+    from prd_taskmaster import __version__
+
+    try:
+        home = Path.home()
+    except RuntimeError:
+        home = None
+    watched: list[Path] = [Path(".mcp.json")]
+    if home is not None:
+        claude = home / ".claude"
+        watched += [
+            home / ".claude.json",
+            claude / "settings.json",
+            claude / "settings" / "mcp.json",
+            home / ".config" / "claude-code" / "mcp.json",
+            claude / "plugins",
+            claude / "plugins" / "superpowers",
+            claude / "plugins" / "cache" / "claude-plugins-official",
+            claude / "plugins" / "cache" / "claude-plugins-official" / "superpowers",
+            claude / "skills",
+            home / ".cursor",
+            home / ".config" / "Cursor",
+            home / ".vscode" / "extensions",
+            home / ".continue",
+        ]
+        try:
+            # A skill appears when its SKILL.md does: watch every skill dir.
+            watched += sorted(p for p in (claude / "skills").iterdir() if p.is_dir())
+        except OSError:
+            pass
+    path_dirs = os.environ.get("PATH", "").split(os.pathsep)
+    tools = {}
+    for name in _TASKMASTER_BINARIES:
+        found = shutil.which(name)
+        if found:
+            real = os.path.realpath(found)
+            tools[name] = [real, _stat_key(real)]
+    payload = {
+        "package": __version__,
+        "cwd": os.getcwd(),
+        "home": str(home),
+        "path": [[d, _stat_key(d)] for d in path_dirs if d],
+        "tools": tools,
+        "watched": [[str(p), _stat_key(p)] for p in watched],
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def cached_detection(kind: str, detect: Callable[[], dict], *, refresh: bool = False) -> dict:
+    """detect() memoized in .atlas-ai/state/detect-<kind>.json per environment fingerprint."""
+    path = DETECTION_CACHE_DIR / f"detect-{kind}.json"
+    fingerprint = environment_fingerprint()
+    if not refresh:
+        try:
+            cached = read_json(path)
+        except ValueError:
+            cached = {}
+        if (
+            isinstance(cached, dict)
+            and cached.get("fingerprint") == fingerprint
+            and isinstance(cached.get("result"), dict)
+        ):
+            return cached["result"]
+    result = detect()
+    if not DETECTION_CACHE_DIR.parent.is_dir():
+        return result  # bare directory: probes stay read-only, never create .atlas-ai
+    try:
+        write_json(path, {"fingerprint": fingerprint, "detected_at": now_iso(), "result": result})
+    except OSError:
+        pass  # read-only checkout: detection still works, just uncached
+    return result
+
+
+def clear_detection_cache() -> None:
+    """Drop every cached detection so the next call of each kind re-detects."""
+    for path in DETECTION_CACHE_DIR.glob("detect-*.json"):
+        path.unlink(missing_ok=True)
+
+
+def _detect_taskmaster_cached(refresh: bool = False) -> dict:
+    """_detect_taskmaster_method() through the detection cache."""
+    return cached_detection("taskmaster", _detect_taskmaster_method, refresh=refresh)
+
+
+# ─── Task storage layout: one tasks.json, or one shard file per tag ──────────
+# The sharded layout keeps each tag in .taskmaster/tasks/tags/<tag>.json (a
+# one-tag tagged payload, {tag: {"tasks": [...], ...}}) listed in
+# tags/manifest.json. Writers lock only their tag's shard, so agents in
+# different tags never queue on one flock. tasks.json is then just a merged
+# export for TaskMaster (`tasks-export`); readers that go through
+# load_tasks_raw / tasks_file_for_tag see the shards, never the export.
+
+TAG_SHARD_DIR = "tags"
+TAG_MANIFEST = "manifest.json"
+
+
+def tag_manifest_path(tasks_path: Path) -> Path:
+    return Path(tasks_path).parent / TAG_SHARD_DIR / TAG_MANIFEST
+
+
+def read_tag_manifest(tasks_path: Path) -> dict | None:
+    """Return {tag: shard filename} when *tasks_path* uses the sharded layout, else None."""
+    manifest = tag_manifest_path(tasks_path)
+    if not manifest.is_file():
+        return None
+    try:
+        data = json.loads(manifest.read_text())
+    except json.JSONDecodeError as exc:
+        raise CommandError(f"Failed to parse {manifest}: {exc}") from exc
+    tags = data.get("tags") if isinstance(data, dict) else None
+    if not isinstance(tags, dict):
+        raise CommandError(f"{manifest} has no 'tags' mapping")
+    return {str(tag): str(name) for tag, name in tags.items()}
+
+
+def tag_shard_name(tag: str) -> str:
+    """Filesystem-safe shard filename for *tag*."""
+    from urllib.parse import quote
+
+    return quote(tag, safe="-_") + ".json"
+
+
+def tasks_file_for_tag(tasks_path: Path, tag: str | None) -> Path:
+    """The file holding *tag*: its shard in the sharded layout, else tasks.json itself."""
+    tasks_path = Path(tasks_path)
+    manifest = read_tag_manifest(tasks_path)
+    if manifest is None or not tag:
+        return tasks_path
+    name = manifest.get(tag) or tag_shard_name(tag)
+    return tasks_path.parent / TAG_SHARD_DIR / name
+
+
+def load_tasks_raw(tasks_path: Path) -> object:
+    """Parse tasks.json, or merge every tag shard when the sharded layout is active.
+
+    Raises json.JSONDecodeError exactly like json.loads on the single file.
+    """
+    tasks_path = Path(tasks_path)
+    manifest = read_tag_manifest(tasks_path)
+    if manifest is None:
+        return storage_json_loads(tasks_path.read_text())
+    shards = {tag: tasks_path.parent / TAG_SHARD_DIR / name for tag, name in manifest.items()}
+    # Shared locks: a merged view never mixes a shard's before/after states.
+    contents = locked_read(list(shards.values()))
+    merged: dict = {}
+    for tag, shard in shards.items():
+        if contents.get(shard) is None:
+            continue
+        payload = storage_json_loads(contents[shard])
+        if isinstance(payload, dict) and isinstance(payload.get(tag), dict):
+            merged[tag] = payload[tag]
+    return merged
+
+
+def tasks_storage_exists(tasks_path: Path) -> bool:
+    return Path(tasks_path).is_file() or read_tag_manifest(tasks_path) is not None
+
+
+def register_tag_shard(tasks_path: Path, tag: str) -> Path:
+    """Add *tag* to the manifest (idempotent) and return its shard path."""
+    manifest = tag_manifest_path(tasks_path)
+    name = tag_shard_name(tag)
+
+    def transform(current: str) -> str:
+        data = json.loads(current) if current.strip() else {"tags": {}}
+        tags = data.setdefault("tags", {})
+        if tag in tags:
+            return current
+        tags[tag] = name
+        return json.dumps(data, indent=2)
+
+    data = json.loads(locked_update(manifest, transform))
+    return manifest.parent / data["tags"][tag]
+
+
+def store_tasks_raw(tasks_path: Path, raw: object) -> None:
+    """Write a payload read via load_tasks_raw back to wherever it lives.
+
+    Sharded layout: each tag block is written to its own shard, and only when
+    it changed (new tags are registered in the manifest). Otherwise the whole
+    payload is written atomically to *tasks_path*.
+    """
+    tasks_path = Path(tasks_path)
+    manifest = read_tag_manifest(tasks_path)
+    if manifest is None or not isinstance(raw, dict):
+        write_json(tasks_path, raw)
+        return
+    for tag, block in raw.items():
+        if not isinstance(block, dict):
+            continue
+        shard = (
+            tasks_path.parent / TAG_SHARD_DIR / manifest[tag]
+            if tag in manifest
+            else register_tag_shard(tasks_path, tag)
+        )
+        content = storage_json_dumps({tag: block})
+        try:
+            unchanged = shard.read_text() == content
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            atomic_write(shard, content)
+
+
 def _read_execution_state() -> dict:
     """Read crash recovery state from .taskmaster/state/execution-state.json."""
     state_file = TASKMASTER_STATE / "execution-state.json"
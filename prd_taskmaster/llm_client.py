@@ -2,20 +2,26 @@
 
 The native backend's headless AI path: one-shot JSON generation against
 anthropic or openai-compatible APIs via urllib. Deliberately small —
-two providers, one retry per failure class, telemetry per HTTP attempt.
+one parse retry, bounded HTTP retries with jittered exponential backoff
+behind a per-provider rate limiter, telemetry per HTTP attempt.
 The local free Perplexity proxy is EXCLUDED (returns prose where strict
 JSON is needed); that traffic stays on the agent path.
 """
 
 import json
 import os
+import random
+import re
+import threading
 import time
 import urllib.error
 import urllib.request
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 
+from prd_taskmaster import budget
 from prd_taskmaster.economy import TIER_MODEL_IDS, append_telemetry
-from prd_taskmaster.lib import _read_env_file_value
 
 ANTHROPIC_URL = "https://api.anthropic.com/v1/messages"
 ANTHROPIC_VERSION = "2023-06-01"
@@ -29,6 +35,14 @@ def _sleep(seconds):
     time.sleep(seconds)
 
 
+def _monotonic():
+    return time.monotonic()
+
+
+def _random():
+    return random.random()
+
+
 class LLMError(Exception):
     """kind in {"no_key", "auth", "http", "timeout", "invalid_json"}."""
 
@@ -37,8 +51,238 @@ class LLMError(Exception):
         self.kind = kind
 
 
+# ─── Provider rate limiting ──────────────────────────────────────────────────
+# One token bucket per provider, shared by every thread in the process (a
+# parallel expand fans packets out over a thread pool). A bucket starts
+# unbounded and learns its quota from the provider's own rate-limit headers,
+# so a fresh process never invents a limit. A 429 closes the bucket for every
+# thread until the announced reset instead of letting each one retry into the
+# same throttle.
+
+HTTP_RETRIES = 4
+BACKOFF_BASE_S = 1.0
+BACKOFF_CAP_S = 60.0
+MAX_RETRY_AFTER_S = 300.0
+
+_LIMIT_HEADERS = ("anthropic-ratelimit-requests-limit", "x-ratelimit-limit-requests")
+# (remaining, reset) pairs; any exhausted quota blocks until its reset.
+_QUOTA_HEADERS = (
+    ("anthropic-ratelimit-requests-remaining", "anthropic-ratelimit-requests-reset"),
+    ("anthropic-ratelimit-tokens-remaining", "anthropic-ratelimit-tokens-reset"),
+    ("x-ratelimit-remaining-requests", "x-ratelimit-reset-requests"),
+    ("x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens"),
+)
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def _header(headers, name):
+    """Case-insensitive header lookup over HTTPMessage or a plain dict."""
+    if not headers:
+        return None
+    try:
+        value = headers.get(name)
+    except AttributeError:
+        return None
+    if value is None and isinstance(headers, dict):
+        lowered = name.lower()
+        for key, candidate in headers.items():
+            if str(key).lower() == lowered:
+                return candidate
+    return value
+
+
+def _parse_reset(value):
+    """Seconds until a reset/Retry-After value, or None if unparseable.
+
+    Accepts plain seconds (``"2"``), OpenAI durations (``"6m0s"``, ``"20ms"``),
+    RFC 3339 timestamps (Anthropic) and HTTP-dates (``Retry-After``)."""
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(text)
+    if parts and "".join(n + u for n, u in parts) == text:
+        scale = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+        return sum(float(n) * scale[u] for n, u in parts)
+    when = None
+    try:
+        when = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _as_count(value):
+    try:
+        count = int(float(str(value).strip()))
+    except (TypeError, ValueError):
+        return None
+    return count if count >= 0 else None
+
+
+class RateLimiter:
+    """Thread-safe request budget for one provider.
+
+    Reservation-style token bucket: ``acquire`` takes a token (going into
+    debt when empty) and sleeps until that token's slot, so waiting callers
+    are spaced at the refill rate instead of waking together. ``capacity`` is
+    the provider-announced requests-per-minute; ``None`` means unbounded.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.capacity = None
+        self.tokens = None
+        self.blocked_until = 0.0
+        self._stamp = _monotonic()
+
+    def _refill(self, now):
+        if self.capacity and self.tokens is not None:
+            gained = (now - self._stamp) * self.capacity / 60.0
+            self.tokens = min(float(self.capacity), self.tokens + gained)
+        self._stamp = now
+
+    def acquire(self):
+        """Block until this caller may send one request."""
+        with self._lock:
+            now = _monotonic()
+            self._refill(now)
+            wait = self.blocked_until - now
+            if self.capacity and self.tokens is not None:
+                self.tokens -= 1.0
+                if self.tokens < 0:
+                    wait = max(wait, -self.tokens * 60.0 / self.capacity)
+        if wait > 0:
+            _sleep(wait)
+
+    def throttle(self, seconds):
+        """Close the bucket for every caller for ``seconds``."""
+        with self._lock:
+            now = _monotonic()
+            self.blocked_until = max(self.blocked_until, now + max(0.0, seconds))
+
+    def observe(self, headers):
+        """Fold provider rate-limit headers into the bucket.
+
+        Returns the ``Retry-After`` hint in seconds (or None)."""
+        with self._lock:
+            now = _monotonic()
+            self._refill(now)
+            for name in _LIMIT_HEADERS:
+                limit = _as_count(_header(headers, name))
+                if limit:
+                    self.capacity = limit
+                    if self.tokens is None:
+                        self.tokens = float(limit)
+                    break
+            for remaining_name, reset_name in _QUOTA_HEADERS:
+                remaining = _as_count(_header(headers, remaining_name))
+                if remaining is None:
+                    continue
+                if "requests" in remaining_name and self.tokens is not None:
+                    self.tokens = min(self.tokens, float(remaining))
+                if remaining == 0:
+                    reset = _parse_reset(_header(headers, reset_name))
+                    if reset is not None:
+                        reset = min(reset, MAX_RETRY_AFTER_S)
+                        self.blocked_until = max(self.blocked_until, now + reset)
+        retry_after = _parse_reset(_header(headers, "Retry-After"))
+        return min(retry_after, MAX_RETRY_AFTER_S) if retry_after is not None else None
+
+
+_LIMITERS = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def limiter_for(provider):
+    """The process-wide RateLimiter for ``provider``."""
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(provider)
+        if limiter is None:
+            limiter = _LIMITERS[provider] = RateLimiter()
+        return limiter
+
+
+def reset_rate_limits():
+    """Forget every learned quota (tests, or after reconfiguring providers)."""
+    with _LIMITERS_LOCK:
+        _LIMITERS.clear()
+
+
+def _backoff_delay(retry_index, hint=None):
+    """Full-jitter exponential backoff, never shorter than a server hint."""
+    ceiling = min(BACKOFF_CAP_S, BACKOFF_BASE_S * (2 ** retry_index))
+    delay = _random() * ceiling
+    if hint is not None:
+        delay = max(delay, hint)
+    return delay
+
+
+# ─── Key discovery ───────────────────────────────────────────────────────────
+# Every structured-gen call discovers its key, so .env is parsed once per
+# (path, mtime, size, inode) rather than once per lookup. The environment is
+# still read live. invalidate_key_cache() drops the parse and bumps
+# credentials_epoch(), which the provider resolver folds into its memo key —
+# called on reconfiguration and whenever a provider rejects the key (401/403).
+
+# lib._read_env_file_value's grammar, kept to one line so an empty value
+# never swallows the next assignment; the first assignment wins.
+_DOTENV_LINE = re.compile(
+    r"^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*['\"]?([^'\"\n#]+)", re.MULTILINE
+)
+_DOTENV_CACHE: dict[str, tuple[tuple, dict]] = {}
+_DOTENV_LOCK = threading.Lock()
+_CREDENTIALS_EPOCH = 0
+
+
+def credentials_epoch():
+    return _CREDENTIALS_EPOCH
+
+
+def invalidate_key_cache():
+    """Forget parsed .env files and start a new credentials epoch."""
+    global _CREDENTIALS_EPOCH
+    with _DOTENV_LOCK:
+        _DOTENV_CACHE.clear()
+        _CREDENTIALS_EPOCH += 1
+
+
+def _dotenv(path=Path(".env")):
+    """{NAME: value} for an env file, re-parsed only when the file changes."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return {}
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    key = os.path.abspath(path)
+    with _DOTENV_LOCK:
+        cached = _DOTENV_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+    try:
+        text = Path(path).read_text()
+    except OSError:
+        return {}
+    values = {}
+    for match in _DOTENV_LINE.finditer(text):
+        values.setdefault(match.group(1), match.group(2).strip())
+    with _DOTENV_LOCK:
+        _DOTENV_CACHE[key] = (stamp, values)
+    return values
+
+
 def _env_or_dotenv(name):
-    return os.environ.get(name) or _read_env_file_value(Path(".env"), name)
+    return os.environ.get(name) or _dotenv().get(name)
 
 
 def discover_key():
@@ -82,6 +326,23 @@ def _resolve_model(model, tier, provider):
     return DEFAULT_OPENAI_MODEL
 
 
+def _budget_candidates(model, tier, provider):
+    """[(tier, model)] for budget admission: the request, then cheaper tiers.
+
+    An explicit *model* is never downgraded; providers with one model per
+    tier ladder collapse to a single candidate.
+    """
+    if model:
+        return [(tier, model)]
+    candidates, seen = [], set()
+    for candidate in budget.tier_candidates(tier):
+        resolved = _resolve_model(None, candidate, provider)
+        if resolved not in seen:
+            seen.add(resolved)
+            candidates.append((candidate, resolved))
+    return candidates
+
+
 def _extract_json(text):
     """loads -> fence-strip -> balanced first {..}/[..] scan."""
     try:
@@ -200,6 +461,7 @@ def _http_call(creds, model, system, prompt, max_tokens, timeout):
 
     req = urllib.request.Request(url, data=json.dumps(body).encode(), headers=headers, method="POST")
     with urllib.request.urlopen(req, timeout=timeout) as resp:
+        limiter_for(creds["provider"]).observe(getattr(resp, "headers", None))
         data = json.loads(resp.read().decode())
     usage_for_telemetry = _usage_fields(creds["provider"], data.get("usageMetadata", {})) if creds["provider"] == "google" else _usage_fields(creds["provider"], data)
 
@@ -216,51 +478,69 @@ def generate_json(prompt, *, system="", schema_hint="", model=None, tier=None,
     """One structured-generation call returning parsed JSON.
 
     Retry policy: ONE retry on invalid JSON (with the parse error fed back);
-    ONE retry on 429/5xx/URLError; 401/403 fail immediately. One telemetry
-    row per HTTP attempt (backend=native-api)."""
+    up to HTTP_RETRIES retries on 429/5xx/URLError with jittered exponential
+    backoff, never shorter than the server's Retry-After; 401/403 fail
+    immediately. A 429 throttles the provider's shared RateLimiter, so every
+    thread waits for capacity instead of retrying into the same limit. One
+    telemetry row per HTTP attempt (backend=native-api)."""
     creds = discover_key()
     if not creds:
         raise LLMError("no_key", "no structured-gen API key available (agent path required)")
 
-    resolved_model = _resolve_model(model, tier, creds["provider"])
+    candidates = _budget_candidates(model, tier, creds["provider"])
+    manager = budget.current()
+    limiter = limiter_for(creds["provider"])
     full_prompt = prompt
     if schema_hint:
         full_prompt += "\n\nReturn ONLY valid JSON matching:\n" + schema_hint
 
     parse_retry = False
-    http_retry_used = False
+    http_retries = 0
     attempt_prompt = full_prompt
 
-    for attempt in range(4):  # bounded: <=2 parse attempts x <=2 http attempts
+    # bounded: <=2 parse attempts x <=HTTP_RETRIES+1 http attempts
+    for attempt in range(2 * (HTTP_RETRIES + 1)):
+        try:
+            ticket = manager.admit(op_class, candidates, (system or "") + attempt_prompt, max_tokens)
+        except budget.BudgetExceeded as e:
+            raise LLMError("budget", str(e))
+        resolved_model = ticket.model
+        limiter.acquire()
         start = time.monotonic()
         status = None
         try:
             text, usage = _http_call(creds, resolved_model, system, attempt_prompt, max_tokens, timeout)
             status = 200
+            ticket.settle(usage)
         except urllib.error.HTTPError as e:
             status = e.code
+            ticket.settle(charged=False)
             _telemetry(op_class, task_id, resolved_model, 1, start, parse_retry, status)
             if e.code in (401, 403):
+                invalidate_key_cache()  # rejected key: re-discover and re-resolve next time
                 raise LLMError("auth", f"HTTP {e.code} from {creds['provider']}")
             if e.code == 429 or e.code >= 500:
-                if http_retry_used:
-                    raise LLMError("http", f"HTTP {e.code} after retry")
-                http_retry_used = True
-                retry_after = e.headers.get("Retry-After") if e.headers else None
-                try:
-                    delay = min(float(retry_after), 5.0) if retry_after else 2.0
-                except (TypeError, ValueError):
-                    delay = 2.0
-                _sleep(delay)
+                if http_retries >= HTTP_RETRIES:
+                    raise LLMError("http", f"HTTP {e.code} after {http_retries} retries")
+                hint = limiter.observe(e.headers)
+                delay = _backoff_delay(http_retries, hint)
+                http_retries += 1
+                if e.code == 429:
+                    limiter.throttle(delay)  # the next acquire() waits it out
+                else:
+                    _sleep(delay)
                 continue
             raise LLMError("http", f"HTTP {e.code}")
         except urllib.error.URLError as e:
+            ticket.settle()  # a timed-out request may still be billed
             _telemetry(op_class, task_id, resolved_model, 1, start, parse_retry, None)
-            if http_retry_used:
-                raise LLMError("timeout", f"network error after retry: {e.reason}")
-            http_retry_used = True
-            _sleep(2.0)
+            if http_retries >= HTTP_RETRIES:
+                raise LLMError("timeout", f"network error after {http_retries} retries: {e.reason}")
+            _sleep(_backoff_delay(http_retries))
+            http_retries += 1
             continue
+        finally:
+            ticket.settle()  # anything unexpected: keep the estimate as spent
 
         result = _extract_json(text)
         telemetry_ref = _telemetry(op_class, task_id, resolved_model, 0 if result is not None else 1,
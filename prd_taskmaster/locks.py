@@ -0,0 +1,63 @@
+"""Lock contention summary (``lock-report``).
+
+lib._flock times every acquisition; with ``ATLAS_LOCK_WAIT_LOG`` set, each
+contended wait is appended there as a JSONL row by whichever process waited.
+This module folds that fleet-wide log into per-file wait statistics.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from prd_taskmaster.lib import LOCK_WAIT_LOG_ENV, CommandError, emit, fail
+from prd_taskmaster.sketch import QuantileSketch
+
+
+def summarize_lock_waits(path=None):
+    """Summarize the lock-wait JSONL written when ``ATLAS_LOCK_WAIT_LOG`` is set.
+
+    One entry per locked file: contended acquisitions (by mode), p50/p95/max
+    wait and total time spent queued. Malformed lines are skipped and counted.
+    """
+    raw = path or os.environ.get(LOCK_WAIT_LOG_ENV)
+    if not raw:
+        raise CommandError(f"no lock-wait log: pass --input or set {LOCK_WAIT_LOG_ENV}")
+    p = Path(raw)
+    groups, skipped = {}, 0
+    if p.is_file():
+        for line in p.read_text().splitlines():
+            try:
+                row = json.loads(line)
+                wait = float(row["wait_ms"])
+                key = str(row["path"])
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                skipped += 1
+                continue
+            g = groups.setdefault(key, {"waits": QuantileSketch(), "total_ms": 0.0,
+                                        "max_ms": 0.0, "modes": {}})
+            g["waits"].add(wait)
+            g["total_ms"] += wait
+            g["max_ms"] = max(g["max_ms"], wait)
+            mode = str(row.get("mode", "ex"))
+            g["modes"][mode] = g["modes"].get(mode, 0) + 1
+
+    files = []
+    for key in sorted(groups, key=lambda k: -groups[k]["total_ms"]):
+        g = groups[key]
+        files.append({
+            "path": key,
+            "contended": g["waits"].count,
+            "modes": g["modes"],
+            "p50_wait_ms": g["waits"].quantile(0.5),
+            "p95_wait_ms": g["waits"].quantile(0.95),
+            "max_wait_ms": round(g["max_ms"], 3),
+            "total_wait_ms": round(g["total_ms"], 3),
+        })
+    return {"ok": True, "log_path": str(p), "skipped_lines": skipped, "files": files}
+
+
+def cmd_lock_report(args):
+    try:
+        emit(summarize_lock_waits(getattr(args, "input", None)))
+    except CommandError as exc:
+        fail(exc.message, **exc.extra)
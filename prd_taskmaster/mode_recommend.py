@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Any
 
 from prd_taskmaster.fleet import engine_config
+from prd_taskmaster.lib import cached_detection
 from prd_taskmaster.providers import (
     _has_perplexity_api_key,
     _is_nested_claude,
@@ -217,9 +218,12 @@ def detect_taskmaster() -> dict:
         return {"ok": True, "method": "none", "version": None, "path": None}
 
 
-def detect_capabilities() -> dict:
+def detect_capabilities(refresh: bool = False) -> dict:
     """Scan for available skills, tools, plugins, and external AI tools.
 
+    Cached per environment fingerprint (see lib.cached_detection); pass
+    refresh=True to force a re-scan.
+
     v4 is designed to be tool-agnostic. Detection covers:
       - Claude Code plugins (superpowers, atlas-*)
       - Claude Code skills (cdd, ralph-loop, phase-executor, etc.)
@@ -238,6 +242,10 @@ def detect_capabilities() -> dict:
       alternative_modes: list
       has_external_ai_tools: bool
     """
+    return cached_detection("capabilities", _detect_capabilities, refresh=refresh)
+
+
+def _detect_capabilities() -> dict:
     capabilities: dict[str, Any] = {}
 
     # ── Claude Code plugin detection ──────────────────────────────────
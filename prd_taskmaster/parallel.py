@@ -17,6 +17,14 @@ Also bridges the tagged tasks.json format (script.py only understands flat):
                  validate-tasks / enrich-tasks.
   4. `inject`  — write the (validated/enriched) flat file back into the tag.
 
+Optional per-tag storage (see lib.py "Task storage layout"):
+  5. `shard`   — split tasks.json into one file per tag plus a manifest, so
+                 writers in different tags lock different files.
+  6. `unshard` — merge the shards back into tasks.json and drop the manifest.
+  7. `export`  — write the merged, pretty-printed tasks.json (for TaskMaster in
+                 the sharded layout, and for humans/diffs in either — state
+                 files are stored compactly, see lib.storage_json_dumps).
+
 All commands print JSON. Tag defaults to .taskmaster/state.json currentTag.
 
 Agent usage pattern (the parallelism lives in the agent, not this script):
@@ -37,7 +45,22 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
-TASKS = Path(".taskmaster/tasks/tasks.json")
+from prd_taskmaster.lib import (
+    CommandError,
+    TAG_SHARD_DIR,
+    atomic_write,
+    load_tasks_raw,
+    read_tag_manifest,
+    register_tag_shard,
+    storage_json_dumps,
+    storage_json_loads,
+    tag_manifest_path,
+    tag_shard_name,
+    tasks_file_for_tag,
+)
+from prd_taskmaster.progress_summary import TASKS_FILE
+
+TASKS = TASKS_FILE
 STATE = Path(".taskmaster/state.json")
 REPORTS = Path(".taskmaster/reports")
 
@@ -64,28 +87,75 @@ def current_tag(args):
     return _resolve_tag(args)
 
 
+def tasks_path(tag=None):
+    """File holding *tag*: its shard when tasks are sharded, else TASKS."""
+    return tasks_file_for_tag(TASKS, tag)
+
+
 def load_tagged(tag):
-    if not TASKS.is_file():
-        fail(f"{TASKS} not found")
-    raw = json.loads(TASKS.read_text())
+    """Return (raw, tag_key) for *tag*; save_tagged(raw, tag_key) writes it back.
+
+    In the sharded layout *raw* is just that tag's shard ({tag: block}).
+    """
+    manifest = read_tag_manifest(TASKS)
+    if manifest is not None and tag not in manifest:
+        fail(f"tag '{tag}' not found in {tag_manifest_path(TASKS)}")
+    path = tasks_path(tag)
+    if not path.is_file():
+        fail(f"{path} not found")
+    raw = storage_json_loads(path.read_text())
     if tag not in raw or not isinstance(raw.get(tag), dict):
         # flat (untagged) file: treat whole file as the tag when it matches
         if "tasks" in raw and isinstance(raw["tasks"], list):
             return raw, None  # flat mode
-        fail(f"tag '{tag}' not found in {TASKS}")
+        fail(f"tag '{tag}' not found in {path}")
     return raw, tag
 
 
+def save_tagged(raw, tag_key):
+    """Write back a payload returned by load_tagged."""
+    write_atomic(tasks_path(tag_key), raw)
+
+
+def store_tag_shard(tag, block):
+    """Sharded layout only: replace (or create) one tag's shard; no other tag is read."""
+    write_atomic(register_tag_shard(TASKS, tag), {tag: block})
+
+
 def get_tasks(raw, tag):
     return raw["tasks"] if tag is None else raw[tag]["tasks"]
 
 
-def write_atomic(path, payload):
+def write_atomic(path, payload, pretty=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(".json.tmp")
-    tmp.write_text(json.dumps(payload, indent=2, default=str))
+    tmp.write_text(storage_json_dumps(payload, pretty=pretty))
     tmp.replace(path)
 
 
+_PACKET_LEAD = (
+    "Research-then-decompose this task for the repo at the current "
+    "working directory. "
+)
+_PACKET_STEPS = (
+    "1) RESEARCH: verify the named files/patterns exist in the repo; "
+    "check library APIs where named (use web/perplexity/context7 if "
+    "available); note pitfalls. 2) COMPLEXITY: score 1-10 + recommended "
+    "subtask count (3-7). 3) DECOMPOSE: TDD-ordered subtasks (each a "
+    "verifiable checkpoint: failing test -> implement -> green; exact "
+    "file paths; one concern per subtask)."
+)
+
+
+def _task_brief(t) -> str:
+    return (
+        "TASK TITLE: " + t["title"] + "\n"
+        "DESCRIPTION: " + str(t.get("description", "")) + "\n"
+        "DETAILS: " + str(t.get("details", "")) + "\n"
+        "TEST STRATEGY: " + str(t.get("testStrategy", "")) + "\n"
+    )
+
+
 def build_packets(tasks, missing_only=True) -> list:
     packets = []
     for t in tasks:
@@ -97,23 +167,91 @@ def build_packets(tasks, missing_only=True) -> list:
             "id": t["id"],
             "title": t["title"],
             "prompt": (
-                "Research-then-decompose this task for the repo at the current "
-                "working directory. TASK TITLE: " + t["title"] + "\n"
-                "DESCRIPTION: " + str(t.get("description", "")) + "\n"
-                "DETAILS: " + str(t.get("details", "")) + "\n"
-                "TEST STRATEGY: " + str(t.get("testStrategy", "")) + "\n\n"
-                "1) RESEARCH: verify the named files/patterns exist in the repo; "
-                "check library APIs where named (use web/perplexity/context7 if "
-                "available); note pitfalls. 2) COMPLEXITY: score 1-10 + recommended "
-                "subtask count (3-7). 3) DECOMPOSE: TDD-ordered subtasks (each a "
-                "verifiable checkpoint: failing test -> implement -> green; exact "
-                "file paths; one concern per subtask). Return ONLY the JSON result "
-                "object per the schema in parallel.py."
+                _PACKET_LEAD + _task_brief(t) + "\n" + _PACKET_STEPS
+                + " Return ONLY the JSON result object per the schema in parallel.py."
             ),
         })
     return packets
 
 
+# ─── Packet batching ──────────────────────────────────────────────────────────
+# Every packet repeats the same lead/steps text and each model call pays the
+# system prompt again, so hundreds of small tasks mean hundreds of round trips
+# of mostly fixed overhead. batch_packets bin-packs small packets into shared
+# requests (one copy of the instructions, results keyed by task id); packets
+# too large for the budget stay single.
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough input-token estimate (chars / 4) — good enough for packing."""
+    return max(1, -(-len(text) // CHARS_PER_TOKEN))
+
+
+def _packet_brief(packet: dict) -> str:
+    """The task-specific part of a packet prompt (the shared lead/steps removed)."""
+    prompt = str(packet.get("prompt", ""))
+    if prompt.startswith(_PACKET_LEAD):
+        prompt = prompt[len(_PACKET_LEAD):]
+    cut = prompt.find("\n" + _PACKET_STEPS)
+    return prompt[:cut] if cut >= 0 else prompt
+
+
+def batch_prompt(packets: list) -> str:
+    """One request covering every packet, results keyed by task id."""
+    sections = [
+        f"=== TASK {packet['id']} ===\n{_packet_brief(packet)}" for packet in packets
+    ]
+    ids = ", ".join(json.dumps(str(packet["id"])) for packet in packets)
+    return (
+        "Research-then-decompose EACH of the following tasks for the repo at the "
+        "current working directory. Treat every task independently.\n\n"
+        + "\n".join(sections) + "\n"
+        + "For every task: " + _PACKET_STEPS + "\n\n"
+        + "Return ONLY one JSON object whose \"results\" maps each task id ("
+        + ids + ") to that task's result object per the schema in parallel.py."
+    )
+
+
+def batch_packets(packets: list, *, token_budget: int, max_tasks: int,
+                  min_batches: int = 1) -> list:
+    """Group packets into batches of at most *max_tasks* within *token_budget*.
+
+    Returns a list of packet lists. Packing is worst-fit decreasing over the
+    task-specific brief sizes, opening at least *min_batches* bins (callers
+    pass their worker count so batching never collapses parallelism) and a
+    new bin whenever nothing fits. A packet whose own prompt exceeds the
+    budget is always alone. Input order is kept inside each batch.
+    """
+    if max_tasks <= 1 or len(packets) <= 1:
+        return [[packet] for packet in packets]
+    order = {id(packet): i for i, packet in enumerate(packets)}
+    sized = sorted(
+        ((estimate_tokens(_packet_brief(p)), p) for p in packets),
+        key=lambda item: (-item[0], order[id(item[1])]),
+    )
+    # Fixed cost of one shared request: lead + steps + the return instructions.
+    overhead = estimate_tokens(batch_prompt([]))
+    singles, bins = [], []
+    for _ in range(min(max(1, min_batches), len(packets))):
+        bins.append([overhead, []])
+    for size, packet in sized:
+        if overhead + size > token_budget:
+            singles.append([packet])
+            continue
+        open_bins = [b for b in bins if len(b[1]) < max_tasks and b[0] + size <= token_budget]
+        if not open_bins:
+            bins.append([overhead, []])
+            open_bins = [bins[-1]]
+        target = min(open_bins, key=lambda b: b[0])
+        target[0] += size
+        target[1].append(packet)
+    batches = [sorted(b[1], key=lambda p: order[id(p)]) for b in bins if b[1]] + singles
+    batches.sort(key=lambda batch: order[id(batch[0])])
+    return batches
+
+
 def cmd_plan(args):
     tag = current_tag(args)
     raw, tag_key = load_tagged(tag)
@@ -158,7 +296,7 @@ def apply_results(results: list, tag: str | None = None, threshold: int = 7) ->
         })
         applied.append(t["id"])
 
-    write_atomic(TASKS, raw)
+    save_tagged(raw, tag_key)
     REPORTS.mkdir(parents=True, exist_ok=True)
     report = {
         "meta": {
@@ -207,10 +345,86 @@ def cmd_inject(args):
     else:
         raw[tag_key]["tasks"] = tasks
         raw[tag_key].setdefault("metadata", {})["updated"] = datetime.now(timezone.utc).isoformat()
-    write_atomic(TASKS, raw)
+    save_tagged(raw, tag_key)
     out({"ok": True, "tag": tag, "injected": len(tasks)})
 
 
+# ─── Sharded layout migration / export ────────────────────────────────────────
+
+def shard_tasks() -> dict:
+    """Split tasks.json into per-tag shards plus a manifest.
+
+    tasks.json is left in place as the merged export TaskMaster reads; after
+    this, refresh it with `export` — the shards are the source of truth.
+    """
+    if read_tag_manifest(TASKS) is not None:
+        return {"ok": True, "already_sharded": True,
+                "tags": sorted(read_tag_manifest(TASKS))}
+    if not TASKS.is_file():
+        raise CommandError(f"{TASKS} not found")
+    raw = json.loads(TASKS.read_text())
+    if not isinstance(raw, dict) or isinstance(raw.get("tasks"), list):
+        raise CommandError(
+            f"{TASKS} is a flat (untagged) file; only tagged files can be sharded"
+        )
+    tags = {k: v for k, v in raw.items()
+            if isinstance(v, dict) and isinstance(v.get("tasks"), list)}
+    if not tags:
+        raise CommandError(f"{TASKS} has no tagged task blocks")
+    shard_dir = TASKS.parent / TAG_SHARD_DIR
+    names = {}
+    for tag, block in tags.items():
+        names[tag] = tag_shard_name(tag)
+        write_atomic(shard_dir / names[tag], {tag: block})
+    # The manifest goes last: until it exists, readers keep using tasks.json.
+    atomic_write(tag_manifest_path(TASKS),
+                 json.dumps({"layout": "sharded", "tags": names}, indent=2))
+    return {"ok": True, "tags": sorted(names), "dir": str(shard_dir)}
+
+
+def export_tasks(output=None) -> dict:
+    """Write the merged, TaskMaster-compatible tasks.json, pretty-printed for
+    humans and diffs whatever the storage encoding."""
+    target = Path(output) if output else TASKS
+    raw = load_tasks_raw(TASKS)
+    write_atomic(target, raw, pretty=True)
+    tags = sorted(raw) if isinstance(raw, dict) else []
+    return {"ok": True, "output": str(target), "tags": tags}
+
+
+def unshard_tasks() -> dict:
+    """Merge the shards back into tasks.json and return to the single-file layout."""
+    manifest = read_tag_manifest(TASKS)
+    if manifest is None:
+        return {"ok": True, "already_single_file": True}
+    result = export_tasks()
+    tag_manifest_path(TASKS).unlink()
+    shard_dir = TASKS.parent / TAG_SHARD_DIR
+    for name in manifest.values():
+        for leftover in (shard_dir / name, shard_dir / (name + ".lock")):
+            leftover.unlink(missing_ok=True)
+    return result
+
+
+def _emit_core(fn, *a):
+    try:
+        out(fn(*a))
+    except (CommandError, json.JSONDecodeError) as exc:
+        fail(str(exc))
+
+
+def cmd_shard(args):
+    _emit_core(shard_tasks)
+
+
+def cmd_unshard(args):
+    _emit_core(unshard_tasks)
+
+
+def cmd_export(args):
+    _emit_core(export_tasks, getattr(args, "output", None))
+
+
 def main():
     p = argparse.ArgumentParser(description=__doc__)
     sub = p.add_subparsers(dest="cmd", required=True)
@@ -236,6 +450,13 @@ def main():
     si.add_argument("--input", required=True)
     si.set_defaults(fn=cmd_inject)
 
+    sub.add_parser("shard").set_defaults(fn=cmd_shard)
+    sub.add_parser("unshard").set_defaults(fn=cmd_unshard)
+
+    sx = sub.add_parser("export")
+    sx.add_argument("--output")
+    sx.set_defaults(fn=cmd_export)
+
     args = p.parse_args()
     args.fn(args)
 
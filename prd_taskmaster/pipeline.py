@@ -8,7 +8,15 @@ import json
 from pathlib import Path
 from typing import Any, Optional
 
-from prd_taskmaster.lib import atomic_write, locked_update, read_json, emit_json_error, now_iso
+from prd_taskmaster.lib import (
+    atomic_write,
+    emit_json_error,
+    load_tasks_raw,
+    locked_update,
+    now_iso,
+    read_json,
+    tasks_storage_exists,
+)
 
 ATLAS_AI_DIR = Path(".atlas-ai")
 STATE_DIR = ATLAS_AI_DIR / "state"
@@ -125,10 +133,10 @@ def _read_taskmaster_state() -> dict:
 
 
 def _read_taskmaster_tasks() -> dict:
-    if not TASKS_FILE.exists():
+    if not tasks_storage_exists(TASKS_FILE):
         return {}
     try:
-        tasks = read_json(TASKS_FILE)
+        tasks = load_tasks_raw(TASKS_FILE)
         return tasks if isinstance(tasks, dict) else {}
     except Exception:
         return {}
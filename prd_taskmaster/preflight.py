@@ -11,9 +11,11 @@ from prd_taskmaster.lib import (
     CommandError,
     emit,
     fail,
-    _detect_taskmaster_method,
+    _detect_taskmaster_cached,
     _read_execution_state,
     _resolve_tasks_payload,
+    load_tasks_raw,
+    tasks_storage_exists,
 )
 
 
@@ -39,20 +41,19 @@ def run_preflight() -> dict:
 
         # Count tasks
         tasks_json = TASKMASTER_TASKS / "tasks.json"
-        if tasks_json.is_file():
+        if tasks_storage_exists(tasks_json):
             try:
-                with open(tasks_json) as f:
-                    data = json.load(f)
+                data = load_tasks_raw(tasks_json)
                 tasks, _ = _resolve_tasks_payload(data)
                 if isinstance(tasks, list):
                     task_count = len(tasks)
                     tasks_completed = sum(1 for t in tasks if t.get("status") == "done")
                     tasks_pending = task_count - tasks_completed
-            except (json.JSONDecodeError, KeyError):
+            except (json.JSONDecodeError, KeyError, CommandError):
                 pass
 
     # Detect taskmaster method
-    tm_method = _detect_taskmaster_method()
+    tm_method = _detect_taskmaster_cached()
 
     # Check CLAUDE.md
     has_claude_md = Path("CLAUDE.md").is_file()
@@ -81,14 +82,14 @@ def cmd_preflight(args: argparse.Namespace) -> None:
         fail(e.message, **e.extra)
 
 
-def run_detect_taskmaster() -> dict:
-    """Detect taskmaster method: MCP > CLI > none."""
-    result = _detect_taskmaster_method()
+def run_detect_taskmaster(refresh: bool = False) -> dict:
+    """Detect taskmaster method: MCP > CLI > none (cached; refresh re-detects)."""
+    result = _detect_taskmaster_cached(refresh=refresh)
     return {"ok": True, **result}
 
 
 def cmd_detect_taskmaster(args: argparse.Namespace) -> None:
     try:
-        emit(run_detect_taskmaster())
+        emit(run_detect_taskmaster(refresh=getattr(args, "refresh", False)))
     except CommandError as e:
         fail(e.message, **e.extra)
@@ -0,0 +1,113 @@
+"""In-progress summary shared by task_state and hooks/evidence_gate.py.
+
+The evidence Stop hook only needs the master tag's in-progress tasks and the
+pipeline phase. task_state re-derives that small summary after every status
+write; the hook trusts it while the (mtime_ns, size, inode) fingerprints of
+the tasks file and pipeline.json it was derived from still match, and
+otherwise scans and rewrites it.
+
+Both sides take every path from this module so they cannot drift apart.
+Stdlib only: the hook imports it without loading the rest of the package.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+TASKS_FILE = Path(".taskmaster") / "tasks" / "tasks.json"
+PIPELINE_FILE = Path(".atlas-ai") / "state" / "pipeline.json"
+SUMMARY_FILE = Path(".atlas-ai") / "state" / "in-progress.json"
+# Sharded layout, as written by lib.register_tag_shard: tags/manifest.json maps
+# each tag to its shard file beside the manifest.
+TAG_MANIFEST = TASKS_FILE.parent / "tags" / "manifest.json"
+
+
+def file_fingerprint(path: "str | Path") -> "list[int] | None":
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size, st.st_ino]
+
+
+def master_tasks_file(root: "str | Path" = ".") -> Path:
+    """The file holding the master tag, relative to *root*.
+
+    Its shard when tasks are sharded (same answer as
+    ``parallel.tasks_path("master")``), else tasks.json. In the sharded
+    layout tasks.json is only an export and goes stale. An unreadable
+    manifest falls back to tasks.json, which fails loudly in task_state.
+    """
+    try:
+        tags = json.loads((Path(root) / TAG_MANIFEST).read_text())["tags"]
+        return TAG_MANIFEST.parent / str(tags.get("master") or "master.json")
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return TASKS_FILE
+
+
+def in_progress_entries(raw: Any) -> list:
+    """``{id, subtasks, evidence}`` for each in-progress master task in *raw*."""
+    block = raw.get("master") if isinstance(raw, dict) else None
+    tasks = block.get("tasks") if isinstance(block, dict) else None
+    return [
+        {
+            "id": task.get("id"),
+            "subtasks": len(task.get("subtasks") or []),
+            "evidence": len(task.get("evidence_files") or []),
+        }
+        for task in tasks or []
+        if isinstance(task, dict) and task.get("status") == "in-progress"
+    ]
+
+
+def build_summary(raw: Any, source: "str | Path", phase: Any,
+                  tasks_fingerprint: "list[int] | None",
+                  pipeline_fingerprint: "list[int] | None") -> dict:
+    """The summary of *raw*, parsed from *source* (relative to the project root)."""
+    return {
+        "source": Path(source).as_posix(),
+        "tasks_fingerprint": tasks_fingerprint,
+        "pipeline_fingerprint": pipeline_fingerprint,
+        "current_phase": phase,
+        "in_progress": in_progress_entries(raw),
+    }
+
+
+def fresh_summary(root: "str | Path",
+                  load_json: Callable[[Path], Any]) -> "dict | None":
+    """The stored summary if it still matches both of its source files, else None.
+
+    A summary derived from any file other than the current master file (say
+    the tasks.json export, after ``tasks-shard``) is stale however fresh its
+    fingerprint looks.
+    """
+    root = Path(root)
+    try:
+        summary = load_json(root / SUMMARY_FILE)
+    except Exception:
+        return None
+    source = master_tasks_file(root)
+    if not isinstance(summary, dict) or summary.get("source") != source.as_posix():
+        return None
+    tasks_fp = file_fingerprint(root / source)
+    pipeline_fp = file_fingerprint(root / PIPELINE_FILE)
+    if tasks_fp is None or pipeline_fp is None:
+        return None
+    if summary.get("tasks_fingerprint") != tasks_fp or summary.get("pipeline_fingerprint") != pipeline_fp:
+        return None
+    return summary
+
+
+def store_summary(root: "str | Path", summary: dict) -> None:
+    """Atomically replace the stored summary; best effort, never raises."""
+    try:
+        path = Path(root) / SUMMARY_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(summary, separators=(",", ":")))
+        os.replace(tmp, path)
+    except Exception:
+        pass
@@ -14,21 +14,38 @@ Nothing here spawns a process or hits the network: it consults
   - _probe_spawn_cached(provider,ttl) -> empirical nested-spawn check (cached)
   - discover_key()                    -> raw-key API creds
 The cli_agent / llm_client actually run the chosen tier downstream.
+
+cli and api handles are memoized per (role, op_class, config fingerprint);
+see _config_fingerprint for what invalidates them, and
+invalidate_provider_cache() for the explicit reset.
 """
 
+import hashlib
+import json
 import os
 import shutil
+import threading
+import time
 from dataclasses import dataclass
 
+from prd_taskmaster import llm_client
 from prd_taskmaster.fleet import engine_config
-from prd_taskmaster.lib import _read_taskmaster_model
+from prd_taskmaster.lib import TASKMASTER_DIR, _read_taskmaster_model
 from prd_taskmaster.llm_client import discover_key
 from prd_taskmaster.providers import (
+    _PROBE_CACHE,
     _SPAWNING_PROVIDERS,
     _provider_usable,
     _probe_spawn_cached,
 )
 
+# Every env var a tier decision reads (discover_key + _usability_facts).
+_CREDENTIAL_ENV = (
+    "ANTHROPIC_API_KEY", "OPENAI_API_KEY", "OPENAI_BASE_URL",
+    "OPENAI_COMPATIBLE_API_KEY", "OPENAI_COMPATIBLE_BASE_URL",
+    "GOOGLE_API_KEY", "GEMINI_API_KEY", "PERPLEXITY_API_KEY", "PATH",
+)
+
 
 @dataclass(frozen=True)
 class ProviderHandle:
@@ -80,13 +97,74 @@ def _plan_floor(role: str, model, reason: str) -> ProviderHandle:
     return ProviderHandle(kind="plan", provider="", role=role, model=model, reason=reason)
 
 
+# ─── Memo ────────────────────────────────────────────────────────────────────
+# The backend resolves a role for every parse / expand / rate call. The walk
+# re-reads .taskmaster/config.json, re-checks CLIs and re-discovers keys,
+# none of which change between calls unless a file, the environment or the
+# credentials epoch does. Only cli and api handles are memoized: a plan
+# floor is usually the product of a failed spawn probe, which must stay
+# retryable (same rule as _probe_spawn_cached), and a cli handle lives no
+# longer than the probe TTL it rests on.
+
+_MEMO: dict[tuple, tuple[float, "ProviderHandle"]] = {}
+_MEMO_LOCK = threading.Lock()
+
+
+def _stat(path) -> "tuple | None":
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _config_fingerprint(engine: dict) -> str:
+    """Everything resolve_provider's answer depends on, hashed (keys included)."""
+    facts = {
+        "cwd": os.getcwd(),
+        "engine": engine,
+        "taskmaster_config": _stat(TASKMASTER_DIR / "config.json"),
+        "dotenv": _stat(".env"),
+        "env": [os.environ.get(name) for name in _CREDENTIAL_ENV],
+        "epoch": llm_client.credentials_epoch(),
+    }
+    return hashlib.sha256(json.dumps(facts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def invalidate_provider_cache() -> None:
+    """Forget resolved handles, parsed keys and spawn probes.
+
+    Called after providers are reconfigured; llm_client bumps the credentials
+    epoch by itself when a call fails with an auth error.
+    """
+    with _MEMO_LOCK:
+        _MEMO.clear()
+    _PROBE_CACHE.clear()
+    llm_client.invalidate_key_cache()
+
+
 def resolve_provider(role, op_class="structured_gen", *, fleet_config=None) -> ProviderHandle:
     # op_class is reserved for Chunk 4 op-class routing; accepted here but not yet used.
     """Resolve the provider tier for one role. See module docstring for precedence."""
     engine = engine_config(fleet_config)
+    ttl_s = (engine.get("cli_agent") or {}).get("probe_cache_ttl_s", 900)
+    key = (role, op_class, _config_fingerprint(engine))
+    now = time.monotonic()
+    with _MEMO_LOCK:
+        cached = _MEMO.get(key)
+    if cached is not None and (cached[1].kind != "cli" or now - cached[0] < ttl_s):
+        return cached[1]
+
+    handle = _resolve_uncached(role, engine, ttl_s)
+    if handle.kind in ("cli", "api"):
+        with _MEMO_LOCK:
+            _MEMO[key] = (now, handle)
+    return handle
+
+
+def _resolve_uncached(role, engine: dict, ttl_s: int) -> ProviderHandle:
     mode = engine.get("provider_mode", "hybrid")
     keyless = engine.get("keyless_default")  # True | False | None
-    ttl_s = (engine.get("cli_agent") or {}).get("probe_cache_ttl_s", 900)
 
     role_cfg = _read_taskmaster_model(role) or {}
     provider = str(role_cfg.get("provider", "")).lower()
@@ -385,6 +385,10 @@ def run_configure_providers(economy: str | None = None) -> dict:
     config.setdefault("global", {}).setdefault("defaultTag", "master")
     _write_taskmaster_config(config)
 
+    from prd_taskmaster.provider_resolver import invalidate_provider_cache
+
+    invalidate_provider_cache()
+
     return {
         "ok": True,
         "changed": changed,
@@ -42,7 +42,9 @@ Known v1 limitations (not fixed here; deferred to future iterations)
 
 from __future__ import annotations
 
+import fnmatch
 import logging
+import os
 import re
 import subprocess
 import sys
@@ -50,6 +52,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from prd_taskmaster.filescan import list_files
+
 logger = logging.getLogger(__name__)
 
 # ─── Sentinel exception ───────────────────────────────────────────────────────
@@ -91,6 +95,9 @@ _EXCLUDE_NAME_RE = re.compile(
 # Directories whose children are always excluded.
 _EXCLUDE_DIRS_RE = re.compile(r"(^|/)(__tests__|tests)/")
 
+# Directories the importer search never descends into.
+_SKIP_IMPORTER_DIRS = {"tests", "__tests__"}
+
 # Language source extensions.
 _LANG_EXTS: dict[str, set[str]] = {
     "py":  {".py"},
@@ -163,8 +170,105 @@ def new_modules_for_task(
         logger.warning(msg)
         raise ReachabilityError(msg)
 
+    return _filter_new_modules(result.stdout.splitlines(), exts)
+
+
+def new_modules_for_commits(
+    repo_root: Path,
+    start_commits: "list[str]",
+    head: str = "HEAD",
+) -> "dict[str, list[Path]]":
+    """Batch form of new_modules_for_task: added modules for many start commits.
+
+    Resolves every start commit and *head* to trees in one ``git cat-file
+    --batch-check`` call, then diffs every (start, head) tree pair in one
+    ``git diff-tree --stdin`` call. Rename detection (``-M``) matches the
+    porcelain ``git diff`` default, so a renamed file is not reported as added.
+
+    Returns ``{start_commit: [module, ...]}`` for each commit that resolved.
+    Start commits git cannot resolve are left OUT of the mapping — callers
+    fall back to new_modules_for_task for those, which produces the exact
+    per-task ReachabilityError. Raises ReachabilityError if *head* does not
+    resolve or either git call fails outright.
+    """
+    repo_root = Path(repo_root)
+    exts = _LANG_EXTS.get(language_for_repo(repo_root), set())
+    commits = list(dict.fromkeys(c for c in start_commits if c))
+    if not commits:
+        return {}
+
+    resolved = subprocess.run(
+        ["git", "-C", str(repo_root), "cat-file", "--batch-check"],
+        input="".join(f"{c}^{{tree}}\n" for c in [head, *commits]),
+        capture_output=True,
+        text=True,
+    )
+    if resolved.returncode != 0:
+        msg = (
+            f"new_modules_for_commits: git cat-file failed (rc={resolved.returncode}): "
+            f"{resolved.stderr.strip()}"
+        )
+        logger.warning(msg)
+        raise ReachabilityError(msg)
+    trees: list["str | None"] = []
+    for line in resolved.stdout.splitlines():
+        fields = line.split()
+        trees.append(fields[0] if len(fields) == 3 and fields[1] == "tree" else None)
+    if len(trees) != len(commits) + 1 or trees[0] is None:
+        msg = f"new_modules_for_commits: cannot resolve {head!r} to a tree"
+        logger.warning(msg)
+        raise ReachabilityError(msg)
+
+    head_tree = trees[0]
+    by_tree: dict[str, list[str]] = {}
+    for commit, tree in zip(commits, trees[1:]):
+        if tree is not None:
+            by_tree.setdefault(tree, []).append(commit)
+    if not by_tree:
+        return {}
+
+    pairs = [f"{tree} {head_tree}\n" for tree in by_tree]
+    result = subprocess.run(
+        ["git", "-C", str(repo_root), "diff-tree", "--stdin", "-r", "-M",
+         "--diff-filter=A", "--name-status", "-z"],
+        input="".join(pairs).encode(),
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        msg = (
+            f"new_modules_for_commits: git diff-tree failed (rc={result.returncode}): "
+            f"{result.stderr.decode(errors='replace').strip()}"
+        )
+        logger.warning(msg)
+        raise ReachabilityError(msg)
+
+    # Output per pair: the echoed "<tree> <tree>\n" header, then "A\0<path>\0"
+    # entries (-z) until the next header.
+    out = result.stdout
+    pos = 0
+    modules: dict[str, list[Path]] = {}
+    for tree, header in zip(by_tree, pairs):
+        header_bytes = header.encode()
+        if not out.startswith(header_bytes, pos):
+            msg = "new_modules_for_commits: unexpected git diff-tree output"
+            logger.warning(msg)
+            raise ReachabilityError(msg)
+        pos += len(header_bytes)
+        added: list[str] = []
+        while out.startswith(b"A\0", pos):
+            end = out.index(b"\0", pos + 2)
+            added.append(os.fsdecode(out[pos + 2:end]))
+            pos = end + 1
+        found = _filter_new_modules(added, exts)
+        for commit in by_tree[tree]:
+            modules[commit] = list(found)
+    return modules
+
+
+def _filter_new_modules(paths: "list[str]", exts: "set[str]") -> list[Path]:
+    """Keep source files of the repo language that are not tests/barrels/etc."""
     modules: list[Path] = []
-    for line in result.stdout.splitlines():
+    for line in paths:
         path = line.strip()
         if not path:
             continue
@@ -183,7 +287,12 @@ def new_modules_for_task(
     return modules
 
 
-def find_importers(repo_root: Path, module: Path, lang: str) -> list[Path]:
+def find_importers(
+    repo_root: Path,
+    module: Path,
+    lang: str,
+    index: "ImportIndex | None" = None,
+) -> list[Path]:
     """Return repo-relative Paths of files that import *module*, excluding the module itself
     and all test files (co-located, under tests/, tests/core/, __tests__/, or any
     path matching the test-file patterns).
@@ -210,6 +319,9 @@ def find_importers(repo_root: Path, module: Path, lang: str) -> list[Path]:
       - grep exit code >= 2 = real error → RAISES ReachabilityError.
       Test-file importers are excluded from the result.
 
+    When *index* is given, patterns are evaluated against its read-once file
+    cache instead of spawning grep (same matches; see ImportIndex).
+
     Returns repo-relative Paths.
     """
     repo_root = Path(repo_root)
@@ -229,21 +341,27 @@ def find_importers(repo_root: Path, module: Path, lang: str) -> list[Path]:
     # Also check tests/ sibling directory.
     exclude_paths.add((parent.parent / "tests" / f"test_{stem}{module.suffix}").as_posix())
 
+    # `hint` is a literal every matching line must contain (lets the index
+    # skip the regexes on lines that cannot match).
     if lang == "py":
         patterns = _py_import_patterns(module)
-        raw = _grep_patterns(repo_root, patterns, "*.py")
+        globs, hint = ["*.py"], stem
     elif lang in ("ts", "js"):
         patterns = _ts_import_patterns(module)
-        globs = ["*.ts", "*.tsx", "*.js", "*.jsx", "*.mjs", "*.cjs"]
-        raw = []
-        for g in globs:
-            raw.extend(_grep_patterns(repo_root, patterns, g))
+        globs, hint = ["*.ts", "*.tsx", "*.js", "*.jsx", "*.mjs", "*.cjs"], stem
     elif lang == "go":
         patterns = _go_import_patterns(repo_root, module)
-        raw = _grep_patterns(repo_root, patterns, "*.go")
+        globs, hint = ["*.go"], parent.as_posix()
     else:
         return []
 
+    raw: list[Path] = []
+    for g in globs:
+        if index is not None:
+            raw.extend(index.grep(patterns, g, hint=hint))
+        else:
+            raw.extend(_grep_patterns(repo_root, patterns, g))
+
     importers: list[Path] = []
     seen: set[str] = set()
     for p in raw:
@@ -266,6 +384,7 @@ def reachability_verdict(
     lang: str,
     reachable_via: str | None = None,
     tier: str = "domain-model",
+    index: "ImportIndex | None" = None,
 ) -> dict:
     """Compute the reachability verdict for a single *module*.
 
@@ -311,7 +430,7 @@ def reachability_verdict(
 
     # Step 2: importer sweep.
     try:
-        importers = find_importers(repo_root, module, lang)
+        importers = find_importers(repo_root, module, lang, index=index)
     except ReachabilityError as exc:
         logger.warning(
             "reachability_verdict: find_importers raised ReachabilityError for %s: %s — returning ERROR",
@@ -343,6 +462,9 @@ def sweep_task(
     repo_root: Path,
     task: dict,
     start_commit: str,
+    *,
+    new_modules: "list[Path] | None" = None,
+    index: "ImportIndex | None" = None,
 ) -> dict:
     """Run the reachability sweep for a task.
 
@@ -363,6 +485,10 @@ def sweep_task(
       ORPHAN → BLOCKING
       ERROR  → BLOCKING (never silently pass on a broken environment)
 
+    Batch callers (reachability_cmd.run_reachability_sweep_batch) pass
+    precomputed *new_modules* (from new_modules_for_commits) and a shared
+    *index* so N tasks cost one git pass and one read of the tree.
+
     Returns::
 
         {
@@ -408,7 +534,8 @@ def sweep_task(
     # Sweep (tier in {wired, live}).
     lang = language_for_repo(repo_root)
     try:
-        new_modules = new_modules_for_task(repo_root, start_commit)
+        if new_modules is None:
+            new_modules = new_modules_for_task(repo_root, start_commit)
     except ReachabilityError as exc:
         logger.warning("sweep_task: new_modules_for_task raised ReachabilityError: %s — returning ERROR", exc)
         return {
@@ -430,6 +557,7 @@ def sweep_task(
             lang=lang,
             reachable_via=reachable_via,
             tier=tier,
+            index=index,
         )
         module_verdicts.append(v)
 
@@ -458,6 +586,77 @@ def sweep_task(
     return result
 
 
+# ─── Shared importer index (batch sweeps) ─────────────────────────────────────
+
+class ImportIndex:
+    """Read-once view of the repo's source files for many find_importers calls.
+
+    Mirrors ``_grep_patterns``: candidate files come from ``_source_files``
+    and a file matches when any pattern matches one of its lines. Each file
+    is read once, so a sweep over N modules costs one listing instead of
+    N x patterns grep processes. An unreadable file raises ReachabilityError,
+    as grep's rc=2 would.
+    """
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = Path(repo_root)
+        self._files: dict[str, list[str]] = {}
+        self._text: dict[str, str] = {}
+        self._compiled: dict[str, "re.Pattern[str]"] = {}
+
+    def files(self, glob: str) -> list[str]:
+        """Repo-relative posix paths the importer search considers for *glob*."""
+        cached = self._files.get(glob)
+        if cached is None:
+            cached = self._files[glob] = _source_files(self.repo_root, glob)
+        return cached
+
+    def _read(self, rel: str) -> str:
+        text = self._text.get(rel)
+        if text is None:
+            try:
+                data = (self.repo_root / rel).read_bytes()
+            except OSError as exc:
+                msg = f"ImportIndex: cannot read {rel}: {exc}"
+                logger.warning(msg)
+                raise ReachabilityError(msg) from exc
+            text = data.decode("utf-8", errors="surrogateescape")
+            self._text[rel] = text
+        return text
+
+    def _regex(self, pattern: str) -> "re.Pattern[str]":
+        compiled = self._compiled.get(pattern)
+        if compiled is None:
+            try:
+                compiled = re.compile(pattern)
+            except re.error as exc:
+                msg = f"ImportIndex: invalid pattern {pattern!r}: {exc}"
+                logger.warning(msg)
+                raise ReachabilityError(msg) from exc
+            self._compiled[pattern] = compiled
+        return compiled
+
+    def grep(self, patterns: "list[str]", glob: str, *, hint: str = "") -> list[Path]:
+        """Files matching any of *patterns* on some line (``grep -El`` semantics).
+
+        *hint*, when given, must be a literal contained in every matching
+        line; lines without it are skipped before the regexes run.
+        """
+        regexes = [self._regex(p) for p in patterns]
+        found: list[Path] = []
+        for rel in self.files(glob):
+            text = self._read(rel)
+            if hint and hint not in text:
+                continue
+            for line in text.split("\n"):
+                if hint and hint not in line:
+                    continue
+                if any(r.search(line) for r in regexes):
+                    found.append(Path(rel))
+                    break
+        return found
+
+
 # ─── Internal helpers ─────────────────────────────────────────────────────────
 
 def _py_import_patterns(module: Path) -> list[str]:
@@ -514,8 +713,30 @@ def _go_import_patterns(repo_root: Path, module: Path) -> list[str]:
     return [rf'"{re.escape(pkg_dir)}"']
 
 
+_GREP_CHUNK = 1000
+
+
+def _source_files(repo_root: Path, glob: str) -> list[str]:
+    """Files the importer search considers: basename matches *glob*, not under
+    a tests/ or __tests__/ directory, drawn from filescan.list_files (git's
+    tracked + untracked-not-ignored view, minus exclude globs)."""
+    files: list[str] = []
+    for rel in list_files(repo_root):
+        parts = rel.split("/")
+        if not fnmatch.fnmatchcase(parts[-1], glob):
+            continue
+        if any(d in _SKIP_IMPORTER_DIRS for d in parts[:-1]):
+            continue
+        files.append(rel)
+    return files
+
+
 def _grep_patterns(repo_root: Path, patterns: list[str], glob: str) -> list[Path]:
-    """Run grep -rEl for each pattern across files matching *glob* under *repo_root*.
+    """Run grep -El for each pattern across files matching *glob* under *repo_root*.
+
+    The candidate files come from _source_files (so ignored trees such as
+    node_modules or virtualenvs are never searched) and are passed to grep
+    explicitly, in chunks of _GREP_CHUNK.
 
     Returns a deduplicated list of repo-relative Paths of matching files.
 
@@ -526,37 +747,34 @@ def _grep_patterns(repo_root: Path, patterns: list[str], glob: str) -> list[Path
         RAISES ReachabilityError.  The caller must propagate this upward so that
         the sweep returns ERROR rather than a false WIRED/ORPHAN.
     """
+    files = _source_files(repo_root, glob)
     found: set[str] = set()
     for pattern in patterns:
-        result = subprocess.run(
-            ["grep", "-rEl", "--include", glob,
-             "--exclude-dir=tests", "--exclude-dir=__tests__",
-             pattern, "."],
-            cwd=str(repo_root),
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            # Matches found.
-            pass
-        elif result.returncode == 1:
-            # No matches — completely normal, not an error.
-            continue
-        else:
-            # rc >= 2: real grep error.
-            msg = (
-                f"_grep_patterns: grep returned rc={result.returncode} "
-                f"for pattern {pattern!r}: {result.stderr.strip()}"
+        for start in range(0, len(files), _GREP_CHUNK):
+            result = subprocess.run(
+                ["grep", "-El", "-e", pattern, "--", *files[start:start + _GREP_CHUNK]],
+                cwd=str(repo_root),
+                capture_output=True,
+                text=True,
             )
-            logger.warning(msg)
-            raise ReachabilityError(msg)
-
-        for line in result.stdout.splitlines():
-            line = line.strip()
-            if line:
-                # Strip leading "./" from grep output.
-                if line.startswith("./"):
-                    line = line[2:]
-                found.add(line)
+            if result.returncode == 0:
+                # Matches found.
+                pass
+            elif result.returncode == 1:
+                # No matches — completely normal, not an error.
+                continue
+            else:
+                # rc >= 2: real grep error.
+                msg = (
+                    f"_grep_patterns: grep returned rc={result.returncode} "
+                    f"for pattern {pattern!r}: {result.stderr.strip()}"
+                )
+                logger.warning(msg)
+                raise ReachabilityError(msg)
+
+            for line in result.stdout.splitlines():
+                line = line.strip()
+                if line:
+                    found.add(line)
 
     return [Path(p) for p in sorted(found)]
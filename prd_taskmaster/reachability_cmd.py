@@ -8,6 +8,12 @@ run_reachability_sweep(task_id, start_commit, cwd=None) -> dict
     (atomic, additive — preserves all other card keys)
   - Returns the full sweep verdict dict
 
+run_reachability_sweep_batch(task_ids=None, ..., cwd=None) -> dict
+  - Sweeps every done task (or the given ids) in one pass: tasks.json is read
+    once, new modules for all start commits come from one git diff-tree call,
+    importers are matched against one shared ImportIndex, and the CDD cards
+    are written together at the end (`reachability-sweep --all`).
+
 Exit code convention (enforced by cmd_reachability_sweep):
   0 → verdict in {WIRED, EXEMPT}
   1 → verdict in {ORPHAN, ERROR} or any CommandError
@@ -34,8 +40,13 @@ from pathlib import Path
 from typing import Any
 
 from prd_taskmaster import parallel
-from prd_taskmaster.lib import CommandError, atomic_write
-from prd_taskmaster.reachability import sweep_task
+from prd_taskmaster.lib import CommandError, atomic_write, load_tasks_raw, tasks_storage_exists
+from prd_taskmaster.reachability import (
+    ImportIndex,
+    ReachabilityError,
+    new_modules_for_commits,
+    sweep_task,
+)
 
 # Verdicts that map to exit 0.
 _PASS_VERDICTS = {"WIRED", "EXEMPT"}
@@ -70,18 +81,37 @@ def _card_path(repo_root: Path, task_id: str) -> "Path | None":
     return None
 
 
-def _load_task(repo_root: Path, task_id: str) -> dict:
-    """Load the task dict from .taskmaster/tasks/tasks.json.
+def _card_index(repo_root: Path) -> "dict[str, Path]":
+    """Map every task id with a CDD card to its card path (one directory scan).
 
-    Looks for task_id in every tag's tasks list (and the flat-tasks fallback).
-    Raises CommandError if not found.
+    Same precedence as _card_path: a direct task-<id>.json wins over a
+    combined card whose hyphen-separated id-list contains the id.
+    """
+    cdd = _cdd_dir(repo_root)
+    if not cdd.exists():
+        return {}
+    index: dict[str, Path] = {}
+    for card in sorted(cdd.glob("task-*.json")):
+        for tid in card.stem[len("task-"):].split("-"):
+            index.setdefault(tid, card)
+    for card in cdd.glob("task-*.json"):
+        index[card.stem[len("task-"):]] = card
+    return index
+
+
+def _all_tasks(repo_root: Path) -> "list[dict]":
+    """Every task in .taskmaster/tasks/tasks.json, across all tags.
+
+    Includes the flat-tasks fallback and reads per-tag shards when the
+    sharded layout is active. Raises CommandError if the file is missing or
+    unparseable.
     """
     tasks_path = repo_root / ".taskmaster" / "tasks" / "tasks.json"
-    if not tasks_path.exists():
+    if not tasks_storage_exists(tasks_path):
         raise CommandError(f"tasks.json not found at {tasks_path}")
 
     try:
-        raw = json.loads(tasks_path.read_text())
+        raw = load_tasks_raw(tasks_path)
     except json.JSONDecodeError as exc:
         raise CommandError(f"tasks.json is invalid JSON: {exc}") from exc
 
@@ -95,8 +125,16 @@ def _load_task(repo_root: Path, task_id: str) -> dict:
     for value in raw.values():
         if isinstance(value, dict) and isinstance(value.get("tasks"), list):
             candidates.extend(value["tasks"])
+    return [t for t in candidates if isinstance(t, dict)]
 
-    for task in candidates:
+
+def _load_task(repo_root: Path, task_id: str) -> dict:
+    """Load the task dict from .taskmaster/tasks/tasks.json.
+
+    Looks for task_id in every tag's tasks list (and the flat-tasks fallback).
+    Raises CommandError if not found.
+    """
+    for task in _all_tasks(repo_root):
         if str(task.get("id")) == task_id:
             return task
 
@@ -167,6 +205,144 @@ def run_reachability_sweep(
     return verdict
 
 
+def _recorded_start_commit(card_path: "Path | None", task: dict) -> "str | None":
+    """Start commit from the card's previous sweep, else the task's startCommit."""
+    if card_path is not None:
+        try:
+            card = json.loads(card_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            card = None
+        reach = card.get("reachability") if isinstance(card, dict) else None
+        if isinstance(reach, dict) and reach.get("start_commit"):
+            return str(reach["start_commit"])
+    start = task.get("startCommit")
+    return str(start) if start else None
+
+
+def run_reachability_sweep_batch(
+    task_ids: "list[str] | None" = None,
+    start_commits: "dict[str, str] | None" = None,
+    default_start_commit: "str | None" = None,
+    status: str = "done",
+    cwd: "str | None" = None,
+) -> dict:
+    """Sweep many tasks against one load of tasks.json, one git pass and one index.
+
+    Parameters
+    ----------
+    task_ids:
+        Tasks to sweep. Defaults to every task whose status is *status*.
+    start_commits:
+        Explicit ``{task_id: sha}`` overrides. Otherwise each task's start
+        commit is the ``start_commit`` recorded by its card's previous sweep,
+        then the task's ``startCommit`` field, then *default_start_commit*.
+    cwd:
+        Optional explicit repo root.  Defaults to the current working directory.
+
+    Every swept task's verdict is written into its CDD card, exactly as
+    run_reachability_sweep does, after all verdicts are computed. Per-task
+    problems (no card, no start commit) are reported in the result instead of
+    aborting the batch; a task with no start commit that would need one gets
+    an ERROR verdict.
+
+    Returns
+    -------
+    ``{"ok": bool, "swept": int, "passed": [...], "failed": [...],
+    "skipped": {task_id: reason}, "verdicts": {task_id: verdict dict}}`` —
+    ok is True only when every swept task is WIRED or EXEMPT and none was
+    skipped.
+    """
+    repo_root = Path(cwd).resolve() if cwd else Path.cwd().resolve()
+    start_commits = dict(start_commits or {})
+
+    tasks = _all_tasks(repo_root)
+    if task_ids is None:
+        selected = [t for t in tasks if t.get("status") == status]
+    else:
+        by_id = {str(t.get("id")): t for t in tasks}
+        missing = [tid for tid in task_ids if tid not in by_id]
+        if missing:
+            raise CommandError(f"tasks not found in tasks.json: {', '.join(missing)}")
+        selected = [by_id[tid] for tid in task_ids]
+
+    cards = _card_index(repo_root)
+    skipped: dict[str, str] = {}
+    plan: list[tuple[str, dict, str]] = []
+    for task in selected:
+        tid = str(task.get("id"))
+        if tid not in cards:
+            skipped[tid] = (
+                "no CDD card found in .atlas-ai/cdd/ — generate the CDD card "
+                "(execute-task Step 5) before running the sweep"
+            )
+            continue
+        start = (
+            start_commits.get(tid)
+            or _recorded_start_commit(cards[tid], task)
+            or default_start_commit
+            or ""
+        )
+        plan.append((tid, task, start))
+
+    # One git pass for every distinct start commit; unresolvable ones fall
+    # back to sweep_task's own git diff so they report the exact error.
+    try:
+        modules_by_commit = new_modules_for_commits(
+            repo_root, [start for _, _, start in plan]
+        )
+    except ReachabilityError:
+        modules_by_commit = {}
+    index = ImportIndex(repo_root)
+
+    verdicts: dict[str, dict] = {}
+    for tid, task, start in plan:
+        if not start:
+            verdict = sweep_task(repo_root, task, start, new_modules=[], index=index)
+            if verdict["verdict"] != "EXEMPT":
+                verdict = {
+                    **verdict,
+                    "verdict": "ERROR",
+                    "modules": [],
+                    "error": "no start commit recorded for this task",
+                }
+        else:
+            verdict = sweep_task(
+                repo_root, task, start,
+                new_modules=modules_by_commit.get(start),
+                index=index,
+            )
+        verdicts[tid] = verdict
+
+    # Write all cards once the sweep is done (a combined card is read and
+    # written once even if it covers several swept tasks).
+    by_card: dict[Path, list[str]] = {}
+    for tid in verdicts:
+        by_card.setdefault(cards[tid], []).append(tid)
+    for card_path, tids in by_card.items():
+        try:
+            existing: dict[str, Any] = json.loads(card_path.read_text())
+        except (OSError, json.JSONDecodeError) as exc:
+            for tid in tids:
+                skipped[tid] = f"cannot read CDD card at {card_path}: {exc}"
+                verdicts.pop(tid)
+            continue
+        # Combined cards hold one verdict; the last swept task wins, matching
+        # sequential run_reachability_sweep calls in task order.
+        existing["reachability"] = verdicts[tids[-1]]
+        atomic_write(card_path, json.dumps(existing, indent=2, default=str))
+
+    passed = [tid for tid, v in verdicts.items() if v.get("verdict") in _PASS_VERDICTS]
+    failed = [tid for tid, v in verdicts.items() if v.get("verdict") not in _PASS_VERDICTS]
+    return {
+        "ok": not failed and not skipped,
+        "swept": len(verdicts),
+        "passed": passed,
+        "failed": failed,
+        "skipped": skipped,
+        "verdicts": verdicts,
+    }
+
+
 # ─── CLI wrapper ──────────────────────────────────────────────────────────────
 
 def cmd_reachability_sweep(args) -> None:
@@ -176,6 +352,23 @@ def cmd_reachability_sweep(args) -> None:
 
     from prd_taskmaster.lib import fail
 
+    if getattr(args, "all", False):
+        try:
+            result = run_reachability_sweep_batch(
+                default_start_commit=args.start_commit,
+                status=getattr(args, "status", None) or "done",
+                cwd=getattr(args, "cwd", None),
+            )
+        except CommandError as exc:
+            fail(exc.message, **exc.extra)
+            return  # never reached; fail() exits
+        print(_json.dumps(result, indent=2, default=str))
+        _sys.exit(0 if result["ok"] else 1)
+
+    if not args.task or not args.start_commit:
+        fail("reachability-sweep needs --task and --start-commit (or --all)")
+        return  # never reached; fail() exits
+
     try:
         verdict = run_reachability_sweep(
             task_id=args.task,
@@ -5,47 +5,85 @@ SELF-reported exit codes — a racer can lie. Reputation is fed ONLY by the
 TRUSTED ``TournamentResult.winner`` (the oracle-graded outcome from a settled
 tournament), so an executor cannot inflate its own standing.
 
-Store (mirrors the economy.py fold pattern):
+Store (mirrors the economy.py rollup pattern):
   - ``.atlas-ai/reputation.jsonl`` — append-only event log (one row per
-    ``record_tournament`` call), via ``lib.locked_update``.
+    ``record_tournament`` call), via ``lib.locked_append`` (O(1) per event).
   - ``.atlas-ai/reputation.json`` — folded snapshot keyed by
-    ``(executor_id, task_class)``, via ``lib.locked_update`` (read-modify-write
-    under flock; atomic replace on write).
+    ``(executor_id, task_class)``, via ``lib.locked_update``. It records the
+    byte offset of the log it has folded up to, so each refresh folds only the
+    events appended since. Latency is a fixed-size ring buffer per record.
+  - ``.atlas-ai/reputation.jsonl.<n>`` — compacted log segments. Once the
+    folded prefix of the live log passes ``_COMPACT_BYTES`` it is moved into
+    the next segment, keeping the live log (and a refresh) small. Segments are
+    only read to rebuild a lost or stale snapshot.
+
+Besides whole-history counts, each record keeps two non-stationary views of
+its outcomes: exponentially discounted job/win sums (half-life
+``_DISCOUNT_HALF_LIFE_S`` of event time) and a ring of the last
+``_OUTCOME_WINDOW`` outcomes. A backend that degraded last week stops winning
+on its stale average.
 
 Routing:
-  - ``route_with_reputation`` computes a UCB1 score per candidate for the task's
-    ``task_class`` and ALWAYS samples an unseen executor (cold-start stays open —
-    an unseen candidate gets +inf and is never zero-weighted). It uses
-    ``fleet.route_task`` only as a tier-appropriate reference/fallback; reputation
-    NEVER gates OUT a new cheap model.
+  - ``route_with_reputation`` scores every candidate for the task's
+    ``task_class`` under the fleet.json ``reputation.policy`` (see
+    ``fleet.reputation_config``): ``ucb1`` over the whole history,
+    ``discounted-ucb``, ``sliding-window-ucb`` or ``thompson`` (Beta posterior
+    over the discounted counts).
+  - Cold-start is bounded: an unseen executor starts from the configured prior
+    pseudo-record instead of +inf, so it is explored early without flooding
+    every job while its first results are still in flight. It is never
+    zero-weighted, and ``fleet.route_task`` is only a reference/fallback —
+    reputation NEVER gates OUT a new cheap model.
+  - Scoring runs over a per-task_class column view of the snapshot that is
+    cached until the snapshot file changes, so routing among hundreds of
+    backends stays sub-millisecond.
 
 Fail-closed / deterministic:
-  - All I/O goes through the injected ``lib.locked_update`` / ``atomic_write``.
-  - ``now`` is injected (no ``datetime.now``); logic carries no randomness.
+  - All I/O goes through ``lib.locked_append`` / ``locked_update`` / ``atomic_write``.
+  - ``now`` is injected (no ``datetime.now``). Thompson sampling draws from an
+    RNG seeded by (now, task_class, task id) unless one is passed in.
   - Malformed snapshot/jsonl content is skipped, never fatal.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import math
+import os
+import random
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable
 
 from prd_taskmaster import fleet
-from prd_taskmaster.lib import locked_update
+from prd_taskmaster.lib import atomic_write, locked_append, locked_update
 
 # Default store paths (relative to the project root, like economy.TELEMETRY).
 REPUTATION_JSONL = Path(".atlas-ai") / "reputation.jsonl"
 REPUTATION_SNAPSHOT = Path(".atlas-ai") / "reputation.json"
 
-# Cap on retained raw latency samples per (executor, task_class). The snapshot is
+# Size of the per-(executor, task_class) latency ring buffer. The snapshot is
 # re-serialized on every record_tournament, so an uncapped history would grow the
 # file and the read-modify-write cost O(total tournaments) for a persistent fleet.
 # p50 over the most-recent window is the routing-relevant signal anyway (stale
 # samples from a since-improved executor only bias it), so we keep a bounded tail.
 _LATENCY_WINDOW = 200
 
+# Folded live-log bytes that trigger compaction into a numbered segment.
+_COMPACT_BYTES = 1 << 20
+
+# Bytes of the live log fingerprinted in the snapshot (detects a replaced log).
+_HEAD_BYTES = 256
+
+# Non-stationary views folded per record: discounted sums halve every
+# _DISCOUNT_HALF_LIFE_S of event time; the outcome ring keeps the last
+# _OUTCOME_WINDOW jobs. Both are fixed at fold time, so changing them needs a
+# snapshot rebuild — bump _SNAPSHOT_VERSION, which forces one.
+_DISCOUNT_HALF_LIFE_S = 3 * 24 * 3600.0
+_OUTCOME_WINDOW = 50
+_SNAPSHOT_VERSION = 2
+
 
 # ─── Path helpers ────────────────────────────────────────────────────────────
 
@@ -98,6 +136,23 @@ def _as_number(value):
     return None
 
 
+def _epoch(ts) -> "float | None":
+    """ISO-8601 timestamp → epoch seconds (naive means UTC); None if unparseable."""
+    if not isinstance(ts, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(ts)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _decay(elapsed_s: float) -> float:
+    return 0.5 ** (max(0.0, elapsed_s) / _DISCOUNT_HALF_LIFE_S)
+
+
 def _p50(values: "list[float]"):
     """Median (lower-of-two convention, matching economy.summarize_telemetry)."""
     clean = sorted(v for v in values if _as_number(v) is not None)
@@ -263,21 +318,338 @@ def _empty_record() -> dict:
         "slashed": 0,
         "p50_latency_ms": None,
         "_latencies": [],
+        "_lat_next": 0,
+        "d_jobs": 0.0,
+        "d_wins": 0.0,
+        "d_ts": None,
+        "_outcomes": [],
+        "_out_next": 0,
     }
 
 
-def _load_snapshot(current: str) -> dict:
-    """Parse the snapshot JSON content fail-closed (bad content → empty)."""
+def _normalize_record(rec: dict) -> dict:
+    """Coerce a stored record fail-closed (older snapshots had no ring cursor)."""
+    latencies = [
+        v for v in (rec.get("_latencies") or [])
+        if _as_number(v) is not None
+    ][-_LATENCY_WINDOW:]
+    cursor = _as_int(rec.get("_lat_next"))
+    outcomes = [v for v in (rec.get("_outcomes") or []) if v in (0, 1)][-_OUTCOME_WINDOW:]
+    out_cursor = _as_int(rec.get("_out_next"))
+    d_jobs = float(_as_number(rec.get("d_jobs")) or 0.0)
+    d_wins = float(_as_number(rec.get("d_wins")) or 0.0)
+    return {
+        "n_jobs": _as_int(rec.get("n_jobs")),
+        "n_wins": _as_int(rec.get("n_wins")),
+        "settled_cost": float(_as_number(rec.get("settled_cost")) or 0.0),
+        "slashed": _as_int(rec.get("slashed")),
+        "p50_latency_ms": rec.get("p50_latency_ms"),
+        "_latencies": latencies,
+        "_lat_next": cursor if 0 <= cursor < _LATENCY_WINDOW else 0,
+        "d_jobs": max(0.0, d_jobs),
+        "d_wins": min(max(0.0, d_wins), max(0.0, d_jobs)),
+        "d_ts": _as_number(rec.get("d_ts")),
+        "_outcomes": outcomes,
+        "_out_next": out_cursor if 0 <= out_cursor < _OUTCOME_WINDOW else 0,
+    }
+
+
+def _push_ring(rec: dict, ring_key: str, cursor_key: str, window: int, value) -> None:
+    """O(1) ring-buffer insert: append until full, then overwrite the oldest."""
+    ring = rec[ring_key]
+    if len(ring) < window:
+        ring.append(value)
+        return
+    cursor = rec[cursor_key]
+    ring[cursor] = value
+    rec[cursor_key] = (cursor + 1) % window
+
+
+def _push_latency(rec: dict, value: float) -> None:
+    _push_ring(rec, "_latencies", "_lat_next", _LATENCY_WINDOW, value)
+
+
+def _push_outcome(rec: dict, won: bool, ts: "float | None") -> None:
+    """Fold one job into the discounted sums and the sliding outcome window.
+
+    Sums are kept as of ``d_ts`` (the newest event seen); an event older than
+    that (logs from racing recorders can interleave) is discounted on the way in.
+    """
+    win = 1.0 if won else 0.0
+    last = rec["d_ts"]
+    if ts is None or last is None or ts >= last:
+        factor = _decay(ts - last) if ts is not None and last is not None else 1.0
+        rec["d_jobs"] = rec["d_jobs"] * factor + 1.0
+        rec["d_wins"] = rec["d_wins"] * factor + win
+        if ts is not None:
+            rec["d_ts"] = ts
+    else:
+        factor = _decay(last - ts)
+        rec["d_jobs"] += factor
+        rec["d_wins"] += win * factor
+    _push_ring(rec, "_outcomes", "_out_next", _OUTCOME_WINDOW, int(won))
+
+
+def _load_state(current: str) -> "tuple[dict, dict | None]":
+    """Parse snapshot content into (records, log cursor) fail-closed.
+
+    A missing/garbage cursor (pre-offset snapshots included) yields None, which
+    forces a rebuild from the log rather than trusting records of unknown
+    provenance.
+    """
     if not current or not current.strip():
-        return {}
+        return {}, None
     try:
         data = json.loads(current)
     except json.JSONDecodeError:
-        return {}
+        return {}, None
     if not isinstance(data, dict):
-        return {}
+        return {}, None
     records = data.get("records")
-    return records if isinstance(records, dict) else {}
+    records = records if isinstance(records, dict) else {}
+    log = data.get("log")
+    if not isinstance(log, dict) or data.get("version") != _SNAPSHOT_VERSION:
+        # Older snapshots lack fields only a refold of the log can fill in.
+        return records, None
+    offset = _as_int(log.get("offset"), -1)
+    generation = _as_int(log.get("generation"), -1)
+    if offset < 0 or generation < 0 or not isinstance(log.get("head"), str):
+        return records, None
+    return records, {"offset": offset, "generation": generation, "head": log["head"]}
+
+
+def _load_snapshot(current: str) -> dict:
+    """Parse the snapshot JSON content fail-closed (bad content → empty)."""
+    return _load_state(current)[0]
+
+
+def _apply_event(records: dict, event: dict) -> "list[str]":
+    """Fold one logged event into ``records``; return the touched keys."""
+    task_class = str(event.get("task_class", ""))
+    winner_id = event.get("winner")
+    participants = event.get("participants")
+    slashed = event.get("slashed")
+    slashed = set(slashed) if isinstance(slashed, list) else set()
+    bounty = float(_as_number(event.get("settled_cost")) or 0.0)
+    latencies = event.get("latencies")
+    latencies = latencies if isinstance(latencies, dict) else {}
+    ts = _epoch(event.get("ts"))
+
+    touched: list[str] = []
+    for executor_id in participants if isinstance(participants, list) else []:
+        executor_id = str(executor_id)
+        key = _snapshot_key(executor_id, task_class)
+        rec = records.get(key)
+        rec = _normalize_record(rec) if isinstance(rec, dict) else _empty_record()
+
+        # Every participating executor: n_jobs += 1.
+        rec["n_jobs"] += 1
+
+        # Winner (TRUSTED): n_wins += 1 and add the settled cost/bounty.
+        won = winner_id is not None and executor_id == winner_id
+        if won:
+            rec["n_wins"] += 1
+            rec["settled_cost"] += bounty
+        _push_outcome(rec, won, ts)
+
+        # Slashed/wouldSlash: slashed += 1.
+        if executor_id in slashed:
+            rec["slashed"] += 1
+
+        # p50 latency over the ring buffer, if this tournament measured one.
+        lat = _as_number(latencies.get(executor_id))
+        if lat is not None:
+            _push_latency(rec, lat)
+            rec["p50_latency_ms"] = _p50(rec["_latencies"])
+
+        records[key] = rec
+        touched.append(key)
+    return touched
+
+
+def _segment_path(jsonl_path: Path, generation: int) -> Path:
+    return jsonl_path.with_name(f"{jsonl_path.name}.{generation}")
+
+
+def _segments(jsonl_path: Path) -> "list[tuple[int, Path]]":
+    """Existing compacted segments in generation order."""
+    found = []
+    prefix = jsonl_path.name + "."
+    if jsonl_path.parent.is_dir():
+        for entry in jsonl_path.parent.iterdir():
+            suffix = entry.name[len(prefix):] if entry.name.startswith(prefix) else ""
+            if suffix.isdigit():
+                found.append((int(suffix), entry))
+    return sorted(found)
+
+
+def _fold_bytes(records: dict, data: bytes) -> int:
+    """Fold every COMPLETE line of ``data``; return the bytes consumed.
+
+    A trailing line without its newline is an append still in flight — it is
+    left for the next refresh. Malformed lines are skipped, never fatal.
+    """
+    end = data.rfind(b"\n") + 1
+    for raw in data[:end].splitlines():
+        if not raw.strip():
+            continue
+        try:
+            event = json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if isinstance(event, dict):
+            _apply_event(records, event)
+    return end
+
+
+def _finish_compaction(jsonl_path: Path, segment: Path) -> bool:
+    """Truncate the live log if it still starts with *segment*'s bytes.
+
+    Compaction writes the segment, then truncates the live log. A crash in
+    between leaves the prefix in both places. The segment's header line
+    (``{"compacted": {"log_bytes", "sha256"}}``, a no-op to ``_apply_event``)
+    identifies that prefix; this completes the truncation under the log
+    lock. Returns True when it did.
+    """
+    try:
+        with open(segment, "rb") as f:
+            mark = json.loads(f.readline())["compacted"]
+        size, digest = int(mark["log_bytes"]), str(mark["sha256"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    done = []
+
+    def _truncate(current_log: str) -> str:
+        data = current_log.encode()
+        if len(data) < size or hashlib.sha256(data[:size]).hexdigest() != digest:
+            return current_log
+        done.append(True)
+        return data[size:].decode()
+
+    locked_update(jsonl_path, _truncate)
+    return bool(done)
+
+
+def _head_digest(data: bytes) -> str:
+    return hashlib.sha256(data[:_HEAD_BYTES]).hexdigest()
+
+
+def _refresh(jsonl_path: Path, current: str, now: "str | None") -> "tuple[str, dict]":
+    """Snapshot transform body: fold new log bytes, compact if due.
+
+    Returns ``(new_snapshot_content, records)``. Runs under the snapshot lock;
+    takes the log lock only for compaction (lock order: snapshot → log, while
+    appenders only ever hold the log lock, so the two can never deadlock).
+    """
+    records, log = _load_state(current)
+    if now is None:
+        try:
+            now = json.loads(current).get("updated_at")
+        except (json.JSONDecodeError, AttributeError):
+            now = None
+    try:
+        with open(jsonl_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            head = f.read(_HEAD_BYTES)
+            valid = (
+                log is not None
+                and log["offset"] <= size
+                and _head_digest(head[:log["offset"]]) == log["head"]
+            )
+            start = log["offset"] if valid else 0
+            f.seek(start)
+            tail = f.read()
+    except FileNotFoundError:
+        head, tail = b"", b""
+        valid = log is not None and log["offset"] == 0
+
+    if not valid:
+        # Rebuild: every compacted segment, then the whole live log.
+        records = {}
+        segments = _segments(jsonl_path)
+        for _, segment in segments:
+            try:
+                _fold_bytes(records, segment.read_bytes())
+            except OSError:
+                continue
+        if segments and _finish_compaction(jsonl_path, segments[-1][1]):
+            # The live log still held the last segment's bytes; they are gone
+            # now, so fold what remains.
+            try:
+                tail = jsonl_path.read_bytes()
+            except FileNotFoundError:
+                tail = b""
+            head = tail[:_HEAD_BYTES]
+        generation = segments[-1][0] + 1 if segments else 0
+        log = {"offset": 0, "generation": generation}
+
+    offset = log["offset"] + _fold_bytes(records, tail)
+    generation = log["generation"]
+
+    if offset >= _COMPACT_BYTES:
+        moved = {}
+
+        def _compact(current_log: str) -> str:
+            data = current_log.encode()
+            # Write the segment before truncating the live log: a crash in
+            # between leaves the head fingerprint intact (nothing lost), and a
+            # retry rewrites the same generation's segment. The segment's
+            # header records the prefix it took, so a rebuild after such a
+            # crash drops that prefix from the live log instead of folding it
+            # twice (_finish_compaction).
+            header = json.dumps({"compacted": {
+                "log_bytes": offset,
+                "sha256": hashlib.sha256(data[:offset]).hexdigest(),
+            }})
+            atomic_write(
+                _segment_path(jsonl_path, generation),
+                header + "\n" + data[:offset].decode(),
+            )
+            moved["bytes"] = offset
+            return data[offset:].decode()
+
+        locked_update(jsonl_path, _compact)
+        if moved:
+            head = b""
+            offset = 0
+            generation += 1
+
+    payload = {
+        "version": _SNAPSHOT_VERSION,
+        "records": records,
+        "updated_at": now,
+        "log": {
+            "offset": offset,
+            "generation": generation,
+            "head": _head_digest(head[:offset]),
+        },
+    }
+    return json.dumps(payload, indent=2, default=str), records
+
+
+def refresh_snapshot(reputation_path, *, now: "str | None" = None) -> dict:
+    """Fold any unfolded log events into the snapshot; return the records map."""
+    jsonl_path = Path(reputation_path)
+    result: dict = {}
+
+    def _fold(current: str) -> str:
+        content, records = _refresh(jsonl_path, current, now)
+        result.update(records)
+        return content
+
+    locked_update(_snapshot_path_for(jsonl_path), _fold)
+    return result
+
+
+def _public(rec: dict) -> dict:
+    return {
+        "n_jobs": rec["n_jobs"],
+        "n_wins": rec["n_wins"],
+        "win_rate": (rec["n_wins"] / rec["n_jobs"]) if rec["n_jobs"] else 0.0,
+        "settled_cost": rec["settled_cost"],
+        "slashed": rec["slashed"],
+        "p50_latency_ms": rec["p50_latency_ms"],
+    }
 
 
 # ─── Public API ───────────────────────────────────────────────────────────────
@@ -329,7 +701,6 @@ def record_tournament(
     self-reported exit/field on a submission. A null winner records no win.
     """
     jsonl_path = Path(reputation_path)
-    snapshot_path = _snapshot_path_for(jsonl_path)
 
     task_class = str(task_class)
     latencies = latencies if isinstance(latencies, dict) else {}
@@ -345,7 +716,7 @@ def record_tournament(
     if winner_id is not None and winner_id not in ordered_participants:
         ordered_participants.append(winner_id)
 
-    # ── 1. Append the jsonl event ─────────────────────────────────────────────
+    # ── 1. Append the jsonl event (O(1): no read of the existing log) ────────
     event = {
         "ts": now,
         "task_class": task_class,
@@ -355,80 +726,18 @@ def record_tournament(
         "settled_cost": bounty,
         "latencies": {str(k): v for k, v in latencies.items()},
     }
-    event_line = json.dumps(event, default=str) + "\n"
-
-    def _append(current: str) -> str:
-        separator = "" if not current or current.endswith("\n") else "\n"
-        return current + separator + event_line
+    locked_append(jsonl_path, json.dumps(event, default=str) + "\n")
 
-    locked_update(jsonl_path, _append)
+    # ── 2. Fold every not-yet-folded event into the snapshot ────────────────
+    # Folding from the recorded offset also picks up events a concurrent
+    # recorder appended but has not folded yet; each event folds exactly once.
+    records = refresh_snapshot(jsonl_path, now=now)
 
-    # ── 2. Fold into the snapshot ─────────────────────────────────────────────
-    touched: dict[str, dict] = {}
-
-    def _fold(current: str) -> str:
-        records = _load_snapshot(current)
-
-        for executor_id in ordered_participants:
-            key = _snapshot_key(executor_id, task_class)
-            rec = records.get(key)
-            if not isinstance(rec, dict):
-                rec = _empty_record()
-            else:
-                # Normalize an existing record fail-closed.
-                rec = {
-                    "n_jobs": _as_int(rec.get("n_jobs")),
-                    "n_wins": _as_int(rec.get("n_wins")),
-                    "settled_cost": float(_as_number(rec.get("settled_cost")) or 0.0),
-                    "slashed": _as_int(rec.get("slashed")),
-                    "p50_latency_ms": rec.get("p50_latency_ms"),
-                    "_latencies": [
-                        v for v in (rec.get("_latencies") or [])
-                        if _as_number(v) is not None
-                    ][-_LATENCY_WINDOW:],
-                }
-
-            # Every participating executor: n_jobs += 1.
-            rec["n_jobs"] += 1
-
-            # Winner (TRUSTED): n_wins += 1 and add the settled cost/bounty.
-            if winner_id is not None and executor_id == winner_id:
-                rec["n_wins"] += 1
-                rec["settled_cost"] += bounty
-
-            # Slashed/wouldSlash: slashed += 1.
-            if executor_id in slashed:
-                rec["slashed"] += 1
-
-            # p50 latency from this tournament's measurement, if provided.
-            lat = _as_number(latencies.get(executor_id))
-            if lat is not None:
-                rec["_latencies"].append(lat)
-                # Bound the retained tail so the snapshot does not grow without
-                # limit over a long-running fleet (keep the most recent window).
-                if len(rec["_latencies"]) > _LATENCY_WINDOW:
-                    rec["_latencies"] = rec["_latencies"][-_LATENCY_WINDOW:]
-                rec["p50_latency_ms"] = _p50(rec["_latencies"])
-
-            records[key] = rec
-            touched[key] = rec
-
-        payload = {"records": records, "updated_at": now}
-        return json.dumps(payload, indent=2, default=str)
-
-    locked_update(snapshot_path, _fold)
-
-    # Return public view of the touched records.
+    # Return public view of the records touched by THIS tournament.
     return {
-        key: {
-            "n_jobs": rec["n_jobs"],
-            "n_wins": rec["n_wins"],
-            "win_rate": (rec["n_wins"] / rec["n_jobs"]) if rec["n_jobs"] else 0.0,
-            "settled_cost": rec["settled_cost"],
-            "slashed": rec["slashed"],
-            "p50_latency_ms": rec["p50_latency_ms"],
-        }
-        for key, rec in touched.items()
+        key: _public(_normalize_record(records[key]))
+        for key in (_snapshot_key(cid, task_class) for cid in ordered_participants)
+        if isinstance(records.get(key), dict)
     }
 
 
@@ -479,6 +788,68 @@ def _task_class_of(task: dict) -> str:
         return "standard"
 
 
+# ─── Column view for routing ─────────────────────────────────────────────────
+# Routing reads the snapshot far more often than tournaments write it. The
+# parsed records are flattened once per snapshot version into parallel
+# per-task_class columns; scoring a candidate set is then one pass over
+# plain lists, with no JSON parse or per-record normalization on the hot path.
+
+_COLUMN_CACHE: dict = {}
+
+
+def _columns(reputation_path) -> dict:
+    """``{task_class: {"index": {executor_id: row}, <column>: [...]}}``, cached
+    until the snapshot file changes. Missing/garbage snapshot → ``{}``."""
+    snapshot_path = _snapshot_path_for(Path(reputation_path))
+    try:
+        st = snapshot_path.stat()
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = _COLUMN_CACHE.get(snapshot_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        records = _load_snapshot(snapshot_path.read_text())
+    except OSError:
+        return {}
+
+    classes: dict = {}
+    for key, raw in records.items():
+        if not isinstance(raw, dict):
+            continue
+        executor_id, task_class = _split_key(key)
+        rec = _normalize_record(raw)
+        col = classes.get(task_class)
+        if col is None:
+            col = classes[task_class] = {
+                "index": {}, "jobs": [], "wins": [], "d_jobs": [], "d_wins": [],
+                "d_ts": [], "w_jobs": [], "w_wins": [],
+            }
+        col["index"][executor_id] = len(col["jobs"])
+        col["jobs"].append(rec["n_jobs"])
+        col["wins"].append(rec["n_wins"])
+        col["d_jobs"].append(rec["d_jobs"])
+        col["d_wins"].append(rec["d_wins"])
+        col["d_ts"].append(rec["d_ts"])
+        col["w_jobs"].append(len(rec["_outcomes"]))
+        col["w_wins"].append(sum(rec["_outcomes"]))
+    _COLUMN_CACHE[snapshot_path] = (stamp, classes)
+    return classes
+
+
+def _gather(col: "dict | None", name: str, rows: list, default=0):
+    values = col[name] if col is not None else ()
+    return [default if row is None else values[row] for row in rows]
+
+
+def _ucb_scores(jobs: list, wins: list, prior_wins: float, prior_jobs: float) -> "list[float]":
+    """Prior-smoothed UCB: every arm carries the prior pseudo-record, so the
+    exploration bonus is at most ``sqrt(2 ln(N + 1) / prior_jobs)``."""
+    ln_term = 2.0 * math.log(sum(jobs) + 1.0)
+    return [
+        (w + prior_wins) / (n + prior_jobs) + math.sqrt(ln_term / (n + prior_jobs))
+        for n, w in zip(jobs, wins)
+    ]
+
+
 def route_with_reputation(
     *,
     task: dict,
@@ -486,33 +857,50 @@ def route_with_reputation(
     reputation_path,
     candidates: "list[str]",
     now: str,
+    policy: "str | None" = None,
+    rng: "random.Random | None" = None,
     _route: Callable = fleet.route_task,
 ) -> dict:
-    """Pick an executor via UCB1 over reputation, keeping cold-start OPEN.
+    """Pick an executor for the task's ``task_class`` with a bandit policy.
+
+    Policies (``policy`` argument, else fleet.json ``reputation.policy``):
 
-    For the task's ``task_class``, each candidate's score is::
+    ``ucb1`` — whole-history UCB1 for seen candidates::
 
         score = win_rate + sqrt(2 * ln(total_jobs + 1) / n_executor_jobs)
 
-    where ``total_jobs`` is the sum of n_jobs across the candidates for this
-    task_class, and ``n_executor_jobs`` is the candidate's own n_jobs. An UNSEEN
-    executor (``n_executor_jobs == 0``) scores ``+inf`` and is ALWAYS sampled —
-    cold-start stays open; a new cheap model is NEVER zero-weighted or gated out.
+    ``discounted-ucb`` / ``sliding-window-ucb`` — the same bound over the
+    discounted sums (decayed to ``now``) or the last ``_OUTCOME_WINDOW``
+    outcomes, with the prior pseudo-record added to every arm.
+
+    ``thompson`` — one draw per candidate from
+    ``Beta(prior_wins + wins, prior_losses + losses)`` over discounted counts.
+
+    Cold-start is bounded but open: an UNSEEN executor scores as if it held
+    only the prior pseudo-record (``prior_wins`` of ``prior_jobs``, default
+    0.5 of 1) — a finite score that still beats a settled incumbent early on
+    and is never zero-weighted.
 
     Parameters
     ----------
     task:
         The task dict (provides ``task_class`` / complexity tier).
     config:
-        Fleet config (passed through to ``_route`` for the reference route).
+        Fleet config (its ``reputation`` block picks the policy and prior;
+        passed through to ``_route`` for the reference route).
     reputation_path:
         Path to the reputation jsonl (snapshot derived as sibling .json).
     candidates:
         Executor ids in contention (MUST include the cheap goose tier so it can
         be explored). Empty/garbage entries are ignored.
     now:
-        Injected timestamp (unused in scoring; kept for signature symmetry and
-        determinism guarantees — no clock is read internally).
+        Injected timestamp: the discount reference time and the Thompson seed.
+        No clock is read internally.
+    policy:
+        Override for ``reputation.policy`` (one of ``fleet.REPUTATION_POLICIES``).
+    rng:
+        Random source for ``thompson``; default is seeded from
+        (now, task_class, task id), so a route is reproducible.
     _route:
         Injectable reference router (default ``fleet.route_task``) used ONLY to
         compute ``base_route`` as a tier-appropriate fallback/reference. It does
@@ -522,13 +910,16 @@ def route_with_reputation(
     -------
     dict with:
       - ``chosen``: the selected executor id.
-      - ``scores``: ``{executor_id: score}`` (``float('inf')`` for unseen).
-      - ``exploring``: True when the chosen executor is an unseen/low-n explore
-        pick (n_executor_jobs == 0).
+      - ``scores``: ``{executor_id: score}`` (always finite).
+      - ``exploring``: True when the chosen executor has no history for this
+        task_class (n_executor_jobs == 0).
+      - ``policy``: the policy that scored the candidates.
       - ``base_route``: the ``_route`` reference result (for callers; may be None
         if the reference router errors — never fatal here).
     """
-    summary = summarize_reputation(reputation_path)
+    settings = fleet.reputation_config(config)
+    policy = policy if policy in fleet.REPUTATION_POLICIES else settings["policy"]
+    prior_wins, prior_jobs = settings["prior_wins"], settings["prior_jobs"]
     task_class = _task_class_of(task)
 
     # Reference route (fail-closed: never let a reference error gate routing).
@@ -538,39 +929,50 @@ def route_with_reputation(
         base_route = None
 
     clean_candidates = [c for c in (candidates or []) if isinstance(c, str) and c]
-
-    # n_jobs per candidate for THIS task_class; total over candidates.
-    per_jobs: dict[str, int] = {}
-    per_winrate: dict[str, float] = {}
-    for cid in clean_candidates:
-        rec = summary.get((cid, task_class))
-        n_jobs = _as_int(rec.get("n_jobs")) if isinstance(rec, dict) else 0
-        per_jobs[cid] = n_jobs
-        per_winrate[cid] = float(rec.get("win_rate", 0.0)) if isinstance(rec, dict) else 0.0
-
-    total_jobs = sum(per_jobs.values())
-    ln_term = math.log(total_jobs + 1)
-
-    scores: dict[str, float] = {}
-    for cid in clean_candidates:
-        n = per_jobs[cid]
-        if n == 0:
-            # Cold-start: NEVER zero-weight an unseen executor — always sampled.
-            scores[cid] = math.inf
+    col = _columns(reputation_path).get(task_class)
+    index = col["index"] if col is not None else {}
+    rows = [index.get(cid) for cid in clean_candidates]
+    jobs = _gather(col, "jobs", rows)
+
+    if policy == "ucb1":
+        wins = _gather(col, "wins", rows)
+        ln_term = 2.0 * math.log(sum(jobs) + 1)
+        cold = prior_wins / prior_jobs + math.sqrt(ln_term / prior_jobs)
+        values = [w / n + math.sqrt(ln_term / n) if n else cold for n, w in zip(jobs, wins)]
+    elif policy == "sliding-window-ucb":
+        values = _ucb_scores(_gather(col, "w_jobs", rows), _gather(col, "w_wins", rows),
+                             prior_wins, prior_jobs)
+    else:
+        now_ts = _epoch(now)
+        factors = [
+            _decay(now_ts - ts) if now_ts is not None and ts is not None else 1.0
+            for ts in _gather(col, "d_ts", rows, None)
+        ]
+        d_jobs = [n * f for n, f in zip(_gather(col, "d_jobs", rows, 0.0), factors)]
+        d_wins = [w * f for w, f in zip(_gather(col, "d_wins", rows, 0.0), factors)]
+        if policy == "discounted-ucb":
+            values = _ucb_scores(d_jobs, d_wins, prior_wins, prior_jobs)
         else:
-            exploration = math.sqrt(2.0 * ln_term / n)
-            scores[cid] = per_winrate[cid] + exploration
-
-    chosen = None
-    if scores:
+            if rng is None:
+                task_id = task.get("id") if isinstance(task, dict) else None
+                rng = random.Random(f"{now}{_KEY_SEP}{task_class}{_KEY_SEP}{task_id}")
+            prior_losses = prior_jobs - prior_wins
+            values = [
+                rng.betavariate(prior_wins + w, prior_losses + max(0.0, n - w))
+                for n, w in zip(d_jobs, d_wins)
+            ]
+
+    scores = dict(zip(clean_candidates, values))
+    chosen, exploring = None, False
+    if values:
         # Deterministic tie-break: highest score, then input order.
-        chosen = max(clean_candidates, key=lambda c: (scores[c], -clean_candidates.index(c)))
-
-    exploring = bool(chosen is not None and per_jobs.get(chosen, 0) == 0)
+        best = max(range(len(values)), key=values.__getitem__)
+        chosen, exploring = clean_candidates[best], jobs[best] == 0
 
     return {
         "chosen": chosen,
         "scores": scores,
         "exploring": exploring,
+        "policy": policy,
         "base_route": base_route,
     }
@@ -46,12 +46,19 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import hashlib
+import hmac
 import json
+import os
 import re
+import secrets
 import sys
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+from prd_taskmaster.filescan import list_files
+from prd_taskmaster.lib import CommandError, atomic_write, load_tasks_raw, tasks_storage_exists
+
 EXIT_STATUS_RE = re.compile(r"\bExit status\s+(\d+)\b", re.IGNORECASE)
 
 
@@ -70,11 +77,12 @@ def gate_pipeline(atlas: Path) -> Tuple[bool, List[str]]:
 
 def gate_tasks(repo_root: Path) -> Tuple[bool, List[str], list]:
     tf = repo_root / ".taskmaster" / "tasks" / "tasks.json"
-    if not tf.exists():
+    if not tasks_storage_exists(tf):
         return False, ["tasks.json missing at .taskmaster/tasks/tasks.json"], []
     try:
-        tdata = json.loads(tf.read_text())
-    except json.JSONDecodeError as exc:
+        # Merges per-tag shards when the sharded layout is active.
+        tdata = load_tasks_raw(tf)
+    except (json.JSONDecodeError, CommandError) as exc:
         return False, [f"tasks.json invalid JSON: {exc}"], []
     # Accept both canonical formats: tagged {"master": {"tasks": [...]}}
     # and flat {"tasks": [...]} (Native Mode / fleet samples).
@@ -237,28 +245,142 @@ def gate_reachability(repo_root: Path, tasks: list) -> Tuple[bool, List[str]]:
     return len(failures) == 0, failures
 
 
+EVIDENCE_CACHE_NAME = "evidence-scan.json"
+SCAN_TAIL_BYTES = 4 * 1024 * 1024
+
+
+def _scan_exit_code(path: Path, size: int) -> Optional[int]:
+    """First non-zero "Exit status N" in *path*, or None.
+
+    Files larger than SCAN_TAIL_BYTES are scanned from their tail only: exit
+    markers are written when a command finishes, so they sit at the end of
+    a log, and a multi-GB log must not be read whole on every run.
+    """
+    with path.open("rb") as fh:
+        if size > SCAN_TAIL_BYTES:
+            fh.seek(size - SCAN_TAIL_BYTES)
+        text = fh.read(SCAN_TAIL_BYTES).decode("utf-8", errors="ignore")
+    for match in EXIT_STATUS_RE.finditer(text):
+        try:
+            code = int(match.group(1))
+        except (ValueError, IndexError):
+            continue
+        if code != 0:
+            return code
+    return None
+
+
+# The scan cache lives in agent-writable .atlas-ai/, so a forged entry
+# ({"code": null} with a failing log's size and mtime) would turn the gate
+# green. It is therefore HMAC-signed under the same per-user key as
+# skel/ship-check.py's gate cache, stored outside the repo
+# (ATLAS_SHIP_CHECK_KEY_FILE overrides the path). A cache that does not
+# verify is ignored, and without a usable key nothing is cached.
+
+_KEY_BYTES = 32
+
+
+def _cache_key_path() -> Path:
+    override = os.environ.get("ATLAS_SHIP_CHECK_KEY_FILE")
+    if override:
+        return Path(override)
+    config = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+    return Path(config) / "atlas-ai" / "ship-check.key"
+
+
+def _cache_key() -> Optional[bytes]:
+    """The per-user cache key, created (mode 0600) on first use; None if unusable."""
+    path = _cache_key_path()
+    for _ in range(2):
+        try:
+            key = path.read_bytes()
+            return key if len(key) >= _KEY_BYTES else None
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            continue  # a concurrent run created it; read theirs
+        except OSError:
+            return None
+        with os.fdopen(fd, "wb") as f:
+            f.write(secrets.token_bytes(_KEY_BYTES))
+    return None
+
+
+def _cache_mac(key: bytes, files: dict) -> str:
+    body = json.dumps(files, sort_keys=True).encode()
+    return hmac.new(key, body, hashlib.sha256).hexdigest()
+
+
+def _load_evidence_cache(cache_path: Path, key: Optional[bytes]) -> dict:
+    """Cached per-file results if the cache's HMAC verifies, else {}."""
+    if key is None:
+        return {}
+    try:
+        data = json.loads(cache_path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    files = data.get("files") if isinstance(data, dict) else None
+    mac = data.get("mac") if isinstance(data, dict) else None
+    if not isinstance(files, dict) or not isinstance(mac, str):
+        return {}
+    if not hmac.compare_digest(mac, _cache_mac(key, files)):
+        return {}
+    return files
+
+
 def gate_exit_codes(atlas: Path) -> Tuple[bool, List[str]]:
+    """Gate 5 (display) — non-zero "Exit status N" lines in evidence files.
+
+    Per-file results are cached in .atlas-ai/evidence-scan.json keyed by
+    (path, size, mtime_ns); only new or changed evidence is re-read. The
+    cache is signed and advisory — unverifiable, unreadable or unwritable,
+    the gate just rescans.
+    """
     failures: List[str] = []
     evidence_dir = atlas / "evidence"
     if not evidence_dir.exists():
         # Gate 3 (CDD) catches missing evidence; this gate is silent when no evidence exists
         return True, []
-    for f in evidence_dir.rglob("*"):
-        if not f.is_file():
-            continue
+    cache_path = atlas / EVIDENCE_CACHE_NAME
+    key = _cache_key()
+    cached = _load_evidence_cache(cache_path, key)
+    fresh: dict = {}
+    # Evidence is usually gitignored, so walk rather than ask git; exclude
+    # globs still keep the scan out of vendored trees (node_modules etc.).
+    for rel in list_files(evidence_dir, use_git=False):
+        f = evidence_dir / rel
         try:
-            text = f.read_text(errors="ignore")
+            st = f.stat()
         except OSError:
             continue
-        for match in EXIT_STATUS_RE.finditer(text):
+        entry = cached.get(rel)
+        if (
+            isinstance(entry, dict)
+            and entry.get("size") == st.st_size
+            and entry.get("mtime_ns") == st.st_mtime_ns
+        ):
+            code = entry.get("code")
+        else:
             try:
-                code = int(match.group(1))
-            except (ValueError, IndexError):
+                code = _scan_exit_code(f, st.st_size)
+            except OSError:
                 continue
-            if code != 0:
-                rel = f.relative_to(atlas.parent) if atlas.parent in f.parents else f
-                failures.append(f"non-zero exit in {rel}: Exit status {code}")
-                break  # one report per file is enough
+        fresh[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "code": code}
+        if code:
+            rel_path = f.relative_to(atlas.parent) if atlas.parent in f.parents else f
+            failures.append(f"non-zero exit in {rel_path}: Exit status {code}")
+    if key is not None and fresh != cached:
+        try:
+            atomic_write(cache_path, json.dumps(
+                {"files": fresh, "mac": _cache_mac(key, fresh)}, sort_keys=True,
+            ))
+        except OSError:
+            pass
     return len(failures) == 0, failures
 
 
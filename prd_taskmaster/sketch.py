@@ -0,0 +1,132 @@
+"""Mergeable quantile sketch for telemetry and reputation rollups.
+
+Stdlib-only and JSON-serializable. A sketch keeps raw samples while it is
+small (so p50 over a handful of calls stays exact) and collapses into
+log-spaced buckets once it passes ``EXACT_LIMIT`` samples (DDSketch-style):
+every quantile is then within ``RELATIVE_ACCURACY`` of the true value, memory
+is O(buckets) rather than O(samples), and two sketches merge by adding bucket
+counts. That lets a rollup fold new rows incrementally and still answer
+percentile queries without ever re-reading history.
+"""
+
+from __future__ import annotations
+
+import math
+
+RELATIVE_ACCURACY = 0.01
+EXACT_LIMIT = 64
+
+_GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+
+
+def _bucket(value: float) -> int:
+    return math.ceil(math.log(value) / _LOG_GAMMA)
+
+
+def _bucket_value(key: int) -> float:
+    """Representative value of a bucket (relative error <= RELATIVE_ACCURACY)."""
+    return 2 * _GAMMA ** key / (_GAMMA + 1)
+
+
+def _rank(q: float, count: int) -> int:
+    """0-based rank of quantile ``q`` — ``n // 2`` for p50, matching the
+    ``sorted(walls)[len(walls) // 2]`` convention used across the repo."""
+    return max(0, min(count - 1, int(q * count)))
+
+
+class QuantileSketch:
+    """Exact-then-bucketed quantile estimator. Non-positive values count as 0."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.samples: "list[float] | None" = []
+        self.zeros = 0
+        self.bins: dict[int, int] = {}
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if self.samples is not None:
+            self.samples.append(value)
+            if len(self.samples) > EXACT_LIMIT:
+                self._collapse()
+            return
+        self._bin(value, 1)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        if other.samples is not None:
+            for value in other.samples:
+                self.add(value)
+            return
+        if self.samples is not None:
+            self._collapse()
+        self.count += other.count
+        self.zeros += other.zeros
+        for key, n in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + n
+
+    def quantile(self, q: float) -> "float | None":
+        if not self.count:
+            return None
+        rank = _rank(q, self.count)
+        if self.samples is not None:
+            return sorted(self.samples)[rank]
+        seen = self.zeros
+        if rank < seen:
+            return 0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if rank < seen:
+                return _bucket_value(key)
+        return _bucket_value(max(self.bins))  # unreachable with consistent counts
+
+    def _bin(self, value: float, n: int) -> None:
+        if value <= 0:
+            self.zeros += n
+            return
+        key = _bucket(value)
+        self.bins[key] = self.bins.get(key, 0) + n
+
+    def _collapse(self) -> None:
+        samples, self.samples = self.samples or [], None
+        for value in samples:
+            self._bin(value, 1)
+
+    # ─── JSON round-trip ──────────────────────────────────────────────────────
+
+    def to_dict(self) -> dict:
+        if self.samples is not None:
+            return {"count": self.count, "samples": list(self.samples)}
+        return {
+            "count": self.count,
+            "zeros": self.zeros,
+            "bins": {str(k): n for k, n in self.bins.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: object) -> "QuantileSketch":
+        """Rebuild from ``to_dict`` output; garbage yields an empty sketch."""
+        sketch = cls()
+        if not isinstance(data, dict):
+            return sketch
+        samples = data.get("samples")
+        if isinstance(samples, list):
+            for value in samples:
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    sketch.add(value)
+            return sketch
+        bins = data.get("bins")
+        if not isinstance(bins, dict):
+            return sketch
+        sketch.samples = None
+        zeros = data.get("zeros")
+        sketch.zeros = zeros if isinstance(zeros, int) and zeros > 0 else 0
+        for key, n in bins.items():
+            try:
+                k = int(key)
+            except (TypeError, ValueError):
+                continue
+            if isinstance(n, int) and n > 0:
+                sketch.bins[k] = n
+        sketch.count = sketch.zeros + sum(sketch.bins.values())
+        return sketch
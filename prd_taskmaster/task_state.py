@@ -5,10 +5,19 @@ from __future__ import annotations
 import argparse
 import json
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 
-from prd_taskmaster import fleet, parallel
-from prd_taskmaster.lib import CommandError, emit, fail, locked_update
+from prd_taskmaster import fleet, parallel, progress_summary
+from prd_taskmaster.lib import (
+    CommandError,
+    emit,
+    fail,
+    locked_update,
+    spooled_update,
+    storage_json_dumps,
+    storage_json_loads,
+)
 
 # Tiers that require a reachability verdict before done is accepted.
 _GATED_TIERS = {"wired", "live"}
@@ -27,11 +36,8 @@ VALID_STATUSES = {
                  # NOT done, NOT deferred (deferred = deliberate); blocks the ship gate.
 }
 
-_PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
-
-
 def _priority_rank(task: dict) -> int:
-    return _PRIORITY_RANK.get(str(task.get("priority", "medium")).lower(), 1)
+    return fleet.priority_rank(task)
 
 
 def _sortable_id(value: Any) -> tuple[int, int | str]:
@@ -115,11 +121,15 @@ def _in_progress_candidates(tasks: list[dict]) -> list[dict]:
 
 
 def _ready_candidates(tasks: list[dict], ready_ids: list) -> list[dict]:
+    """Ready tasks, longest critical path first (fleet.critical_path_lengths),
+    then priority, dependency count and id."""
     ready = {str(task_id) for task_id in ready_ids}
     candidates = [task for task in tasks if str(task.get("id")) in ready]
+    level = fleet.critical_path_lengths(tasks) if len(candidates) > 1 else {}
     return sorted(
         candidates,
         key=lambda task: (
+            -level.get(task.get("id"), 0.0),
             _priority_rank(task),
             len(_dependencies(task)),
             _sortable_id(task.get("id")),
@@ -189,24 +199,26 @@ def _claim_selected_task(tasks: list[dict], selected: dict) -> dict:
 def run_claim_task(tag: str | None = None) -> dict:
     """Atomically select the next task or subtask and mark it in-progress."""
     resolved_tag = parallel.current_tag(tag)
+    # Sharded layout: lock only this tag's file, not every tag's.
+    tasks_file = parallel.tasks_path(resolved_tag)
     result: dict[str, Any] = {}
 
     def transform(current: str) -> str:
         if not current.strip():
-            raise CommandError(f"{parallel.TASKS} not found")
+            raise CommandError(f"{tasks_file} not found")
         try:
-            raw = json.loads(current)
+            raw = storage_json_loads(current)
         except json.JSONDecodeError as exc:
-            raise CommandError(f"Failed to parse {parallel.TASKS}: {exc}") from exc
+            raise CommandError(f"Failed to parse {tasks_file}: {exc}") from exc
         if not isinstance(raw, dict):
-            raise CommandError(f"Failed to parse {parallel.TASKS}: root must be an object")
+            raise CommandError(f"Failed to parse {tasks_file}: root must be an object")
 
         tag_key = _tag_key_for_raw(raw, resolved_tag)
         try:
             tasks = parallel.get_tasks(raw, tag_key)
         except (KeyError, TypeError) as exc:
             raise CommandError(
-                f"tasks missing for tag '{resolved_tag}' in {parallel.TASKS}"
+                f"tasks missing for tag '{resolved_tag}' in {tasks_file}"
             ) from exc
 
         selected = _select_next_task(resolved_tag, tasks)
@@ -220,9 +232,14 @@ def run_claim_task(tag: str | None = None) -> dict:
         result.update(selected)
         result["task"] = claimed_task
         result["claimed"] = True
-        return json.dumps(raw, indent=2, default=str)
-
-    locked_update(parallel.TASKS, transform)
+        written["text"] = storage_json_dumps(raw)
+        written["raw"] = raw
+        return written["text"]
+
+    written: dict[str, Any] = {}
+    locked_update(tasks_file, transform)
+    if written:
+        refresh_in_progress_summary(tasks_file, written["text"], written["raw"])
     return result
 
 
@@ -251,13 +268,17 @@ def run_set_status(
 
     When evidence_ref or reachability is provided (any tier), the proof is
     persisted on the task object as doneEvidence / reachability fields.
+
+    The update is spooled as data (lib.spooled_update): concurrent set-status
+    calls from any number of processes share one parse and one write of the
+    tasks file. Re-applying an op is a no-op, which is what makes that safe.
     """
     if status not in VALID_STATUSES:
         raise CommandError(f"unknown status: {status}")
 
     parent_id, subtask_id = _split_id(id_str)
     resolved_tag = parallel.current_tag(tag)
-    result: dict[str, Any] = {}
+    tasks_file = parallel.tasks_path(resolved_tag)
 
     # Auto-read reachability from CDD card when marking done without an explicit verdict.
     # This allows `set-status done` to work transparently after the sweep has run and
@@ -265,83 +286,170 @@ def run_set_status(
     if reachability is None and status == "done" and subtask_id is None:
         reachability = _read_cdd_reachability(parent_id)
 
-    def transform(current: str) -> str:
+    op = {
+        "id": str(id_str),
+        "status": status,
+        "tag": resolved_tag,
+        "evidence_ref": evidence_ref,
+        "reachability": reachability,
+        # Stamped here, not when applied, so a replayed op writes the same bytes.
+        "at": datetime.now(timezone.utc).isoformat(),
+    }
+
+    def apply(current: str, ops: list[dict]) -> tuple[str, list[dict]]:
+        new, results, raw = _apply_set_status_batch(tasks_file, current, ops)
+        if raw is not None:
+            written["text"], written["raw"] = new, raw
+        return new, results
+
+    written: dict[str, Any] = {}
+    result = spooled_update(tasks_file, op, apply)
+    if written:
+        # This process held the lock and wrote the batch.
+        refresh_in_progress_summary(tasks_file, written["text"], written["raw"])
+    if not result.get("ok"):
+        raise CommandError(result.get("error", "set-status failed"), result.get("extra"))
+    return result
+
+
+def _apply_set_status_batch(
+    tasks_file: Path, current: str, ops: list[dict]
+) -> tuple[str, list[dict], dict | None]:
+    """Apply spooled set-status ops to *current*: (new text, results, parsed raw).
+
+    Each op succeeds or fails on its own, exactly as separate calls would;
+    a tasks file that cannot be parsed fails them all. raw is None when
+    nothing changed.
+    """
+    try:
         if not current.strip():
-            raise CommandError(f"{parallel.TASKS} not found")
+            raise CommandError(f"{tasks_file} not found")
         try:
-            raw = json.loads(current)
+            raw = storage_json_loads(current)
         except json.JSONDecodeError as exc:
-            raise CommandError(f"Failed to parse {parallel.TASKS}: {exc}") from exc
+            raise CommandError(f"Failed to parse {tasks_file}: {exc}") from exc
         if not isinstance(raw, dict):
-            raise CommandError(f"Failed to parse {parallel.TASKS}: root must be an object")
+            raise CommandError(f"Failed to parse {tasks_file}: root must be an object")
+    except CommandError as exc:
+        return current, [_error_result(exc)] * len(ops), None
 
-        tag_key = _tag_key_for_raw(raw, resolved_tag)
+    results: list[dict] = []
+    for op in ops:
         try:
-            tasks = parallel.get_tasks(raw, tag_key)
-        except (KeyError, TypeError) as exc:
-            raise CommandError(
-                f"tasks missing for tag '{resolved_tag}' in {parallel.TASKS}"
-            ) from exc
+            results.append(_apply_set_status(tasks_file, raw, op))
+        except CommandError as exc:
+            results.append(_error_result(exc))
+    if not any(r.get("ok") for r in results):
+        return current, results, None
+    return storage_json_dumps(raw), results, raw
 
-        for task in tasks:
-            if str(task.get("id")) != parent_id:
-                continue
-            if subtask_id is None:
-                # Tier-gated reachability check for parent tasks marked done.
-                if status == "done":
-                    tier = (
-                        (task.get("phaseConfig") or {}).get("tier")
-                        or task.get("tier")
-                        or "domain-model"
-                    )
-                    if tier in _GATED_TIERS:
-                        if reachability is None:
-                            raise CommandError(
-                                f"cannot mark task {id_str} (tier={tier}) done without a"
-                                f" reachability verdict — run the reachability sweep"
-                            )
-                        verdict = reachability.get("verdict")
-                        if verdict not in _PASSING_VERDICTS:
-                            raise CommandError(
-                                f"cannot mark task {id_str} done: reachability {verdict}"
-                                f" — wire the module(s) into the running system or"
-                                f" re-status deferred/scaffold"
-                            )
-                task["status"] = status
-                # Persist evidence additively when provided (any tier).
-                if evidence_ref is not None:
-                    task["doneEvidence"] = {
-                        "evidence_ref": evidence_ref,
-                        "at": datetime.now(timezone.utc).isoformat(),
-                    }
-                if reachability is not None:
-                    task["reachability"] = reachability
-                result.update({
+
+def _error_result(exc: CommandError) -> dict:
+    return {"ok": False, "error": exc.message, "extra": exc.extra}
+
+
+def _apply_set_status(tasks_file: Path, raw: dict, op: dict) -> dict:
+    """Apply one set-status op to *raw* in place. Raises before mutating."""
+    id_str, status, resolved_tag = op["id"], op["status"], op["tag"]
+    evidence_ref, reachability = op.get("evidence_ref"), op.get("reachability")
+    parent_id, subtask_id = _split_id(id_str)
+
+    tag_key = _tag_key_for_raw(raw, resolved_tag)
+    try:
+        tasks = parallel.get_tasks(raw, tag_key)
+    except (KeyError, TypeError) as exc:
+        raise CommandError(
+            f"tasks missing for tag '{resolved_tag}' in {tasks_file}"
+        ) from exc
+
+    for task in tasks:
+        if str(task.get("id")) != parent_id:
+            continue
+        if subtask_id is None:
+            # Tier-gated reachability check for parent tasks marked done.
+            if status == "done":
+                tier = (
+                    (task.get("phaseConfig") or {}).get("tier")
+                    or task.get("tier")
+                    or "domain-model"
+                )
+                if tier in _GATED_TIERS:
+                    if reachability is None:
+                        raise CommandError(
+                            f"cannot mark task {id_str} (tier={tier}) done without a"
+                            f" reachability verdict — run the reachability sweep"
+                        )
+                    verdict = reachability.get("verdict")
+                    if verdict not in _PASSING_VERDICTS:
+                        raise CommandError(
+                            f"cannot mark task {id_str} done: reachability {verdict}"
+                            f" — wire the module(s) into the running system or"
+                            f" re-status deferred/scaffold"
+                        )
+            task["status"] = status
+            # Persist evidence additively when provided (any tier).
+            if evidence_ref is not None:
+                task["doneEvidence"] = {"evidence_ref": evidence_ref, "at": op["at"]}
+            if reachability is not None:
+                task["reachability"] = reachability
+            return {
+                "ok": True,
+                "tag": resolved_tag,
+                "id": id_str,
+                "status": status,
+                "kind": "task",
+            }
+
+        for subtask in task.get("subtasks") or []:
+            if str(subtask.get("id")) == subtask_id:
+                subtask["status"] = status
+                return {
                     "ok": True,
                     "tag": resolved_tag,
-                    "id": str(id_str),
+                    "id": id_str,
                     "status": status,
-                    "kind": "task",
-                })
-                return json.dumps(raw, indent=2, default=str)
+                    "kind": "subtask",
+                }
+        raise CommandError(f"unknown id: {id_str}")
 
-            for subtask in task.get("subtasks") or []:
-                if str(subtask.get("id")) == subtask_id:
-                    subtask["status"] = status
-                    result.update({
-                        "ok": True,
-                        "tag": resolved_tag,
-                        "id": str(id_str),
-                        "status": status,
-                        "kind": "subtask",
-                    })
-                    return json.dumps(raw, indent=2, default=str)
-            raise CommandError(f"unknown id: {id_str}")
+    raise CommandError(f"unknown id: {id_str}")
 
-        raise CommandError(f"unknown id: {id_str}")
 
-    locked_update(parallel.TASKS, transform)
-    return result
+# ─── In-progress summary ──────────────────────────────────────────────────────
+#
+# hooks/evidence_gate.py reads the summary kept by prd_taskmaster.progress_summary;
+# see that module for the layout and freshness rules.
+
+
+def refresh_in_progress_summary(tasks_file: "str | Path", text: str, raw: dict) -> None:
+    """Re-derive the summary after a mutation that wrote *text* (parsed: *raw*).
+
+    Only files holding the master tag feed the summary. Best effort and
+    lock-free: the fingerprint is taken around a snapshot read, and if
+    another writer got in between the file is re-parsed. A summary that still
+    ends up stale is harmless — the hook sees the fingerprint mismatch and
+    scans.
+    """
+    if not isinstance(raw, dict) or "master" not in raw:
+        return
+    tasks_file = Path(tasks_file)
+    try:
+        before = progress_summary.file_fingerprint(tasks_file)
+        current = tasks_file.read_text()
+        if progress_summary.file_fingerprint(tasks_file) != before:
+            return
+        if current != text:
+            raw = storage_json_loads(current)
+        pipeline_fp = progress_summary.file_fingerprint(progress_summary.PIPELINE_FILE)
+        try:
+            phase = json.loads(progress_summary.PIPELINE_FILE.read_text()).get("current_phase")
+        except (OSError, ValueError, AttributeError):
+            phase = None
+        progress_summary.store_summary(".", progress_summary.build_summary(
+            raw, tasks_file, phase, before, pipeline_fp,
+        ))
+    except (OSError, ValueError):
+        pass
 
 
 def cmd_next_task(args: argparse.Namespace) -> None:
@@ -15,6 +15,11 @@ from prd_taskmaster.lib import (
     fail,
     _resolve_tasks_payload,
     _current_taskmaster_tag,
+    load_tasks_raw,
+    tasks_storage_exists,
+    read_tag_manifest,
+    storage_json_dumps,
+    store_tasks_raw,
 )
 
 
@@ -295,6 +300,25 @@ def _generate_acceptance_criteria(task: dict, complexity: str) -> list:
     return criteria
 
 
+def _write_tasks_wrapper(tasks_path: Path, wrapper: object) -> None:
+    """Write back a payload read via load_tasks_raw (per-tag shards or one file)."""
+    if read_tag_manifest(tasks_path) is not None:
+        # Sharded layout: only the shard(s) whose tag block changed are rewritten.
+        try:
+            store_tasks_raw(tasks_path, wrapper)
+        except OSError as e:
+            raise CommandError(f"Failed to write {tasks_path}: {e}")
+        return
+    tmp_path = tasks_path.with_suffix(".json.tmp")
+    try:
+        tmp_path.write_text(storage_json_dumps(wrapper))
+        tmp_path.replace(tasks_path)
+    except Exception as e:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise CommandError(f"Failed to write {tasks_path}: {e}")
+
+
 def run_enrich_tasks(input_path: str | None, tag: str | None = None) -> dict:
     """Enrich tasks.json with phaseConfig metadata.
 
@@ -310,12 +334,11 @@ def run_enrich_tasks(input_path: str | None, tag: str | None = None) -> dict:
     a stale legacy flat ``tasks`` key (BUG2).
     """
     tasks_path = Path(input_path) if input_path else TASKMASTER_TASKS / "tasks.json"
-    if not tasks_path.is_file():
+    if not tasks_storage_exists(tasks_path):
         raise CommandError(f"tasks.json not found: {tasks_path}")
 
     try:
-        with open(tasks_path) as f:
-            raw = json.load(f)
+        raw = load_tasks_raw(tasks_path)
     except json.JSONDecodeError as e:
         raise CommandError(f"Failed to parse {tasks_path}: {e}")
 
@@ -348,14 +371,7 @@ def run_enrich_tasks(input_path: str | None, tag: str | None = None) -> dict:
         enriched_count += 1
 
     # Write back atomically
-    tmp_path = tasks_path.with_suffix(".json.tmp")
-    try:
-        tmp_path.write_text(json.dumps(wrapper, indent=2, default=str))
-        tmp_path.replace(tasks_path)
-    except Exception as e:
-        if tmp_path.exists():
-            tmp_path.unlink()
-        raise CommandError(f"Failed to write {tasks_path}: {e}")
+    _write_tasks_wrapper(tasks_path, wrapper)
 
     return {
         "ok": True,
@@ -448,11 +464,10 @@ def run_expand_structural(
     Honors the active TaskMaster tag, mirroring ``run_enrich_tasks``.
     """
     tasks_path = Path(input_path) if input_path else TASKMASTER_TASKS / "tasks.json"
-    if not tasks_path.is_file():
+    if not tasks_storage_exists(tasks_path):
         raise CommandError(f"tasks.json not found: {tasks_path}")
     try:
-        with open(tasks_path) as f:
-            raw = json.load(f)
+        raw = load_tasks_raw(tasks_path)
     except json.JSONDecodeError as e:
         raise CommandError(f"Failed to parse {tasks_path}: {e}")
 
@@ -474,14 +489,7 @@ def run_expand_structural(
         task["subtasks"] = _structural_subtasks(task, min_subtasks=min_subtasks)
         expanded.append(task.get("id"))
 
-    tmp_path = tasks_path.with_suffix(".json.tmp")
-    try:
-        tmp_path.write_text(json.dumps(wrapper, indent=2, default=str))
-        tmp_path.replace(tasks_path)
-    except Exception as e:
-        if tmp_path.exists():
-            tmp_path.unlink()
-        raise CommandError(f"Failed to write {tasks_path}: {e}")
+    _write_tasks_wrapper(tasks_path, wrapper)
 
     return {
         "ok": True,
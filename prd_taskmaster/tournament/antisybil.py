@@ -20,7 +20,13 @@ Shape::
                 "active": bool
             },
             ...
-        ]
+        ],
+        "index": {                    # derived; rebuilt from entries if absent
+            "jobs": {job_id: active_count},
+            "operators": {operator_id: active_count},
+            "expiry": [[epoch_s, job_id, claimant_id], ...],   # min-heap
+            "inactive": int
+        }
     }
 
 TTL / crashed-job cleanup
@@ -31,11 +37,22 @@ counting, so crashed-job slots self-free after TTL_SECONDS.
 
 ``sweep_expired(state, now)`` is a pure helper — also useful from tests or a
 separate maintenance job.
+
+Index and compaction
+--------------------
+Counting and sweeping no longer scan every entry ever admitted. The persisted
+``index`` keeps per-job and per-operator active counts and a min-heap of
+expiry epochs, so a sweep pops only what has actually expired (released
+entries are skipped lazily when their heap item surfaces). Once inactive
+entries outnumber ``max(COMPACT_MIN_INACTIVE, active)`` they are dropped and
+the index is rebuilt, so the file stays proportional to live admissions
+rather than to months of tournament history.
 """
 from __future__ import annotations
 
+import heapq
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from prd_taskmaster.lib import locked_update
@@ -47,7 +64,7 @@ FAKERY_STAKE_MULT: int = 5        # S = 5 * E
 PER_JOB_CAP_N: int = 8
 PER_OPERATOR_RATE_LIMIT: int = 3
 TTL_SECONDS: int = 4 * 3600      # 4 hours — matches launcher max_lifetime
-
+COMPACT_MIN_INACTIVE: int = 32   # inactive entries tolerated before compaction
 
 
 # ─── Typed errors ─────────────────────────────────────────────────────────────
@@ -72,6 +89,90 @@ class SybilLimitError(Exception):
 
 # ─── Pure helpers (no I/O) ────────────────────────────────────────────────────
 
+def _epoch(stamp: "str | None") -> "float | None":
+    """ISO-8601 → epoch seconds; a naive stamp is read as UTC. None if unparseable."""
+    if not stamp:
+        return None
+    try:
+        dt = datetime.fromisoformat(stamp)
+    except (ValueError, TypeError):
+        return None
+    # Normalize to tz-aware (UTC) so naive and aware stamps compare safely.
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _build_index(entries: list) -> dict:
+    """Derive the count maps + expiry heap from the entry list (O(n), one-off)."""
+    jobs: dict[str, int] = {}
+    operators: dict[str, int] = {}
+    expiry: list = []
+    inactive = 0
+    for entry in entries:
+        if not isinstance(entry, dict) or not entry.get("active", False):
+            inactive += 1
+            continue
+        job_id, operator_id = entry.get("job_id"), entry.get("operator_id")
+        jobs[job_id] = jobs.get(job_id, 0) + 1
+        operators[operator_id] = operators.get(operator_id, 0) + 1
+        ts = _epoch(entry.get("expires_at"))
+        if ts is not None:
+            expiry.append([ts, job_id, entry.get("claimant_id")])
+    heapq.heapify(expiry)
+    return {"jobs": jobs, "operators": operators, "expiry": expiry, "inactive": inactive}
+
+
+def _valid_index(index: object) -> bool:
+    return (
+        isinstance(index, dict)
+        and isinstance(index.get("jobs"), dict)
+        and isinstance(index.get("operators"), dict)
+        and isinstance(index.get("expiry"), list)
+        and isinstance(index.get("inactive"), int)
+    )
+
+
+def _index_of(state: dict) -> dict:
+    """The state's persisted index, or a throwaway one derived from entries.
+
+    Only states loaded by admit/release carry a persisted index; hand-built
+    states (tests, maintenance scripts) get a fresh derivation so a caller that
+    edits ``entries`` directly can never read stale counts.
+    """
+    index = state.get("index")
+    if _valid_index(index):
+        return index
+    return _build_index(state.get("entries", []))
+
+
+def _decrement(counts: dict, key) -> None:
+    remaining = counts.get(key, 0) - 1
+    if remaining > 0:
+        counts[key] = remaining
+    else:
+        counts.pop(key, None)
+
+
+def _deactivate(index: dict, entry: dict) -> None:
+    entry["active"] = False
+    _decrement(index["jobs"], entry.get("job_id"))
+    _decrement(index["operators"], entry.get("operator_id"))
+    index["inactive"] += 1
+
+
+def _compact(state: dict) -> None:
+    """Drop inactive entries once they dominate the file; rebuild the index."""
+    index = state["index"]
+    active = sum(index["jobs"].values())
+    if index["inactive"] <= max(COMPACT_MIN_INACTIVE, active):
+        return
+    state["entries"] = [
+        e for e in state["entries"] if isinstance(e, dict) and e.get("active", False)
+    ]
+    state["index"] = _build_index(state["entries"])
+
+
 def sweep_expired(state: dict, now: str) -> dict:
     """Deactivate entries whose expires_at is in the past (pure — mutates in place).
 
@@ -87,53 +188,61 @@ def sweep_expired(state: dict, now: str) -> dict:
     Notes
     -----
     Entries without an ``expires_at`` field are left untouched (backwards
-    compatible with data written before TTL was introduced).
+    compatible with data written before TTL was introduced). Pops the expiry
+    heap only while its head is due, so the cost is O(k log n) for k expired
+    entries rather than a parse of every entry.
     """
-    try:
-        now_dt = datetime.fromisoformat(now)
-    except (ValueError, TypeError):
+    now_ts = _epoch(now)
+    if now_ts is None:
         return state
 
-    # Normalize now_dt to tz-aware (UTC) so comparisons with tz-aware entries
-    # never raise TypeError: can't compare offset-naive and offset-aware datetimes.
-    if now_dt.tzinfo is None:
-        now_dt = now_dt.replace(tzinfo=timezone.utc)
-
-    for entry in state.get("entries", []):
-        if not entry.get("active", False):
-            continue
-        expires_at = entry.get("expires_at")
-        if not expires_at:
-            continue
-        try:
-            exp_dt = datetime.fromisoformat(expires_at)
-        except (ValueError, TypeError):
-            continue
-        # Normalize exp_dt to tz-aware (UTC) for a safe comparison.
-        if exp_dt.tzinfo is None:
-            exp_dt = exp_dt.replace(tzinfo=timezone.utc)
-        if exp_dt <= now_dt:
-            entry["active"] = False
+    index = _index_of(state)
+    heap = index["expiry"]
+    by_key = None
+    while heap and heap[0][0] <= now_ts:
+        ts, job_id, claimant_id = heapq.heappop(heap)
+        if by_key is None:
+            by_key = {}
+            for e in state.get("entries", []):
+                if isinstance(e, dict) and e.get("active", False):
+                    by_key.setdefault((e.get("job_id"), e.get("claimant_id")), []).append(e)
+        for entry in by_key.get((job_id, claimant_id), []):
+            # Released entries / re-admissions of the same claimant keep their
+            # own heap items; only the admission this item was pushed for expires.
+            if entry.get("active", False) and _epoch(entry.get("expires_at")) == ts:
+                _deactivate(index, entry)
+                break
 
     return state
 
 
 def active_count_for_job(state: dict, job_id: str) -> int:
     """Count active entries for a given job_id (pure, on a loaded dict)."""
-    return sum(
-        1
-        for e in state.get("entries", [])
-        if e.get("job_id") == job_id and e.get("active", False)
-    )
+    return _index_of(state)["jobs"].get(job_id, 0)
 
 
 def active_count_for_operator(state: dict, operator_id: str) -> int:
     """Count active entries for a given operator_id across all jobs (pure)."""
-    return sum(
-        1
-        for e in state.get("entries", [])
-        if e.get("operator_id") == operator_id and e.get("active", False)
-    )
+    return _index_of(state)["operators"].get(operator_id, 0)
+
+
+def _load_state(current: str) -> dict:
+    """Parse operators.json fail-closed and attach a persisted index."""
+    state: dict
+    if current.strip():
+        try:
+            state = json.loads(current)
+        except json.JSONDecodeError:
+            state = {"entries": []}
+    else:
+        state = {"entries": []}
+    if not isinstance(state, dict):
+        state = {"entries": []}
+    if not isinstance(state.get("entries"), list):
+        state["entries"] = []
+    if not _valid_index(state.get("index")):
+        state["index"] = _build_index(state["entries"])
+    return state
 
 
 # ─── Stateful API ─────────────────────────────────────────────────────────────
@@ -192,11 +301,11 @@ def admit(
         # Ensure timezone-aware for arithmetic; fallback to UTC if naive.
         if now_dt.tzinfo is None:
             now_dt = now_dt.replace(tzinfo=timezone.utc)
-        from datetime import timedelta
         expires_dt = now_dt + timedelta(seconds=TTL_SECONDS)
         expires_at = expires_dt.isoformat()
     except (ValueError, TypeError):
         expires_at = now  # degenerate fallback
+    expires_ts = _epoch(expires_at)
 
     result: dict = {}
     error: SybilLimitError | None = None
@@ -204,17 +313,8 @@ def admit(
     def _transform(current: str) -> str:
         nonlocal result, error
 
-        state: dict
-        if current.strip():
-            try:
-                state = json.loads(current)
-            except json.JSONDecodeError:
-                state = {"entries": []}
-        else:
-            state = {"entries": []}
-
-        if not isinstance(state.get("entries"), list):
-            state["entries"] = []
+        state = _load_state(current)
+        index = state["index"]
 
         # ── Sweep expired entries BEFORE counting (I2) ────────────────────────
         sweep_expired(state, now)
@@ -240,6 +340,11 @@ def admit(
             "expires_at": expires_at,
             "active": True,
         })
+        index["jobs"][job_id] = job_active + 1
+        index["operators"][operator_id] = op_active + 1
+        if expires_ts is not None:
+            heapq.heappush(index["expiry"], [expires_ts, job_id, claimant_id])
+        _compact(state)
 
         result = {
             "entry_fee_paid": entry_fee,
@@ -284,17 +389,24 @@ def release(
         except json.JSONDecodeError:
             return current
 
-        if not isinstance(state.get("entries"), list):
+        if not isinstance(state, dict) or not isinstance(state.get("entries"), list):
             return current
 
+        if not _valid_index(state.get("index")):
+            state["index"] = _build_index(state["entries"])
+        index = state["index"]
+        if not index["jobs"].get(job_id):
+            return current  # nothing active for this job — no write
+
         for entry in state["entries"]:
-            if entry.get("job_id") != job_id:
+            if not isinstance(entry, dict) or entry.get("job_id") != job_id:
                 continue
             if not entry.get("active", False):
                 continue
             if claimant_id is None or entry.get("claimant_id") == claimant_id:
-                entry["active"] = False
+                _deactivate(index, entry)
 
+        _compact(state)
         return json.dumps(state, indent=2)
 
     locked_update(operators_path, _transform)
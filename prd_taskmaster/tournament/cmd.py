@@ -38,6 +38,7 @@ import sys
 from pathlib import Path
 from typing import Any, Callable, Optional
 
+from prd_taskmaster import fleet
 from prd_taskmaster.tournament import antisybil
 from prd_taskmaster.tournament import adjudicate as _adjudicate_module
 from prd_taskmaster.tournament.spawn import build_roster, spawn_roster, default_launcher_adapter
@@ -93,25 +94,29 @@ def run_tournament(
     card_ref: str,
     now: str,
     window_s: float = 120.0,
+    spawn_start_timeout_s: "float | None" = None,
     enforce_slash: bool = False,
     repo_root: str = ".",
     watcher_ledger_path: "str | Path | None" = None,
     _re_adjudicate: "Optional[Callable[..., dict]]" = None,
     _permit: "Optional[Callable[..., dict]]" = None,
     _spawn_fn: "Callable[[Any], dict]" = default_launcher_adapter,
+    _start_fn: "Optional[Callable[[Any, dict], dict]]" = None,
     _inbox_read: "Callable[..., list[dict]]" = default_inbox_adapter,
     _dispatch_reveal: "Callable[..., Optional[dict]]" = default_reveal_adapter,
     _seed_bank: "Optional[Callable[..., None]]" = None,
     _settle: "Optional[Callable[..., dict]]" = None,
     _compute_hash: "Optional[Callable[..., str]]" = None,
     clock=None,
+    inbox_dir: "str | Path | None" = None,
 ) -> dict:
     """Orchestrate a full tournament job, fail-closed at every step.
 
     Orchestration order
     -------------------
     1. build_roster     — admission-gated racer list.
-    2. spawn_roster     — dispatch each racer; normalize handle shape for collect.
+    2. spawn_roster     — dispatch racers concurrently; failed spawns release
+                          their slot at once; normalize handle shape for collect.
     3. collect_tournament — commit-reveal window; returns verified racers.
     4. _seed_bank       — optional escrow hook (called before settle if provided).
     5. adjudicate_job   — oracle + reachability per verified racer; writes
@@ -159,10 +164,17 @@ def run_tournament(
         ISO-8601 UTC timestamp (injected — no datetime.now() calls).
     window_s:
         Commit-reveal window in seconds (default 120).
+    spawn_start_timeout_s:
+        Start-barrier timeout for a two-phase spawn (see spawn_roster). None
+        reads fleet.json `tournament.spawn_start_timeout_s` (default 30).
     enforce_slash:
         If True, passes --enforce-slash to the settle CLI.
     _spawn_fn:
         Callable(RacerSpec) → dict. Default raises-with-guidance until wired.
+    _start_fn:
+        Optional Callable(RacerSpec, handle) → dict. When given, _spawn_fn only
+        provisions and every racer is started together after a barrier
+        (see spawn_roster).
     _inbox_read:
         Callable(job_id=) → list[dict]. Default raises-with-guidance.
     _dispatch_reveal:
@@ -179,6 +191,9 @@ def run_tournament(
         overridden; always inject in unit tests).
     clock:
         Injectable Clock for collect_tournament (tests inject FakeClock).
+    inbox_dir:
+        Optional directory the real _inbox_read adapter's submissions land in;
+        lets collect_tournament wake on file arrival instead of polling blind.
 
     Returns
     -------
@@ -237,7 +252,15 @@ def run_tournament(
         # ── Orchestration body — NEVER propagates; any crash → summary ───────
         try:
             # ── Step 2: Spawn roster ─────────────────────────────────────────
-            raw_handles = spawn_roster(roster, _spawn_fn=_spawn_fn)
+            if spawn_start_timeout_s is None:
+                spawn_start_timeout_s = fleet.load_fleet_config()["tournament"][
+                    "spawn_start_timeout_s"
+                ]
+            raw_handles = spawn_roster(
+                roster, _spawn_fn=_spawn_fn, _start_fn=_start_fn,
+                start_timeout_s=spawn_start_timeout_s,
+                operators_path=operators_path,
+            )
 
             # Normalize spawn handles: collect_tournament requires
             #   {claimant_id, session_name, worktree_path}
@@ -278,6 +301,8 @@ def run_tournament(
                 collect_kwargs["_compute_hash"] = _compute_hash
             if clock is not None:
                 collect_kwargs["clock"] = clock
+            if inbox_dir is not None:
+                collect_kwargs["inbox_dir"] = str(inbox_dir)
 
             collected = collect_tournament(**collect_kwargs)
             summary["collected"] = len(collected.racers)
@@ -424,6 +449,10 @@ def cmd_tournament_run(args: argparse.Namespace) -> None:
     For production use, a skill/orchestrator wraps run_tournament with real
     session_spawn/inbox adapters. This CLI is the direct-invocation entry point.
 
+    default_launcher_adapter is one-phase (session_spawn provisions and starts
+    at once), so racers launched from this CLI are not start-aligned; only a
+    wrapper that passes a two-phase ``_start_fn`` gets the start barrier.
+
     Note: re-running the same job_id re-admits/re-records (no Python-side
     idempotency guard; the TS settle CLI has a settled.json guard on its side).
     """
@@ -470,6 +499,7 @@ def cmd_tournament_run(args: argparse.Namespace) -> None:
             window_s=float(getattr(args, "window", 120.0)),
             enforce_slash=bool(getattr(args, "enforce_slash", False)),
             repo_root=_resolve_repo_root(),
+            inbox_dir=getattr(args, "inbox_dir", None),
             # Real adapters must be wired by the orchestrator skill; the defaults
             # raise RuntimeError with guidance if called directly.
             _spawn_fn=default_launcher_adapter,
@@ -27,6 +27,12 @@ Design constraints
   :mod:`prd_taskmaster.tournament.adjudicate`.
 - **Deterministic / pure where possible** — time comes from an injected
   :class:`Clock`; logic uses no ``random`` or wall-clock reads.
+- **Event-driven waits** — between inbox polls the collector blocks on an
+  :class:`InboxWatcher`. On Linux, with a real clock and a file-backed inbox
+  directory, that is an inotify watch (via ``ctypes``) which wakes the
+  collector the moment a submission file lands; everywhere else it is the
+  clock-driven :class:`PollingWatcher`, so ``FakeClock`` tests stay
+  deterministic.
 - **Fail-closed everywhere** — a git error yields an empty hash, which can
   never match a committed hash, so the racer is rejected rather than admitted.
 
@@ -37,8 +43,13 @@ revealed_at, entry_fee_paid, fakery_stake``.
 """
 from __future__ import annotations
 
+import ctypes
+import ctypes.util
 import hashlib
+import os
+import select
 import subprocess
+import sys
 import time
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
@@ -108,6 +119,101 @@ class FakeClock(Clock):
         self._t += float(seconds)
 
 
+# ─── Inbox watcher abstraction ────────────────────────────────────────────────
+
+# inotify(7) constants (linux/inotify.h).
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_INOTIFY_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+
+
+class InboxWatcher:
+    """Blocks between inbox polls until the inbox may have changed.
+
+    ``wait(seconds)`` returns True when woken early by an inbox event and False
+    when the full interval elapsed. A spurious True is harmless — the collector
+    just re-reads the inbox — so implementations may over-report.
+    """
+
+    def wait(self, seconds: float) -> bool:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class PollingWatcher(InboxWatcher):
+    """Fallback watcher: sleeps the full interval through the injected clock."""
+
+    def __init__(self, clock: Clock) -> None:
+        self._clock = clock
+
+    def wait(self, seconds: float) -> bool:
+        self._clock.sleep(seconds)
+        return False
+
+
+class InotifyWatcher(InboxWatcher):
+    """Linux inotify watch on an inbox directory, via ``ctypes`` (no deps).
+
+    Wakes on files created, closed-after-write or moved into the directory —
+    the latter covers writers that publish atomically via tmp + rename.
+
+    Raises
+    ------
+    OSError
+        If inotify is unavailable or the directory cannot be watched; callers
+        fall back to :class:`PollingWatcher`.
+    """
+
+    def __init__(self, inbox_dir: str) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 failed: {os.strerror(err)}")
+        wd = libc.inotify_add_watch(fd, os.fsencode(str(inbox_dir)), _INOTIFY_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(err, f"inotify_add_watch({inbox_dir!r}) failed: {os.strerror(err)}")
+        self._fd: Optional[int] = fd
+
+    def wait(self, seconds: float) -> bool:
+        if self._fd is None:
+            raise ValueError("InotifyWatcher is closed")
+        ready, _, _ = select.select([self._fd], [], [], max(0.0, seconds))
+        if not ready:
+            return False
+        # Drain every queued event; one wake covers the whole batch.
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def make_inbox_watcher(inbox_dir: "Optional[str]", clock: Clock) -> InboxWatcher:
+    """Pick the best watcher for this inbox: inotify when it can work, else polling.
+
+    inotify is only used with a :class:`RealClock` — an injected test clock
+    keeps the virtual-time :class:`PollingWatcher` so tests never block.
+    """
+    if inbox_dir and isinstance(clock, RealClock) and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(inbox_dir)
+        except (OSError, AttributeError):
+            pass  # no inotify / unwatchable dir → polling fallback
+    return PollingWatcher(clock)
+
+
 # ─── Diff-hash recompute (fail-closed) ────────────────────────────────────────
 
 
@@ -323,6 +429,8 @@ def collect_tournament(
     _dispatch_reveal: "Callable[..., Optional[dict]]" = default_reveal_adapter,
     _compute_hash: "Callable[..., str]" = _compute_diff_hash,
     clock: "Optional[Clock]" = None,
+    inbox_dir: "Optional[str]" = None,
+    watcher: "Optional[InboxWatcher]" = None,
 ) -> CollectResult:
     """Run the commit-reveal collection for one tournament job.
 
@@ -330,9 +438,10 @@ def collect_tournament(
     ------
     1. **COMMIT** — poll ``_inbox_read(job_id=...)`` until every roster claimant
        has reported a commit OR the quality-gated window ``window_s`` elapses.
-       The loop sleeps ``poll_interval_s`` between polls via the injected
-       ``clock`` (a FakeClock fast-forwards with no real wait, proving the loop
-       always terminates).
+       Between polls the loop waits up to ``poll_interval_s`` on an
+       :class:`InboxWatcher`, which returns early when a submission lands (a
+       FakeClock-backed PollingWatcher fast-forwards with no real wait,
+       proving the loop always terminates).
     2. **REVEAL** — for each committed claimant, call ``_dispatch_reveal`` to get
        ``{claimant_id, worktree_path, commit_sha, self_reported_exit}``. A racer
        that never reveals is rejected ``no_reveal``.
@@ -381,13 +490,22 @@ def collect_tournament(
         Quality-gated commit window in seconds (default 120). Once elapsed,
         un-committed roster claimants are rejected.
     poll_interval_s:
-        Seconds to sleep between inbox polls (default 2).
+        Longest wait between inbox polls (default 2). With an event-driven
+        watcher this is only the safety-net re-poll interval.
     _inbox_read, _dispatch_reveal, _compute_hash:
         Injectable I/O. Defaults raise-with-guidance / are fail-closed and never
         import the launcher at module load.
     clock:
         Injectable :class:`Clock`. Defaults to :class:`RealClock`. Tests inject
         a :class:`FakeClock`.
+    inbox_dir:
+        Optional directory the inbox adapter's submissions land in. When given
+        (with a real clock on Linux) the collector waits on an inotify watch of
+        it instead of sleeping blind.
+    watcher:
+        Injectable :class:`InboxWatcher`; overrides ``inbox_dir``. Defaults to
+        :func:`make_inbox_watcher`. A watcher built here is closed on return;
+        an injected one is left to its owner.
 
     Returns
     -------
@@ -395,7 +513,43 @@ def collect_tournament(
     """
     if clock is None:
         clock = RealClock()
+    owns_watcher = watcher is None
+    if watcher is None:
+        watcher = make_inbox_watcher(inbox_dir, clock)
+    try:
+        return _collect(
+            job_id=job_id,
+            roster=roster,
+            handles=handles,
+            base_ref=base_ref,
+            window_s=window_s,
+            poll_interval_s=poll_interval_s,
+            _inbox_read=_inbox_read,
+            _dispatch_reveal=_dispatch_reveal,
+            _compute_hash=_compute_hash,
+            clock=clock,
+            watcher=watcher,
+        )
+    finally:
+        if owns_watcher:
+            watcher.close()
+
 
+def _collect(
+    *,
+    job_id: str,
+    roster: "list[Any]",
+    handles: "list[dict]",
+    base_ref: str,
+    window_s: float,
+    poll_interval_s: float,
+    _inbox_read: "Callable[..., list[dict]]",
+    _dispatch_reveal: "Callable[..., Optional[dict]]",
+    _compute_hash: "Callable[..., str]",
+    clock: Clock,
+    watcher: InboxWatcher,
+) -> CollectResult:
+    """Body of :func:`collect_tournament` once the clock and watcher are set."""
     # Index roster + handles by claimant_id. Only claimants present in BOTH the
     # roster and the handles can be collected (we need fees AND a worktree).
     roster_by_id: dict[str, Any] = {}
@@ -440,9 +594,10 @@ def collect_tournament(
         if clock.now() >= deadline:
             break
 
-        # Sleep one interval — but never sleep past the deadline. The FakeClock
-        # advances virtual time here without any real wait, guaranteeing the
-        # loop terminates. The advance is floored to a positive minimum so a
+        # Wait one interval — but never past the deadline. The watcher returns
+        # early when a submission lands; the polling fallback's FakeClock
+        # advances virtual time without any real wait, guaranteeing the loop
+        # terminates. The advance is floored to a positive minimum so a
         # degenerate poll_interval_s<=0 cannot stall progress to the deadline
         # (the clock must strictly approach `deadline` every iteration). We
         # still never overshoot: when the remaining window is below that floor
@@ -455,7 +610,7 @@ def collect_tournament(
             step = _MIN_POLL_S
         if step > remaining:
             step = remaining
-        clock.sleep(step)
+        watcher.wait(step)
 
     # Roster claimants that never committed within the window → rejected.
     for cid in roster_ids:
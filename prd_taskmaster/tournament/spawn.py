@@ -24,6 +24,8 @@ Usage::
 """
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
@@ -251,12 +253,48 @@ def build_roster(
 
 # ─── Spawn dispatcher ─────────────────────────────────────────────────────────
 
+# Default start-barrier timeout; fleet.json `tournament.spawn_start_timeout_s`
+# overrides it for run_tournament.
+SPAWN_START_TIMEOUT_S = 30.0
+
+
+def _spawn_one(spec: RacerSpec, spawn_fn: "Callable[[RacerSpec], dict]") -> dict:
+    """Run one spawn, folding any exception into a spawned=False handle."""
+    try:
+        handle = dict(spawn_fn(spec))
+        # Ensure the claimant_id and spawned flag are always present.
+        handle.setdefault("claimant_id", spec.claimant_id)
+        handle["spawned"] = True
+    except Exception as exc:  # noqa: BLE001
+        handle = {
+            "claimant_id": spec.claimant_id,
+            "spawned": False,
+            "error": str(exc),
+        }
+    return handle
+
+
+def _start_one(
+    spec: RacerSpec, handle: dict, start_fn: "Callable[[RacerSpec, dict], dict]"
+) -> dict:
+    """Start a provisioned racer, folding any exception into a spawned=False handle."""
+    try:
+        return {**handle, **dict(start_fn(spec, handle)), "spawned": True}
+    except Exception as exc:  # noqa: BLE001
+        return {**handle, "spawned": False, "error": str(exc)}
+
+
 def spawn_roster(
     roster: "list[RacerSpec]",
     *,
     _spawn_fn: "Callable[[RacerSpec], dict]",
+    _start_fn: "Callable[[RacerSpec, dict], dict] | None" = None,
+    max_parallel: int = PER_JOB_CAP_N,
+    start_timeout_s: float = SPAWN_START_TIMEOUT_S,
+    operators_path: "str | Path | None" = None,
+    _release: "Callable[..., None]" = antisybil.release,
 ) -> "list[dict]":
-    """Dispatch each RacerSpec through _spawn_fn; fail-isolate individual spawn errors.
+    """Dispatch each RacerSpec through _spawn_fn concurrently; fail-isolate errors.
 
     Parameters
     ----------
@@ -267,37 +305,82 @@ def spawn_roster(
         (at minimum {"claimant_id": ..., "session_id": ...}).
         Use ``default_launcher_adapter`` for production; inject a stub in tests.
         There is NO default here to prevent accidental live-launcher coupling.
+        Must be thread-safe: up to ``max_parallel`` calls run at once.
+        With ``_start_fn`` it only provisions the racer (worktree, session)
+        without letting it begin work.
+    _start_fn:
+        Optional second phase: ``(spec, handle) -> dict`` lets a provisioned
+        racer begin work; its dict is merged into the handle. See Notes.
+    max_parallel:
+        Upper bound on concurrent _spawn_fn calls (default PER_JOB_CAP_N, i.e.
+        a full roster launches at once). ``1`` restores sequential spawning.
+    start_timeout_s:
+        Seconds a provisioned racer waits at the start barrier (two-phase
+        adapters only) for the rest of the first wave.
+    operators_path:
+        When given, a racer whose spawn (or start) fails has its anti-sybil
+        admission released immediately (``antisybil.release`` for that
+        claimant only), so the operator slot is not held until the
+        tournament settles.
+    _release:
+        Injectable release function (default ``antisybil.release``).
 
     Returns
     -------
-    list[dict] — one entry per racer.
+    list[dict] — one entry per racer, in roster order.
         Successful spawn: ``{"claimant_id": ..., "session_id": ..., "spawned": True, ...}``.
-        Failed spawn:     ``{"claimant_id": ..., "spawned": False, "error": str}``.
+        Failed spawn:     ``{"claimant_id": ..., "spawned": False, "error": str}``,
+        plus ``released: True`` (or ``release_error``) when operators_path is set.
 
     Notes
     -----
     A single failing spawn does NOT abort the roster. Each racer's spawn is
     attempted independently; failures are recorded with spawned=False.
-    """
-    handles: list[dict] = []
 
-    for spec in roster:
-        try:
-            handle = _spawn_fn(spec)
-            # Ensure the claimant_id and spawned flag are always present.
-            handle = dict(handle)
-            handle.setdefault("claimant_id", spec.claimant_id)
-            handle["spawned"] = True
-        except Exception as exc:  # noqa: BLE001
-            handle = {
-                "claimant_id": spec.claimant_id,
-                "spawned": False,
-                "error": str(exc),
-            }
+    Fair start needs a two-phase adapter. With ``_start_fn``, the first wave
+    of workers (``min(max_parallel, len(roster))``) provisions concurrently,
+    meets at a barrier, and only then calls ``_start_fn``, so a racer that
+    provisions quickly gets no head start over a slow one. A worker that
+    does not reach the barrier within ``start_timeout_s`` breaks it and
+    the rest start unsynchronised. Without ``_start_fn`` there is no barrier:
+    _spawn_fn provisions and starts in one call, and each racer's start time
+    still differs by its provisioning time.
+    """
+    if max_parallel < 1:
+        raise ValueError(f"max_parallel must be >= 1, got {max_parallel}")
+    if start_timeout_s <= 0:
+        raise ValueError(f"start_timeout_s must be > 0, got {start_timeout_s}")
+    if not roster:
+        return []
+
+    workers = min(max_parallel, len(roster))
+    barrier = threading.Barrier(workers) if workers > 1 and _start_fn is not None else None
+
+    def _run(index: int, spec: RacerSpec) -> dict:
+        handle = _spawn_one(spec, _spawn_fn)
+        if barrier is not None and index < workers:
+            try:
+                barrier.wait(timeout=start_timeout_s)
+            except threading.BrokenBarrierError:
+                pass
+        if handle["spawned"] and _start_fn is not None:
+            handle = _start_one(spec, handle, _start_fn)
+        if not handle["spawned"] and operators_path is not None:
+            try:
+                _release(
+                    operators_path, job_id=spec.job_id, claimant_id=spec.claimant_id
+                )
+                handle["released"] = True
+            except Exception as exc:  # noqa: BLE001
+                handle["release_error"] = str(exc)
+        return handle
 
-        handles.append(handle)
+    if workers == 1:
+        return [_run(i, spec) for i, spec in enumerate(roster)]
 
-    return handles
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="racer-spawn") as pool:
+        futures = [pool.submit(_run, i, spec) for i, spec in enumerate(roster)]
+        return [f.result() for f in futures]
 
 
 # ─── Live adapter documentation (no-op at module load) ───────────────────────
@@ -319,6 +402,9 @@ def default_launcher_adapter(spec: RacerSpec) -> dict:
             session_name=spec.claimant_id,
         )
 
+    session_spawn provisions and starts in one call, so this is a one-phase
+    adapter: racers are not start-aligned (see spawn_roster's ``_start_fn``).
+
     Raises
     ------
     RuntimeError
@@ -18,6 +18,8 @@ from prd_taskmaster.lib import (
     word_count,
     _resolve_tasks_payload,
     _current_taskmaster_tag,
+    load_tasks_raw,
+    tasks_storage_exists,
 )
 
 # Angle-bracket placeholder sub-pattern: matches only TRUE placeholders like
@@ -510,12 +512,11 @@ def run_validate_tasks(
     the tagged block so manual/native mode does not silently validate a stale
     legacy flat ``tasks`` key (BUG2)."""
     tasks_path = Path(input_path) if input_path else TASKMASTER_TASKS / "tasks.json"
-    if not tasks_path.is_file():
+    if not tasks_storage_exists(tasks_path):
         raise CommandError(f"tasks.json not found: {tasks_path}")
 
     try:
-        with open(tasks_path) as f:
-            raw = json.load(f)
+        raw = load_tasks_raw(tasks_path)
     except json.JSONDecodeError as e:
         raise CommandError(f"Failed to parse {tasks_path}: {e}")
 
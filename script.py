@@ -1,8 +1,34 @@
 #!/usr/bin/env python3
-"""prd-taskmaster CLI — thin shim over the prd_taskmaster package."""
+"""prd-taskmaster CLI — thin shim over the prd_taskmaster package.
+
+When a daemon is serving this project (``daemon-serve``) the command runs
+there; otherwise, or if the daemon turns it away, it runs in-process. A
+command the daemon accepted but never answered is reported as an error, never
+re-run here.
+"""
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
-from prd_taskmaster.cli import main
+
+
+def _via_daemon():
+    from prd_taskmaster.daemon import DaemonError, run_cli_via_daemon
+
+    try:
+        reply = run_cli_via_daemon(sys.argv[1:])
+    except DaemonError as exc:
+        from prd_taskmaster.lib import fail
+
+        fail(str(exc), command=sys.argv[1])
+    if reply is None:
+        return False
+    sys.stdout.write(reply.get("stdout", ""))
+    sys.stderr.write(reply.get("stderr", ""))
+    sys.stdout.flush()
+    sys.exit(reply.get("exit", 0))
+
+
 if __name__ == "__main__":
+    _via_daemon()
+    from prd_taskmaster.cli import main
     main()
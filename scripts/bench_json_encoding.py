@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Benchmark the tasks.json storage encodings on a synthetic task graph.
+
+Compares indent=2 (the old on-disk format, still what `tasks-export` writes)
+with the compact storage encoding. For each it reports the file size and
+the median encode, decode and atomic-write times over a few repetitions.
+
+    python scripts/bench_json_encoding.py [--tasks 10000] [--repeat 5]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from prd_taskmaster import lib  # noqa: E402
+
+
+def _graph(n):
+    tasks = []
+    for i in range(1, n + 1):
+        tasks.append({
+            "id": i,
+            "title": f"Implement component {i}",
+            "description": "Wire the component into the service layer and expose it.",
+            "details": "Touch src/service/component_%d.py; add a unit test; update docs." % i,
+            "testStrategy": "unit + integration",
+            "status": "pending" if i % 3 else "done",
+            "priority": "medium",
+            "dependencies": [i - 1] if i > 1 else [],
+            "phaseConfig": {"tier": "domain-model", "requiresCDD": True,
+                            "acceptanceCriteria": ["tests pass", "lint clean"]},
+            "subtasks": [
+                {"id": s, "title": f"Step {s}", "description": "failing test -> implement",
+                 "details": "", "status": "pending", "dependencies": [s - 1] if s > 1 else []}
+                for s in range(1, 5)
+            ],
+        })
+    return {"master": {"tasks": tasks, "metadata": {"created": "2026-01-01T00:00:00Z"}}}
+
+
+def _median_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 1)
+
+
+def _bench(label, payload, repeat, pretty):
+    text = lib.storage_json_dumps(payload, pretty=pretty)
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(tmp) / "tasks.json"
+        return {
+            "encoding": label,
+            "bytes": len(text.encode()),
+            "encode_ms": _median_ms(lambda: lib.storage_json_dumps(payload, pretty=pretty), repeat),
+            "decode_ms": _median_ms(lambda: lib.storage_json_loads(text), repeat),
+            "write_ms": _median_ms(lambda: lib.atomic_write(target, text), repeat),
+        }
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--tasks", type=int, default=10000)
+    p.add_argument("--repeat", type=int, default=5)
+    args = p.parse_args()
+
+    payload = _graph(args.tasks)
+    rows = [
+        _bench("pretty (indent=2)", payload, args.repeat, True),
+        _bench("compact", payload, args.repeat, False),
+    ]
+    base = rows[0]
+    for row in rows[1:]:
+        row["vs_pretty"] = {
+            key: f"{100 * (1 - row[key] / base[key]):.0f}% less"
+            for key in ("bytes", "encode_ms", "decode_ms", "write_ms") if base[key]
+        }
+    print(json.dumps({"tasks": args.tasks, "repeat": args.repeat, "results": rows}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
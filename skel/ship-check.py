@@ -46,6 +46,16 @@ Interface:
   python3 .atlas-ai/ship-check.py                              # standard gate
   python3 .atlas-ai/ship-check.py --dry-run                    # always exit 0; report on stderr
   python3 .atlas-ai/ship-check.py --cwd /path/to/project       # explicit project root
+  python3 .atlas-ai/ship-check.py --no-cache                   # re-evaluate every gate
+
+Incremental: each cheap gate's verdict is recorded with a fingerprint of its
+inputs in .atlas-ai/state/ship-check-cache.json and reused while the inputs are
+unchanged. The cache sits in an agent-writable tree, so it is HMAC-signed with
+a key kept OUTSIDE the repo (~/.config/atlas-ai/ship-check.key); an unsigned
+or tampered cache is ignored. Oracle verdicts are NEVER reused — Gate 5
+re-grades every done task on every run. On success the combined fingerprint is
+printed on stderr and recorded as "ship_check_ok" — the SHIP_CHECK_OK token
+vouches for exactly that state.
 
 Exit codes:
   0 — SHIP_CHECK_OK (stdout: exactly "SHIP_CHECK_OK\n")
@@ -55,13 +65,16 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import hashlib
+import hmac
 import json
 import os
+import secrets
 import shlex
 import subprocess
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 
 def gate_pipeline(atlas: Path) -> Tuple[bool, List[str]]:
@@ -77,13 +90,31 @@ def gate_pipeline(atlas: Path) -> Tuple[bool, List[str]]:
     return True, []
 
 
+def _load_tasks_data(repo_root: Path):
+    """Parsed tasks.json — or, when .taskmaster/tasks/tags/manifest.json exists
+    (prd-taskmaster's per-tag sharded layout), every tag shard merged into one
+    tagged object. In that layout tasks.json is only an export and may be stale."""
+    tasks_dir = repo_root / ".taskmaster" / "tasks"
+    manifest = tasks_dir / "tags" / "manifest.json"
+    if not manifest.is_file():
+        return json.loads((tasks_dir / "tasks.json").read_text())
+    merged = {}
+    for tag, name in (json.loads(manifest.read_text()).get("tags") or {}).items():
+        shard = tasks_dir / "tags" / name
+        if shard.is_file():
+            block = json.loads(shard.read_text()).get(tag)
+            if isinstance(block, dict):
+                merged[tag] = block
+    return merged
+
+
 def gate_tasks(repo_root: Path) -> Tuple[bool, List[str], list]:
     tf = repo_root / ".taskmaster" / "tasks" / "tasks.json"
-    if not tf.exists():
+    if not tf.exists() and not (tf.parent / "tags" / "manifest.json").is_file():
         return False, ["tasks.json missing at .taskmaster/tasks/tasks.json"], []
     try:
-        tdata = json.loads(tf.read_text())
-    except json.JSONDecodeError as exc:
+        tdata = _load_tasks_data(repo_root)
+    except (json.JSONDecodeError, AttributeError) as exc:
         return False, [f"tasks.json invalid JSON: {exc}"], []
     # Accept both canonical formats: tagged {"master": {"tasks": [...]}}
     # and flat {"tasks": [...]} (Native Mode / fleet samples).
@@ -275,7 +306,12 @@ def gate_reachability(repo_root: Path, tasks: list) -> Tuple[bool, List[str]]:
     return len(failures) == 0, failures
 
 
-def gate_oracle(repo_root: Path, tasks: list, head_commit: str) -> Tuple[bool, List[str]]:
+def gate_oracle(
+    repo_root: Path,
+    tasks: list,
+    head_commit: str,
+    verdicts: Optional[Dict[str, dict]] = None,
+) -> Tuple[bool, List[str]]:
     """Re-grade every DONE task via the atlas oracle CLI. FAIL-CLOSED.
 
     For each done task: the CDD card must exist and carry a 'grading' block,
@@ -283,6 +319,14 @@ def gate_oracle(repo_root: Path, tasks: list, head_commit: str) -> Tuple[bool, L
     no grading block, CLI crash, unparseable output, a non-PASS verdict —
     appends a failure. The submitter's evidence is NOT read here; the oracle
     re-executes the grading and writes its own evidence/ledger.
+
+    Verdicts are never reused from an earlier run: this gate exists to stop
+    a faked "done", and any stored verdict is one the agent under review
+    could have written. When *verdicts* is given, each definitive PASS/FAIL
+    is recorded there under the task id with the fingerprint of its inputs —
+    HEAD commit, oracle command, card bytes and the held-out tree — so the
+    combined SHIP_CHECK_OK fingerprint names what was graded. Nothing is
+    recorded when HEAD is UNKNOWN.
     """
     failures: List[str] = []
     atlas = repo_root / ".atlas-ai"
@@ -290,6 +334,7 @@ def gate_oracle(repo_root: Path, tasks: list, head_commit: str) -> Tuple[bool, L
     evidence = atlas / "evidence"
     ledger = atlas / "ledger"
     cmd_base = _oracle_cmd()
+    held_fp = _dir_fp(held) if verdicts is not None else None
 
     for t in tasks:
         if t.get("status") != "done":
@@ -299,6 +344,10 @@ def gate_oracle(repo_root: Path, tasks: list, head_commit: str) -> Tuple[bool, L
         if not card_path.exists():
             failures.append(f"task {tid}: no CDD card to grade")
             continue
+
+        task_fp = None
+        if verdicts is not None and head_commit != "UNKNOWN":
+            task_fp = _digest(head_commit, cmd_base, held_fp, _file_fp(card_path))
         try:
             card = json.loads(card_path.read_text())
         except (OSError, json.JSONDecodeError) as exc:
@@ -333,6 +382,8 @@ def gate_oracle(repo_root: Path, tasks: list, head_commit: str) -> Tuple[bool, L
         if verdict not in ("PASS", "FAIL"):
             failures.append(f"task {tid}: oracle verdict missing/invalid ({verdict!r})")
             continue
+        if task_fp is not None:
+            verdicts[str(tid)] = {"fingerprint": task_fp, "verdict": verdict}
         if verdict == "FAIL":
             failures.append(f"task {tid}: oracle verdict FAIL")
             continue
@@ -341,31 +392,193 @@ def gate_oracle(repo_root: Path, tasks: list, head_commit: str) -> Tuple[bool, L
     return len(failures) == 0, failures
 
 
-def run_all_gates(repo_root: Path) -> Tuple[bool, List[str]]:
-    failures: List[str] = []
+# ─── Incremental re-runs: gate input fingerprints ────────────────────────────
+#
+# Every gate declares its inputs; run_all_gates(use_cache=True) records each
+# gate's fingerprint with its failures in .atlas-ai/state/ship-check-cache.json
+# and reuses the failures when the fingerprint is unchanged. The combined
+# fingerprint of all gates is what a SHIP_CHECK_OK vouches for: main() records
+# it under "ship_check_ok" and prints it on stderr, so the token can be checked
+# against the tree it was issued for. Fingerprints hash file CONTENTS for the
+# small JSON inputs and (name, size, mtime_ns) for directory trees.
+#
+# Every input to a fingerprint is public, so anyone who can write the cache
+# could forge a matching "no failures" entry. The cache therefore carries an
+# HMAC under a per-user key stored outside the repo (ATLAS_SHIP_CHECK_KEY_FILE
+# overrides the path); a cache that does not verify is treated as empty, and
+# without a usable key nothing is cached at all.
+
+CACHE_REL = Path("state") / "ship-check-cache.json"
+_KEY_BYTES = 32
+
+
+def _key_path() -> Path:
+    override = os.environ.get("ATLAS_SHIP_CHECK_KEY_FILE")
+    if override:
+        return Path(override)
+    config = os.environ.get("XDG_CONFIG_HOME") or str(Path.home() / ".config")
+    return Path(config) / "atlas-ai" / "ship-check.key"
+
+
+def _cache_key() -> Optional[bytes]:
+    """The per-user cache key, created (mode 0600) on first use; None if unusable."""
+    path = _key_path()
+    for _ in range(2):
+        try:
+            key = path.read_bytes()
+            return key if len(key) >= _KEY_BYTES else None
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            continue  # a concurrent run created it; read theirs
+        except OSError:
+            return None
+        with os.fdopen(fd, "wb") as f:
+            f.write(secrets.token_bytes(_KEY_BYTES))
+    return None
+
+
+def _mac(key: bytes, cache: dict) -> str:
+    body = json.dumps(cache, sort_keys=True, default=str).encode()
+    return hmac.new(key, body, hashlib.sha256).hexdigest()
+
+
+def _digest(*parts) -> str:
+    blob = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.sha256(blob).hexdigest()
+
+
+def _file_fp(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return "missing"
+
+
+def _dir_fp(path: Path, pattern: str = "*") -> list:
+    """Sorted (relative path, size, mtime_ns) for files under *path* matching *pattern*."""
+    if not path.is_dir():
+        return []
+    entries = []
+    for f in path.rglob(pattern):
+        try:
+            st = f.stat()
+        except OSError:
+            continue
+        if f.is_file():
+            entries.append((f.relative_to(path).as_posix(), st.st_size, st.st_mtime_ns))
+    return sorted(entries)
+
+
+def _load_cache(atlas: Path) -> dict:
+    """The cache if its HMAC verifies, else {} (unsigned, forged or tampered)."""
+    try:
+        data = json.loads((atlas / CACHE_REL).read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    mac = data.pop("mac", None)
+    key = _cache_key()
+    if key is None or not isinstance(mac, str) or not hmac.compare_digest(mac, _mac(key, data)):
+        return {}
+    return data
+
+
+def _save_cache(atlas: Path, cache: dict) -> None:
+    """Best-effort signed atomic write; a read-only tree just loses the speed-up."""
+    key = _cache_key()
+    if key is None:
+        return
+    path = atlas / CACHE_REL
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + f".tmp.{os.getpid()}")
+        tmp.write_text(json.dumps({**cache, "mac": _mac(key, cache)}, indent=2, sort_keys=True))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _evaluate(repo_root: Path, cache: Optional[dict]) -> Tuple[bool, List[str], str, dict]:
+    """Run (or reuse) every gate. Returns (ok, failures, combined fingerprint, new cache)."""
     atlas = repo_root / ".atlas-ai"
+    previous = (cache or {}).get("gates") or {}
+    gates: Dict[str, dict] = {}
+    failures: List[str] = []
 
-    _, f1 = gate_pipeline(atlas)
-    failures.extend(f1)
+    def _gate(name: str, fingerprint: str, run) -> None:
+        prior = previous.get(name)
+        if (
+            cache is not None
+            and isinstance(prior, dict)
+            and prior.get("fingerprint") == fingerprint
+            and isinstance(prior.get("failures"), list)
+        ):
+            gate_failures = prior["failures"]
+        else:
+            gate_failures = run()
+        gates[name] = {"fingerprint": fingerprint, "failures": gate_failures}
+        failures.extend(gate_failures)
+
+    pipeline_fp = _file_fp(atlas / "state" / "pipeline.json")
+    tasks_fp = _digest(
+        _file_fp(repo_root / ".taskmaster" / "tasks" / "tasks.json"),
+        _dir_fp(repo_root / ".taskmaster" / "tasks" / "tags", "*.json"),
+    )
+
+    _gate("pipeline", pipeline_fp, lambda: gate_pipeline(atlas)[1])
 
+    # The task list feeds the later gates, so Gate 2 always runs (it is one
+    # JSON parse); its verdict is still fingerprinted into the combined hash.
     _, f2, tasks = gate_tasks(repo_root)
+    gates["tasks"] = {"fingerprint": tasks_fp, "failures": f2}
     failures.extend(f2)
 
+    oracle_verdicts: Dict[str, dict] = {}
     if tasks:
-        _, f3 = gate_cdd(atlas, tasks)
-        failures.extend(f3)
+        cards_fp = _dir_fp(atlas / "cdd", "task-*.json")
+        _gate("cdd", _digest(tasks_fp, [c[0] for c in cards_fp]),
+              lambda: gate_cdd(atlas, tasks)[1])
 
         head = _head_commit(repo_root)
-        _, f5 = gate_oracle(repo_root, tasks, head)
+        _, f5 = gate_oracle(repo_root, tasks, head, verdicts=oracle_verdicts)
+        # Uncacheable outcomes (crashes, UNKNOWN head) make the gate fingerprint
+        # unique to this run, so a later OK can never be vouched by a stale hash.
+        oracle_fp = _digest(tasks_fp, head, sorted(
+            (tid, v.get("fingerprint")) for tid, v in oracle_verdicts.items()
+        ), f5)
+        gates["oracle"] = {"fingerprint": oracle_fp, "failures": f5}
         failures.extend(f5)
 
-        _, f6 = gate_reachability(repo_root, tasks)
-        failures.extend(f6)
+        _gate("reachability", _digest(tasks_fp, cards_fp),
+              lambda: gate_reachability(repo_root, tasks)[1])
 
-    _, f4 = gate_plan(repo_root)
-    failures.extend(f4)
+    plans = _dir_fp(repo_root / "docs" / "superpowers" / "plans", "*.md")
+    plan_fp = _digest((repo_root / ".taskmaster" / "docs" / "plan.md").exists(),
+                      [p[0] for p in plans])
+    _gate("plan", plan_fp, lambda: gate_plan(repo_root)[1])
 
-    return len(failures) == 0, failures
+    combined = _digest(sorted((name, g["fingerprint"]) for name, g in gates.items()))
+    new_cache = {"gates": gates, "oracle": oracle_verdicts, "fingerprint": combined}
+    if cache is not None and cache.get("ship_check_ok"):
+        new_cache["ship_check_ok"] = cache["ship_check_ok"]
+    return len(failures) == 0, failures, combined, new_cache
+
+
+def run_all_gates(repo_root: Path, use_cache: bool = False) -> Tuple[bool, List[str]]:
+    """Evaluate every gate. With *use_cache*, reuse verdicts whose input
+    fingerprints are unchanged since the last cached run (see above)."""
+    atlas = repo_root / ".atlas-ai"
+    ok, failures, _, new_cache = _evaluate(repo_root, _load_cache(atlas) if use_cache else None)
+    if use_cache:
+        _save_cache(atlas, new_cache)
+    return ok, failures
 
 
 def main() -> int:
@@ -374,16 +587,26 @@ def main() -> int:
                         help="Run all gates but always exit 0. Report goes to stderr. Used by execute-task Step 9 as a per-task predicate.")
     parser.add_argument("--cwd", type=str, default=None,
                         help="Project root (defaults to current working directory).")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-evaluate every gate from scratch, ignoring .atlas-ai/state/ship-check-cache.json.")
     args = parser.parse_args()
 
     repo_root = Path(args.cwd).resolve() if args.cwd else Path.cwd()
+    atlas = repo_root / ".atlas-ai"
 
     try:
-        ok, failures = run_all_gates(repo_root)
+        cache = {} if args.no_cache else _load_cache(atlas)
+        ok, failures, fingerprint, new_cache = _evaluate(repo_root, cache)
     except Exception as exc:  # noqa: BLE001 — top-level guard
         print(f"FAIL: ship-check script error: {exc!r}", file=sys.stderr)
         return 2
 
+    if ok and not args.dry_run:
+        new_cache["ship_check_ok"] = {"fingerprint": fingerprint}
+    elif not ok:
+        new_cache.pop("ship_check_ok", None)
+    _save_cache(atlas, new_cache)
+
     if args.dry_run:
         if ok:
             print("[DRY-RUN] all gates would pass", file=sys.stderr)
@@ -395,6 +618,7 @@ def main() -> int:
 
     if ok:
         print("SHIP_CHECK_OK")
+        print(f"ship-check fingerprint: {fingerprint}", file=sys.stderr)
         return 0
 
     for f in failures:
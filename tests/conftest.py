@@ -0,0 +1,16 @@
+"""Suite-wide isolation: no test reads per-user state or writes into the repo."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _ship_check_key(tmp_path_factory, monkeypatch):
+    """Sign ship-check caches with a throwaway key, never ~/.config's."""
+    key_dir = tmp_path_factory.mktemp("ship-check-key")
+    monkeypatch.setenv("ATLAS_SHIP_CHECK_KEY_FILE", str(key_dir / "ship-check.key"))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cwd(tmp_path, monkeypatch):
+    """Run every test in its own directory so .atlas-ai/ state never lands in the repo."""
+    monkeypatch.chdir(tmp_path)
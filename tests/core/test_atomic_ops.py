@@ -1,8 +1,23 @@
+import fcntl
+import json
 import os
 import threading
+import time
 from pathlib import Path
 
-from prd_taskmaster.lib import atomic_write, locked_update, emit_json_error
+import pytest
+
+from prd_taskmaster import lib
+from prd_taskmaster.lib import (
+    atomic_write,
+    emit_json_error,
+    locked_append,
+    locked_read,
+    locked_update,
+    snapshot_read,
+    spooled_update,
+)
+from prd_taskmaster.locks import summarize_lock_waits
 
 
 def test_atomic_write_creates_file(tmp_path):
@@ -45,9 +60,193 @@ def test_locked_update_serializes_concurrent_writes(tmp_path):
     assert int(target.read_text().strip()) == 10, "All 10 increments must land (no lost updates)"
 
 
+def test_locked_append_returns_offset_and_repairs_torn_line(tmp_path):
+    target = tmp_path / "log.jsonl"
+    assert locked_append(target, "a\n") == 0
+    target.write_text(target.read_text() + "torn")
+    assert locked_append(target, "b\n") == len("a\ntorn\n")
+    assert target.read_text() == "a\ntorn\nb\n"
+
+
+def test_locked_append_concurrent_lines_never_interleave(tmp_path):
+    target = tmp_path / "log.jsonl"
+    threads = [
+        threading.Thread(target=locked_append, args=(target, f"{i}\n"))
+        for i in range(20)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(int(x) for x in target.read_text().splitlines()) == list(range(20))
+
+
+def _hold_lock(target):
+    lock_f = open(target.with_suffix(target.suffix + ".lock"), "w")
+    fcntl.flock(lock_f, fcntl.LOCK_EX)
+    return lock_f
+
+
+def _wait_for_ops(spool, count):
+    deadline = time.monotonic() + 10
+    while len(list(spool.glob("*.op"))) < count:
+        assert time.monotonic() < deadline, "ops never reached the spool"
+        time.sleep(0.01)
+
+
+def _add_lines(current, ops):
+    lines = set(current.split())
+    results = []
+    for op in ops:
+        if op["line"] == "bad":
+            results.append({"ok": False, "error": "bad line"})
+            continue
+        lines.add(op["line"])
+        results.append({"ok": True, "line": op["line"]})
+    return " ".join(sorted(lines)), results
+
+
+def test_spooled_update_applies_waiting_ops_in_one_batch(tmp_path):
+    target = tmp_path / "lines.txt"
+    batches = []
+    results = {}
+
+    def apply(current, ops):
+        batches.append(len(ops))
+        return _add_lines(current, ops)
+
+    def call(line):
+        results[line] = spooled_update(target, {"line": line}, apply)
+
+    lock_f = _hold_lock(target)
+    names = ["a", "b", "c", "d", "bad"]
+    threads = [threading.Thread(target=call, args=(n,)) for n in names]
+    for t in threads:
+        t.start()
+    _wait_for_ops(tmp_path / "lines.txt.spool", len(names))
+    fcntl.flock(lock_f, fcntl.LOCK_UN)
+    lock_f.close()
+    for t in threads:
+        t.join()
+
+    assert batches == [len(names)], "one holder applies every waiting op"
+    assert target.read_text() == "a b c d"
+    assert results["bad"] == {"ok": False, "error": "bad line"}
+    assert all(results[n] == {"ok": True, "line": n} for n in "abcd")
+    assert not list((tmp_path / "lines.txt.spool").iterdir())
+
+
+def test_spooled_update_replays_ops_left_by_a_crashed_holder(tmp_path):
+    target = tmp_path / "lines.txt"
+    target.write_text("a")
+    spool = tmp_path / "lines.txt.spool"
+    # The dead holder wrote "a" but never handed out its result.
+    atomic_write(spool / "00000000000000000001-1-dead.op", json.dumps({"line": "a"}))
+
+    assert spooled_update(target, {"line": "b"}, _add_lines) == {"ok": True, "line": "b"}
+    assert target.read_text() == "a b"
+    assert json.loads((spool / "00000000000000000001-1-dead.result").read_text())["ok"]
+
+
+def test_spooled_update_fails_the_whole_batch_when_apply_raises(tmp_path):
+    target = tmp_path / "lines.txt"
+    target.write_text("a")
+
+    def apply(current, ops):
+        raise RuntimeError("boom")
+
+    result = spooled_update(target, {"line": "b"}, apply)
+    assert result == {"ok": False, "error": "RuntimeError: boom"}
+    assert target.read_text() == "a"
+    assert not list((tmp_path / "lines.txt.spool").glob("*.op"))
+
+
 def test_emit_json_error_returns_dict_not_exit():
     """Functions must return dicts, NOT call sys.exit (per spec §13.3)."""
     result = emit_json_error("test error", code=42)
     assert result["ok"] is False
     assert result["error"] == "test error"
     assert result["code"] == 42
+
+
+def _hold_writer(target, content):
+    """Start a locked_update that keeps the exclusive lock until released."""
+    entered, release = threading.Event(), threading.Event()
+
+    def transform(current):
+        entered.set()
+        release.wait(5)
+        return content
+
+    writer = threading.Thread(target=locked_update, args=(target, transform))
+    writer.start()
+    assert entered.wait(5)
+    return writer, release
+
+
+def test_snapshot_read_never_waits_for_writer(tmp_path):
+    target = tmp_path / "state.json"
+    assert snapshot_read(target) is None
+    target.write_text("old")
+    writer, release = _hold_writer(target, "new")
+    try:
+        assert snapshot_read(target) == "old"
+    finally:
+        release.set()
+        writer.join()
+    assert snapshot_read(target) == "new"
+
+
+def test_locked_read_waits_for_writer_and_reads_consistently(tmp_path):
+    a, b = tmp_path / "a.json", tmp_path / "b.json"
+    a.write_text("a0")
+    writer, release = _hold_writer(b, "b1")
+    seen = {}
+    reader = threading.Thread(target=lambda: seen.update(locked_read([a, b])))
+    reader.start()
+    reader.join(0.2)
+    assert reader.is_alive()  # queued behind the exclusive lock on b
+    release.set()
+    writer.join()
+    reader.join(5)
+    assert seen == {a: "a0", b: "b1"}
+    assert locked_read([tmp_path / "missing.json"]) == {tmp_path / "missing.json": None}
+
+
+def test_lock_waits_are_measured_and_logged(tmp_path, monkeypatch):
+    log = tmp_path / "lock-waits.jsonl"
+    monkeypatch.setenv(lib.LOCK_WAIT_LOG_ENV, str(log))
+    monkeypatch.setattr(lib, "LOCK_WAIT_LOG_MIN_MS", 0.0)
+    lib.reset_lock_wait_stats()
+    target = tmp_path / "counter.txt"
+
+    locked_update(target, lambda s: "1")
+    locked_read([target])
+
+    stats = lib.lock_wait_stats()[str(target)]
+    assert stats["count"] == 2 and stats["contended"] == 2
+    rows = [json.loads(line) for line in log.read_text().splitlines()]
+    assert [r["mode"] for r in rows] == ["ex", "sh"]
+
+    log.write_text(log.read_text() + "not json\n")
+    report = summarize_lock_waits(str(log))
+    assert report["skipped_lines"] == 1
+    assert report["files"][0]["path"] == str(target)
+    assert report["files"][0]["modes"] == {"ex": 1, "sh": 1}
+
+
+def test_lock_wait_totals_survive_concurrent_recording():
+    lib.reset_lock_wait_stats()
+
+    def record():
+        for _ in range(2000):
+            lib._record_lock_wait(Path("shared"), "ex", 0.001)
+
+    threads = [threading.Thread(target=record) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert lib.lock_wait_stats()["shared"]["count"] == 8 * 2000
+    lib.reset_lock_wait_stats()
@@ -0,0 +1,81 @@
+"""Pre-call budget admission: admit / downgrade / defer / reject, and reconciliation."""
+
+import threading
+
+import pytest
+
+from prd_taskmaster import budget, llm_client
+from prd_taskmaster.fleet import budget_config
+
+LADDER = [("capable", "claude-opus-4-8"), ("standard", "claude-sonnet-4-6"),
+          ("fast", "claude-haiku-4-5")]
+PROMPT = "x" * 4000  # ~1000 input tokens
+
+
+def _manager(**limits):
+    return budget.BudgetManager({**budget_config(None), **limits}, priors={})
+
+
+def test_unlimited_admits_at_requested_tier_and_tracks_spend():
+    manager = _manager()
+    ticket = manager.admit("structured_gen", LADDER, PROMPT)
+    assert (ticket.tier, ticket.action) == ("capable", "admit")
+    ticket.settle({"tokens_in": 1000, "tokens_out": 1000})
+    assert manager.spent_usd == pytest.approx((1000 * 5 + 1000 * 25) / 1e6)
+    assert manager.reserved_usd == 0
+
+
+def test_downgrades_to_cheapest_fitting_tier_then_rejects():
+    # opus ~$0.0425, sonnet ~$0.0255, haiku ~$0.0085 for 1000 in / 1500 out.
+    manager = _manager(run_usd=0.01, defer_timeout_s=0.01)
+    ticket = manager.admit("structured_gen", LADDER, PROMPT)
+    assert (ticket.tier, ticket.action) == ("fast", "downgrade")
+    with pytest.raises(budget.BudgetExceeded):
+        manager.admit("structured_gen", LADDER, PROMPT)  # haiku reserved; nothing fits
+    assert manager.decisions["reject"] == 1
+
+
+def test_op_class_budget_is_separate_from_other_op_classes():
+    manager = _manager(op_class_usd={"research": 0.001})
+    with pytest.raises(budget.BudgetExceeded):
+        manager.admit("research", LADDER[-1:], PROMPT)
+    assert manager.admit("structured_gen", LADDER, PROMPT).action == "admit"
+
+
+def test_deferred_call_admitted_once_inflight_call_settles_cheaper():
+    manager = _manager(run_usd=0.012, defer_timeout_s=5)
+    first = manager.admit("structured_gen", LADDER[-1:], PROMPT)  # reserves ~$0.0085
+    threading.Timer(0.1, first.settle, args=({"tokens_in": 100, "tokens_out": 100},)).start()
+    second = manager.admit("structured_gen", LADDER[-1:], PROMPT)
+    assert second.model == "claude-haiku-4-5"
+    assert manager.decisions["defer"] == 1
+
+
+def test_settled_actuals_reconcile_later_estimates():
+    manager = _manager()
+    before = manager.estimate("structured_gen", "claude-haiku-4-5", 1000)
+    ticket = manager.admit("structured_gen", LADDER[-1:], PROMPT)
+    ticket.settle({"tokens_in": 500, "tokens_out": 100})
+    after = manager.estimate("structured_gen", "claude-haiku-4-5", 1000)
+    assert after < before
+
+
+def test_wall_clock_budget_rejects_once_spent():
+    now = [0.0]
+    manager = budget.BudgetManager({**budget_config(None), "run_wall_s": 10},
+                                   priors={}, clock=lambda: now[0])
+    manager.admit("structured_gen", LADDER, PROMPT).settle()
+    now[0] = 11.0
+    with pytest.raises(budget.BudgetExceeded):
+        manager.admit("structured_gen", LADDER, PROMPT)
+
+
+def test_generate_json_refuses_over_budget_call_before_any_http(monkeypatch):
+    monkeypatch.setattr(llm_client, "discover_key", lambda: {"provider": "anthropic", "key": "k"})
+    monkeypatch.setattr(llm_client, "_http_call",
+                        lambda *a, **k: pytest.fail("over-budget call reached HTTP"))
+    settings = {**budget_config(None), "run_usd": 0.000001, "defer_timeout_s": 0.01}
+    with budget.run_scope(settings):
+        with pytest.raises(llm_client.LLMError) as exc:
+            llm_client.generate_json(PROMPT, tier="standard")
+    assert exc.value.kind == "budget"
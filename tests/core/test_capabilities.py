@@ -253,3 +253,61 @@ class TestValidateSetup:
             if not c["passed"] and c.get("severity") not in _non_critical
         ]
         assert result["critical_failures"] == len(critical_ids)
+
+
+# ─── detection cache ──────────────────────────────────────────────────────────
+
+
+class TestDetectionCache:
+    """detect_capabilities() is memoized per environment fingerprint."""
+
+    @pytest.fixture
+    def project(self, monkeypatch, tmp_path):
+        home, bin_dir, project = tmp_path / "home", tmp_path / "bin", tmp_path / "project"
+        for d in (home, bin_dir, project / ".atlas-ai"):
+            d.mkdir(parents=True)
+        fake_bin = bin_dir / "task-master"
+        fake_bin.write_text("#!/bin/sh\necho 0.99.0\n")
+        fake_bin.chmod(0o755)
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.setenv("PATH", str(bin_dir))
+        monkeypatch.chdir(project)
+
+        import prd_taskmaster.mode_recommend as mr
+
+        calls = []
+        real_run = mr.subprocess.run
+        monkeypatch.setattr(
+            mr.subprocess, "run",
+            lambda cmd, *a, **kw: calls.append(cmd) or real_run(cmd, *a, **kw),
+        )
+        return home, bin_dir, calls
+
+    def test_repeat_calls_skip_the_subprocess(self, project):
+        _home, _bin, calls = project
+        first = detect_capabilities()
+        assert detect_capabilities() == first
+        assert len(calls) == 1
+
+        detect_capabilities(refresh=True)
+        assert len(calls) == 2
+
+    def test_environment_changes_invalidate(self, project):
+        home, bin_dir, calls = project
+        assert detect_capabilities()["capabilities"]["ralph-loop"] is False
+
+        skill = home / ".claude" / "skills" / "ralph-loop"
+        skill.mkdir(parents=True)
+        (skill / "SKILL.md").write_text("x")
+        assert detect_capabilities()["capabilities"]["ralph-loop"] is True
+        assert len(calls) == 2
+
+        (bin_dir / "aider").write_text("#!/bin/sh\n")
+        (bin_dir / "aider").chmod(0o755)
+        assert detect_capabilities()["capabilities"]["aider"] is True
+
+    def test_bare_directory_is_not_written(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("PATH", str(tmp_path))
+        monkeypatch.chdir(tmp_path)
+        detect_capabilities()
+        assert list(tmp_path.iterdir()) == []
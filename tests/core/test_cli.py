@@ -21,7 +21,7 @@ def run_cli(*args, expect_exit=0, cwd=None, env=None):
         [sys.executable, str(SCRIPT), *args],
         capture_output=True,
         text=True,
-        cwd=str(cwd or REPO_ROOT),
+        cwd=str(cwd or Path.cwd()),
         env=env,
     )
     assert proc.returncode == expect_exit, (
@@ -389,3 +389,26 @@ def test_codex_prompt_carried_on_stdin_not_argv(monkeypatch, tmp_path):
     assert "SECRET PROMPT" not in " ".join(argv)        # never on the command line
     assert "SECRET PROMPT" in fake.calls[0]["kwargs"]["input"]  # on stdin
     assert '{"x":1}' in fake.calls[0]["kwargs"]["input"]        # schema folded into stdin
+
+
+def test_run_once_cancel_event_kills_spawn(monkeypatch, tmp_path):
+    import sys
+    import threading
+    import time
+
+    monkeypatch.chdir(tmp_path)
+    # A stand-in child that would outlive the test; the cancel event must kill it.
+    monkeypatch.setattr(C, "_build_argv", lambda *a, **k: (
+        [sys.executable, "-c", "import time; time.sleep(30)"], None))
+    cancel = threading.Event()
+    threading.Timer(0.2, cancel.set).start()
+    start = time.monotonic()
+    with pytest.raises(C.CliAgentError) as ei:
+        C._run_once(
+            "claude-code", "/bin/claude", "P", schema_hint="", structured_json="auto",
+            model="sonnet", op_class="structured_gen", task_id=1, timeout=60, cancel=cancel,
+        )
+    assert ei.value.kind == "cancelled"
+    assert time.monotonic() - start < 10
+    rows = (tmp_path / ".atlas-ai" / "telemetry.jsonl").read_text().splitlines()
+    assert json.loads(rows[-1])["exit"] == 1
@@ -0,0 +1,134 @@
+"""Tests for prd_taskmaster.daemon — the optional warm Unix-socket daemon."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from prd_taskmaster import daemon
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def served(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(daemon.SOCKET_ENV, raising=False)
+    monkeypatch.delenv(daemon.DISABLE_ENV, raising=False)
+    thread = threading.Thread(target=daemon.serve, args=(tmp_path,), daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while daemon.request({"op": "ping"}) is None:
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.01)
+    yield tmp_path
+    daemon.request({"op": "shutdown"})
+    thread.join(timeout=5)
+    assert not daemon.socket_path(tmp_path).exists()
+
+
+def _execute_state(root: Path, evidence: list) -> None:
+    (root / ".atlas-ai" / "state").mkdir(parents=True, exist_ok=True)
+    (root / ".atlas-ai" / "state" / "pipeline.json").write_text(
+        json.dumps({"current_phase": "EXECUTE"}))
+    tasks = root / ".taskmaster" / "tasks"
+    tasks.mkdir(parents=True, exist_ok=True)
+    (tasks / "tasks.json").write_text(json.dumps({"master": {"tasks": [
+        {"id": 1, "status": "in-progress", "subtasks": [{"id": 1}, {"id": 2}],
+         "evidence_files": evidence},
+    ]}}))
+
+
+def test_no_daemon_means_run_in_process(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert daemon.request({"op": "ping"}) is None
+    assert daemon.run_hook_via_daemon("evidence_gate", {}) is None
+    assert daemon.run_cli_via_daemon(["status"]) is None
+
+
+def test_hook_decisions_follow_state_changes(served):
+    _execute_state(served, ["a.txt"])
+    out = daemon.run_hook_via_daemon("evidence_gate", {})
+    assert out["decision"] == "block"
+    assert daemon.run_hook_via_daemon("evidence_gate", {"stop_hook_active": True}) == {}
+
+    time.sleep(0.01)  # distinct mtime for the parse cache
+    _execute_state(served, ["a.txt", "b.txt"])
+    assert daemon.run_hook_via_daemon("evidence_gate", {}) == {}
+
+    denied = daemon.run_hook_via_daemon(
+        "mode_d_blocker", {"tool_name": "mcp__atlas-cdd__x"})
+    assert denied["hookSpecificOutput"]["permissionDecision"] == "deny"
+
+
+def test_cli_round_trip_and_local_only_commands(served):
+    reply = daemon.run_cli_via_daemon(["daemon-status"])
+    assert reply is None  # never proxied
+
+    reply = daemon.run_cli_via_daemon(["lock-report"])
+    assert reply["exit"] == 1
+    assert json.loads(reply["stdout"])["ok"] is False
+    assert daemon.request({"op": "ping"})["served"] == 1
+
+
+def test_other_project_or_version_falls_back(served, tmp_path_factory, monkeypatch):
+    other = tmp_path_factory.mktemp("other")
+    monkeypatch.setenv(daemon.SOCKET_ENV, str(daemon.socket_path(served)))
+    monkeypatch.chdir(other)
+    assert daemon.run_hook_via_daemon("evidence_gate", {}) is None
+    monkeypatch.chdir(served)
+    monkeypatch.setattr(daemon.prd_taskmaster, "__version__", "0.0.0")
+    assert daemon.run_hook_via_daemon("evidence_gate", {}) is None
+
+
+def test_hook_script_uses_daemon(served):
+    _execute_state(served, [])
+    r = subprocess.run(
+        [sys.executable, str(REPO_ROOT / "hooks" / "evidence_gate.py")],
+        input="{}", capture_output=True, text=True, cwd=served, timeout=10,
+    )
+    assert json.loads(r.stdout)["decision"] == "block"
+    assert daemon.request({"op": "ping"})["served"] == 1
+
+
+def test_sent_cli_request_is_never_rerun_after_timeout(served, monkeypatch):
+    """A slow command that outlives the client's wait runs exactly once."""
+    import runpy
+
+    from prd_taskmaster import cli
+
+    runs = []
+
+    def slow_main():
+        runs.append(sys.argv[1:])
+        time.sleep(0.6)
+        raise SystemExit(0)
+
+    monkeypatch.setattr(cli, "main", slow_main)
+    monkeypatch.setattr(daemon, "CLI_TIMEOUT_S", 0.2)
+    monkeypatch.setattr(sys, "argv", [str(REPO_ROOT / "script.py"), "lock-report"])
+    with pytest.raises(SystemExit) as exc:
+        runpy.run_path(str(REPO_ROOT / "script.py"), run_name="__main__")
+    assert exc.value.code == 1  # reported as an error, not re-run in-process
+    time.sleep(0.6)  # let the daemon finish its copy
+    assert runs == [["lock-report"]]
+
+
+def test_busy_daemon_turns_request_away_before_running(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(daemon, "CLI_QUEUE_S", 0.05)
+    served = daemon._Daemon(tmp_path)
+    monkeypatch.setattr(served.cli, "main", lambda: pytest.fail("busy daemon ran the command"))
+    with served.cli_lock:  # a long command holds the CLI slot
+        assert served._run_cli(["lock-report"], {}) == {"ok": False, "error": "busy"}
+
+
+def test_long_ai_commands_stay_local(served):
+    for command in ("parse-prd", "expand", "rate", "engine-preflight"):
+        assert daemon.run_cli_via_daemon([command, "--help"]) is None
@@ -198,3 +198,76 @@ def test_append_telemetry_returns_row_reference(tmp_path):
         "exit": second["exit"],
     }
     assert [json.loads(line) for line in f.read_text().splitlines()] == [first, second]
+
+
+def test_append_telemetry_appends_without_rewriting_and_tracks_lines(tmp_path, monkeypatch):
+    from prd_taskmaster import economy, lib
+
+    f = tmp_path / "telemetry.jsonl"
+    f.write_text('{"op_class": "a"}\n{"op_class": "b"}')  # torn last line
+    monkeypatch.setattr(lib, "atomic_write", lambda *a: pytest.fail("ledger rewritten"))
+    inode = f.stat().st_ino
+
+    assert append_telemetry({"op_class": "c"}, f)["line"] == 3
+    assert append_telemetry({"op_class": "d"}, f)["line"] == 4
+    assert f.stat().st_ino == inode
+
+    # A rotated ledger is recounted from its first byte.
+    f.unlink()
+    assert append_telemetry({"op_class": "e"}, f)["line"] == 1
+    assert economy._LINE_COUNTS[str(f.resolve())][3] == 0
+
+
+# ── rollup sidecar (incremental folding) ─────────────────────────────────────
+
+def test_summary_folds_only_appended_bytes(tmp_path, monkeypatch):
+    from prd_taskmaster import economy
+
+    f = tmp_path / "telemetry.jsonl"
+    f.write_text("\n".join(json.dumps(r) for r in _rows()) + "\n")
+    first = summarize_telemetry(f)
+    sidecar = economy.rollup_path_for(f)
+    assert sidecar.name == "telemetry.rollup.json"
+    assert json.loads(sidecar.read_text())["offset"] == f.stat().st_size
+
+    folded = []
+    real_fold = economy._fold_row
+    monkeypatch.setattr(economy, "_fold_row", lambda r, row: (folded.append(row), real_fold(r, row)))
+    append_telemetry({"op_class": "structured_gen", "model": "claude-sonnet-4-6",
+                      "exit": 0, "wall_ms": 1000, "escalated": False}, f)
+    second = summarize_telemetry(f)
+
+    assert len(folded) == 1  # only the new row was parsed
+    assert second["total_calls"] == first["total_calls"] + 1
+    groups = {(g["op_class"], g["model"]): g for g in second["groups"]}
+    assert groups[("structured_gen", "claude-sonnet-4-6")]["calls"] == 2
+    assert groups[("structured_gen", "claude-sonnet-4-6")]["p50_wall_ms"] == 2400
+
+
+def test_rewritten_ledger_is_refolded_from_scratch(tmp_path):
+    f = tmp_path / "telemetry.jsonl"
+    f.write_text("\n".join(json.dumps(r) for r in _rows()) + "\n")
+    summarize_telemetry(f)
+    f.write_text(json.dumps({"op_class": "research", "model": "m", "exit": 0, "wall_ms": 5}) + "\n")
+    rep = summarize_telemetry(f)
+    assert rep["total_calls"] == 1
+    assert [(g["op_class"], g["model"]) for g in rep["groups"]] == [("research", "m")]
+
+
+def test_corrupt_sidecar_is_rebuilt(tmp_path):
+    from prd_taskmaster.economy import rollup_path_for
+
+    f = tmp_path / "telemetry.jsonl"
+    f.write_text("\n".join(json.dumps(r) for r in _rows()) + "\n")
+    rollup_path_for(f).write_text("{not json")
+    assert summarize_telemetry(f)["total_calls"] == 3
+
+
+def test_groups_carry_token_and_cost_sums(tmp_path):
+    f = tmp_path / "telemetry.jsonl"
+    f.write_text(json.dumps({"op_class": "structured_gen", "model": "gpt-4.1-mini", "exit": 0,
+                             "wall_ms": 100, "tokens_in": 384, "tokens_out": 1240}) + "\n")
+    (group,) = summarize_telemetry(f)["groups"]
+    assert group["tokens_in"] == 384 and group["tokens_out"] == 1240
+    assert group["est_cost_usd"] == pytest.approx(0.0021376)
+    assert group["p95_wall_ms"] == 100
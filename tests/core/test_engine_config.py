@@ -76,6 +76,18 @@ def test_engine_config_merges_valid_concurrency_values():
     assert eng["concurrency"]["ram_aware"] is True
 
 
+
+def test_engine_config_merges_hedge_values_and_rejects_bad_fraction():
+    eng = engine_config({"engine": {"hedge": {"enabled": True, "min_samples": 5,
+                                              "budget_fraction": 0.25}}})
+    assert eng["hedge"]["enabled"] is True
+    assert eng["hedge"]["min_samples"] == 5
+    assert eng["hedge"]["budget_fraction"] == 0.25
+    assert eng["hedge"]["min_delay_ms"] == 2000
+    bad = engine_config({"engine": {"hedge": {"enabled": "yes", "budget_fraction": 3}}})
+    assert bad["hedge"]["enabled"] is False
+    assert bad["hedge"]["budget_fraction"] == 0.1
+
 # ─── engine_config() ignores malformed values (silent fallback) ──────────────
 
 def test_engine_config_malformed_provider_mode_falls_back():
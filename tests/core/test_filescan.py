@@ -0,0 +1,108 @@
+"""Tests for prd_taskmaster.filescan — git-aware file enumeration."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from prd_taskmaster import filescan
+from prd_taskmaster.filescan import exclude_globs, is_excluded, list_files
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    filescan.clear_cache()
+    yield
+    filescan.clear_cache()
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *args], capture_output=True, check=True)
+
+
+def _repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test")
+    (repo / ".gitignore").write_text("build/\n*.log\n")
+    (repo / "pkg").mkdir()
+    (repo / "pkg" / "app.py").write_text("x = 1\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-m", "init")
+    return repo
+
+
+def test_git_listing_has_tracked_and_untracked_but_not_ignored(tmp_path):
+    repo = _repo(tmp_path)
+    (repo / "pkg" / "new.py").write_text("")
+    (repo / "build").mkdir()
+    (repo / "build" / "out.py").write_text("")
+    (repo / "debug.log").write_text("")
+
+    assert list_files(repo) == [".gitignore", "pkg/app.py", "pkg/new.py"]
+
+
+def test_default_excludes_apply_to_tracked_files(tmp_path):
+    repo = _repo(tmp_path)
+    (repo / "node_modules" / "dep").mkdir(parents=True)
+    (repo / "node_modules" / "dep" / "index.js").write_text("")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-m", "vendor")
+
+    assert "node_modules/dep/index.js" not in list_files(repo)
+    assert "node_modules/dep/index.js" in list_files(repo, exclude=[])
+
+
+def test_deleted_tracked_file_is_skipped(tmp_path):
+    repo = _repo(tmp_path)
+    (repo / "pkg" / "app.py").unlink()
+    assert "pkg/app.py" not in list_files(repo)
+
+
+def test_listing_cached_until_index_changes(tmp_path, monkeypatch):
+    repo = _repo(tmp_path)
+    calls = []
+    real_run = subprocess.run
+
+    def _counting_run(cmd, *args, **kwargs):
+        if "ls-files" in cmd:
+            calls.append(cmd)
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(filescan.subprocess, "run", _counting_run)
+    list_files(repo)
+    list_files(repo)
+    assert len(calls) == 1
+
+    (repo / "pkg" / "more.py").write_text("")
+    _git(repo, "add", "-A")
+    assert "pkg/more.py" in list_files(repo)
+    assert len(calls) == 2
+
+
+def test_walk_fallback_outside_git(tmp_path):
+    (tmp_path / "a.txt").write_text("")
+    (tmp_path / ".venv" / "lib").mkdir(parents=True)
+    (tmp_path / ".venv" / "lib" / "x.py").write_text("")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.txt").write_text("")
+
+    assert list_files(tmp_path, use_git=False) == ["a.txt", "sub/b.txt"]
+
+
+def test_env_overrides_default_excludes(monkeypatch):
+    monkeypatch.setenv("ATLAS_SCAN_EXCLUDE", "dist, *.min.js")
+    assert exclude_globs() == ("dist", "*.min.js")
+    assert exclude_globs(["x"]) == ("x",)
+
+
+def test_is_excluded_matches_path_or_component():
+    globs = ("node_modules", "*.min.js", "docs/generated/*")
+    assert is_excluded("web/node_modules/a/b.js", globs)
+    assert is_excluded("static/app.min.js", globs)
+    assert is_excluded("docs/generated/api.md", globs)
+    assert not is_excluded("src/app.js", globs)
@@ -5,7 +5,7 @@ import subprocess
 import sys
 from pathlib import Path
 
-from prd_taskmaster.fleet import compute_waves, ready_set
+from prd_taskmaster.fleet import compute_waves, critical_path_lengths, ready_set
 
 REPO = Path(__file__).resolve().parents[2]
 SCRIPT = REPO / "script.py"
@@ -204,3 +204,29 @@ def test_compute_waves_all_done_graph():
         "blocked": [],
         "deadlocked": False,
     }
+
+
+def test_critical_path_lengths_weight_chains_by_complexity():
+    tasks = [
+        {**_task(1), "complexityScore": 2},
+        {**_task(2, dependencies=[1]), "complexityScore": 8},
+        {**_task(3, dependencies=[1]), "complexityScore": 3},
+        _task(4, status="done"),
+    ]
+
+    assert critical_path_lengths(tasks) == {1: 10.0, 2: 8.0, 3: 3.0}
+    assert critical_path_lengths(tasks, durations={3: 20})[1] == 22.0
+
+
+def test_compute_waves_starts_longest_chain_before_higher_priority_leaf():
+    tasks = [
+        {**_task(1), "priority": "high"},
+        _task(2),
+        _task(3, dependencies=[2]),
+        _task(4, dependencies=[3]),
+    ]
+
+    # Chain 2->3->4 first; task 1 ties with 4 on path length and wins on priority.
+    assert compute_waves(tasks, max_concurrency=1)["waves"] == [[2], [3], [1], [4]]
+    # A dependent joins the very next wave instead of waiting out its frontier.
+    assert compute_waves(tasks, max_concurrency=2)["waves"] == [[2, 1], [3], [4]]
@@ -4,7 +4,12 @@ import json
 
 import pytest
 
-from prd_taskmaster.fleet import load_fleet_config, resolve_backend
+from prd_taskmaster.fleet import (
+    load_fleet_config,
+    reputation_config,
+    resolve_backend,
+    tournament_config,
+)
 
 
 def test_defaults_without_config_file(tmp_path, monkeypatch):
@@ -101,6 +106,25 @@ def test_invalid_values_ignored(tmp_path, monkeypatch):
     assert isinstance(cfg["routing"], dict)
 
 
+def test_reputation_block_defaults_and_validation():
+    assert reputation_config(None) == {"policy": "ucb1", "prior_wins": 0.5, "prior_jobs": 1.0}
+    assert reputation_config({"reputation": {"policy": "thompson", "prior_jobs": 4}}) == {
+        "policy": "thompson", "prior_wins": 2.0, "prior_jobs": 4.0,
+    }
+    # Unknown policy and a prior with no losses fall back to defaults.
+    assert reputation_config({"reputation": {"policy": "greedy", "prior_wins": 1}}) == \
+        reputation_config(None)
+
+
+def test_tournament_block_defaults_and_validation():
+    assert tournament_config(None) == {"spawn_start_timeout_s": 30.0}
+    assert tournament_config({"tournament": {"spawn_start_timeout_s": 90}}) == {
+        "spawn_start_timeout_s": 90.0,
+    }
+    assert tournament_config({"tournament": {"spawn_start_timeout_s": 0}}) == \
+        tournament_config(None)
+
+
 def test_unknown_token_economy_string_is_preserved_for_profile_resolution(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     d = tmp_path / ".atlas-ai"
@@ -0,0 +1,97 @@
+"""Telemetry-driven fleet makespan simulator."""
+
+import json
+import random
+import time
+
+import pytest
+
+from prd_taskmaster import fleet_sim
+from prd_taskmaster.economy import model_distributions
+from prd_taskmaster.fleet import load_fleet_config
+from prd_taskmaster.lib import CommandError
+
+BACKENDS = {"claude": True, "codex": False, "gemini": False}
+
+
+def _profile(low_ms, high_ms, cost):
+    step = (high_ms - low_ms) / 20
+    return {"calls": 50, "wall_ms_quantiles": [low_ms + step * i for i in range(21)],
+            "cost_usd": cost}
+
+
+PROFILES = {
+    "claude-haiku-4-5-20251001": _profile(1000, 3000, 0.002),
+    "claude-sonnet-4-6": _profile(4000, 9000, 0.02),
+    "claude-opus-4-8": _profile(8000, 20000, 0.06),
+}
+
+
+def _graph(n, seed=3):
+    rng = random.Random(seed)
+    tasks = []
+    for i in range(1, n + 1):
+        deps = sorted(rng.sample(range(max(1, i - 30), i), k=min(i - 1, rng.randint(0, 2))))
+        tasks.append({"id": i, "status": "pending", "dependencies": deps,
+                      "complexityScore": rng.choice([2, 5, 8])})
+    return tasks
+
+
+def _by_level(result):
+    return {row["concurrency"]: row for row in result["by_concurrency"]}
+
+
+def test_more_agents_never_slower_and_cheaper_economy_costs_less():
+    cfg = load_fleet_config("/nonexistent/fleet.json")
+    scenarios = [("cheap", {**cfg, "token_economy": "conservative"}),
+                 ("fast", {**cfg, "token_economy": "performance"})]
+    results = fleet_sim.simulate(_graph(200), scenarios, [1, 4, 16], PROFILES,
+                                 trials=5, scheduler="greedy", backends=BACKENDS)
+    cheap, fast = results
+    assert cheap["cost_usd"] < fast["cost_usd"]
+    assert cheap["unmatched_targets"] == []
+    levels = _by_level(cheap)
+    assert (levels[1]["makespan_s"]["mean"] >= levels[4]["makespan_s"]["mean"]
+            >= levels[16]["makespan_s"]["mean"])
+    assert levels[1]["utilization"] == pytest.approx(1.0)
+    assert 0 < levels[16]["utilization"] < 1
+
+
+def test_ten_thousand_task_graph_simulates_in_seconds():
+    cfg = load_fleet_config("/nonexistent/fleet.json")
+    started = time.perf_counter()
+    for scheduler in fleet_sim.SCHEDULERS:
+        [result] = fleet_sim.simulate(_graph(10_000), [("current", cfg)], [4, 32], PROFILES,
+                                      trials=5, scheduler=scheduler, backends=BACKENDS)
+        assert result["blocked"] == 0
+    assert time.perf_counter() - started < 20
+    levels = _by_level(result)
+    assert levels[32]["makespan_s"]["p90"] >= levels[32]["makespan_s"]["mean"] * 0.9
+
+
+def test_profiles_come_from_telemetry_and_empty_telemetry_is_an_error(tmp_path):
+    path = tmp_path / "telemetry.jsonl"
+    rows = [{"op_class": "code_impl", "model": "claude-sonnet-4-6", "exit": 0,
+             "wall_ms": 1000 * i, "tokens_in": 1000, "tokens_out": 1000} for i in range(1, 11)]
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+    profiles = model_distributions(path=path)
+    sonnet = profiles["claude-sonnet-4-6"]
+    assert sonnet["calls"] == 10
+    assert sonnet["wall_ms_quantiles"][0] <= sonnet["wall_ms_quantiles"][-1]
+    assert sonnet["cost_usd"] == pytest.approx(0.018)
+    assert model_distributions("research", path=path) == {}
+
+    with pytest.raises(CommandError):
+        fleet_sim.simulate(_graph(5), [("current", {})], [1], {}, backends=BACKENDS)
+
+
+def test_profile_cost_is_averaged_over_priced_calls_only(tmp_path):
+    path = tmp_path / "telemetry.jsonl"
+    priced = {"op_class": "code_impl", "model": "claude-sonnet-4-6", "exit": 0,
+              "wall_ms": 1000, "tokens_in": 1000, "tokens_out": 1000}
+    untokened = {"op_class": "code_impl", "model": "claude-sonnet-4-6", "exit": 0,
+                 "wall_ms": 1000}
+    path.write_text("".join(json.dumps(row) + "\n" for row in [priced, untokened, untokened]))
+    sonnet = model_distributions(path=path)["claude-sonnet-4-6"]
+    assert sonnet["calls"] == 3
+    assert sonnet["cost_usd"] == pytest.approx(0.018)
@@ -0,0 +1,97 @@
+"""Tests for prd_taskmaster.jobs — background job handles for long operations."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+from prd_taskmaster import jobs
+from prd_taskmaster.lib import CommandError
+
+
+def _wait_for(manager, job_id, statuses=jobs.TERMINAL):
+    for _ in range(500):
+        status = manager.status(job_id)
+        if status["status"] in statuses:
+            return status
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} stuck in {status['status']}")
+
+
+def test_submit_returns_immediately_and_records_result(tmp_path):
+    manager = jobs.JobManager(tmp_path / "jobs")
+    gate = threading.Event()
+
+    def op(x):
+        gate.wait(5)
+        return {"ok": True, "x": x}
+
+    started = manager.submit("demo", op, 7)
+    assert started["status"] == "queued"
+    assert manager.status(started["job_id"])["status"] in ("queued", "running")
+    gate.set()
+
+    done = _wait_for(manager, started["job_id"])
+    assert done["status"] == "succeeded"
+    assert done["result"] == {"ok": True, "x": 7}
+    on_disk = json.loads((tmp_path / "jobs" / f"{started['job_id']}.json").read_text())
+    assert on_disk["result"] == {"ok": True, "x": 7}
+    assert on_disk["params"] == {"args": [7], "kwargs": {}}
+
+
+def test_progress_partials_and_cancel(tmp_path):
+    manager = jobs.JobManager(tmp_path / "jobs")
+    step = threading.Event()
+
+    def op():
+        for i in range(1, 100):
+            jobs.report_progress(i, 99, partial={"packet": i})
+            if jobs.cancel_requested():
+                raise jobs.JobCancelled()
+            step.set()
+            time.sleep(0.01)
+        return {"ok": True}
+
+    job_id = manager.submit("expand", op)["job_id"]
+    assert step.wait(5)
+    running = manager.status(job_id)
+    assert running["progress"]["total"] == 99
+    assert running["partial"][0] == {"packet": 1}
+
+    assert manager.cancel(job_id)["cancel_requested"] is True
+    cancelled = _wait_for(manager, job_id)
+    assert cancelled["status"] == "cancelled"
+    assert cancelled["progress"]["done"] < 99
+
+
+def test_failures_are_recorded_not_raised(tmp_path):
+    manager = jobs.JobManager(tmp_path / "jobs")
+
+    def op():
+        raise CommandError("no tasks", {"tag": "alpha"})
+
+    job_id = manager.submit("rate", op)["job_id"]
+    failed = _wait_for(manager, job_id)
+    assert failed["status"] == "failed"
+    assert failed["error"] == {"message": "no tasks", "tag": "alpha"}
+
+
+def test_restarted_manager_reports_orphans_as_interrupted(tmp_path):
+    jobs_dir = tmp_path / "jobs"
+    jobs_dir.mkdir()
+    (jobs_dir / "abc.json").write_text(json.dumps({"job_id": "abc", "status": "running"}))
+
+    manager = jobs.JobManager(jobs_dir)
+    assert manager.status("abc")["status"] == "interrupted"
+    assert manager.cancel("abc")["ok"] is True
+    assert [j["job_id"] for j in manager.list()["jobs"]] == ["abc"]
+    with pytest.raises(CommandError):
+        manager.status("missing")
+
+
+def test_helpers_are_noops_outside_a_job():
+    jobs.report_progress(1, 2, partial={"x": 1})
+    assert jobs.cancel_requested() is False
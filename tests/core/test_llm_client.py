@@ -14,6 +14,26 @@ class FakeResponse(io.BytesIO):
     def __exit__(self, *a): return False
 
 
+@pytest.fixture(autouse=True)
+def _fresh_rate_limits():
+    L.reset_rate_limits()
+    yield
+    L.reset_rate_limits()
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.t
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.t += seconds
+
+
 def _anthropic_ok(payload_text, usage=None):
     payload = {"content": [{"text": payload_text}]}
     if usage is not None:
@@ -57,6 +77,25 @@ def test_discover_key_excludes_local_free_proxy(monkeypatch, tmp_path):
     assert L.discover_key() is None  # proxy is agent-path only
 
 
+def test_dotenv_parsed_once_per_change(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    for v in ("ANTHROPIC_API_KEY", "OPENAI_API_KEY"):
+        monkeypatch.delenv(v, raising=False)
+    env = tmp_path / ".env"
+    env.write_text('OPENAI_API_KEY="sk-one"\nEMPTY=\nexport OTHER=x # note\n')
+    reads = []
+    real_read = L.Path.read_text
+    monkeypatch.setattr(L.Path, "read_text", lambda self, *a, **k: reads.append(self) or real_read(self, *a, **k))
+    assert L.discover_key()["key"] == "sk-one"
+    assert L.discover_key()["key"] == "sk-one"
+    assert L._env_or_dotenv("OTHER") == "x"
+    assert len(reads) == 1
+
+    env.write_text('OPENAI_API_KEY="sk-two-longer"\n')
+    assert L.discover_key()["key"] == "sk-two-longer"
+    assert len(reads) == 2
+
+
 def test_discover_key_none_when_nothing(monkeypatch, tmp_path):
     monkeypatch.chdir(tmp_path)
     for v in ("ANTHROPIC_API_KEY", "OPENAI_API_KEY", "OPENAI_COMPATIBLE_API_KEY",
@@ -227,3 +266,100 @@ def test_generate_json_can_return_success_telemetry_ref(monkeypatch, tmp_path):
     assert rows[0]["task_id"] == 11
     assert rows[0]["tokens_in"] == 11
     assert rows[0]["tokens_out"] == 3
+
+
+# ── rate limiting + backoff ──────────────────────────────────────────────────
+
+def _rate_limited(req, headers):
+    return urllib.error.HTTPError(req.full_url, 429, "rate", headers, io.BytesIO(b"{}"))
+
+
+def test_429_waits_for_capacity_across_several_retries(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "k")
+    clock = FakeClock()
+    monkeypatch.setattr(L, "_monotonic", clock.monotonic)
+    monkeypatch.setattr(L, "_sleep", clock.sleep)
+    monkeypatch.setattr(L, "_random", lambda: 0.0)
+    calls = []
+    def fake(req, timeout=None):
+        calls.append(1)
+        if len(calls) <= 3:
+            raise _rate_limited(req, {"Retry-After": "7"})
+        return _anthropic_ok('{"ok": true}')
+    monkeypatch.setattr(L.urllib.request, "urlopen", fake)
+    assert L.generate_json("x") == {"ok": True}
+    assert len(calls) == 4
+    assert clock.sleeps == [7.0, 7.0, 7.0]  # Retry-After honoured, not capped at 5s
+
+
+def test_http_retries_are_bounded(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "k")
+    monkeypatch.setattr(L, "_sleep", lambda s: None)
+    calls = []
+    def fake(req, timeout=None):
+        calls.append(1)
+        raise urllib.error.HTTPError(req.full_url, 503, "down", {}, io.BytesIO(b"{}"))
+    monkeypatch.setattr(L.urllib.request, "urlopen", fake)
+    with pytest.raises(L.LLMError) as e:
+        L.generate_json("x")
+    assert e.value.kind == "http" and len(calls) == L.HTTP_RETRIES + 1
+
+
+def test_backoff_is_exponential_with_jitter(monkeypatch):
+    monkeypatch.setattr(L, "_random", lambda: 0.5)
+    assert [L._backoff_delay(i) for i in range(4)] == [0.5, 1.0, 2.0, 4.0]
+    assert L._backoff_delay(20) == L.BACKOFF_CAP_S * 0.5
+    assert L._backoff_delay(0, hint=9.0) == 9.0
+
+
+def test_exhausted_quota_header_blocks_next_call(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(L, "_monotonic", clock.monotonic)
+    monkeypatch.setattr(L, "_sleep", clock.sleep)
+    limiter = L.limiter_for("openai")
+    limiter.observe({
+        "x-ratelimit-limit-requests": "60",
+        "x-ratelimit-remaining-requests": "0",
+        "x-ratelimit-reset-requests": "1m30s",
+    })
+    limiter.acquire()
+    assert clock.sleeps == [90.0]
+
+
+def test_token_bucket_spaces_callers_at_announced_rate(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(L, "_monotonic", clock.monotonic)
+    monkeypatch.setattr(L, "_sleep", lambda s: clock.sleeps.append(s))
+    limiter = L.limiter_for("anthropic")
+    limiter.observe({"anthropic-ratelimit-requests-limit": "60",
+                     "anthropic-ratelimit-requests-remaining": "1"})
+    for _ in range(3):
+        limiter.acquire()
+    assert clock.sleeps == [1.0, 2.0]  # 60 rpm: one slot per second, reserved in order
+
+
+def test_throttle_is_shared_per_provider(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(L, "_monotonic", clock.monotonic)
+    monkeypatch.setattr(L, "_sleep", clock.sleep)
+    assert L.limiter_for("anthropic") is L.limiter_for("anthropic")
+    L.limiter_for("anthropic").throttle(4.0)
+    L.limiter_for("openai").acquire()
+    assert clock.sleeps == []
+    L.limiter_for("anthropic").acquire()
+    assert clock.sleeps == [4.0]
+
+
+@pytest.mark.parametrize("value,expected", [
+    ("2", 2.0), ("6m0s", 360.0), ("20ms", 0.02), ("1h2m3.5s", 3723.5), ("soon", None), (None, None),
+])
+def test_parse_reset_formats(value, expected):
+    assert L._parse_reset(value) == expected
+
+
+def test_parse_reset_timestamp_is_relative_to_now():
+    from datetime import datetime, timedelta, timezone
+    when = (datetime.now(timezone.utc) + timedelta(seconds=30)).isoformat()
+    assert 25 < L._parse_reset(when) <= 30
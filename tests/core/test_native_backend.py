@@ -553,6 +553,88 @@ def test_expand_cli_kind_fans_out_in_parallel(tmp_path, monkeypatch):
     assert result["ai"] == "cli"
 
 
+def _packet_result(task_id):
+    return {
+        "id": task_id,
+        "complexityScore": 4,
+        "recommendedSubtasks": 2,
+        "reasoning": "batched",
+        "researchNotes": "",
+        "subtasks": [
+            {"title": "a", "description": "x", "details": "y", "dependencies": []},
+            {"title": "b", "description": "x", "details": "y", "dependencies": [1]},
+        ],
+    }
+
+
+def test_expand_batches_small_tasks_and_requeues_only_missing(tmp_path, monkeypatch):
+    from prd_taskmaster import backend as backend_mod
+    from prd_taskmaster.backend import BATCH_RESULT_SCHEMA_HINT, NativeBackend
+
+    monkeypatch.chdir(tmp_path)
+    _seed_project(tmp_path, [_pending_task(i) for i in (1, 2, 3, 4)])
+    monkeypatch.setattr(
+        backend_mod, "resolve_provider", lambda role, *a, **k: _stub_handle("api", "anthropic", role)
+    )
+    monkeypatch.setattr(backend_mod, "_native_concurrency", lambda n, c, p: 1)
+    calls = []
+
+    def fake_generate_json(prompt, **kwargs):
+        calls.append(kwargs)
+        if kwargs["schema_hint"] == BATCH_RESULT_SCHEMA_HINT:
+            # Partial output: task 3 missing, task 4 malformed.
+            return {"results": {"1": _packet_result(1), "2": _packet_result(2), "4": "oops"}}
+        return _packet_result(kwargs["task_id"])
+
+    monkeypatch.setattr(llm_client, "generate_json", fake_generate_json)
+
+    result = NativeBackend().expand(tag="master")
+
+    assert result["ok"] is True
+    assert sorted(result["applied"]) == [1, 2, 3, 4]
+    batched = [c for c in calls if c["schema_hint"] == BATCH_RESULT_SCHEMA_HINT]
+    assert len(batched) == 1
+    assert sorted(c["task_id"] for c in calls if c not in batched) == [3, 4]
+    by_id = {item["task_id"]: item for item in result["results"]}
+    assert by_id[1]["batch_size"] == 4 and "batch_size" not in by_id[3]
+
+
+def test_expand_hedges_slow_call_past_op_class_p95(tmp_path, monkeypatch):
+    import time
+    from prd_taskmaster import backend as backend_mod
+    from prd_taskmaster.backend import NativeBackend
+
+    monkeypatch.chdir(tmp_path)
+    _seed_project(tmp_path, [_pending_task(1)])
+    atlas = tmp_path / ".atlas-ai"
+    atlas.mkdir()
+    (atlas / "fleet.json").write_text(json.dumps({"engine": {"hedge": {
+        "enabled": True, "min_samples": 5, "min_delay_ms": 1}}}))
+    (atlas / "telemetry.jsonl").write_text("".join(
+        json.dumps({"op_class": "structured_gen", "model": "m", "exit": 0, "wall_ms": 20}) + "\n"
+        for _ in range(5)))
+    monkeypatch.setattr(
+        backend_mod, "resolve_provider", lambda role, *a, **k: _stub_handle("api", "anthropic", role)
+    )
+    tiers = []
+
+    def fake_generate_json(prompt, **kwargs):
+        tiers.append(kwargs["tier"])
+        if kwargs["tier"] == "standard":
+            time.sleep(1.0)  # the straggler; its late reply is discarded
+        return _packet_result(kwargs["task_id"])
+
+    monkeypatch.setattr(llm_client, "generate_json", fake_generate_json)
+
+    result = NativeBackend().expand(tag="master")
+
+    assert result["ok"] is True
+    assert result["applied"] == [1]
+    assert result["hedges"] == 1
+    assert result["results"][0]["hedged"] is True
+    assert sorted(tiers) == ["capable", "standard"]
+
+
 def _complexity_payload():
     return {
         "complexityAnalysis": [
@@ -109,3 +109,125 @@ def test_parallel_extract_inject_roundtrip(tmp_path):
 
     merged = json.loads(tasks_file.read_text())
     assert merged["master"]["tasks"][0]["title"] == "Build auth (edited)"
+
+
+# ─── Per-tag sharded layout ──────────────────────────────────────────────────
+
+
+def _seed_two_tags(tmp_path):
+    tasks_file = _seed_tasks(tmp_path)
+    payload = json.loads(tasks_file.read_text())
+    payload["feat/x"] = {"tasks": [
+        {"id": 1, "title": "Other", "description": "", "details": "",
+         "status": "pending", "subtasks": []},
+    ]}
+    tasks_file.write_text(json.dumps(payload))
+    return tasks_file
+
+
+def test_shard_splits_tags_and_reads_stay_transparent(tmp_path):
+    tasks_file = _seed_two_tags(tmp_path)
+    code, out, err = _run(tmp_path, "tasks-shard")
+    assert code == 0, err
+    assert json.loads(out)["tags"] == ["feat/x", "master"]
+
+    shard_dir = tasks_file.parent / "tags"
+    manifest = json.loads((shard_dir / "manifest.json").read_text())
+    assert manifest["tags"] == {"master": "master.json", "feat/x": "feat%2Fx.json"}
+    assert list(json.loads((shard_dir / "feat%2Fx.json").read_text())) == ["feat/x"]
+
+    code, out, err = _run(tmp_path, "parallel-plan", "--tag", "feat/x")
+    assert code == 0, err
+    assert [p["id"] for p in json.loads(out)["packets"]] == [1]
+
+
+def test_sharded_writes_touch_only_their_tag(tmp_path):
+    tasks_file = _seed_two_tags(tmp_path)
+    _run(tmp_path, "tasks-shard")
+    shard_dir = tasks_file.parent / "tags"
+    master_before = (shard_dir / "master.json").read_text()
+    export_before = tasks_file.read_text()
+
+    code, out, err = _run(tmp_path, "claim-task", "--tag", "feat/x")
+    assert code == 0, err
+    assert json.loads(out)["task"]["id"] == 1
+
+    claimed = json.loads((shard_dir / "feat%2Fx.json").read_text())
+    assert claimed["feat/x"]["tasks"][0]["status"] == "in-progress"
+    assert (shard_dir / "master.json").read_text() == master_before
+    assert (shard_dir / "feat%2Fx.json.lock").exists()
+    assert not (shard_dir / "master.json.lock").exists()
+    # tasks.json is only an export until tasks-export refreshes it.
+    assert tasks_file.read_text() == export_before
+
+    code, out, err = _run(tmp_path, "tasks-export")
+    assert code == 0, err
+    merged = json.loads(tasks_file.read_text())
+    assert merged["feat/x"]["tasks"][0]["status"] == "in-progress"
+    assert merged["master"]["tasks"][0]["status"] == "pending"
+
+
+def test_sharded_unknown_tag_fails_and_unshard_restores(tmp_path):
+    tasks_file = _seed_two_tags(tmp_path)
+    _run(tmp_path, "tasks-shard")
+
+    code, out, _ = _run(tmp_path, "parallel-plan", "--tag", "nope")
+    assert code == 1
+    assert "not found" in json.loads(out)["error"]
+
+    _run(tmp_path, "set-status", "--id", "1", "--status", "done", "--tag", "feat/x")
+    code, out, err = _run(tmp_path, "tasks-unshard")
+    assert code == 0, err
+    assert not (tasks_file.parent / "tags" / "manifest.json").exists()
+    merged = json.loads(tasks_file.read_text())
+    assert merged["feat/x"]["tasks"][0]["status"] == "done"
+    assert set(merged) == {"master", "feat/x"}
+
+
+def test_shard_rejects_flat_tasks_file(tmp_path):
+    tasks_dir = tmp_path / ".taskmaster" / "tasks"
+    tasks_dir.mkdir(parents=True)
+    (tasks_dir / "tasks.json").write_text(json.dumps({"tasks": []}))
+    code, out, _ = _run(tmp_path, "tasks-shard")
+    assert code == 1
+    assert "flat" in json.loads(out)["error"]
+    assert not (tasks_dir / "tags").exists()
+
+
+def _small_packets(count, details="short"):
+    from prd_taskmaster.parallel import build_packets
+
+    return build_packets([
+        {"id": i, "title": f"Task {i}", "description": "d", "details": details,
+         "testStrategy": "unit", "status": "pending"}
+        for i in range(1, count + 1)
+    ])
+
+
+def test_batch_packets_respects_task_cap_and_keeps_parallelism():
+    from prd_taskmaster.parallel import batch_packets
+
+    packets = _small_packets(20)
+    batches = batch_packets(packets, token_budget=100_000, max_tasks=8, min_batches=3)
+    assert len(batches) == 3
+    assert all(len(batch) <= 8 for batch in batches)
+    assert sorted(p["id"] for batch in batches for p in batch) == list(range(1, 21))
+    # Never fewer bins than workers: three tasks, three workers -> three singles.
+    assert [len(b) for b in batch_packets(packets[:3], token_budget=100_000,
+                                          max_tasks=8, min_batches=3)] == [1, 1, 1]
+
+
+def test_batch_packets_keeps_oversized_packets_single():
+    from prd_taskmaster.parallel import batch_packets, batch_prompt, estimate_tokens
+
+    small = _small_packets(4)
+    big = _small_packets(1, details="x" * 20_000)[0] | {"id": 99}
+    budget = estimate_tokens(batch_prompt(small)) + 10
+    batches = batch_packets(small + [big], token_budget=budget, max_tasks=8)
+    assert [big] in batches
+    assert sorted(len(b) for b in batches) == [1, 4]
+    prompt = batch_prompt(small)
+    assert prompt.count("RESEARCH") == 1
+    assert all(f"=== TASK {p['id']} ===" in prompt for p in small)
+    # max_tasks=1 switches batching off.
+    assert batch_packets(small, token_budget=budget, max_tasks=1) == [[p] for p in small]
@@ -7,10 +7,20 @@ Knobs under test (all default-applied by fleet.engine_config):
   keyless_default : True/null -> CLI-first ; False -> key-first ; floor always
 """
 
+import pytest
+
 import prd_taskmaster.provider_resolver as pr
 from prd_taskmaster.provider_resolver import ProviderHandle
 
 
+@pytest.fixture(autouse=True)
+def _fresh_memo():
+    # Each test patches the facts in place, which the memo key cannot see.
+    pr.invalidate_provider_cache()
+    yield
+    pr.invalidate_provider_cache()
+
+
 def _engine(provider_mode="hybrid", keyless_default=None, ttl_s=900):
     """A fleet_config dict whose engine block is what the resolver reads."""
     return {
@@ -155,3 +165,40 @@ def test_unusable_cli_demotes_to_api(monkeypatch):
     h = pr.resolve_provider("fallback", fleet_config=_engine())
     assert h.kind == "api"
     assert h.role == "fallback"
+
+
+def test_resolution_is_memoized_until_config_changes(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+    _patch(monkeypatch, usable=True, probe=True)
+    monkeypatch.setattr(
+        pr, "_read_taskmaster_model",
+        lambda role: calls.append(role) or {"provider": "claude-code", "modelId": "sonnet"},
+    )
+    first = pr.resolve_provider("main", fleet_config=_engine())
+    assert pr.resolve_provider("main", fleet_config=_engine()) is first
+    assert calls == ["main"]
+
+    (tmp_path / ".taskmaster").mkdir()
+    (tmp_path / ".taskmaster" / "config.json").write_text("{}")
+    pr.resolve_provider("main", fleet_config=_engine())
+    pr.resolve_provider("main", fleet_config=_engine(provider_mode="cli_only"))
+    assert len(calls) == 3
+
+
+def test_plan_floor_is_not_memoized(monkeypatch):
+    # A refused spawn probe must stay retryable, like _probe_spawn_cached.
+    _patch(monkeypatch, usable=True, probe=False, key=None)
+    assert pr.resolve_provider("main", fleet_config=_engine()).kind == "plan"
+    monkeypatch.setattr(pr, "_probe_spawn_cached", lambda provider, ttl_s: True)
+    assert pr.resolve_provider("main", fleet_config=_engine()).kind == "cli"
+
+
+def test_auth_failure_and_reconfigure_invalidate(monkeypatch):
+    _patch(monkeypatch, role_provider="anthropic", key={"provider": "anthropic"})
+    assert pr.resolve_provider("main", fleet_config=_engine()).kind == "api"
+    monkeypatch.setattr(pr, "discover_key", lambda: None)
+    assert pr.resolve_provider("main", fleet_config=_engine()).kind == "api"  # memoized
+
+    pr.llm_client.invalidate_key_cache()  # what generate_json does on 401/403
+    assert pr.resolve_provider("main", fleet_config=_engine()).kind == "plan"
@@ -13,9 +13,11 @@ from pathlib import Path
 import pytest
 
 from prd_taskmaster.reachability import (
+    ImportIndex,
     ReachabilityError,
     find_importers,
     language_for_repo,
+    new_modules_for_commits,
     new_modules_for_task,
     reachability_verdict,
     sweep_task,
@@ -795,3 +797,72 @@ class TestSpecCyImporterIsOrphan:
             "Pre-fix code would return WIRED (false pass)."
         )
         assert verdict["importers"] == []
+
+
+# ─── 11. Batch: new_modules_for_commits + ImportIndex ────────────────────────
+
+class TestBatchSweepPrimitives:
+    def test_commits_match_per_task_diff(self, tmp_path):
+        """One diff-tree pass returns what new_modules_for_task returns per commit."""
+        repo, start, head = _make_py_repo(tmp_path)
+        (repo / "pkg" / "bar.py").write_text("X = 1\n")
+        _commit_all(repo, "add bar")
+
+        batch = new_modules_for_commits(repo, [start, head, start])
+        assert batch == {
+            start: new_modules_for_task(repo, start),
+            head: new_modules_for_task(repo, head),
+        }
+        assert batch[head] == [Path("pkg/bar.py")]
+
+    def test_rename_is_not_an_added_module(self, tmp_path):
+        repo, _start, head = _make_py_repo(tmp_path)
+        _git(repo, "mv", "pkg/foo.py", "pkg/renamed.py")
+        _commit_all(repo, "rename")
+        assert new_modules_for_commits(repo, [head]) == {head: new_modules_for_task(repo, head)}
+
+    def test_unknown_commit_left_out_for_fallback(self, tmp_path):
+        repo, start, _head = _make_py_repo(tmp_path)
+        batch = new_modules_for_commits(repo, [start, "deadbeef"])
+        assert list(batch) == [start]
+        with pytest.raises(ReachabilityError):
+            new_modules_for_task(repo, "deadbeef")
+
+    def test_not_a_repo_raises(self, tmp_path):
+        with pytest.raises(ReachabilityError):
+            new_modules_for_commits(tmp_path, ["HEAD~1"])
+
+    def test_index_matches_grep(self, tmp_path):
+        """ImportIndex gives the same importers as the grep path."""
+        repo, _start, _head = _make_py_repo(tmp_path)
+        (repo / "pkg" / "app.py").write_text("from pkg import foo\n")
+        (repo / "pkg" / "other.py").write_text("import pkg.foobar\n")
+        index = ImportIndex(repo)
+        module = Path("pkg/foo.py")
+        assert find_importers(repo, module, "py", index=index) == find_importers(
+            repo, module, "py"
+        )
+        assert find_importers(repo, module, "py", index=index) == [Path("pkg/app.py")]
+
+    def test_index_skips_test_dirs(self, tmp_path):
+        repo, _start, _head = _make_py_repo(tmp_path)
+        assert "tests/test_foo.py" not in ImportIndex(repo).files("*.py")
+
+    def test_sweep_task_uses_precomputed_modules(self, tmp_path):
+        """With new_modules given, sweep_task never consults git for the diff."""
+        repo, _start, _head = _make_py_repo(tmp_path)
+        task = {"id": 1, "phaseConfig": {"tier": "wired"}}
+        result = sweep_task(repo, task, "not-a-commit", new_modules=[], index=ImportIndex(repo))
+        assert result["verdict"] == "WIRED"
+        assert result["modules"] == []
+
+    def test_ignored_tree_importer_does_not_wire(self, tmp_path):
+        """Importers under gitignored / excluded trees are not searched."""
+        repo, _start, _head = _make_py_repo(tmp_path)
+        (repo / ".gitignore").write_text("generated/\n")
+        for d in ("generated", "node_modules"):
+            (repo / d).mkdir()
+            (repo / d / "uses_foo.py").write_text("from pkg import foo\n")
+        module = Path("pkg/foo.py")
+        assert find_importers(repo, module, "py") == []
+        assert find_importers(repo, module, "py", index=ImportIndex(repo)) == []
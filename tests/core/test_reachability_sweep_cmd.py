@@ -13,6 +13,12 @@ Coverage:
     A5. No tasks.json → CommandError.
     A6. EXEMPT task (tier-exempt) → writes EXEMPT into card.
 
+  Part C — run_reachability_sweep_batch
+    C1. --all sweeps every done task, writes each card, matches the per-task verdicts.
+    C2. Start commit falls back to the card's previous sweep, then startCommit.
+    C3. Task without a card is skipped and makes ok False; others still written.
+    C4. Wired task with no start commit anywhere → ERROR verdict.
+
   Part B — cmd_set_status auto-read
     B1. wired task whose CDD card has verdict==WIRED → set-status done succeeds (no flag).
     B2. wired task whose CDD card has verdict==ORPHAN → raises CommandError.
@@ -31,7 +37,10 @@ from pathlib import Path
 import pytest
 
 from prd_taskmaster.lib import CommandError
-from prd_taskmaster.reachability_cmd import run_reachability_sweep
+from prd_taskmaster.reachability_cmd import (
+    run_reachability_sweep,
+    run_reachability_sweep_batch,
+)
 from prd_taskmaster.task_state import (
     _parse_reachability_arg,
     _read_cdd_reachability,
@@ -521,3 +530,83 @@ class TestEndToEnd:
 
         assert result["ok"] is True
         assert result["status"] == "done"
+
+
+# ─── Part C: run_reachability_sweep_batch ────────────────────────────────────
+
+
+class TestReachabilitySweepBatch:
+    def _done(self, task_id, *, tier="wired", **extra):
+        task = _make_task(task_id, tier=tier)
+        task["status"] = "done"
+        task.update(extra)
+        return task
+
+    def test_batch_sweeps_done_tasks_and_writes_cards(self, tmp_path):
+        """C1: one call sweeps every done task; cards hold the same verdicts."""
+        repo, start, _head, _tid = _make_wired_py_repo(tmp_path)
+        pending = _make_task(3, tier="wired")
+        _write_tasks(repo, [self._done(1), self._done(2, tier="spike"), pending])
+        for tid in ("1", "2", "3"):
+            _write_cdd_card(repo, tid)
+
+        result = run_reachability_sweep_batch(default_start_commit=start, cwd=str(repo))
+
+        assert result["ok"] is True
+        assert result["swept"] == 2
+        assert result["passed"] == ["1", "2"]
+        card1 = json.loads((repo / ".atlas-ai/cdd/task-1.json").read_text())
+        assert card1["reachability"]["verdict"] == "WIRED"
+        assert card1["reachability"]["start_commit"] == start
+        assert card1["task_id"] == "1"
+        card2 = json.loads((repo / ".atlas-ai/cdd/task-2.json").read_text())
+        assert card2["reachability"]["verdict"] == "EXEMPT"
+        assert "reachability" not in json.loads((repo / ".atlas-ai/cdd/task-3.json").read_text())
+
+        single = run_reachability_sweep("1", start, cwd=str(repo))
+        assert single["modules"] == result["verdicts"]["1"]["modules"]
+
+    def test_start_commit_from_card_then_task(self, tmp_path):
+        """C2: recorded start commits are reused; the ORPHAN repo yields ORPHAN."""
+        repo, start, _head, _tid = _make_orphan_py_repo(tmp_path)
+        _write_tasks(repo, [self._done(1), self._done(2, startCommit=start)])
+        _write_cdd_card(repo, "1", {"reachability": {"verdict": "WIRED", "start_commit": start}})
+        _write_cdd_card(repo, "2")
+
+        result = run_reachability_sweep_batch(cwd=str(repo))
+
+        assert result["ok"] is False
+        assert result["failed"] == ["1", "2"]
+        for tid in ("1", "2"):
+            card = json.loads((repo / f".atlas-ai/cdd/task-{tid}.json").read_text())
+            assert card["reachability"]["verdict"] == "ORPHAN"
+            assert card["reachability"]["start_commit"] == start
+
+    def test_missing_card_is_skipped(self, tmp_path):
+        """C3: a card-less task is reported, not fatal."""
+        repo, start, _head, _tid = _make_wired_py_repo(tmp_path)
+        _write_tasks(repo, [self._done(1), self._done(2)])
+        _write_cdd_card(repo, "1")
+
+        result = run_reachability_sweep_batch(default_start_commit=start, cwd=str(repo))
+
+        assert result["ok"] is False
+        assert "no CDD card" in result["skipped"]["2"]
+        assert result["passed"] == ["1"]
+
+    def test_no_start_commit_is_error(self, tmp_path):
+        """C4: a wired task needs a start commit; without one it fails closed."""
+        repo, _start, _head, _tid = _make_wired_py_repo(tmp_path)
+        _write_tasks(repo, [self._done(1)])
+        _write_cdd_card(repo, "1")
+
+        result = run_reachability_sweep_batch(cwd=str(repo))
+
+        assert result["verdicts"]["1"]["verdict"] == "ERROR"
+        assert result["failed"] == ["1"]
+
+    def test_unknown_task_id_raises(self, tmp_path):
+        repo, start, _head, _tid = _make_wired_py_repo(tmp_path)
+        _write_tasks(repo, [self._done(1)])
+        with pytest.raises(CommandError, match="99"):
+            run_reachability_sweep_batch(task_ids=["99"], cwd=str(repo))
@@ -14,14 +14,20 @@ Coverage:
       correct win_rate (n_wins / n_jobs).
   R6. UCB exploit: a high-win-rate, many-jobs executor is chosen when every
       candidate has history (no unseen) — exploitation works.
-  R7. UCB cold-start: an unseen executor (n=0) is ALWAYS sampled (exploring=True,
-      score == +inf) even against a strong seen incumbent — cold-start open.
+  R7. UCB cold-start: an unseen executor (n=0) is sampled (exploring=True) over
+      a strong seen incumbent on a FINITE prior score — cold-start open but bounded.
   R8. A task_class with ZERO history → every candidate is an explore pick
-      (all scores +inf, exploring=True).
-  R9. Never zero-weight: an unseen cheap candidate's score (+inf) beats a
+      (equal finite prior scores, exploring=True).
+  R9. Never zero-weight: an unseen cheap candidate's prior score beats a
       mediocre seen one; the cheap model is sampled.
   R10. p50 latency folds from the latencies map.
   R11. Fail-closed: garbage snapshot content → summarize_reputation returns {}.
+  R12. Incremental store: events append in O(1), each refresh folds only new
+       events from the recorded offset, a lost snapshot rebuilds from the log,
+       and the folded prefix compacts into numbered segments.
+  R13. Non-stationary policies: discounted and sliding-window UCB drop a
+       backend that degraded recently; Thompson sampling is reproducible and
+       explores an unseen backend only some of the time.
 """
 
 from __future__ import annotations
@@ -319,6 +325,144 @@ def test_garbage_snapshot_is_fail_closed(tmp_path):
     assert summarize_reputation(path) == {}
 
 
+def test_record_appends_without_rewriting_log(tmp_path, monkeypatch):
+    """R12a: the event log is appended to, never read-modify-written."""
+    from prd_taskmaster import reputation
+
+    path = _rep_path(tmp_path)
+    rewritten = []
+    real_update = reputation.locked_update
+    monkeypatch.setattr(
+        reputation, "locked_update",
+        lambda p, t: (rewritten.append(Path(p).name), real_update(p, t))[1],
+    )
+    for i in range(3):
+        record_tournament(
+            reputation_path=path,
+            result=_result(ranked=["alice", "bob"], winner_id="alice"),
+            task_class="standard",
+            now=f"2026-06-17T00:00:0{i}+00:00",
+        )
+    assert rewritten == ["reputation.json"] * 3
+
+
+def test_refresh_folds_only_new_events(tmp_path, monkeypatch):
+    """R12b: a refresh folds events past the stored offset exactly once."""
+    from prd_taskmaster import reputation
+
+    path = _rep_path(tmp_path)
+    record_tournament(
+        reputation_path=path,
+        result=_result(ranked=["alice", "bob"], winner_id="alice"),
+        task_class="standard",
+        now="2026-06-17T00:00:00+00:00",
+    )
+    applied = []
+    real_apply = reputation._apply_event
+    monkeypatch.setattr(
+        reputation, "_apply_event",
+        lambda records, event: (applied.append(event["winner"]), real_apply(records, event))[1],
+    )
+    touched = record_tournament(
+        reputation_path=path,
+        result=_result(ranked=["alice", "bob"], winner_id="bob"),
+        task_class="standard",
+        now="2026-06-17T00:00:01+00:00",
+    )
+    assert applied == ["bob"]
+    assert touched[("bob" + reputation._KEY_SEP + "standard")]["n_wins"] == 1
+    assert reputation.refresh_snapshot(path) and applied == ["bob"]  # nothing new
+
+
+def test_lost_snapshot_rebuilds_from_log(tmp_path):
+    """R12c: deleting (or corrupting) the snapshot loses nothing."""
+    path = _rep_path(tmp_path)
+    for i, winner in enumerate(("alice", "bob", "alice")):
+        record_tournament(
+            reputation_path=path,
+            result=_result(ranked=["alice", "bob"], winner_id=winner),
+            task_class="standard",
+            now=f"2026-06-17T00:00:0{i}+00:00",
+            latencies={"alice": 100 * (i + 1)},
+        )
+    before = summarize_reputation(path)
+    path.with_suffix(".json").write_text("{ garbage")
+    from prd_taskmaster.reputation import refresh_snapshot
+
+    refresh_snapshot(path)
+    assert summarize_reputation(path) == before
+
+
+def test_log_compacts_into_segments(tmp_path, monkeypatch):
+    """R12d: the folded prefix moves to numbered segments; totals survive a rebuild."""
+    from prd_taskmaster import reputation
+
+    monkeypatch.setattr(reputation, "_COMPACT_BYTES", 600)
+    path = _rep_path(tmp_path)
+    for i in range(12):
+        record_tournament(
+            reputation_path=path,
+            result=_result(ranked=["alice", "bob"], winner_id="alice"),
+            task_class="standard",
+            now=f"2026-06-17T00:00:{i:02d}+00:00",
+        )
+    segments = sorted(p.name for p in path.parent.glob("reputation.jsonl.*") if p.suffix[1:].isdigit())
+    assert segments and segments[0] == "reputation.jsonl.0"
+    assert path.stat().st_size < 600
+    assert summarize_reputation(path)[("alice", "standard")]["n_jobs"] == 12
+
+    path.with_suffix(".json").unlink()
+    reputation.refresh_snapshot(path)
+    assert summarize_reputation(path)[("alice", "standard")]["n_wins"] == 12
+
+
+def test_crash_between_segment_and_truncate_does_not_double_count(tmp_path, monkeypatch):
+    """R12d: a rebuild after a crash mid-compaction drops the segmented prefix once."""
+    from prd_taskmaster import reputation
+
+    path = _rep_path(tmp_path)
+    for i in range(12):
+        record_tournament(
+            reputation_path=path,
+            result=_result(ranked=["alice", "bob"], winner_id="alice"),
+            task_class="standard",
+            now=f"2026-06-17T00:00:{i:02d}+00:00",
+        )
+    log_before = path.read_bytes()
+
+    real_write = reputation.atomic_write
+
+    def crash_after_segment(target, content):
+        real_write(target, content)
+        raise OSError("killed before the live log was truncated")
+
+    monkeypatch.setattr(reputation, "_COMPACT_BYTES", 600)
+    monkeypatch.setattr(reputation, "atomic_write", crash_after_segment)
+    with pytest.raises(OSError):
+        reputation.refresh_snapshot(path)
+    monkeypatch.setattr(reputation, "atomic_write", real_write)
+    assert (path.parent / "reputation.jsonl.0").exists()
+    assert path.read_bytes() == log_before
+
+    path.with_suffix(".json").unlink()
+    reputation.refresh_snapshot(path)
+    assert summarize_reputation(path)[("alice", "standard")]["n_jobs"] == 12
+    assert len(path.read_bytes()) < len(log_before)
+
+
+def test_latency_ring_buffer_overwrites_oldest():
+    """R12e: the latency window is a fixed-size ring, O(1) per sample."""
+    from prd_taskmaster import reputation
+
+    rec = reputation._empty_record()
+    window = reputation._LATENCY_WINDOW
+    for v in range(window + 3):
+        reputation._push_latency(rec, float(v))
+    assert len(rec["_latencies"]) == window
+    assert rec["_latencies"][:3] == [float(window), float(window + 1), float(window + 2)]
+    assert rec["_lat_next"] == 3
+
+
 # ---------------------------------------------------------------------------
 # route_with_reputation — UCB
 # ---------------------------------------------------------------------------
@@ -381,9 +525,9 @@ def test_ucb_always_samples_unseen_coldstart(tmp_path):
 
     assert out["chosen"] == "goose-cheap"
     assert out["exploring"] is True
-    assert out["scores"]["goose-cheap"] == math.inf
-    # The strong incumbent is finite → cold-start beats it.
-    assert math.isfinite(out["scores"]["champ"])
+    # Bounded: the unseen candidate's score is finite, yet it beats the incumbent.
+    assert math.isfinite(out["scores"]["goose-cheap"])
+    assert out["scores"]["goose-cheap"] > out["scores"]["champ"]
 
 
 def test_zero_history_task_class_all_explore(tmp_path):
@@ -403,8 +547,9 @@ def test_zero_history_task_class_all_explore(tmp_path):
     )
 
     assert out["exploring"] is True
-    assert all(out["scores"][c] == math.inf for c in ("a", "b", "c"))
-    assert out["chosen"] in ("a", "b", "c")
+    assert len({out["scores"][c] for c in ("a", "b", "c")}) == 1
+    assert all(math.isfinite(out["scores"][c]) for c in ("a", "b", "c"))
+    assert out["chosen"] == "a"  # ties break by input order
 
 
 def test_never_zero_weight_unseen_cheap_beats_mediocre_seen(tmp_path):
@@ -423,8 +568,7 @@ def test_never_zero_weight_unseen_cheap_beats_mediocre_seen(tmp_path):
         _route=_stub_route,
     )
 
-    # The unseen cheap model is NEVER zero-weighted — it wins on +inf.
-    assert out["scores"]["goose-cheap"] == math.inf
+    # The unseen cheap model is NEVER zero-weighted — its prior score wins.
     assert out["scores"]["goose-cheap"] > out["scores"]["mediocre"]
     assert out["chosen"] == "goose-cheap"
     assert out["exploring"] is True
@@ -449,6 +593,146 @@ def test_route_falls_back_when_reference_router_errors(tmp_path):
     assert out["chosen"] in ("a", "b")
 
 
+# ---------------------------------------------------------------------------
+# route_with_reputation — non-stationary policies (R13)
+# ---------------------------------------------------------------------------
+
+def _seed_degraded(path):
+    """'stale' beat 'fresh' 40 times two weeks ago, then lost 12 straight to it
+    this week: 'stale' still leads on whole-history win rate."""
+    for i in range(40):
+        record_tournament(
+            reputation_path=path,
+            result=_result(ranked=["stale", "fresh"], winner_id="stale"),
+            task_class="standard",
+            now=f"2026-06-01T00:{i:02d}:00+00:00",
+        )
+    for i in range(12):
+        record_tournament(
+            reputation_path=path,
+            result=_result(ranked=["fresh", "stale"], winner_id="fresh"),
+            task_class="standard",
+            now=f"2026-06-15T00:{i:02d}:00+00:00",
+        )
+
+
+@pytest.mark.parametrize("policy, chosen", [
+    ("ucb1", "stale"),                  # whole-history average still favours it
+    ("discounted-ucb", "fresh"),
+    ("thompson", "fresh"),
+])
+def test_nonstationary_policies_drop_recently_degraded_backend(tmp_path, policy, chosen):
+    """R13a: the whole-history policy keeps routing on the stale average; the
+    discounted ones follow this week's results."""
+    path = _rep_path(tmp_path)
+    _seed_degraded(path)
+    out = route_with_reputation(
+        task={"id": 1, "task_class": "standard"},
+        config={"reputation": {"policy": policy}},
+        reputation_path=path,
+        candidates=["stale", "fresh"],
+        now="2026-06-16T00:00:00+00:00",
+        _route=_stub_route,
+    )
+    assert out["policy"] == policy
+    assert out["chosen"] == chosen
+
+
+def test_sliding_window_forgets_outcomes_past_the_window(tmp_path, monkeypatch):
+    """R13b: with a 5-job window, 40 old wins are forgotten after recent losses."""
+    from prd_taskmaster import reputation
+
+    monkeypatch.setattr(reputation, "_OUTCOME_WINDOW", 5)
+    path = _rep_path(tmp_path)
+    _seed_degraded(path)
+    out = route_with_reputation(
+        task={"id": 1, "task_class": "standard"},
+        config={},
+        reputation_path=path,
+        candidates=["stale", "fresh"],
+        now="2026-06-16T00:00:00+00:00",
+        policy="sliding-window-ucb",
+        _route=_stub_route,
+    )
+    assert out["scores"]["stale"] < out["scores"]["fresh"]
+
+
+def test_thompson_is_reproducible_and_cold_start_is_bounded(tmp_path):
+    """R13c: same inputs → same pick; an unseen backend is explored sometimes, not always."""
+    path = _rep_path(tmp_path)
+    _seed_history(path, winner="champ", others=["mid"], task_class="standard", n=20)
+
+    def _route_at(now):
+        return route_with_reputation(
+            task={"id": 1, "task_class": "standard"},
+            config={"reputation": {"policy": "thompson"}},
+            reputation_path=path,
+            candidates=["champ", "goose-cheap"],
+            now=now,
+            _route=_stub_route,
+        )
+
+    assert _route_at("2026-06-17T01:00:00+00:00") == _route_at("2026-06-17T01:00:00+00:00")
+    picks = [_route_at(f"2026-06-17T{h:02d}:{m:02d}:00+00:00")["chosen"]
+             for h in range(2, 12) for m in range(0, 60, 3)]
+    explored = picks.count("goose-cheap")
+    assert 0 < explored < len(picks) / 2
+
+
+def test_routing_hundreds_of_backends_is_sub_millisecond(tmp_path):
+    """R13d: scoring runs on the cached column view, not a snapshot re-parse."""
+    import time
+
+    from prd_taskmaster import reputation
+
+    path = _rep_path(tmp_path)
+    ids = [f"exec-{i}" for i in range(300)]
+    for i in range(0, 300, 30):
+        record_tournament(
+            reputation_path=path,
+            result=_result(ranked=ids[i:i + 30], winner_id=ids[i]),
+            task_class="standard",
+            now=f"2026-06-17T00:00:{i // 30:02d}+00:00",
+        )
+    candidates = ids + ["unseen"]
+    for policy in ("ucb1", "discounted-ucb", "sliding-window-ucb", "thompson"):
+        route_with_reputation(task={"id": 1, "task_class": "standard"}, config={},
+                              reputation_path=path, candidates=candidates,
+                              now="2026-06-17T01:00:00+00:00", policy=policy,
+                              _route=_stub_route)  # warms the column cache
+        started = time.perf_counter()
+        for _ in range(50):
+            out = route_with_reputation(
+                task={"id": 1, "task_class": "standard"}, config={},
+                reputation_path=path, candidates=candidates,
+                now="2026-06-17T01:00:00+00:00", policy=policy, _route=_stub_route,
+            )
+        per_route = (time.perf_counter() - started) / 50
+        assert len(out["scores"]) == 301
+        assert per_route < 0.002, (policy, per_route)
+    assert reputation._columns(path)["standard"]["jobs"][0] == 1
+
+
+def test_pre_policy_snapshot_is_refolded_from_log(tmp_path):
+    """R13e: a snapshot written before the discounted fields existed is rebuilt."""
+    path = _rep_path(tmp_path)
+    _seed_history(path, winner="champ", others=["mid"], task_class="standard", n=3)
+    snapshot = path.with_suffix(".json")
+    data = json.loads(snapshot.read_text())
+    del data["version"]
+    for rec in data["records"].values():
+        for key in ("d_jobs", "d_wins", "d_ts", "_outcomes", "_out_next"):
+            rec.pop(key)
+    snapshot.write_text(json.dumps(data))
+
+    from prd_taskmaster.reputation import refresh_snapshot
+
+    records = refresh_snapshot(path)
+    champ = next(rec for key, rec in records.items() if key.startswith("champ"))
+    assert champ["n_jobs"] == 3 and champ["_outcomes"] == [1, 1, 1]
+    assert champ["d_wins"] == pytest.approx(champ["d_jobs"])
+
+
 # ---------------------------------------------------------------------------
 # Fix 6/7: _bounty_amount — NaN and negative values are clamped to 0.0
 # ---------------------------------------------------------------------------
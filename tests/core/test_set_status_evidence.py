@@ -12,7 +12,12 @@ Design:
 
 from __future__ import annotations
 
+import fcntl
 import json
+import os
+import subprocess
+import sys
+import time
 from pathlib import Path
 
 import pytest
@@ -340,3 +345,46 @@ def test_domain_model_evidence_persisted(tmp_path, monkeypatch):
     tasks = _reload(tasks_file)
     assert tasks["1"]["doneEvidence"]["evidence_ref"] == "proof.json"
     assert "at" in tasks["1"]["doneEvidence"]
+
+
+# ---------------------------------------------------------------------------
+# 9. Concurrent set-status from separate processes shares one write
+# ---------------------------------------------------------------------------
+
+
+def test_concurrent_processes_are_applied_in_one_batch(tmp_path):
+    """Callers queued behind the lock are applied together; each gets its own result."""
+    tasks_file = _write_project(tmp_path, [_task(i) for i in range(1, 5)])
+    lock_f = open(tasks_file.with_suffix(".json.lock"), "w")
+    fcntl.flock(lock_f, fcntl.LOCK_EX)
+    script = (
+        "import json, sys\n"
+        "from prd_taskmaster.lib import CommandError\n"
+        "from prd_taskmaster.task_state import run_set_status\n"
+        "try:\n"
+        "    print(json.dumps(run_set_status(sys.argv[1], 'done')))\n"
+        "except CommandError as exc:\n"
+        "    print(json.dumps({'error': exc.message}))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(REPO)}
+    ids = ["1", "2", "3", "4", "9"]
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-c", script, task_id],
+            cwd=tmp_path, env=env, stdout=subprocess.PIPE, text=True,
+        )
+        for task_id in ids
+    ]
+    spool = tasks_file.with_name("tasks.json.spool")
+    deadline = time.monotonic() + 30
+    while len(list(spool.glob("*.op"))) < len(ids):
+        assert time.monotonic() < deadline, "set-status never spooled its op"
+        time.sleep(0.02)
+    fcntl.flock(lock_f, fcntl.LOCK_UN)
+    lock_f.close()
+    outputs = {task_id: json.loads(p.communicate(timeout=30)[0]) for task_id, p in zip(ids, procs)}
+
+    assert outputs["9"] == {"error": "unknown id: 9"}
+    assert all(outputs[i]["ok"] and outputs[i]["id"] == i for i in ids[:4])
+    assert all(t["status"] == "done" for t in _reload(tasks_file).values())
+    assert not list(spool.iterdir())
@@ -212,3 +212,70 @@ def test_ship_check_passes_with_flat_tasks_format(tmp_path):
     r = _run(tmp_path, oracle_cmd=_fake_oracle(tmp_path, "PASS"))
     assert r.returncode == 0, f"stderr={r.stderr!r}"
     assert "SHIP_CHECK_OK" in r.stdout
+
+
+# ─── Display heuristic: evidence exit-code scan cache ───────────────────────
+
+
+def test_gate_exit_codes_caches_per_file_results(tmp_path: Path, monkeypatch) -> None:
+    """Unchanged evidence is answered from .atlas-ai/evidence-scan.json."""
+    from prd_taskmaster import shipcheck
+
+    atlas = tmp_path / ".atlas-ai"
+    evidence = atlas / "evidence"
+    evidence.mkdir(parents=True)
+    (evidence / "ok.log").write_text("tests passed\nExit status 0\n")
+    (evidence / "bad.log").write_text("1 failed\nExit status 1\n")
+
+    ok, failures = shipcheck.gate_exit_codes(atlas)
+    assert not ok
+    assert failures == [f"non-zero exit in {Path('.atlas-ai/evidence/bad.log')}: Exit status 1"]
+    assert (atlas / shipcheck.EVIDENCE_CACHE_NAME).exists()
+
+    scanned: list[Path] = []
+    real_scan = shipcheck._scan_exit_code
+    monkeypatch.setattr(
+        shipcheck, "_scan_exit_code", lambda p, size: scanned.append(p) or real_scan(p, size)
+    )
+    assert shipcheck.gate_exit_codes(atlas) == (ok, failures)
+    assert scanned == []
+
+    (evidence / "bad.log").write_text("rerun\nExit status 0\n")
+    assert shipcheck.gate_exit_codes(atlas) == (True, [])
+    assert scanned == [evidence / "bad.log"]
+
+
+def test_gate_exit_codes_rejects_a_forged_cache_entry(tmp_path: Path) -> None:
+    """A hand-written "code: null" for a failing log must not turn the gate green."""
+    from prd_taskmaster import shipcheck
+
+    atlas = tmp_path / ".atlas-ai"
+    (atlas / "evidence").mkdir(parents=True)
+    bad = atlas / "evidence" / "bad.log"
+    bad.write_text("1 failed\nExit status 1\n")
+    assert shipcheck.gate_exit_codes(atlas)[0] is False
+
+    cache_path = atlas / shipcheck.EVIDENCE_CACHE_NAME
+    cache = json.loads(cache_path.read_text())
+    cache["files"]["bad.log"]["code"] = None
+    cache_path.write_text(json.dumps(cache))
+    assert shipcheck.gate_exit_codes(atlas)[0] is False
+
+    st = bad.stat()
+    forged = {"bad.log": {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "code": None}}
+    cache_path.write_text(json.dumps({"files": forged}))
+    assert shipcheck.gate_exit_codes(atlas)[0] is False
+
+
+def test_gate_exit_codes_reads_only_the_tail_of_huge_logs(tmp_path: Path, monkeypatch) -> None:
+    from prd_taskmaster import shipcheck
+
+    monkeypatch.setattr(shipcheck, "SCAN_TAIL_BYTES", 64)
+    atlas = tmp_path / ".atlas-ai"
+    (atlas / "evidence").mkdir(parents=True)
+    log = atlas / "evidence" / "big.log"
+    log.write_text("Exit status 3\n" + "x" * 500 + "\nExit status 2\n")
+
+    ok, failures = shipcheck.gate_exit_codes(atlas)
+    assert not ok
+    assert failures[0].endswith("Exit status 2")
@@ -198,3 +198,100 @@ def test_gates_1_to_4_still_enforced(tmp_path, monkeypatch):
     ok, failures = mod.run_all_gates(tmp_path)
     assert ok is False
     assert any("current_phase" in f for f in failures), failures
+
+
+# ─── 7. Incremental re-runs reuse fingerprinted verdicts ──────────────────────
+
+
+def _counting(grade_stdout: str):
+    fake = _fake_run_factory(grade_stdout)
+    calls: list = []
+
+    def run(cmd, *args, **kwargs):
+        if "grade" in cmd:
+            calls.append(cmd)
+        return fake(cmd, *args, **kwargs)
+
+    return run, calls
+
+
+def test_cached_rerun_regrades_every_done_task(tmp_path, monkeypatch):
+    """Oracle verdicts are never reused: every cached run re-grades."""
+    mod = load()
+    setup_project(tmp_path, [1, 2], with_cdd=True)
+    run, calls = _counting('{"verdict":"PASS"}')
+    monkeypatch.setattr(mod.subprocess, "run", run)
+
+    assert mod.run_all_gates(tmp_path, use_cache=True) == (True, [])
+    assert mod.run_all_gates(tmp_path, use_cache=True) == (True, [])
+    assert len(calls) == 4
+
+
+def test_forged_oracle_cache_entry_is_rejected(tmp_path, monkeypatch):
+    """A hand-written PASS with a correctly computed fingerprint never ships."""
+    mod = load()
+    setup_project(tmp_path, [1], with_cdd=True)
+    atlas = tmp_path / ".atlas-ai"
+    run, calls = _counting('{"verdict":"FAIL"}')
+    monkeypatch.setattr(mod.subprocess, "run", run)
+
+    held_fp = mod._dir_fp(atlas / "held-out")
+    card_fp = mod._file_fp(atlas / "cdd" / "task-1.json")
+    forged_fp = mod._digest("deadbeef", mod._oracle_cmd(), held_fp, card_fp)
+    cache = {"oracle": {"1": {"fingerprint": forged_fp, "verdict": "PASS"}}}
+    (atlas / mod.CACHE_REL).write_text(json.dumps(cache))
+
+    ok, failures = mod.run_all_gates(tmp_path, use_cache=True)
+    assert not ok
+    assert any("oracle verdict FAIL" in f for f in failures), failures
+    assert len(calls) == 1
+
+
+def test_unsigned_or_tampered_gate_cache_is_ignored(tmp_path, monkeypatch):
+    """Forged cheap-gate verdicts (here: Gate 3 "no failures") are not reused."""
+    mod = load()
+    setup_project(tmp_path, [1], with_cdd=False)
+    run, _ = _counting('{"verdict":"PASS"}')
+    monkeypatch.setattr(mod.subprocess, "run", run)
+    atlas = tmp_path / ".atlas-ai"
+    cache_path = atlas / mod.CACHE_REL
+
+    ok, failures = mod.run_all_gates(tmp_path, use_cache=True)
+    assert not ok
+    signed = json.loads(cache_path.read_text())
+    assert signed["mac"] and mod._load_cache(atlas)["gates"]["cdd"]["failures"]
+
+    # Clearing the recorded failures breaks the signature...
+    signed["gates"]["cdd"]["failures"] = []
+    cache_path.write_text(json.dumps(signed))
+    assert mod._load_cache(atlas) == {}
+    assert mod.run_all_gates(tmp_path, use_cache=True) == (ok, failures)
+
+    # ...and so does dropping it.
+    signed.pop("mac")
+    cache_path.write_text(json.dumps(signed))
+    assert mod.run_all_gates(tmp_path, use_cache=True) == (ok, failures)
+
+
+def test_ship_check_ok_records_combined_fingerprint(tmp_path, monkeypatch, capsys):
+    mod = load()
+    setup_project(tmp_path, [1], with_cdd=True)
+    run, calls = _counting('{"verdict":"PASS"}')
+    monkeypatch.setattr(mod.subprocess, "run", run)
+    monkeypatch.setattr(mod.sys, "argv", ["ship-check.py", "--cwd", str(tmp_path)])
+
+    assert mod.main() == 0
+    out = capsys.readouterr()
+    assert out.out == "SHIP_CHECK_OK\n"
+    cache = json.loads((tmp_path / ".atlas-ai" / "state" / "ship-check-cache.json").read_text())
+    assert cache["ship_check_ok"]["fingerprint"] == cache["fingerprint"]
+    assert cache["fingerprint"] in out.err
+
+    # A changed input yields a different fingerprint; a failing run drops the OK.
+    (tmp_path / ".atlas-ai" / "state" / "pipeline.json").write_text(
+        json.dumps({"current_phase": "GENERATE"})
+    )
+    assert mod.main() == 1
+    cache = json.loads((tmp_path / ".atlas-ai" / "state" / "ship-check-cache.json").read_text())
+    assert "ship_check_ok" not in cache
+    assert len(calls) == 2
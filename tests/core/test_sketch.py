@@ -0,0 +1,49 @@
+"""QuantileSketch — exact while small, bounded relative error once bucketed."""
+
+import random
+
+import pytest
+
+from prd_taskmaster.sketch import EXACT_LIMIT, RELATIVE_ACCURACY, QuantileSketch
+
+
+def test_small_sketch_is_exact_with_repo_median_convention():
+    s = QuantileSketch()
+    for v in (900, 1200, 2400, 50):
+        s.add(v)
+    assert s.quantile(0.5) == sorted([900, 1200, 2400, 50])[2]
+    assert QuantileSketch().quantile(0.5) is None
+
+
+def test_large_sketch_stays_within_relative_accuracy():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(7, 1) for _ in range(5000)]
+    s = QuantileSketch()
+    for v in values:
+        s.add(v)
+    assert s.samples is None and len(s.bins) < 1000
+    ordered = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[int(q * len(ordered))]
+        assert s.quantile(q) == pytest.approx(exact, rel=RELATIVE_ACCURACY * 1.01)
+
+
+def test_merge_matches_single_sketch_and_round_trips():
+    left, right, whole = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for i in range(1, 3 * EXACT_LIMIT):
+        (left if i % 2 else right).add(i)
+        whole.add(i)
+    left.merge(right)
+    assert left.count == whole.count
+    assert left.quantile(0.5) == whole.quantile(0.5)
+    restored = QuantileSketch.from_dict(left.to_dict())
+    assert restored.quantile(0.95) == left.quantile(0.95)
+
+
+def test_zero_values_and_garbage_payloads():
+    s = QuantileSketch()
+    for _ in range(EXACT_LIMIT + 1):
+        s.add(0)
+    assert s.quantile(0.5) == 0
+    assert QuantileSketch.from_dict("nope").count == 0
+    assert QuantileSketch.from_dict({"bins": {"x": 1, "3": 2}}).count == 2
@@ -158,6 +158,24 @@ def test_next_task_orders_ready_by_priority_before_id_and_dependency_count(tmp_p
     assert result["task"]["title"] == "High id high priority"
 
 
+def test_next_task_prefers_longest_critical_path_over_priority(tmp_path, monkeypatch):
+    from prd_taskmaster.task_state import run_next_task
+
+    _write_project(
+        tmp_path,
+        _tagged_payload(
+            [
+                _task(1, title="High priority leaf", priority="high"),
+                _task(2, title="Chain head", priority="low"),
+                _task(3, title="Chain middle", dependencies=[2]),
+                _task(4, title="Chain tail", dependencies=[3]),
+            ]
+        ),
+    )
+    monkeypatch.chdir(tmp_path)
+
+    assert run_next_task()["task"]["id"] == 2
+
 def test_next_task_resumes_in_progress_ready_subtask_before_ready_parent(tmp_path, monkeypatch):
     from prd_taskmaster.task_state import run_next_task
 
@@ -14,17 +14,21 @@ Coverage:
   AS11. sweep_expired deactivates entries past expires_at (pure helper).
   AS12. Expired entries auto-free inside admit's transform (TTL sweep).
   AS13. Concurrency: exactly PER_JOB_CAP_N threads succeed; the rest raise job_cap_exceeded.
+  AS14. Persisted index: counts + expiry heap stay in step with entries, legacy
+        files gain an index, sweeps pop only due entries, inactive entries compact.
 """
 
 from __future__ import annotations
 
 import json
 import threading
+from datetime import datetime
 from pathlib import Path
 
 import pytest
 
 from prd_taskmaster.tournament.antisybil import (
+    COMPACT_MIN_INACTIVE,
     ENTRY_FEE_E,
     FAKERY_STAKE_MULT,
     PER_JOB_CAP_N,
@@ -531,6 +535,74 @@ class TestConcurrencyAtomicity:
         )
 
 
+# ─── AS14: persisted index + compaction ──────────────────────────────────────
+
+class TestIndexAndCompaction:
+    def test_index_tracks_counts_and_expiry(self, ops_path: Path) -> None:
+        """AS14a: admit/release keep the persisted counts and heap in step."""
+        for i in range(3):
+            admit(ops_path, operator_id="claude:sonnet", job_id=f"job-{i}",
+                  claimant_id=f"job-{i}:0:sonnet", now=NOW)
+        index = json.loads(ops_path.read_text())["index"]
+        assert index["operators"] == {"claude:sonnet": 3}
+        assert index["jobs"] == {"job-0": 1, "job-1": 1, "job-2": 1}
+        assert len(index["expiry"]) == 3
+        assert index["expiry"][0][0] == pytest.approx(
+            datetime.fromisoformat(NOW).timestamp() + TTL_SECONDS
+        )
+
+        release(ops_path, job_id="job-1")
+        index = json.loads(ops_path.read_text())["index"]
+        assert index["operators"] == {"claude:sonnet": 2}
+        assert "job-1" not in index["jobs"] and index["inactive"] == 1
+
+    def test_legacy_file_without_index_is_indexed(self, ops_path: Path) -> None:
+        """AS14b: an operators.json written before the index still counts correctly."""
+        ops_path.parent.mkdir(parents=True, exist_ok=True)
+        ops_path.write_text(json.dumps({"entries": [
+            {"operator_id": "claude:sonnet", "job_id": "job-old", "claimant_id": f"c{i}",
+             "admitted_at": NOW, "expires_at": FAR_FUTURE, "active": True}
+            for i in range(PER_OPERATOR_RATE_LIMIT)
+        ]}))
+        with pytest.raises(SybilLimitError) as exc_info:
+            admit(ops_path, operator_id="claude:sonnet", job_id="job-new",
+                  claimant_id="job-new:0:sonnet", now=NOW)
+        assert exc_info.value.reason == "operator_rate_limited"
+
+    def test_sweep_only_parses_due_entries(self, monkeypatch) -> None:
+        """AS14c: with an index, a sweep pops the heap instead of parsing every entry."""
+        from prd_taskmaster.tournament import antisybil
+
+        entries = [
+            {"operator_id": f"op-{i}", "job_id": "job", "claimant_id": f"c{i}",
+             "active": True, "expires_at": PAST if i == 0 else FAR_FUTURE}
+            for i in range(50)
+        ]
+        state = {"entries": entries, "index": antisybil._build_index(entries)}
+        parsed = []
+        real_epoch = antisybil._epoch
+        monkeypatch.setattr(antisybil, "_epoch", lambda s: (parsed.append(s), real_epoch(s))[1])
+        sweep_expired(state, NOW)
+        assert entries[0]["active"] is False
+        assert all(e["active"] for e in entries[1:])
+        assert len(parsed) == 2  # `now` + the one expired entry
+        assert active_count_for_job(state, "job") == 49
+
+    def test_inactive_entries_are_compacted(self, ops_path: Path) -> None:
+        """AS14d: released entries are dropped once they outnumber the slack."""
+        for i in range(COMPACT_MIN_INACTIVE + 1):
+            admit(ops_path, operator_id="claude:sonnet", job_id=f"job-c{i}",
+                  claimant_id=f"job-c{i}:0:sonnet", now=NOW)
+            release(ops_path, job_id=f"job-c{i}")
+        admit(ops_path, operator_id="claude:sonnet", job_id="job-live",
+              claimant_id="job-live:0:sonnet", now=NOW)
+
+        state = json.loads(ops_path.read_text())
+        assert [e["job_id"] for e in state["entries"]] == ["job-live"]
+        assert state["index"]["inactive"] == 0
+        assert len(state["index"]["expiry"]) == 1
+
+
 # ─── AS-FIX1: sweep_expired tz-normalization (audit fix 1) ──────────────────
 
 class TestSweepExpiredTzNormalization:
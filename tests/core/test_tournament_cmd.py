@@ -23,6 +23,7 @@ Coverage:
 from __future__ import annotations
 
 import json
+import sys
 from pathlib import Path
 from typing import Optional
 from unittest.mock import MagicMock
@@ -709,3 +710,62 @@ def test_watcher_gate_fail_closed_when_watcher_errors(tmp_path):
 
     assert calls == [False], "a watcher error must downgrade to shadow (fail-closed)"
     assert summary["enforce_slash_downgraded"] is True
+
+
+# ─── Start-barrier timeout ────────────────────────────────────────────────────
+
+def test_spawn_start_timeout_comes_from_fleet_json(tmp_path, monkeypatch):
+    """tournament.spawn_start_timeout_s in fleet.json reaches spawn_roster."""
+    from prd_taskmaster.tournament import cmd
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".atlas-ai").mkdir()
+    (tmp_path / ".atlas-ai" / "fleet.json").write_text(
+        json.dumps({"tournament": {"spawn_start_timeout_s": 75}})
+    )
+    seen = {}
+    real_spawn_roster = cmd.spawn_roster
+    monkeypatch.setattr(
+        cmd, "spawn_roster",
+        lambda roster, **kw: seen.update(kw) or real_spawn_roster(roster, **kw),
+    )
+    run_tournament(**_run_args(tmp_path))
+    assert seen["start_timeout_s"] == 75.0
+
+    explicit = tmp_path / "explicit"
+    explicit.mkdir()
+    run_tournament(**{**_run_args(explicit), "spawn_start_timeout_s": 5.0})
+    assert seen["start_timeout_s"] == 5.0
+
+
+# ─── Inbox watcher wiring ─────────────────────────────────────────────────────
+
+def test_tournament_run_cli_passes_inbox_dir(tmp_path, monkeypatch):
+    """--inbox-dir reaches run_tournament, so the CLI path can use inotify."""
+    from prd_taskmaster.cli import build_parser
+    from prd_taskmaster.tournament import cmd
+
+    seen = {}
+    monkeypatch.setattr(cmd, "run_tournament", lambda **kw: seen.update(kw) or {})
+    args = build_parser().parse_args([
+        "tournament-run", "--card", str(_make_card(tmp_path)), "--task", "7",
+        "--base-ref", BASE_REF, "--models", "claude:sonnet", "--job-id", JOB_ID,
+        "--bounty", "100", "--job-poster", "poster", "--inbox-dir", str(tmp_path),
+    ])
+    with pytest.raises(SystemExit):
+        cmd.cmd_tournament_run(args)
+    assert seen["inbox_dir"] == str(tmp_path)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inbox_dir_with_real_clock_collects_through_inotify(tmp_path, monkeypatch):
+    from prd_taskmaster.tournament import collect
+
+    built = []
+    real_make = collect.make_inbox_watcher
+    monkeypatch.setattr(collect, "make_inbox_watcher",
+                        lambda *a: built.append(real_make(*a)) or built[-1])
+    kwargs = _run_args(tmp_path)
+    kwargs.pop("clock")
+    run_tournament(**kwargs, inbox_dir=tmp_path)
+    assert [type(w).__name__ for w in built] == ["InotifyWatcher"]
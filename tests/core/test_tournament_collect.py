@@ -11,14 +11,22 @@ No live launcher / git / sleep is ever touched.
 """
 from __future__ import annotations
 
+import sys
+import threading
+import time
+
 import pytest
 
 from prd_taskmaster.tournament.collect import (
     Clock,
     CollectResult,
     FakeClock,
+    InboxWatcher,
+    InotifyWatcher,
+    PollingWatcher,
     RealClock,
     collect_tournament,
+    make_inbox_watcher,
     default_inbox_adapter,
     default_reveal_adapter,
     _compute_diff_hash,
@@ -462,3 +470,79 @@ def test_compute_diff_hash_fail_closed_on_git_error():
         _run=fake_runner,
     )
     assert h == ""
+
+
+# ─── Inbox watcher (event-driven waits) ───────────────────────────────────────
+
+
+class WakingWatcher(InboxWatcher):
+    """Watcher stub that reports an inbox event on every wait, advancing the
+    fake clock by a tiny amount (an event arrived almost immediately)."""
+
+    def __init__(self, clock: FakeClock) -> None:
+        self.clock = clock
+        self.waits: list[float] = []
+
+    def wait(self, seconds: float) -> bool:
+        self.waits.append(seconds)
+        self.clock.sleep(0.01)
+        return True
+
+
+def test_watcher_wake_repolls_without_waiting_a_full_interval():
+    roster = [make_spec("c0", entry_fee_paid=1, fakery_stake=5)]
+    polls = []
+
+    def inbox_read(*, job_id):
+        polls.append(1)
+        # The commit "lands" after the first wait.
+        return [commit_msg("job-1", "c0", "sha", "H")] if len(polls) > 1 else []
+
+    clock = fast_clock()
+    watcher = WakingWatcher(clock)
+    result = collect_tournament(
+        job_id="job-1",
+        roster=roster,
+        handles=make_handles(["c0"]),
+        base_ref="base",
+        orchestrator_session="orch",
+        poll_interval_s=30.0,
+        _inbox_read=inbox_read,
+        _dispatch_reveal=lambda **kw: {"commit_sha": "sha", "self_reported_exit": 0},
+        _compute_hash=lambda *a: "H",
+        clock=clock,
+        watcher=watcher,
+    )
+    assert [r["claimant_id"] for r in result.racers] == ["c0"]
+    assert watcher.waits == [30.0] and len(polls) == 2
+    assert clock.now() == pytest.approx(0.01)  # woke at once, not after 30 s
+
+
+def test_make_inbox_watcher_keeps_polling_for_fake_clock(tmp_path):
+    clock = fast_clock()
+    watcher = make_inbox_watcher(str(tmp_path), clock)
+    assert isinstance(watcher, PollingWatcher)
+    assert watcher.wait(2.0) is False and clock.sleeps == [2.0]
+    assert isinstance(make_inbox_watcher(None, RealClock()), PollingWatcher)
+
+
+def test_make_inbox_watcher_falls_back_for_unwatchable_dir(tmp_path):
+    watcher = make_inbox_watcher(str(tmp_path / "missing"), RealClock())
+    assert isinstance(watcher, PollingWatcher)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_watcher_wakes_when_submission_lands(tmp_path):
+    watcher = InotifyWatcher(str(tmp_path))
+    try:
+        assert watcher.wait(0.01) is False  # nothing yet → times out
+        timer = threading.Timer(0.05, lambda: (tmp_path / "c0.json").write_text("{}"))
+        timer.start()
+        started = time.monotonic()
+        assert watcher.wait(10.0) is True
+        assert time.monotonic() - started < 5.0
+        timer.join()
+    finally:
+        watcher.close()
+    with pytest.raises(ValueError):
+        watcher.wait(0)
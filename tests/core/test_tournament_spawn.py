@@ -18,10 +18,16 @@ Coverage:
   SP13. build_roster passes report_to= through to RacerSpec.report_to.
   SP14. Duplicate models in roster raises ValueError (I3).
   SP15. Mid-roster admit failure rolls back all already-admitted entries (I1).
+  SP16. spawn_roster runs spawns concurrently (bounded by max_parallel), keeps
+        roster order, starts two-phase racers together after provisioning, and
+        releases a failed racer's admission immediately.
 """
 
 from __future__ import annotations
 
+import json
+import threading
+import time
 from pathlib import Path
 from typing import Any
 
@@ -615,7 +621,204 @@ class TestSpawnRoster:
             return _stub_spawn(spec)
 
         spawn_roster(roster, _spawn_fn=_recording_spawn)
-        assert received == roster
+        # Spawns run concurrently, so call order is not roster order.
+        assert sorted(received, key=lambda s: s.claimant_id) == roster
+
+
+# ─── SP16: concurrent spawn + failed-spawn release ───────────────────────────
+
+class TestConcurrentSpawn:
+    def _roster(self, n: int) -> "list[RacerSpec]":
+        return TestSpawnRoster()._roster(n)
+
+    def test_spawns_overlap_up_to_max_parallel(self) -> None:
+        """SP16: with max_parallel=3, three spawns are in flight together."""
+        roster = self._roster(4)
+        lock = threading.Lock()
+        state = {"in_flight": 0, "peak": 0}
+
+        def _slow(spec: RacerSpec) -> dict:
+            with lock:
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            time.sleep(0.05)
+            with lock:
+                state["in_flight"] -= 1
+            return _stub_spawn(spec)
+
+        handles = spawn_roster(roster, _spawn_fn=_slow, max_parallel=3)
+        assert state["peak"] == 3
+        assert [h["claimant_id"] for h in handles] == [s.claimant_id for s in roster]
+
+    def test_max_parallel_one_is_sequential(self) -> None:
+        """SP16: max_parallel=1 never overlaps spawns."""
+        roster = self._roster(3)
+        active = threading.Semaphore(1)
+
+        def _exclusive(spec: RacerSpec) -> dict:
+            assert active.acquire(blocking=False), "spawns overlapped"
+            try:
+                return _stub_spawn(spec)
+            finally:
+                active.release()
+
+        handles = spawn_roster(roster, _spawn_fn=_exclusive, max_parallel=1)
+        assert all(h["spawned"] for h in handles)
+
+    def test_starts_wait_for_slowest_provisioning(self) -> None:
+        """SP16: with a start phase, no racer starts before every racer is provisioned."""
+        roster = self._roster(3)
+        delays = {spec.claimant_id: d for spec, d in zip(roster, (0.0, 0.1, 0.3))}
+        provisioned: dict[str, float] = {}
+        started: dict[str, float] = {}
+        lock = threading.Lock()
+
+        def _provision(spec: RacerSpec) -> dict:
+            time.sleep(delays[spec.claimant_id])
+            with lock:
+                provisioned[spec.claimant_id] = time.monotonic()
+            return _stub_spawn(spec)
+
+        def _start(spec: RacerSpec, handle: dict) -> dict:
+            with lock:
+                started[spec.claimant_id] = time.monotonic()
+            return {"started": True}
+
+        handles = spawn_roster(roster, _spawn_fn=_provision, _start_fn=_start)
+        assert min(started.values()) >= max(provisioned.values())
+        assert max(started.values()) - min(started.values()) < 0.1
+        assert all(h["spawned"] and h["started"] for h in handles)
+        assert handles[0]["session_id"] == f"sess-{roster[0].claimant_id}"
+
+    def test_without_start_phase_nothing_waits_for_slow_provisioning(self) -> None:
+        """SP16: a one-phase adapter is not barriered; start skew is its provisioning skew."""
+        roster = self._roster(2)
+        finished: dict[str, float] = {}
+
+        def _spawn(spec: RacerSpec) -> dict:
+            if spec.claimant_id == roster[1].claimant_id:
+                time.sleep(0.3)
+            finished[spec.claimant_id] = time.monotonic()
+            return _stub_spawn(spec)
+
+        spawn_roster(roster, _spawn_fn=_spawn)
+        assert finished[roster[1].claimant_id] - finished[roster[0].claimant_id] > 0.2
+
+    def test_failed_start_releases_admission(self, tmp_path: Path) -> None:
+        """SP16: a racer that provisions but cannot start frees its slot too."""
+        roster = self._roster(2)
+        released: list[str] = []
+
+        def _start(spec: RacerSpec, handle: dict) -> dict:
+            if spec.claimant_id == roster[0].claimant_id:
+                raise RuntimeError("start refused")
+            return {}
+
+        handles = spawn_roster(
+            roster,
+            _spawn_fn=_stub_spawn,
+            _start_fn=_start,
+            operators_path=tmp_path / "ops.json",
+            _release=lambda path, **kw: released.append(kw["claimant_id"]),
+        )
+        assert released == [roster[0].claimant_id]
+        assert handles[0]["spawned"] is False and handles[0]["error"] == "start refused"
+        assert handles[1]["spawned"] is True
+
+    def test_start_timeout_bounds_the_barrier_wait(self) -> None:
+        """SP16: a racer stuck provisioning holds the others back only start_timeout_s."""
+        roster = self._roster(2)
+        stuck = threading.Event()
+        started: dict[str, float] = {}
+
+        def _provision(spec: RacerSpec) -> dict:
+            if spec.claimant_id == roster[1].claimant_id:
+                stuck.wait(5)
+            return _stub_spawn(spec)
+
+        def _start(spec: RacerSpec, handle: dict) -> dict:
+            started[spec.claimant_id] = time.monotonic()
+            stuck.set()
+            return {}
+
+        begin = time.monotonic()
+        spawn_roster(roster, _spawn_fn=_provision, _start_fn=_start, start_timeout_s=0.2)
+        assert started[roster[0].claimant_id] - begin < 2
+
+    def test_invalid_start_timeout_raises(self) -> None:
+        with pytest.raises(ValueError, match="start_timeout_s"):
+            spawn_roster(self._roster(1), _spawn_fn=_stub_spawn, start_timeout_s=0)
+
+    def test_invalid_max_parallel_raises(self) -> None:
+        with pytest.raises(ValueError, match="max_parallel"):
+            spawn_roster(self._roster(1), _spawn_fn=_stub_spawn, max_parallel=0)
+
+    def test_failed_spawn_releases_its_claimant_only(self, tmp_path: Path) -> None:
+        """SP16: a failed racer's admission is released at once; others are kept."""
+        roster = self._roster(3)
+        fail_id = roster[1].claimant_id
+        released: list[dict] = []
+
+        def _flaky(spec: RacerSpec) -> dict:
+            if spec.claimant_id == fail_id:
+                raise RuntimeError("session spawn failed")
+            return _stub_spawn(spec)
+
+        def _release(path: Any, **kwargs: Any) -> None:
+            released.append({"path": path, **kwargs})
+
+        handles = spawn_roster(
+            roster,
+            _spawn_fn=_flaky,
+            operators_path=tmp_path / "operators.json",
+            _release=_release,
+        )
+        assert released == [
+            {"path": tmp_path / "operators.json", "job_id": JOB_ID, "claimant_id": fail_id}
+        ]
+        assert handles[1]["released"] is True
+        assert "released" not in handles[0]
+
+    def test_release_error_is_recorded_not_raised(self, tmp_path: Path) -> None:
+        roster = self._roster(1)
+
+        def _fail(spec: RacerSpec) -> dict:
+            raise RuntimeError("boom")
+
+        def _release(path: Any, **kwargs: Any) -> None:
+            raise OSError("disk gone")
+
+        handles = spawn_roster(
+            roster, _spawn_fn=_fail, operators_path=tmp_path / "ops.json", _release=_release
+        )
+        assert handles[0]["spawned"] is False
+        assert "disk gone" in handles[0]["release_error"]
+
+    def test_failed_spawn_frees_real_operator_slot(self, tmp_path: Path) -> None:
+        """SP16: end to end against antisybil — the failed claimant goes inactive."""
+        from prd_taskmaster.tournament import antisybil
+
+        ops = tmp_path / "operators.json"
+        roster = build_roster(
+            models=["claude:sonnet", "claude:haiku"],
+            job_id=JOB_ID,
+            task_prompt="do task",
+            card_ref=CARD_REF,
+            base_ref="abc1234",
+            report_to="",
+            operators_path=ops,
+            now=NOW,
+        )
+        fail_id = roster[0].claimant_id
+
+        def _flaky(spec: RacerSpec) -> dict:
+            if spec.claimant_id == fail_id:
+                raise RuntimeError("launch failed")
+            return _stub_spawn(spec)
+
+        spawn_roster(roster, _spawn_fn=_flaky, operators_path=ops)
+        state = json.loads(ops.read_text())
+        assert antisybil.active_count_for_job(state, JOB_ID) == 1
 
 
 # ─── SP11: default_launcher_adapter ──────────────────────────────────────────
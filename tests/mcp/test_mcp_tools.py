@@ -1,4 +1,4 @@
-"""MCP tool contract tests — the merged server.py registers 31 tools.
+"""MCP tool contract tests — the merged server.py registers 35 tools.
 
 Retargeted from the plugin: server.py now imports from prd_taskmaster.* and
 lives at mcp-server/server.py. We add the repo root (so `prd_taskmaster` is
@@ -244,13 +244,14 @@ def test_context_pack_tool_returns_core_pack(tmp_path):
     }
 
 
-def test_server_registers_32_tools():
-    """Verify server.py declares all 32 expected tool functions at module scope.
+def test_server_registers_35_tools():
+    """Verify server.py declares all 35 expected tool functions at module scope.
 
     The task-master backend was removed (spec §9.4): the init_taskmaster,
     tm_parallel_expand, and backend_detect MCP tools were deleted (32 -> 29).
     The suggestion + suggestion_report tools were then added (29 -> 31).
     render_status was added (31 -> 32).
+    job_status, job_cancel and job_list were added for background jobs (32 -> 35).
     """
     import server as S
     expected = {
@@ -274,8 +275,11 @@ def test_server_registers_32_tools():
         "suggestion",
         "suggestion_report",
         "render_status",
+        "job_status",
+        "job_cancel",
+        "job_list",
     }
-    assert len(expected) == 32
+    assert len(expected) == 35
     public_attrs = {name for name in dir(S) if not name.startswith("_")}
     missing = expected - public_attrs
     assert not missing, f"missing tools: {sorted(missing)}"
@@ -305,3 +309,31 @@ def test_render_status_tool_returns_panel(tmp_path, monkeypatch):
     assert r["ok"] is True
     assert "┌" in r["rendered"] or "│" in r["rendered"]
     assert r["phase"] == "EXECUTE"
+
+
+def test_long_running_tools_return_job_ids_and_persist_results(tmp_path, monkeypatch):
+    import time
+    import server as S
+    from prd_taskmaster import jobs as J
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(S, "_jobs", J.JobManager())
+    monkeypatch.setattr(S.CLI, "run_rate", lambda **kw: {"ok": True, "rated": kw})
+
+    started = S.rate_tasks(tag="alpha", research=False)
+    assert started["ok"] is True and started["status"] == "queued"
+    job_id = started["job_id"]
+    for _ in range(200):
+        status = S.job_status(job_id)
+        if status["status"] == "succeeded":
+            break
+        time.sleep(0.01)
+    assert status["result"] == {"ok": True, "rated": {"tag": "alpha", "research": False}}
+    assert [j["job_id"] for j in S.job_list()["jobs"]] == [job_id]
+
+    # A reconnecting client on a fresh server process still sees the result.
+    monkeypatch.setattr(S, "_jobs", J.JobManager())
+    assert S.job_status(job_id)["result"]["ok"] is True
+    assert S.job_status("nope")["ok"] is False
+
+    assert S.rate_tasks(tag="alpha", research=False, wait=True)["ok"] is True
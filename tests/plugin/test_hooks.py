@@ -73,7 +73,7 @@ def _write_pipeline(tmp_path, phase="EXECUTE"):
 
 
 def _write_tasks(tmp_path, tasks):
-    p = tmp_path / ".atlas-ai" / "taskmaster" / "tasks"
+    p = tmp_path / ".taskmaster" / "tasks"
     p.mkdir(parents=True, exist_ok=True)
     (p / "tasks.json").write_text(json.dumps({"master": {"tasks": tasks}}))
 
@@ -176,3 +176,165 @@ def test_evidence_gate_no_subtasks_key_no_crash(tmp_path, monkeypatch):
     rc, out, err = _run_hook(hook_path, input_json)
     assert rc == 0
     assert out == {}
+
+
+def test_evidence_gate_uses_summary_until_tasks_change(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    hook_path = REPO_ROOT / "hooks" / "evidence_gate.py"
+    _write_pipeline(tmp_path, phase="EXECUTE")
+    _write_tasks(tmp_path, [
+        {"id": "1", "status": "in-progress", "subtasks": [{"id": "1.1"}], "evidence_files": []},
+    ])
+    rc, out, err = _run_hook(hook_path, {"stop_hook_active": False})
+    assert out.get("decision") == "block"
+    summary_path = tmp_path / ".atlas-ai" / "state" / "in-progress.json"
+    summary = json.loads(summary_path.read_text())
+    assert summary["in_progress"] == [{"id": "1", "subtasks": 1, "evidence": 0}]
+
+    # A fresh summary is trusted without parsing tasks.json.
+    summary["in_progress"] = []
+    summary_path.write_text(json.dumps(summary))
+    rc, out, err = _run_hook(hook_path, {"stop_hook_active": False})
+    assert out == {}
+
+    # Any change to tasks.json makes it stale: full scan again.
+    _write_tasks(tmp_path, [
+        {"id": "2", "status": "in-progress", "subtasks": [{"id": "2.1"}, {"id": "2.2"}],
+         "evidence_files": ["a"]},
+    ])
+    rc, out, err = _run_hook(hook_path, {"stop_hook_active": False})
+    assert "task 2: 1/2 evidence" in out.get("reason", "")
+
+
+def test_task_state_keeps_summary_current_for_hook(tmp_path, monkeypatch):
+    import importlib.util
+
+    from prd_taskmaster.task_state import run_set_status
+
+    monkeypatch.chdir(tmp_path)
+    _write_pipeline(tmp_path, phase="EXECUTE")
+    _write_tasks(tmp_path, [
+        {"id": "1", "status": "pending", "subtasks": [{"id": "1"}], "evidence_files": []},
+    ])
+    spec = importlib.util.spec_from_file_location("evidence_gate", REPO_ROOT / "hooks" / "evidence_gate.py")
+    hook = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(hook)
+    parsed = []
+
+    def load_json(path):
+        parsed.append(Path(path).name)
+        return json.loads(Path(path).read_text())
+
+    run_set_status("1", "in-progress")
+    assert hook.decide({}, load_json=load_json)["decision"] == "block"
+    assert "tasks.json" not in parsed and "pipeline.json" not in parsed
+
+    run_set_status("1", "deferred")
+    assert hook.decide({}, load_json=load_json) == {}
+    assert "tasks.json" not in parsed
+
+
+def test_summary_follows_master_shard_and_ignores_other_tags(tmp_path, monkeypatch):
+    import importlib.util
+
+    from prd_taskmaster.parallel import shard_tasks
+    from prd_taskmaster.task_state import run_set_status
+
+    monkeypatch.chdir(tmp_path)
+    _write_pipeline(tmp_path, phase="EXECUTE")
+    tasks_file = tmp_path / ".taskmaster" / "tasks" / "tasks.json"
+    tasks_file.parent.mkdir(parents=True)
+    tasks_file.write_text(json.dumps({
+        "master": {"tasks": [{"id": "1", "status": "pending", "subtasks": [{"id": "1"}]}]},
+        "feature": {"tasks": [{"id": "1", "status": "pending"}]},
+    }))
+    shard_tasks()
+    spec = importlib.util.spec_from_file_location("evidence_gate", REPO_ROOT / "hooks" / "evidence_gate.py")
+    hook = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(hook)
+    parsed = []
+
+    def load_json(path):
+        parsed.append(Path(path).name)
+        return json.loads(Path(path).read_text())
+
+    run_set_status("1", "in-progress")
+    run_set_status("1", "in-progress", tag="feature")
+    assert hook.decide({}, load_json=load_json)["decision"] == "block"
+    assert parsed == ["in-progress.json"]
+
+
+def _import_hook():
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location("evidence_gate", REPO_ROOT / "hooks" / "evidence_gate.py")
+    hook = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(hook)
+    return hook
+
+
+def _sharded_project(tmp_path):
+    from prd_taskmaster.parallel import shard_tasks
+
+    _write_pipeline(tmp_path, phase="EXECUTE")
+    _write_tasks(tmp_path, [{"id": "1", "status": "pending", "subtasks": [{"id": "1"}]}])
+    shard_tasks()
+
+
+def test_sharded_rescan_reads_master_shard_not_stale_export(tmp_path, monkeypatch):
+    from prd_taskmaster import parallel
+    from prd_taskmaster.task_state import run_set_status
+
+    monkeypatch.chdir(tmp_path)
+    _sharded_project(tmp_path)
+    hook = _import_hook()
+    run_set_status("1", "in-progress")
+    assert hook.decide({})["decision"] == "block"
+
+    # pipeline.json rewritten: the summary is stale, the hook rescans.
+    _write_pipeline(tmp_path, phase="EXECUTE")
+    assert hook.decide({})["decision"] == "block"
+    summary = json.loads((tmp_path / ".atlas-ai" / "state" / "in-progress.json").read_text())
+    assert summary["source"] == parallel.tasks_path("master").as_posix()
+    assert summary["in_progress"] == [{"id": "1", "subtasks": 1, "evidence": 0}]
+    assert hook.decide({})["decision"] == "block"
+
+
+def test_summary_of_the_export_is_not_trusted_once_sharded(tmp_path, monkeypatch):
+    from prd_taskmaster.parallel import shard_tasks
+    from prd_taskmaster.task_state import run_set_status
+
+    monkeypatch.chdir(tmp_path)
+    _write_pipeline(tmp_path, phase="EXECUTE")
+    _write_tasks(tmp_path, [{"id": "1", "status": "pending", "subtasks": [{"id": "1"}]}])
+    hook = _import_hook()
+    summary_path = tmp_path / ".atlas-ai" / "state" / "in-progress.json"
+    assert hook.decide({}) == {}
+    export_summary = summary_path.read_text()  # fingerprints tasks.json, nothing in progress
+
+    shard_tasks()  # tasks.json stays in place, unchanged, as the export
+    run_set_status("1", "in-progress")
+    summary_path.write_text(export_summary)
+    assert hook.decide({})["decision"] == "block"
+
+
+def test_hook_still_scans_when_the_package_cannot_be_imported(tmp_path, monkeypatch):
+    from prd_taskmaster.task_state import run_set_status
+
+    monkeypatch.chdir(tmp_path)
+    _sharded_project(tmp_path)
+    run_set_status("1", "in-progress")
+    hook = _import_hook()
+    monkeypatch.setattr(hook, "progress_summary", None)
+    (tmp_path / ".atlas-ai" / "state" / "in-progress.json").unlink()
+    assert hook.decide({})["decision"] == "block"
+    assert not (tmp_path / ".atlas-ai" / "state" / "in-progress.json").exists()
+
+
+def test_hook_fallback_layout_matches_progress_summary():
+    from prd_taskmaster import progress_summary
+
+    hook = _import_hook()
+    assert hook.PIPELINE == progress_summary.PIPELINE_FILE.as_posix()
+    assert hook.TASKS == progress_summary.TASKS_FILE.as_posix()
+    assert hook.TAG_MANIFEST == progress_summary.TAG_MANIFEST.as_posix()
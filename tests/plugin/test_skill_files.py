@@ -127,6 +127,26 @@ def test_bare_taskmaster_lifecycle_commands_are_mode_b_only():
     assert not failures, "bare task-master lifecycle commands outside Mode B:\n" + "\n".join(failures)
 
 
+def test_background_mcp_tool_calls_say_how_to_get_the_result():
+    # These tools return a job_id unless called with wait=true.
+    background = ("engine_preflight(", "parse_prd(", "rate_tasks`", "expand_tasks`")
+    failures = []
+    for path in DOC_CONTRACT_PATHS:
+        rel_path = path.relative_to(REPO_ROOT)
+        lines = path.read_text().splitlines()
+        for line_no, line in enumerate(lines, start=1):
+            if not any(f"<prefix>{tool}" in line for tool in background) \
+                    and "`expand_tasks` MCP tool" not in line:
+                continue
+            context = "\n".join(lines[max(0, line_no - 4): min(len(lines), line_no + 3)])
+            if "job_status" not in context and "wait=true" not in context:
+                failures.append(f"{rel_path}:{line_no}: {line}")
+    assert not failures, "background MCP calls without job_status / wait=true:\n" + "\n".join(failures)
+    content = (REPO_ROOT / "SKILL.md").read_text()
+    assert "### Background MCP jobs" in content
+    assert "job_cancel" in content
+
+
 def test_discover_skill_has_valid_frontmatter():
     fm = _parse_frontmatter("skills/discover/SKILL.md")
     assert fm["name"] == "discover"